@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Compare cassette v1 (inline base64) and v2 (content-addressed bodies) on disk and at load.
+
+Builds a synthetic recording of ``--interactions`` JSON responses drawn from
+``--distinct`` payloads (recorded suites repeat the same fixtures a lot), saves
+it in both formats and times ``Cassette.load`` plus decoding every body, the
+way a full replay would.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sdetkit.cassette import Cassette  # noqa: E402
+
+
+def _build(interactions: int, distinct: int, body_kb: int, seed: int) -> Cassette:
+    rnd = random.Random(seed)
+    bodies = []
+    for i in range(distinct):
+        items = [
+            {"id": i * 1000 + j, "name": f"item-{rnd.randrange(10**6)}", "tags": ["a", "b"]}
+            for j in range(max(1, body_kb * 1024 // 60))
+        ]
+        bodies.append(json.dumps({"items": items}).encode("utf-8"))
+    cassette = Cassette()
+    for n in range(interactions):
+        req = httpx.Request("GET", f"https://api.example.test/items?page={n}")
+        body = bodies[rnd.randrange(distinct)]
+        resp = httpx.Response(200, headers={"content-type": "application/json"}, content=body)
+        cassette.append(req, resp, body)
+    return cassette
+
+
+def _size(path: Path) -> int:
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return path.stat().st_size if path.exists() else 0
+
+
+def _time(fn: Callable[[], object], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000.0
+
+
+def _replay_all(path: Path) -> int:
+    cassette = Cassette.load(path, allow_absolute=True)
+    total = 0
+    for it in cassette.interactions:
+        total += len(cassette.body(it["response"]))
+    return total
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--interactions", type=int, default=2000)
+    ap.add_argument("--distinct", type=int, default=20)
+    ap.add_argument("--body-kb", type=int, default=16)
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--format", choices=["text", "json"], default="text")
+    ns = ap.parse_args(argv)
+
+    cassette = _build(ns.interactions, max(1, ns.distinct), ns.body_kb, ns.seed)
+    runs = max(1, ns.runs)
+    payload: dict[str, object] = {
+        "interactions": ns.interactions,
+        "distinct_bodies": ns.distinct,
+        "runs": runs,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for version in (1, 2):
+            path = Path(tmp) / f"v{version}.json"
+            cassette.save(path, allow_absolute=True, version=version)
+            disk = _size(path) + _size(Cassette.body_store_path(path))
+            expected = _replay_all(path)
+            payload[f"v{version}_bytes"] = disk
+            payload[f"v{version}_replay_ms_median"] = round(
+                _time(lambda p=path: _replay_all(p), runs), 1
+            )
+            payload[f"v{version}_body_bytes"] = expected
+
+    if ns.format == "json":
+        print(json.dumps(payload, indent=2, sort_keys=True))
+    else:
+        print(f"interactions:    {ns.interactions} ({ns.distinct} distinct bodies) x {runs} runs")
+        for version in (1, 2):
+            print(
+                f"cassette v{version}:     {payload[f'v{version}_bytes'] / 1024 / 1024:.2f} MiB, "
+                f"load+decode {payload[f'v{version}_replay_ms_median']:.1f} ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark sdetkit CLI startup cost using ``python -X importtime``.
+
+Runs ``import sdetkit.cli`` and ``python -m sdetkit --version`` in fresh
+interpreters and reports the cumulative import time of ``sdetkit.cli``, the
+number of ``sdetkit`` modules loaded, and the end-to-end wall time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    existing = env.get("PYTHONPATH", "")
+    env["PYTHONPATH"] = f"{_SRC}{os.pathsep}{existing}" if existing else str(_SRC)
+    return env
+
+
+def _importtime(stmt: str) -> tuple[int, int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        text=True,
+        capture_output=True,
+        env=_env(),
+        check=True,
+    )
+    cumulative = 0
+    modules = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [p.strip() for p in line.split(":", 1)[1].split("|")]
+        if len(parts) != 3 or not parts[1].isdigit():
+            continue
+        name = parts[2]
+        if name.startswith("sdetkit"):
+            modules += 1
+        if name == "sdetkit.cli":
+            cumulative = int(parts[1])
+    return cumulative, modules
+
+
+def _wall_ms(args: list[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], capture_output=True, env=_env(), check=True)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--format", choices=["text", "json"], default="text")
+    ns = ap.parse_args(argv)
+
+    samples = [_importtime("import sdetkit.cli") for _ in range(max(1, ns.runs))]
+    version_ms = [_wall_ms(["-m", "sdetkit", "--version"]) for _ in range(max(1, ns.runs))]
+    payload = {
+        "runs": max(1, ns.runs),
+        "cli_import_us_median": int(statistics.median(s[0] for s in samples)),
+        "sdetkit_modules_loaded": samples[-1][1],
+        "version_wall_ms_median": round(statistics.median(version_ms), 1),
+    }
+    if ns.format == "json":
+        print(json.dumps(payload, indent=2, sort_keys=True))
+    else:
+        print(f"sdetkit.cli cumulative import: {payload['cli_import_us_median'] / 1000:.1f} ms")
+        print(f"sdetkit modules loaded:        {payload['sdetkit_modules_loaded']}")
+        print(f"sdetkit --version wall time:   {payload['version_wall_ms_median']:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Compare buffered ``response.json()`` with incremental ``iter_json_array`` decoding.
+
+Serves a synthetic top-level JSON array of ``--items`` objects through an
+``httpx.MockTransport`` in small chunks and reports the traced peak memory and
+the wall time of consuming every element both ways.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sdetkit.netclient import SdetHttpClient  # noqa: E402
+
+
+def _transport(items: int, pad: int) -> httpx.MockTransport:
+    def body() -> Iterator[bytes]:
+        yield b"["
+        for i in range(items):
+            item = {"id": i, "name": f"item-{i}", "pad": "x" * pad, "tags": ["a", "b"]}
+            yield (b"," if i else b"") + json.dumps(item).encode("utf-8")
+        yield b"]"
+
+    return httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+
+
+def _measure(fn: Callable[[], int]) -> tuple[int, float, int]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        n = fn()
+        return tracemalloc.get_traced_memory()[1], time.perf_counter() - start, n
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--items", type=int, default=50000)
+    ap.add_argument("--pad", type=int, default=200, help="Filler bytes per item.")
+    ap.add_argument("--format", choices=["text", "json"], default="text")
+    ns = ap.parse_args(argv)
+    transport = _transport(ns.items, ns.pad)
+    url = "https://api.example.test/items"
+
+    def buffered() -> int:
+        with httpx.Client(transport=transport) as raw:
+            return sum(1 for _ in raw.get(url).json())
+
+    def streamed() -> int:
+        with httpx.Client(transport=transport) as raw:
+            return sum(1 for _ in SdetHttpClient(raw).iter_json_array(url))
+
+    payload: dict[str, object] = {"items": ns.items}
+    for name, fn in (("buffered", buffered), ("streamed", streamed)):
+        peak, seconds, n = _measure(fn)
+        assert n == ns.items
+        payload[f"{name}_peak_bytes"] = peak
+        payload[f"{name}_seconds"] = round(seconds, 3)
+
+    if ns.format == "json":
+        print(json.dumps(payload, indent=2, sort_keys=True))
+    else:
+        for name in ("buffered", "streamed"):
+            print(
+                f"{name}: peak {payload[f'{name}_peak_bytes'] / 1024 / 1024:.1f} MiB, "
+                f"{payload[f'{name}_seconds']:.2f} s"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
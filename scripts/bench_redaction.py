@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Micro-benchmark secret redaction over megabyte-size payloads.
+
+Compares the precompiled ``sdetkit.security.Redactor`` (what ``redact_json`` and
+``redact_secrets_text`` use) against the previous per-key ``re.sub`` loop and
+recursive JSON walk, on a synthetic JSON document and log text of ``--mb`` MiB.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sdetkit.security import (  # noqa: E402
+    is_sensitive_key,
+    redact_json,
+    redact_keys,
+    redact_secrets_text,
+)
+
+
+def _legacy_text(text: str, keys: set[str]) -> str:
+    out = text
+    for key in sorted(keys):
+        token = re.escape(key).replace("\\-", "[-_]")
+        out = re.sub(rf"(?i)(\b{token}\b\s*[:=]\s*)([^\s,;]+)", r"\1<redacted>", out)
+    return out
+
+
+def _legacy_json(value: object, keys: set[str]) -> object:
+    if isinstance(value, dict):
+        return {
+            k: "<redacted>"
+            if isinstance(k, str) and is_sensitive_key(k, keys)
+            else _legacy_json(value[k], keys)
+            for k in sorted(value.keys(), key=str)
+        }
+    if isinstance(value, list):
+        return [_legacy_json(v, keys) for v in value]
+    return value
+
+
+def _payloads(mb: float, seed: int) -> tuple[object, str]:
+    rnd = random.Random(seed)
+    target = int(mb * 1024 * 1024)
+    records: list[object] = []
+    size = 0
+    while size < target:
+        rec = {
+            "id": rnd.randrange(10**9),
+            "name": f"user-{rnd.randrange(10**6)}",
+            "tags": [rnd.choice(["a", "b", "c"]) for _ in range(8)],
+            "profile": {"city": "x" * 12, "token": "t" * 16, "prefs": {"theme": "dark"}},
+            "events": [{"kind": "login", "at": rnd.random(), "Session": "s" * 8}],
+        }
+        records.append(rec)
+        size += len(json.dumps(rec))
+    lines: list[str] = []
+    size = 0
+    while size < target:
+        line = (
+            f"GET /items/{rnd.randrange(10**6)} status=200 elapsed_ms={rnd.randrange(999)} "
+            f"authorization: Bearer {'k' * 20} trace={rnd.randrange(10**9)}"
+        )
+        lines.append(line)
+        size += len(line) + 1
+    return {"records": records}, "\n".join(lines)
+
+
+def _time(fn: Callable[[], object], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000.0
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--mb", type=float, default=2.0, help="Payload size in MiB.")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--format", choices=["text", "json"], default="text")
+    ns = ap.parse_args(argv)
+
+    keys = redact_keys()
+    doc, text = _payloads(ns.mb, ns.seed)
+    runs = max(1, ns.runs)
+    if redact_json(doc, enabled=True, keys=keys) != _legacy_json(doc, keys):
+        raise SystemExit("json redaction mismatch")
+    if redact_secrets_text(text, enabled=True, keys=keys) != _legacy_text(text, keys):
+        raise SystemExit("text redaction mismatch")
+
+    payload = {
+        "mb": ns.mb,
+        "runs": runs,
+        "json_ms_median": round(_time(lambda: redact_json(doc, enabled=True, keys=keys), runs), 1),
+        "json_legacy_ms_median": round(_time(lambda: _legacy_json(doc, keys), runs), 1),
+        "text_ms_median": round(
+            _time(lambda: redact_secrets_text(text, enabled=True, keys=keys), runs), 1
+        ),
+        "text_legacy_ms_median": round(_time(lambda: _legacy_text(text, keys), runs), 1),
+    }
+    if ns.format == "json":
+        print(json.dumps(payload, indent=2, sort_keys=True))
+    else:
+        print(f"payload size:        {ns.mb:g} MiB x {runs} runs")
+        print(
+            f"redact_json:         {payload['json_ms_median']:.1f} ms "
+            f"(legacy {payload['json_legacy_ms_median']:.1f} ms)"
+        )
+        print(
+            f"redact_secrets_text: {payload['text_ms_median']:.1f} ms "
+            f"(legacy {payload['text_legacy_ms_median']:.1f} ms)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,47 @@
 """Public package exports for sdetkit."""
 
-from .sqlite_scalar import ScalarFunctionRegistrationError, register_scalar_function
+from __future__ import annotations
+
+import sys
+from importlib.abc import MetaPathFinder
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from importlib.machinery import ModuleSpec
+
+    from .sqlite_scalar import ScalarFunctionRegistrationError, register_scalar_function
 
 __all__ = ["ScalarFunctionRegistrationError", "register_scalar_function"]
+
+# Kept in step with [project].version (tests/test_playbooks_cli_extra.py checks it);
+# a constant rather than importlib.metadata, which costs ~20 ms per CLI start.
+__version__ = "1.0.2"
+
+_CLOSEOUT_SPEC_DIR = Path(__file__).resolve().parent / "closeout_specs"
+
+
+class _LegacyCloseoutFinder(MetaPathFinder):
+    """Serve ``sdetkit.<lane>_closeout`` modules that now live as JSON specs."""
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> ModuleSpec | None:
+        if not fullname.startswith(f"{__name__}.") or not fullname.endswith("_closeout"):
+            return None
+        if not (_CLOSEOUT_SPEC_DIR / f"{fullname.rpartition('.')[2]}.json").is_file():
+            return None
+        from .closeout_engine import find_legacy_spec
+
+        return find_legacy_spec(fullname)
+
+
+if not any(type(f).__name__ == "_LegacyCloseoutFinder" for f in sys.meta_path):
+    sys.meta_path.append(_LegacyCloseoutFinder())
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily so `import sdetkit` (and every CLI start) does not pull in sqlite3.
+    if name in __all__:
+        from . import sqlite_scalar
+
+        return getattr(sqlite_scalar, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,9 @@ from __future__ import annotations
 
 import hashlib
 import json
-import urllib.request
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol, cast
+from typing import Protocol
 
 from ..security import ensure_allowed_scheme
 
@@ -31,14 +30,19 @@ class LocalHTTPProvider:
         ensure_allowed_scheme(self.endpoint, allowed={"http", "https"})
         payload = {"model": self.model, "prompt": f"[{role}] {task}", "context": context}
         body = json.dumps(payload, ensure_ascii=True).encode("utf-8")
-        req = urllib.request.Request(
+        from ..httppool import shared_client
+
+        # Agent runs call complete() many times against one endpoint; the
+        # shared client keeps that connection alive between calls. Redirects
+        # are followed, as they were with urllib.
+        response = shared_client(follow_redirects=True).post(
             self.endpoint,
-            data=body,
+            content=body,
             headers={"content-type": "application/json"},
-            method="POST",
+            timeout=self.timeout_s,
         )
-        with urllib.request.urlopen(req, timeout=self.timeout_s) as response:  # noqa: S310  # nosec B310
-            raw = cast(str, response.read().decode("utf-8"))
+        response.raise_for_status()
+        raw = response.text
         try:
             data = json.loads(raw)
         except ValueError:
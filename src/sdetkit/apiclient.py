@@ -1,37 +1,26 @@
 from __future__ import annotations
 
 import asyncio
-import random
+import contextlib
+import functools
+import threading
 import time
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterator
 from typing import Any
-from urllib.parse import urljoin
 
 import httpx
 
-
-def _backoff_delay(attempt: int, base: float, factor: float, jitter: float) -> float:
-    if base <= 0:
-        return 0.0
-    d = base * (factor**attempt)
-    if jitter > 0:
-        d += random.random() * jitter * d
-    return d
-
-
-def _retry_after_seconds(headers: Any) -> float | None:
-    v = None
-    try:
-        v = headers.get("Retry-After")
-    except Exception:
-        v = None
-    if not v:
-        return None
-    try:
-        return float(int(str(v).strip()))
-    except Exception:
-        return None
+from .netclient import (
+    AsyncHook,
+    CircuitBreaker,
+    ClientEvent,
+    Hook,
+    HttpStatusError,
+    RetryPolicy,
+    SdetAsyncHttpClient,
+    SdetHttpClient,
+)
 
 
 def _merge_headers(
@@ -48,6 +37,106 @@ def _merge_headers(
     return out
 
 
+class _NoResponse(httpx.RequestError):
+    """A duck-typed client's ``get`` returned nothing; retried like a failed request."""
+
+
+class _SyncGet:
+    def __init__(self, client: Any) -> None:
+        self._client = client
+
+    def get(self, url: str, **kw: Any) -> Any:
+        r = self._client.get(url, **kw)
+        if r is None:
+            raise _NoResponse("no response")
+        return r
+
+
+class _AsyncGet:
+    def __init__(self, client: Any) -> None:
+        self._client = client
+
+    async def get(self, url: str, **kw: Any) -> Any:
+        r = await self._client.get(url, **kw)
+        if r is None:
+            raise _NoResponse("no response")
+        return r
+
+
+_hook_loop_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _start_hook_loop() -> asyncio.AbstractEventLoop:
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="sdetkit-apiclient-hooks", daemon=True).start()
+    return loop
+
+
+def _sync_hook(hook: Hook | AsyncHook | None) -> Hook | None:
+    """``hook`` for the sync client: async hooks run to completion on a background loop.
+
+    That loop lives in its own daemon thread, so this works whether or not the
+    calling thread is already running an event loop.
+    """
+    if hook is None:
+        return None
+
+    def call(ev: ClientEvent) -> None:
+        r = hook(ev)
+        if asyncio.iscoroutine(r):
+            with _hook_loop_lock:
+                loop = _start_hook_loop()
+            asyncio.run_coroutine_threadsafe(r, loop).result()
+
+    return call
+
+
+def _policy(
+    retries: int,
+    retry_on_429: bool,
+    backoff_base: float,
+    backoff_factor: float,
+    backoff_jitter: float,
+) -> RetryPolicy:
+    if retries < 1:
+        raise ValueError("retries must be >= 1")
+    return RetryPolicy(
+        retries=retries,
+        retry_on_429=retry_on_429,
+        backoff_base=backoff_base,
+        backoff_factor=backoff_factor,
+        backoff_jitter=backoff_jitter,
+    )
+
+
+@contextlib.contextmanager
+def _plain_errors() -> Iterator[None]:
+    """Report netclient failures as the plain errors ``fetch_*`` have always raised.
+
+    Retries, backoff, events and breaker bookkeeping are the netclient clients'
+    own; only ``HttpStatusError`` and a duck-typed client's missing responses are
+    translated here.
+    """
+    try:
+        yield
+    except HttpStatusError:
+        raise RuntimeError("non-2xx response") from None
+    except RuntimeError as e:
+        if isinstance(e.__cause__, _NoResponse):
+            raise RuntimeError(str(e)) from None
+        raise
+
+
+def _trace_headers(
+    headers: dict[str, str] | None, trace_header: str | None, request_id: str | None
+) -> dict[str, str] | None:
+    # One request id for every page of a paginated fetch.
+    if trace_header is not None and request_id is None:
+        request_id = uuid.uuid4().hex
+    return _merge_headers(headers, trace_header, request_id)
+
+
 def fetch_json_dict(
     client: httpx.Client,
     path: str,
@@ -62,61 +151,20 @@ def fetch_json_dict(
     backoff_factor: float = 2.0,
     backoff_jitter: float = 0.0,
     sleep: Callable[[float], None] | None = None,
+    hook: Hook | AsyncHook | None = None,
+    breaker: CircuitBreaker | None = None,
 ) -> dict:
-    if retries < 1:
-        raise ValueError("retries must be >= 1")
-
-    hdrs = _merge_headers(headers, trace_header, request_id)
-    sleep_fn = sleep or time.sleep
-
-    last_err = None  # pragma: no mutate
-    for attempt in range(retries):
-        try:
-            if hdrs is None:
-                r = client.get(path, timeout=timeout)
-            else:
-                r = client.get(path, headers=hdrs, timeout=timeout)
-            last_err = None  # pragma: no mutate
-        except httpx.TimeoutException as e:
-            raise TimeoutError("request timed out") from e
-        except httpx.RequestError as e:
-            last_err = e
-            if attempt < retries - 1:
-                d = _backoff_delay(attempt, backoff_base, backoff_factor, backoff_jitter)
-                if d > 0:
-                    sleep_fn(d)
-                continue
-            r = None  # pragma: no mutate
-
-        if last_err is not None:
-            continue
-
-        if r is None:
-            continue
-
-        if r.status_code == 429 and retry_on_429 and attempt < retries - 1:
-            ra = _retry_after_seconds(r.headers)
-            d = (
-                ra
-                if ra is not None
-                else _backoff_delay(attempt, backoff_base, backoff_factor, backoff_jitter)
-            )
-            if d > 0:
-                sleep_fn(d)
-            continue
-
-        if r.status_code < 200 or r.status_code >= 300:
-            raise RuntimeError("non-2xx response")
-
-        data = r.json()
-        if not isinstance(data, dict):
-            raise ValueError("expected json object")
-        return data
-
-    if last_err is not None:
-        raise RuntimeError("request failed") from last_err
-
-    raise RuntimeError("request failed")
+    policy = _policy(retries, retry_on_429, backoff_base, backoff_factor, backoff_jitter)
+    core = SdetHttpClient(_SyncGet(client), sleep=sleep or time.sleep)  # type: ignore[arg-type]
+    with _plain_errors():
+        return core.get_json_dict(
+            path,
+            headers=_merge_headers(headers, trace_header, request_id),
+            timeout=timeout,
+            retry=policy,
+            hook=_sync_hook(hook),
+            breaker=breaker,
+        )
 
 
 async def fetch_json_dict_async(
@@ -133,61 +181,20 @@ async def fetch_json_dict_async(
     backoff_factor: float = 2.0,
     backoff_jitter: float = 0.0,
     sleep: Callable[[float], Awaitable[None]] | None = None,
+    hook: Hook | AsyncHook | None = None,
+    breaker: CircuitBreaker | None = None,
 ) -> dict:
-    if retries < 1:
-        raise ValueError("retries must be >= 1")
-
-    hdrs = _merge_headers(headers, trace_header, request_id)
-    sleep_fn = sleep or asyncio.sleep
-
-    last_err = None  # pragma: no mutate
-    for attempt in range(retries):
-        try:
-            if hdrs is None:
-                r = await client.get(path, timeout=timeout)
-            else:
-                r = await client.get(path, headers=hdrs, timeout=timeout)
-            last_err = None  # pragma: no mutate
-        except httpx.TimeoutException as e:
-            raise TimeoutError("request timed out") from e
-        except httpx.RequestError as e:
-            last_err = e
-            if attempt < retries - 1:
-                d = _backoff_delay(attempt, backoff_base, backoff_factor, backoff_jitter)
-                if d > 0:
-                    await sleep_fn(d)
-                continue
-            r = None  # pragma: no mutate
-
-        if last_err is not None:
-            continue
-
-        if r is None:
-            continue
-
-        if r.status_code == 429 and retry_on_429 and attempt < retries - 1:
-            ra = _retry_after_seconds(r.headers)
-            d = (
-                ra
-                if ra is not None
-                else _backoff_delay(attempt, backoff_base, backoff_factor, backoff_jitter)
-            )
-            if d > 0:
-                await sleep_fn(d)
-            continue
-
-        if r.status_code < 200 or r.status_code >= 300:
-            raise RuntimeError("non-2xx response")
-
-        data = r.json()
-        if not isinstance(data, dict):
-            raise ValueError("expected json object")
-        return data
-
-    if last_err is not None:
-        raise RuntimeError("request failed") from last_err
-
-    raise RuntimeError("request failed")
+    policy = _policy(retries, retry_on_429, backoff_base, backoff_factor, backoff_jitter)
+    core = SdetAsyncHttpClient(_AsyncGet(client), sleep=sleep or asyncio.sleep)  # type: ignore[arg-type]
+    with _plain_errors():
+        return await core.get_json_dict(
+            path,
+            headers=_merge_headers(headers, trace_header, request_id),
+            timeout=timeout,
+            retry=policy,
+            hook=hook,
+            breaker=breaker,
+        )
 
 
 def fetch_json_list(
@@ -204,61 +211,20 @@ def fetch_json_list(
     backoff_factor: float = 2.0,
     backoff_jitter: float = 0.0,
     sleep: Callable[[float], None] | None = None,
+    hook: Hook | AsyncHook | None = None,
+    breaker: CircuitBreaker | None = None,
 ) -> list:
-    if retries < 1:
-        raise ValueError("retries must be >= 1")
-
-    hdrs = _merge_headers(headers, trace_header, request_id)
-    sleep_fn = sleep or time.sleep
-
-    last_err = None  # pragma: no mutate
-    for attempt in range(retries):
-        try:
-            if hdrs is None:
-                r = client.get(path, timeout=timeout)
-            else:
-                r = client.get(path, headers=hdrs, timeout=timeout)
-            last_err = None  # pragma: no mutate
-        except httpx.TimeoutException as e:
-            raise TimeoutError("request timed out") from e
-        except httpx.RequestError as e:
-            last_err = e
-            if attempt < retries - 1:
-                d = _backoff_delay(attempt, backoff_base, backoff_factor, backoff_jitter)
-                if d > 0:
-                    sleep_fn(d)
-                continue
-            r = None  # pragma: no mutate
-
-        if last_err is not None:
-            continue
-
-        if r is None:
-            continue
-
-        if r.status_code == 429 and retry_on_429 and attempt < retries - 1:
-            ra = _retry_after_seconds(r.headers)
-            d = (
-                ra
-                if ra is not None
-                else _backoff_delay(attempt, backoff_base, backoff_factor, backoff_jitter)
-            )
-            if d > 0:
-                sleep_fn(d)
-            continue
-
-        if r.status_code < 200 or r.status_code >= 300:
-            raise RuntimeError("non-2xx response")
-
-        data = r.json()
-        if not isinstance(data, list):
-            raise ValueError("expected json array")
-        return data
-
-    if last_err is not None:
-        raise RuntimeError("request failed") from last_err
-
-    raise RuntimeError("request failed")
+    policy = _policy(retries, retry_on_429, backoff_base, backoff_factor, backoff_jitter)
+    core = SdetHttpClient(_SyncGet(client), sleep=sleep or time.sleep)  # type: ignore[arg-type]
+    with _plain_errors():
+        return core.get_json_list(
+            path,
+            headers=_merge_headers(headers, trace_header, request_id),
+            timeout=timeout,
+            retry=policy,
+            hook=_sync_hook(hook),
+            breaker=breaker,
+        )
 
 
 async def fetch_json_list_async(
@@ -275,216 +241,20 @@ async def fetch_json_list_async(
     backoff_factor: float = 2.0,
     backoff_jitter: float = 0.0,
     sleep: Callable[[float], Awaitable[None]] | None = None,
+    hook: Hook | AsyncHook | None = None,
+    breaker: CircuitBreaker | None = None,
 ) -> list:
-    if retries < 1:
-        raise ValueError("retries must be >= 1")
-
-    hdrs = _merge_headers(headers, trace_header, request_id)
-    sleep_fn = sleep or asyncio.sleep
-
-    last_err = None  # pragma: no mutate
-    for attempt in range(retries):
-        try:
-            if hdrs is None:
-                r = await client.get(path, timeout=timeout)
-            else:
-                r = await client.get(path, headers=hdrs, timeout=timeout)
-            last_err = None  # pragma: no mutate
-        except httpx.TimeoutException as e:
-            raise TimeoutError("request timed out") from e
-        except httpx.RequestError as e:
-            last_err = e
-            if attempt < retries - 1:
-                d = _backoff_delay(attempt, backoff_base, backoff_factor, backoff_jitter)
-                if d > 0:
-                    await sleep_fn(d)
-                continue
-            r = None  # pragma: no mutate
-
-        if last_err is not None:
-            continue
-
-        if r is None:
-            continue
-
-        if r.status_code == 429 and retry_on_429 and attempt < retries - 1:
-            ra = _retry_after_seconds(r.headers)
-            d = (
-                ra
-                if ra is not None
-                else _backoff_delay(attempt, backoff_base, backoff_factor, backoff_jitter)
-            )
-            if d > 0:
-                await sleep_fn(d)
-            continue
-
-        if r.status_code < 200 or r.status_code >= 300:
-            raise RuntimeError("non-2xx response")
-
-        data = r.json()
-        if not isinstance(data, list):
-            raise ValueError("expected json array")
-        return data
-
-    if last_err is not None:
-        raise RuntimeError("request failed") from last_err
-
-    raise RuntimeError("request failed")
-
-
-def _link_next_url(r: httpx.Response) -> str | None:
-    link = r.headers.get("Link")
-    if not link:
-        return None
-
-    for part in (p.strip() for p in link.split(",")):
-        if "rel=" not in part:
-            continue
-        segs = [s.strip() for s in part.split(";")]
-        if not segs:
-            continue
-
-        u = segs[0]
-        if not (u.startswith("<") and ">" in u):
-            continue
-        url = u[1 : u.find(">")].strip()
-
-        rel = None
-        for s in segs[1:]:
-            if s.startswith("rel="):
-                rel = s[4:].strip()
-                if rel.startswith('"') and rel.endswith('"') and len(rel) >= 2:
-                    rel = rel[1:-1]
-                break
-
-        if rel == "next":
-            return str(urljoin(str(r.url), url))
-
-    return None
-
-
-def _fetch_json_list_response(
-    client: httpx.Client,
-    url: str,
-    retries: int,
-    *,
-    headers: dict[str, str] | None,
-    retry_on_429: bool,
-    backoff_base: float,
-    backoff_factor: float,
-    backoff_jitter: float,
-    timeout: float | httpx.Timeout | None,
-    sleep: Callable[[float], None] | None,
-) -> tuple[httpx.Response, list]:
-    sleep_fn = sleep or time.sleep
-    last_err = None  # pragma: no mutate
-
-    for attempt in range(retries):
-        try:
-            if headers is None:
-                r = client.get(url, timeout=timeout)
-            else:
-                r = client.get(url, headers=headers, timeout=timeout)
-            last_err = None  # pragma: no mutate
-        except httpx.TimeoutException as e:
-            raise TimeoutError("request timed out") from e
-        except httpx.RequestError as e:
-            last_err = e
-            if attempt < retries - 1:
-                d = _backoff_delay(attempt, backoff_base, backoff_factor, backoff_jitter)
-                if d > 0:
-                    sleep_fn(d)
-                continue
-            r = None  # pragma: no mutate
-
-        if last_err is not None or r is None:
-            continue
-
-        if r.status_code == 429 and retry_on_429 and attempt < retries - 1:
-            ra = _retry_after_seconds(r.headers)
-            d = (
-                ra
-                if ra is not None
-                else _backoff_delay(attempt, backoff_base, backoff_factor, backoff_jitter)
-            )
-            if d > 0:
-                sleep_fn(d)
-            continue
-
-        if r.status_code < 200 or r.status_code >= 300:
-            raise RuntimeError("non-2xx response")
-
-        data = r.json()
-        if not isinstance(data, list):
-            raise ValueError("expected json array")
-        return r, data
-
-    if last_err is not None:
-        raise RuntimeError("request failed") from last_err
-
-    raise RuntimeError("request failed")
-
-
-async def _fetch_json_list_response_async(
-    client: httpx.AsyncClient,
-    url: str,
-    retries: int,
-    *,
-    headers: dict[str, str] | None,
-    retry_on_429: bool,
-    backoff_base: float,
-    backoff_factor: float,
-    backoff_jitter: float,
-    timeout: float | httpx.Timeout | None,
-    sleep: Callable[[float], Awaitable[None]] | None,
-) -> tuple[httpx.Response, list]:
-    sleep_fn = sleep or asyncio.sleep
-    last_err = None  # pragma: no mutate
-
-    for attempt in range(retries):
-        try:
-            if headers is None:
-                r = await client.get(url, timeout=timeout)
-            else:
-                r = await client.get(url, headers=headers, timeout=timeout)
-            last_err = None  # pragma: no mutate
-        except httpx.TimeoutException as e:
-            raise TimeoutError("request timed out") from e
-        except httpx.RequestError as e:
-            last_err = e
-            if attempt < retries - 1:
-                d = _backoff_delay(attempt, backoff_base, backoff_factor, backoff_jitter)
-                if d > 0:
-                    await sleep_fn(d)
-                continue
-            r = None  # pragma: no mutate
-
-        if last_err is not None or r is None:
-            continue
-
-        if r.status_code == 429 and retry_on_429 and attempt < retries - 1:
-            ra = _retry_after_seconds(r.headers)
-            d = (
-                ra
-                if ra is not None
-                else _backoff_delay(attempt, backoff_base, backoff_factor, backoff_jitter)
-            )
-            if d > 0:
-                await sleep_fn(d)
-            continue
-
-        if r.status_code < 200 or r.status_code >= 300:
-            raise RuntimeError("non-2xx response")
-
-        data = r.json()
-        if not isinstance(data, list):
-            raise ValueError("expected json array")
-        return r, data
-
-    if last_err is not None:
-        raise RuntimeError("request failed") from last_err
-
-    raise RuntimeError("request failed")
+    policy = _policy(retries, retry_on_429, backoff_base, backoff_factor, backoff_jitter)
+    core = SdetAsyncHttpClient(_AsyncGet(client), sleep=sleep or asyncio.sleep)  # type: ignore[arg-type]
+    with _plain_errors():
+        return await core.get_json_list(
+            path,
+            headers=_merge_headers(headers, trace_header, request_id),
+            timeout=timeout,
+            retry=policy,
+            hook=hook,
+            breaker=breaker,
+        )
 
 
 def fetch_json_list_paginated(
@@ -502,46 +272,23 @@ def fetch_json_list_paginated(
     backoff_jitter: float = 0.0,
     timeout: float | httpx.Timeout | None = None,
     sleep: Callable[[float], None] | None = None,
+    hook: Hook | AsyncHook | None = None,
+    breaker: CircuitBreaker | None = None,
 ) -> list:
-    if retries < 1:
-        raise ValueError("retries must be >= 1")
+    policy = _policy(retries, retry_on_429, backoff_base, backoff_factor, backoff_jitter)
     if max_pages < 1:
         raise ValueError("max_pages must be >= 1")
-
-    rid = request_id
-    if trace_header is not None and rid is None:
-        rid = uuid.uuid4().hex
-    hdrs = _merge_headers(headers, trace_header, rid)
-
-    out: list = []
-    url = path
-    seen: set[str] = set()
-
-    for _ in range(max_pages):
-        r, page = _fetch_json_list_response(
-            client,
-            url,
-            retries,
-            headers=hdrs,
-            retry_on_429=retry_on_429,
-            backoff_base=backoff_base,
-            backoff_factor=backoff_factor,
-            backoff_jitter=backoff_jitter,
+    core = SdetHttpClient(_SyncGet(client), sleep=sleep or time.sleep)  # type: ignore[arg-type]
+    with _plain_errors():
+        return core.get_json_list_paginated(
+            path,
+            max_pages=max_pages,
+            headers=_trace_headers(headers, trace_header, request_id),
             timeout=timeout,
-            sleep=sleep,
+            retry=policy,
+            hook=_sync_hook(hook),
+            breaker=breaker,
         )
-        out.extend(page)
-
-        nxt = _link_next_url(r)
-        if not nxt:
-            return out
-
-        if nxt in seen:
-            raise RuntimeError("pagination impact")
-        seen.add(nxt)
-        url = nxt
-
-    raise RuntimeError("pagination limit exceeded")
 
 
 async def fetch_json_list_paginated_async(
@@ -559,43 +306,20 @@ async def fetch_json_list_paginated_async(
     backoff_jitter: float = 0.0,
     timeout: float | httpx.Timeout | None = None,
     sleep: Callable[[float], Awaitable[None]] | None = None,
+    hook: Hook | AsyncHook | None = None,
+    breaker: CircuitBreaker | None = None,
 ) -> list:
-    if retries < 1:
-        raise ValueError("retries must be >= 1")
+    policy = _policy(retries, retry_on_429, backoff_base, backoff_factor, backoff_jitter)
     if max_pages < 1:
         raise ValueError("max_pages must be >= 1")
-
-    rid = request_id
-    if trace_header is not None and rid is None:
-        rid = uuid.uuid4().hex
-    hdrs = _merge_headers(headers, trace_header, rid)
-
-    out: list = []
-    url = path
-    seen: set[str] = set()
-
-    for _ in range(max_pages):
-        r, page = await _fetch_json_list_response_async(
-            client,
-            url,
-            retries,
-            headers=hdrs,
-            retry_on_429=retry_on_429,
-            backoff_base=backoff_base,
-            backoff_factor=backoff_factor,
-            backoff_jitter=backoff_jitter,
+    core = SdetAsyncHttpClient(_AsyncGet(client), sleep=sleep or asyncio.sleep)  # type: ignore[arg-type]
+    with _plain_errors():
+        return await core.get_json_list_paginated(
+            path,
+            max_pages=max_pages,
+            headers=_trace_headers(headers, trace_header, request_id),
             timeout=timeout,
-            sleep=sleep,
+            retry=policy,
+            hook=hook,
+            breaker=breaker,
         )
-        out.extend(page)
-
-        nxt = _link_next_url(r)
-        if not nxt:
-            return out
-
-        if nxt in seen:
-            raise RuntimeError("pagination impact")
-        seen.add(nxt)
-        url = nxt
-
-    raise RuntimeError("pagination limit exceeded")
@@ -6,9 +6,11 @@ import json
 import os
 import shlex
 import sys
+import tempfile
 import traceback
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
+from typing import Any
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import httpx
@@ -16,10 +18,11 @@ import httpx
 from .atomicio import atomic_write_text
 from .netclient import (
     CircuitOpenError,
+    ClientEvent,
     HttpStatusError,
     RetryPolicy,
     SdetHttpClient,
-    _link_next_url,
+    _merge_headers,
 )
 from .security import (
     SecurityError,
@@ -127,6 +130,38 @@ def _die(msg: str) -> None:
     raise SystemExit(2)
 
 
+def _write_ndjson(
+    pages: Iterable[tuple[httpx.Response, list]],
+    ns: argparse.Namespace,
+    *,
+    on_page: Callable[[httpx.Response], None],
+) -> None:
+    """Stream items as NDJSON to stdout or ``--out`` (renamed into place at the end)."""
+    out_path = getattr(ns, "out", None)
+    if not out_path:
+        for resp, page in pages:
+            on_page(resp)
+            sys.stdout.write("".join(json.dumps(item, sort_keys=True) + "\n" for item in page))
+            sys.stdout.flush()
+        return
+
+    pp = safe_path(Path.cwd(), str(out_path), allow_absolute=True)
+    if pp.exists() and not ns.force:
+        _die("refusing to overwrite existing output file (use --force)")
+    pp.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=pp.name + ".", dir=str(pp.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            for resp, page in pages:
+                on_page(resp)
+                f.write("".join(json.dumps(item, sort_keys=True) + "\n" for item in page))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, pp)
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
 def _add_apiget_args(p: argparse.ArgumentParser) -> None:
     p.add_argument("url", help="Request URL.")
     p.add_argument(
@@ -160,11 +195,30 @@ def _add_apiget_args(p: argparse.ArgumentParser) -> None:
         help="Envelope mode only: key containing next URL or null (default: next).",
     )
     p.add_argument("--max-pages", type=int, default=100, help="Pagination page limit (>= 1).")
+    p.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="With --paginate, write one JSON item per line as each page arrives.",
+    )
+    p.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Decode a top-level JSON array response incrementally and write one item "
+            "per line as it arrives (bounded memory for very large arrays)."
+        ),
+    )
     p.add_argument(
         "--retries", type=int, default=1, help="Retry attempts for transient errors (>= 1)."
     )
     p.add_argument("--retry-429", action="store_true", help="Retry HTTP 429 responses.")
     p.add_argument("--timeout", type=float, default=None, help="Request timeout in seconds.")
+    p.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="Overall time budget in seconds across all retries (caps each attempt).",
+    )
     p.add_argument(
         "--allow-scheme",
         action="append",
@@ -245,6 +299,49 @@ def _add_apiget_args(p: argparse.ArgumentParser) -> None:
     p.add_argument(
         "--query", action="append", default=None, help="Add query param KEY=VALUE (repeatable)."
     )
+    p.add_argument(
+        "--cache",
+        default=None,
+        metavar="DIR",
+        help="Cache GET responses in DIR and revalidate them with ETag/Last-Modified.",
+    )
+    p.add_argument(
+        "--cache-max-mb", type=float, default=64.0, help="Size bound for --cache (LRU eviction)."
+    )
+    p.add_argument(
+        "--raw",
+        action="store_true",
+        help=(
+            "Stream the response body unmodified instead of decoding JSON; with --out, "
+            "interrupted downloads resume with Range requests."
+        ),
+    )
+    p.add_argument(
+        "--sha256", default=None, help="With --raw --out, verify the downloaded file checksum."
+    )
+    p.add_argument(
+        "--circuit-breaker",
+        nargs="?",
+        const=".sdetkit/circuit-breakers.sqlite3",
+        default=None,
+        metavar="DB",
+        help=(
+            "Share per-host circuit breaker state with other processes through DB "
+            "(default: .sdetkit/circuit-breakers.sqlite3)."
+        ),
+    )
+    p.add_argument(
+        "--breaker-threshold",
+        type=int,
+        default=5,
+        help="Consecutive failures that open --circuit-breaker.",
+    )
+    p.add_argument(
+        "--breaker-reset",
+        type=float,
+        default=30.0,
+        help="Seconds an open --circuit-breaker waits before a half-open probe.",
+    )
     p.add_argument("--out", default=None, help="Write JSON output to a file instead of stdout.")
     p.add_argument(
         "--force", action="store_true", help="Allow overwriting an existing output file."
@@ -462,8 +559,30 @@ def main(argv: Sequence[str] | None = None) -> int:
         _die("retries must be >= 1")
     if ns.max_pages < 1:
         _die("max_pages must be >= 1")
+    if ns.breaker_threshold < 1:
+        _die("breaker-threshold must be >= 1")
+    if ns.breaker_reset <= 0:
+        _die("breaker-reset must be > 0")
+    if ns.deadline is not None and ns.deadline <= 0:
+        _die("deadline must be > 0")
+    if ns.cache_max_mb <= 0:
+        _die("cache-max-mb must be > 0")
+    if ns.ndjson and not ns.paginate:
+        _die("ndjson requires --paginate")
+    if ns.raw and (ns.paginate or ns.cache):
+        _die("raw does not support --paginate or --cache")
+    if ns.raw and (ns.circuit_breaker or ns.deadline is not None):
+        _die("raw does not support --circuit-breaker or --deadline")
+    if ns.raw and (_req_method != "GET" or _req_content is not None or _req_json is not None):
+        _die("raw only supports GET without a request body")
+    if ns.sha256 is not None and not (ns.raw and ns.out):
+        _die("sha256 requires --raw --out")
     if ns.paginate and ns.expect == "dict":
         _die("paginate requires --expect list (or any)")
+    if ns.stream and (ns.paginate or ns.raw):
+        _die("stream does not support --paginate or --raw")
+    if ns.stream and ns.expect == "dict":
+        _die("stream requires --expect list (or any)")
     if ns.paginate and ns.paginate_mode == "envelope":
         if not str(ns.paginate_items_key).strip():
             _die("paginate-items-key must not be empty")
@@ -476,6 +595,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         backoff_base=0.5,
         backoff_factor=2.0,
         backoff_jitter=0.0,
+        deadline=ns.deadline,
     )
 
     try:
@@ -491,6 +611,19 @@ def main(argv: Sequence[str] | None = None) -> int:
                 cassette_mode,
                 upstream=upstream_transport,
                 allow_absolute=bool(ns.allow_absolute_path),
+                match=os.getenv("SDETKIT_CASSETTE_MATCH", "sequence"),
+            )
+        if ns.cache:
+            from .httpcache import CachingTransport, ResponseCache
+
+            cache_dir = safe_path(Path.cwd(), str(ns.cache), allow_absolute=True)
+            inner = (
+                transport
+                if transport is not None
+                else httpx.HTTPTransport(verify=not bool(ns.insecure))
+            )
+            transport = CachingTransport(
+                inner, ResponseCache(cache_dir, max_bytes=int(ns.cache_max_mb * 1024 * 1024))
             )
         _client_kwargs: dict[str, object] = {
             "timeout": default_http_timeout(ns.timeout),
@@ -539,8 +672,31 @@ def main(argv: Sequence[str] | None = None) -> int:
                     return resp
 
                 raw.request = _wrapped_request
+
+            def _cache_hook(ev: ClientEvent) -> None:
+                if ev.type == "attempt_response" and ev.cache_status is not None:
+                    sys.stderr.write(
+                        f"http cache: {ev.cache_status} "
+                        f"{redact_url(ev.url, enabled=ns.redact, keys=redaction_keys)}\n"
+                    )
+
+            breaker = None
+            if ns.circuit_breaker:
+                from .breakerstore import SharedCircuitBreaker
+
+                breaker = SharedCircuitBreaker.for_url(
+                    safe_path(Path.cwd(), str(ns.circuit_breaker), allow_absolute=True),
+                    str(ns.url),
+                    failure_threshold=ns.breaker_threshold,
+                    reset_seconds=ns.breaker_reset,
+                )
             c = SdetHttpClient(
-                raw, retry=pol, trace_header=ns.trace_header, allowed_schemes=allowed_schemes
+                raw,
+                retry=pol,
+                breaker=breaker,
+                trace_header=ns.trace_header,
+                allowed_schemes=allowed_schemes,
+                hook=_cache_hook if ns.cache and getattr(ns, "verbose", False) else None,
             )
 
             def _print_status_and_headers(resp: httpx.Response) -> None:
@@ -560,66 +716,129 @@ def main(argv: Sequence[str] | None = None) -> int:
 
             data: object
 
+            if ns.raw:
+                raw_headers, _ = _merge_headers(
+                    _req_headers or None, ns.trace_header, ns.request_id
+                )
+                out_path = getattr(ns, "out", None)
+                if out_path:
+                    from .httpdownload import download
+
+                    pp = safe_path(Path.cwd(), str(out_path), allow_absolute=True)
+                    if pp.exists() and not ns.force:
+                        _die("refusing to overwrite existing output file (use --force)")
+                    try:
+                        res = download(
+                            raw,
+                            str(ns.url),
+                            pp,
+                            headers=raw_headers,
+                            timeout=default_http_timeout(ns.timeout),
+                            retries=ns.retries,
+                            expected_sha256=ns.sha256,
+                            on_response=_print_status_and_headers,
+                        )
+                    except HttpStatusError as e:
+                        if getattr(ns, "fail", False) or getattr(ns, "fail_with_body", False):
+                            sys.stderr.write(f"http error: {e.status_code}\n")
+                            return 1
+                        raise
+                    if getattr(ns, "verbose", False):
+                        sys.stderr.write(
+                            f"download: {res.total_bytes} bytes sha256={res.sha256}"
+                            f" resumed_from={res.resumed_from}\n"
+                        )
+                    return 0
+
+                with raw.stream(
+                    "GET",
+                    str(ns.url),
+                    headers=raw_headers,
+                    timeout=default_http_timeout(ns.timeout),
+                ) as resp:
+                    _print_status_and_headers(resp)
+                    failing = getattr(ns, "fail", False) or getattr(ns, "fail_with_body", False)
+                    if failing and resp.status_code >= 400:
+                        if getattr(ns, "fail_with_body", False):
+                            sys.stdout.write(resp.read().decode("utf-8", errors="replace"))
+                        sys.stderr.write(f"http error: {resp.status_code}\n")
+                        return 1
+                    _check_status(resp)
+                    sink = getattr(sys.stdout, "buffer", None)
+                    for chunk in resp.iter_bytes():
+                        if sink is not None:
+                            sink.write(chunk)
+                        else:
+                            sys.stdout.write(chunk.decode("utf-8", errors="replace"))
+                    sys.stdout.flush()
+                return 0
+
+            if ns.stream:
+                from .jsonstream import JsonArrayDecoder
+
+                resp = c.request(
+                    _req_method,
+                    ns.url,
+                    headers=_req_headers or None,
+                    request_id=ns.request_id,
+                    content=_req_content,
+                    json=_req_json,
+                    timeout=ns.timeout,
+                    stream=True,
+                )
+                try:
+                    _print_status_and_headers(resp)
+                    failing = getattr(ns, "fail", False) or getattr(ns, "fail_with_body", False)
+                    if failing and resp.status_code >= 400:
+                        if getattr(ns, "fail_with_body", False):
+                            sys.stdout.write(resp.read().decode("utf-8", errors="replace"))
+                        sys.stderr.write(f"http error: {resp.status_code}\n")
+                        return 1
+                    _check_status(resp)
+                    decoder = JsonArrayDecoder()
+
+                    def _stream_pages() -> Iterable[tuple[httpx.Response, list]]:
+                        for chunk in resp.iter_bytes():
+                            yield resp, decoder.feed(chunk)
+                        yield resp, decoder.close()
+
+                    _write_ndjson(_stream_pages(), ns, on_page=lambda _resp: None)
+                finally:
+                    resp.close()
+                return 0
+
             if ns.paginate:
                 if getattr(ns, "dump_headers", False):
                     _die("dump-headers is not supported with --paginate")
 
-                if (
-                    getattr(ns, "print_status", False)
-                    and _req_method == "GET"
-                    and _req_content is None
-                    and _req_json is None
-                ):
-                    out: list = []
-                    seen: set[str] = set()
-                    cur = str(ns.url)
-
-                    for _ in range(int(ns.max_pages)):
-                        resp, page, _rid = c._request_json(
-                            cur,
-                            headers=_req_headers or None,
-                            request_id=ns.request_id,
-                            timeout=ns.timeout,
-                            retry=None,
-                            hook=None,
-                            breaker=None,
-                        )
-                        _print_status_and_headers(resp)
-                        if not isinstance(page, list):
-                            raise ValueError("expected list")
-                        out.extend(page)
-
-                        nxt = _link_next_url(resp)
-                        if not nxt:
-                            data = out
-                            break
-                        if nxt in seen:
-                            raise RuntimeError("pagination impact")
-                        seen.add(nxt)
-                        cur = nxt
-                    else:
-                        raise RuntimeError("pagination limit exceeded")
-
-                    data = out
+                page_kwargs: dict[str, Any] = {
+                    "max_pages": ns.max_pages,
+                    "headers": _req_headers or None,
+                    "request_id": ns.request_id,
+                    "timeout": ns.timeout,
+                    "retry": None,
+                    "hook": None,
+                    "breaker": None,
+                }
+                if ns.paginate_mode == "envelope":
+                    pages = c._iter_envelope_pages(
+                        str(ns.url),
+                        items_key=ns.paginate_items_key,
+                        next_key=ns.paginate_next_key,
+                        **page_kwargs,
+                    )
                 else:
-                    if ns.paginate_mode == "envelope":
-                        data = c.get_json_list_paginated_envelope(
-                            ns.url,
-                            items_key=ns.paginate_items_key,
-                            next_key=ns.paginate_next_key,
-                            max_pages=ns.max_pages,
-                            headers=_req_headers or None,
-                            request_id=ns.request_id,
-                            timeout=ns.timeout,
-                        )
-                    else:
-                        data = c.get_json_list_paginated(
-                            ns.url,
-                            max_pages=ns.max_pages,
-                            headers=_req_headers or None,
-                            request_id=ns.request_id,
-                            timeout=ns.timeout,
-                        )
+                    pages = c._iter_link_pages(str(ns.url), **page_kwargs)
+
+                if ns.ndjson:
+                    _write_ndjson(pages, ns, on_page=_print_status_and_headers)
+                    return 0
+
+                out: list = []
+                for resp, page in pages:
+                    _print_status_and_headers(resp)
+                    out.extend(page)
+                data = out
 
             else:
                 needs_raw = (
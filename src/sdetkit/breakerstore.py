@@ -0,0 +1,180 @@
+"""Circuit breaker state shared between processes through a small SQLite file.
+
+:class:`SharedCircuitBreaker` is a drop-in :class:`~sdetkit.netclient.CircuitBreaker`
+for one host whose failure count and open/half-open state live in a WAL-mode
+database (by default ``.sdetkit/circuit-breakers.sqlite3``). Many short-lived
+``sdetkit apiget`` processes pointed at the same file therefore trip the breaker
+once, together, instead of each paying full timeouts to rediscover an outage.
+
+Timestamps are wall-clock (``time.time``) because monotonic clocks are not
+comparable across processes; the ``now`` the clients pass in is ignored.
+Traffic to the file is bounded: ``allow`` answers from a per-process snapshot
+younger than ``read_interval`` seconds, successes on a closed breaker write
+nothing, and only one process at a time wins the half-open probe (an atomic
+claim that expires after ``reset_seconds`` if its owner dies mid-probe).
+``state`` reports the stored state, and ``on_transition`` fires for the state
+changes this process writes.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal
+
+from .netclient import CircuitBreaker, CircuitOpenError, _host_key
+
+DEFAULT_STORE = Path(".sdetkit") / "circuit-breakers.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS breakers (
+    host TEXT PRIMARY KEY,
+    failures INTEGER NOT NULL DEFAULT 0,
+    opened_at REAL,
+    probe_until REAL
+)
+"""
+
+
+class SharedCircuitBreaker(CircuitBreaker):
+    def __init__(
+        self,
+        path: Path,
+        host: str,
+        *,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        read_interval: float = 0.25,
+        clock: Callable[[], float] = time.time,
+        on_transition: Callable[[str, str], None] | None = None,
+    ):
+        super().__init__(
+            failure_threshold=failure_threshold,
+            reset_seconds=reset_seconds,
+            on_transition=on_transition,
+        )
+        self.path = Path(path)
+        self.host = host
+        self.read_interval = read_interval
+        self.writes = 0
+        self._wall = clock
+        self._probing = False
+        # read_at, failures, opened_at, probe_until
+        self._snapshot: tuple[float, int, float | None, float | None] | None = None
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(
+            str(self.path), timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+
+    @classmethod
+    def for_url(
+        cls,
+        path: Path,
+        url: str,
+        *,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+    ) -> SharedCircuitBreaker:
+        """Breaker for ``url``'s scheme+host+port."""
+        return cls(
+            path,
+            _host_key(url),
+            failure_threshold=failure_threshold,
+            reset_seconds=reset_seconds,
+        )
+
+    @property
+    def state(self) -> Literal["closed", "open", "half_open"]:
+        """State in the shared store, as of a snapshot at most ``read_interval`` old."""
+        now = self._wall()
+        with self._lock:
+            return self._state(now)
+
+    def _state(self, now: float) -> Literal["closed", "open", "half_open"]:
+        # Caller holds the lock.
+        _, opened, probe_until = self._read(now)
+        if opened is None:
+            return "closed"
+        if self._probing or (probe_until is not None and probe_until >= now):
+            return "half_open"
+        return "open"
+
+    def _moved(self, old: str) -> None:
+        # Reading the new state costs a query, so only do it for a listener.
+        if self.on_transition is not None:
+            super()._moved(old)
+
+    def _read(self, now: float) -> tuple[int, float | None, float | None]:
+        snap = self._snapshot
+        if snap is not None and now - snap[0] < self.read_interval:
+            return snap[1], snap[2], snap[3]
+        row = self._db.execute(
+            "SELECT failures, opened_at, probe_until FROM breakers WHERE host = ?", (self.host,)
+        ).fetchone()
+        failures, opened, probe_until = (int(row[0]), row[1], row[2]) if row else (0, None, None)
+        self._snapshot = (now, failures, opened, probe_until)
+        return failures, opened, probe_until
+
+    def _write(self, sql: str, params: tuple[object, ...]) -> int:
+        self.writes += 1
+        self._snapshot = None
+        return int(self._db.execute(sql, params).rowcount)
+
+    def allow(self, now: float) -> None:
+        now = self._wall()
+        with self._lock:
+            _, opened, _ = self._read(now)
+            if opened is None:
+                return
+            if now - opened < self.reset_seconds:
+                raise CircuitOpenError("circuit open")
+            claimed = self._write(
+                "UPDATE breakers SET probe_until = ? WHERE host = ? AND opened_at IS NOT NULL"
+                " AND (probe_until IS NULL OR probe_until < ?)",
+                (now + self.reset_seconds, self.host, now),
+            )
+            if not claimed:
+                raise CircuitOpenError("circuit open")
+            self._probing = True
+        self._moved("open")
+
+    def record_success(self) -> None:
+        now = self._wall()
+        with self._lock:
+            old = self._state(now)
+            failures, opened, _ = self._read(now)
+            probing, self._probing = self._probing, False
+            if not probing and failures == 0 and opened is None:
+                return
+            self._write("DELETE FROM breakers WHERE host = ?", (self.host,))
+        self._moved(old)
+
+    def record_failure(self, now: float) -> None:
+        now = self._wall()
+        with self._lock:
+            old = self._state(now)
+            if self._probing:
+                self._probing = False
+                self._write(
+                    "UPDATE breakers SET opened_at = ?, probe_until = NULL WHERE host = ?",
+                    (now, self.host),
+                )
+            else:
+                self._write(
+                    "INSERT INTO breakers (host, failures, opened_at)"
+                    " VALUES (?, 1, CASE WHEN 1 >= ? THEN ? END)"
+                    " ON CONFLICT(host) DO UPDATE SET failures = failures + 1,"
+                    " opened_at = CASE WHEN opened_at IS NULL AND failures + 1 >= ? THEN ?"
+                    " ELSE opened_at END",
+                    (self.host, self.failure_threshold, now, self.failure_threshold, now),
+                )
+        self._moved(old)
+
+    def close(self) -> None:
+        self._db.close()
@@ -1,15 +1,32 @@
 from __future__ import annotations
 
 import base64
+import binascii
+import gzip
+import hashlib
+import importlib
 import json
-from dataclasses import dataclass
+import os
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+from urllib.parse import urlencode
 
 import httpx
 
+from .atomicio import atomic_write_bytes
 from .security import safe_path
 
+FORMAT_VERSIONS = (1, 2)
+
+_BODY_CACHE_BYTES = 16 * 1024 * 1024  # replay memory stays flat however large the cassette
+
+NDJSON_SUFFIX = ".ndjson"
+_NDJSON_FORMAT = "sdetkit-cassette-ndjson"
+
 
 def _b64e(b: bytes) -> str:
     if not b:
@@ -23,6 +40,113 @@ def _b64d(s: str) -> bytes:
     return base64.b64decode(s.encode("ascii"))
 
 
+def _digest(b: bytes) -> str:
+    return hashlib.sha256(b).hexdigest() if b else ""
+
+
+def _zstd() -> Any:
+    try:
+        return importlib.import_module("zstandard")
+    except ImportError:
+        return None
+
+
+class _BodyStore:
+    """Content-addressed body blobs: ``<sha256>.zst`` when ``zstandard`` is
+    installed, ``<sha256>.gz`` otherwise. Either is read back regardless."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._cache: OrderedDict[str, bytes] = OrderedDict()  # recorded suites repeat bodies
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+
+    def _find(self, sha: str) -> Path | None:
+        for suffix in (".zst", ".gz"):
+            p = self.root / f"{sha}{suffix}"
+            if p.is_file():
+                return p
+        return None
+
+    def read(self, sha: str) -> bytes:
+        if not sha:
+            return b""
+        with self._lock:
+            hit = self._cache.get(sha)
+            if hit is not None:
+                self._cache.move_to_end(sha)
+                return hit
+        data = self._read(sha)
+        if len(data) <= _BODY_CACHE_BYTES // 4:
+            with self._lock:
+                if sha not in self._cache:
+                    self._cache[sha] = data
+                    self._cached_bytes += len(data)
+                while self._cached_bytes > _BODY_CACHE_BYTES:
+                    self._cached_bytes -= len(self._cache.popitem(last=False)[1])
+        return data
+
+    def _read(self, sha: str) -> bytes:
+        p = self._find(sha) if len(sha) == 64 and sha.isalnum() else None
+        if p is None:
+            raise RuntimeError(f"cassette body {sha[:12]} missing from {self.root.name}")
+        data = p.read_bytes()
+        if p.suffix == ".gz":
+            return gzip.decompress(data)
+        zstd = _zstd()
+        if zstd is None:
+            raise RuntimeError("cassette body is zstd-compressed; install zstandard to read it")
+        return bytes(zstd.ZstdDecompressor().decompressobj().decompress(data))
+
+    def verify(self, sha: str) -> None:
+        """Decompress blob ``sha`` in chunks and check its digest; nothing is cached.
+
+        Raises ``RuntimeError`` if the blob is missing, unreadable or corrupt.
+        """
+        p = self._find(sha) if len(sha) == 64 and sha.isalnum() else None
+        if p is None:
+            raise RuntimeError(f"cassette body {sha[:12]} missing from {self.root.name}")
+        errors: tuple[type[BaseException], ...] = (OSError, EOFError, ValueError)
+        zstd = None
+        if p.suffix == ".zst":
+            zstd = _zstd()
+            if zstd is None:
+                raise RuntimeError("cassette body is zstd-compressed; install zstandard to read it")
+            errors = (*errors, zstd.ZstdError)
+        h = hashlib.sha256()
+        try:
+            with p.open("rb") as raw:
+                reader: Any = (
+                    gzip.GzipFile(fileobj=raw)
+                    if zstd is None
+                    else zstd.ZstdDecompressor().stream_reader(raw)
+                )
+                with reader:
+                    while chunk := reader.read(1 << 16):
+                        h.update(chunk)
+        except errors as exc:
+            raise RuntimeError(f"cassette body {sha[:12]} is unreadable: {exc}") from exc
+        if h.hexdigest() != sha:
+            raise RuntimeError(f"cassette body {sha[:12]} does not match its digest")
+
+    def write(self, data: bytes) -> str:
+        sha = _digest(data)
+        if sha and self._find(sha) is None:
+            zstd = _zstd()
+            if zstd is not None:
+                atomic_write_bytes(self.root / f"{sha}.zst", zstd.ZstdCompressor().compress(data))
+            else:
+                atomic_write_bytes(
+                    self.root / f"{sha}.gz", gzip.compress(data, compresslevel=6, mtime=0)
+                )
+        return sha
+
+    def prune(self, keep: set[str]) -> None:
+        for p in self.root.glob("*"):
+            if p.suffix in (".zst", ".gz") and p.stem not in keep:
+                p.unlink(missing_ok=True)
+
+
 def _headers_to_list(h: httpx.Headers) -> list[list[str]]:
     return [[k, v] for k, v in h.multi_items()]
 
@@ -42,42 +166,244 @@ def _headers_from_list(items: list[list[str]]) -> list[tuple[str, str]]:
 class _Key:
     method: str
     url: str
-    body_b64: str
+    body: str  # sha256 of the body bytes, "" when empty
+    headers: tuple[tuple[str, str], ...] = ()
+
+
+MATCH_MODES = ("sequence", "indexed")
+
+# Headers that differ between otherwise identical runs (or are set by httpx itself).
+DEFAULT_IGNORED_HEADERS = frozenset(
+    {
+        "accept",
+        "accept-encoding",
+        "authorization",
+        "connection",
+        "content-length",
+        "cookie",
+        "date",
+        "host",
+        "user-agent",
+        "x-request-id",
+        "x-trace",
+        "x-trace-id",
+    }
+)
+
+
+@dataclass(frozen=True)
+class Matcher:
+    """How ``match="indexed"`` replay normalizes requests before looking them up.
+
+    Method, URL and body always take part. ``ignore_query_order`` compares
+    query strings as sorted parameter lists and ``ignore_query_params`` drops
+    volatile ones (nonces, timestamps). ``ignore_origin`` matches on path and
+    query alone, for requests replayed against another host. Request headers
+    only count when ``match_headers`` is set, and then without ``ignore_headers``.
+    """
+
+    ignore_query_order: bool = True
+    ignore_query_params: frozenset[str] = frozenset()
+    match_headers: bool = False
+    ignore_headers: frozenset[str] = field(default=DEFAULT_IGNORED_HEADERS)
+    ignore_origin: bool = False
+
+    def url(self, url: str) -> str:
+        u = httpx.URL(url)
+        if self.ignore_origin:
+            u = u.copy_with(scheme="http", host="origin", port=None)
+        params = [(k, v) for k, v in u.params.multi_items() if k not in self.ignore_query_params]
+        if not self.ignore_query_order and not self.ignore_query_params:
+            return str(u)
+        if self.ignore_query_order:
+            params.sort()
+        return str(u.copy_with(query=urlencode(params).encode("ascii") if params else None))
+
+    def key(self, method: str, url: str, body: str, headers: list[tuple[str, str]]) -> _Key:
+        hdrs: tuple[tuple[str, str], ...] = ()
+        if self.match_headers:
+            ignored = {h.lower() for h in self.ignore_headers}
+            hdrs = tuple(sorted((k.lower(), v) for k, v in headers if k.lower() not in ignored))
+        return _Key(method.upper(), self.url(url), body, hdrs)
 
 
 class Cassette:
-    def __init__(self, interactions: list[dict[str, Any]] | None = None) -> None:
+    """Recorded HTTP interactions.
+
+    Version 1 files inline every body as base64. Version 2 files (the default
+    for :meth:`save`) keep only a ``body_sha256`` reference per request and
+    response; the bodies live once each, compressed, in a side directory
+    (``<name>.bodies`` next to the cassette) and are read on first use.
+    Both versions load transparently, and so do ``*.ndjson`` cassettes written
+    by :class:`CassetteStream`.
+    """
+
+    def __init__(
+        self,
+        interactions: list[dict[str, Any]] | None = None,
+        *,
+        bodies: Path | None = None,
+    ) -> None:
         self.interactions: list[dict[str, Any]] = interactions or []
+        self._store = _BodyStore(bodies) if bodies is not None else None
+
+    @staticmethod
+    def body_store_path(path: Path) -> Path:
+        return path.with_name(path.stem + ".bodies")
+
+    def body(self, part: dict[str, Any]) -> bytes:
+        """Body bytes of a recorded request or response, whichever version it came from."""
+        sha = part.get("body_sha256")
+        if isinstance(sha, str):
+            if self._store is None:
+                if sha:
+                    raise RuntimeError("cassette body reference without a body store")
+                return b""
+            return self._store.read(sha)
+        b64 = part.get("body_b64", "")
+        if not isinstance(b64, str):
+            raise RuntimeError("cassette mismatch: invalid body")
+        return _b64d(b64)
+
+    def verify_body(self, part: dict[str, Any]) -> None:
+        """Check that a recorded body decodes, without keeping it; ``RuntimeError`` if not."""
+        if "body_sha256" in part:
+            sha = part["body_sha256"]
+            if not isinstance(sha, str):
+                raise RuntimeError("cassette mismatch: invalid body reference")
+            if not sha:
+                return
+            if self._store is None:
+                raise RuntimeError("cassette body reference without a body store")
+            self._store.verify(sha)
+            return
+        b64 = part.get("body_b64", "")
+        if not isinstance(b64, str):
+            raise RuntimeError("cassette mismatch: invalid body")
+        try:
+            base64.b64decode(b64, validate=True)
+        except (binascii.Error, ValueError) as exc:
+            raise RuntimeError("cassette body is not valid base64") from exc
+
+    def body_id(self, part: dict[str, Any]) -> str:
+        """sha256 of a recorded body without reading version 2 blobs."""
+        sha = part.get("body_sha256")
+        if isinstance(sha, str):
+            return sha
+        b64 = part.get("body_b64", "")
+        if not isinstance(b64, str):
+            return ""
+        try:
+            return _digest(_b64d(b64))
+        except (binascii.Error, ValueError):
+            return "invalid:" + b64
 
-    def to_json(self) -> dict[str, Any]:
-        return {"version": 1, "interactions": self.interactions}
+    def _inline(self, part: Any) -> Any:
+        if not isinstance(part, dict) or "body_sha256" not in part:
+            return part
+        out = {k: v for k, v in part.items() if k != "body_sha256"}
+        out["body_b64"] = _b64e(self.body(part))
+        return out
 
-    def save(self, path: str | Path, *, allow_absolute: bool = False) -> None:
+    def to_json(self) -> dict[str, Any]:
+        if self._store is None:
+            return {"version": 1, "interactions": self.interactions}
+        return {
+            "version": 1,
+            "interactions": [
+                {k: self._inline(v) if k in ("request", "response") else v for k, v in it.items()}
+                for it in self.interactions
+            ],
+        }
+
+    def _by_ref(self, it: dict[str, Any], store: _BodyStore, keep: set[str]) -> dict[str, Any]:
+        row = dict(it)
+        for k in ("request", "response"):
+            part = it.get(k)
+            if isinstance(part, dict):
+                ref = {n: v for n, v in part.items() if n not in ("body_b64", "body_sha256")}
+                ref["body_sha256"] = store.write(self.body(part))
+                keep.add(ref["body_sha256"])
+                row[k] = ref
+        return row
+
+    def _to_v2(self, store: _BodyStore, keep: set[str]) -> dict[str, Any]:
+        out = [self._by_ref(it, store, keep) for it in self.interactions]
+        return {"version": 2, "bodies": store.root.name, "interactions": out}
+
+    def save(self, path: str | Path, *, allow_absolute: bool = False, version: int = 2) -> None:
+        if version not in FORMAT_VERSIONS:
+            raise ValueError("cassette version must be 1 or 2")
         p = safe_path(Path.cwd(), str(path), allow_absolute=allow_absolute)
         p.parent.mkdir(parents=True, exist_ok=True)
+        if p.suffix == NDJSON_SUFFIX:
+            with CassetteStream(p, allow_absolute=True) as stream:
+                for it in self.interactions:
+                    stream.write(self._by_ref(it, stream.store, stream.keep))
+            return
+        if version == 1:
+            payload = self.to_json()
+        else:
+            store = _BodyStore(self.body_store_path(p))
+            store.root.mkdir(parents=True, exist_ok=True)
+            keep: set[str] = set()
+            payload = self._to_v2(store, keep)
+            store.prune(keep)
         p.write_text(
-            json.dumps(self.to_json(), ensure_ascii=True, sort_keys=True, indent=2) + "\n",
+            json.dumps(payload, ensure_ascii=True, sort_keys=True, indent=2) + "\n",
             encoding="utf-8",
         )
 
     @classmethod
     def load(cls, path: str | Path, *, allow_absolute: bool = False) -> Cassette:
         p = safe_path(Path.cwd(), str(path), allow_absolute=allow_absolute)
-        data = json.loads(p.read_text(encoding="utf-8"))
+        bodies, items = cls.iter_index(p)
+        return cls([it for it in items if isinstance(it, dict)], bodies=bodies)
+
+    @classmethod
+    def iter_index(
+        cls, p: Path, *, object_pairs_hook: Callable[[list[tuple[str, Any]]], Any] | None = None
+    ) -> tuple[Path | None, Iterator[Any]]:
+        """Body store (``None`` for version 1) and raw interaction entries of ``p``.
+
+        Bodies are never read. ``*.ndjson`` cassettes are read one line at a
+        time as the iterator advances; a final line without its newline is what
+        a killed recorder leaves behind, so it is dropped instead of failing the
+        whole cassette. JSON cassettes parse their index up front, which for
+        version 2 holds no bodies. Malformed files raise ``ValueError``.
+        """
+        bodies: Path | None
+        if p.suffix == NDJSON_SUFFIX:
+            f = p.open(encoding="utf-8")
+            try:
+                header = _ndjson_line(f.readline(), 1, object_pairs_hook)
+                if not isinstance(header, dict) or header.get("format") != _NDJSON_FORMAT:
+                    raise ValueError("invalid cassette: missing ndjson header")
+                bodies = cls._sibling(p, header.get("bodies"))
+            except BaseException:
+                f.close()
+                raise
+            return bodies, _ndjson_items(f, object_pairs_hook)
+        data = json.loads(p.read_text(encoding="utf-8"), object_pairs_hook=object_pairs_hook)
         if not isinstance(data, dict):
             raise ValueError("invalid cassette: expected object")
         inter = data.get("interactions")
         if not isinstance(inter, list):
             raise ValueError("invalid cassette: expected interactions list")
-        out: list[dict[str, Any]] = []
-        for it in inter:
-            if isinstance(it, dict):
-                out.append(it)
-        return cls(out)
+        bodies = cls._sibling(p, data.get("bodies")) if data.get("version") == 2 else None
+        return bodies, iter(inter)
+
+    @classmethod
+    def _sibling(cls, p: Path, name: object) -> Path:
+        if name is None:
+            return cls.body_store_path(p)
+        if isinstance(name, str) and name and Path(name).name == name and name != "..":
+            return p.parent / name
+        raise ValueError("invalid cassette: bodies must name a sibling directory")
 
     def _key_for_request(self, req: httpx.Request) -> _Key:
         body = req.content if isinstance(req.content, bytes | bytearray) else b""
-        return _Key(req.method.upper(), str(req.url), _b64e(bytes(body)))
+        return _Key(req.method.upper(), str(req.url), _digest(bytes(body)))
 
     def append(self, req: httpx.Request, resp: httpx.Response, body: bytes) -> None:
         self.interactions.append(
@@ -99,10 +425,137 @@ class Cassette:
         )
 
 
-class CassetteReplayTransport(httpx.BaseTransport):
-    def __init__(self, cassette: Cassette) -> None:
+def _ndjson_line(line: str, n: int, hook: Callable[..., Any] | None = None) -> Any:
+    try:
+        return json.loads(line, object_pairs_hook=hook)
+    except ValueError as e:
+        raise ValueError(f"invalid cassette: bad ndjson line {n}") from e
+
+
+def _ndjson_items(f: TextIO, hook: Callable[..., Any] | None) -> Iterator[Any]:
+    with f:
+        for n, line in enumerate(f, start=2):
+            if not line.endswith("\n"):
+                try:
+                    yield json.loads(line, object_pairs_hook=hook)
+                except ValueError:
+                    pass
+                return
+            yield _ndjson_line(line, n, hook)
+
+
+class CassetteStream:
+    """Append-only NDJSON cassette recorder (``*.ndjson``).
+
+    Every interaction is flushed as one line the moment it completes, with its
+    bodies already in the ``<name>.bodies`` store, so memory does not grow
+    with the recording and a killed process keeps everything recorded so far.
+    Pass it to the record transports in place of a :class:`Cassette`.
+    """
+
+    def __init__(self, path: str | Path, *, allow_absolute: bool = False) -> None:
+        self.path = safe_path(Path.cwd(), str(path), allow_absolute=allow_absolute)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.store = _BodyStore(Cassette.body_store_path(self.path))
+        self.store.root.mkdir(parents=True, exist_ok=True)
+        self.keep: set[str] = set()
+        self.recorded = 0
+        self._lock = threading.Lock()
+        self._f = self.path.open("w", encoding="utf-8")
+        header = {"bodies": self.store.root.name, "format": _NDJSON_FORMAT, "version": 1}
+        self._f.write(json.dumps(header, sort_keys=True) + "\n")
+        self._f.flush()
+
+    def __enter__(self) -> CassetteStream:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def write(self, interaction: dict[str, Any]) -> None:
+        line = json.dumps(interaction, ensure_ascii=True, sort_keys=True) + "\n"
+        with self._lock:
+            self._f.write(line)
+            self._f.flush()
+            self.recorded += 1
+
+    def append(self, req: httpx.Request, resp: httpx.Response, body: bytes) -> None:
+        content = req.content if isinstance(req.content, bytes | bytearray) else b""
+        req_sha = self.store.write(bytes(content))
+        resp_sha = self.store.write(body)
+        with self._lock:
+            self.keep.update((req_sha, resp_sha))
+        self.write(
+            {
+                "request": {
+                    "method": req.method.upper(),
+                    "url": str(req.url),
+                    "headers": _headers_to_list(req.headers),
+                    "body_sha256": req_sha,
+                },
+                "response": {
+                    "status_code": int(resp.status_code),
+                    "headers": _headers_to_list(resp.headers),
+                    "body_sha256": resp_sha,
+                },
+            }
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._f.closed:
+                return
+            os.fsync(self._f.fileno())
+            self._f.close()
+        self.store.prune(self.keep)
+
+
+class _Replay:
+    """Shared lookup for the sync and async replay transports.
+
+    ``match="sequence"`` (the default) plays interactions strictly in recorded
+    order. ``match="indexed"`` hashes each recorded request through ``matcher``
+    into a queue per key, so lookups are O(1) and requests may arrive in any
+    order or concurrently; identical requests get their responses in recorded
+    order. With ``cycle=True`` (indexed only) each key starts over after its
+    last response instead of running dry, for long-lived mock servers.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        *,
+        match: str = "sequence",
+        matcher: Matcher | None = None,
+        cycle: bool = False,
+    ) -> None:
+        if match not in MATCH_MODES:
+            raise ValueError("cassette match must be one of: sequence, indexed")
         self._cassette = cassette
+        self._match = match
+        self._matcher = matcher or Matcher()
+        self._cycle = cycle
         self._i = 0
+        self._lock = threading.Lock()
+        self._index: dict[_Key, deque[dict[str, Any]]] | None = None
+        if match == "indexed":
+            self._index = {}
+            for it in cassette.interactions:
+                rreq = it.get("request")
+                if not isinstance(rreq, dict):
+                    raise RuntimeError("cassette mismatch: invalid interaction shape")
+                self._index.setdefault(self._recorded_key(rreq), deque()).append(it)
+
+    def _recorded_key(self, rreq: dict[str, Any]) -> _Key:
+        method = rreq.get("method")
+        url = rreq.get("url")
+        hdrs = rreq.get("headers")
+        return self._matcher.key(
+            str(method) if isinstance(method, str) else "",
+            str(url) if isinstance(url, str) else "",
+            self._cassette.body_id(rreq),
+            _headers_from_list(hdrs) if isinstance(hdrs, list) else [],
+        )
 
     def assert_exhausted(self) -> None:
         if self._i != len(self._cassette.interactions):
@@ -110,28 +563,43 @@ class CassetteReplayTransport(httpx.BaseTransport):
                 f"cassette not exhausted: played={self._i} total={len(self._cassette.interactions)}"
             )
 
-    def close(self) -> None:
-        self.assert_exhausted()
-
-    def handle_request(self, request: httpx.Request) -> httpx.Response:
-        if self._i >= len(self._cassette.interactions):
-            raise RuntimeError("cassette mismatch: no more recorded interactions")
-
-        it = self._cassette.interactions[self._i]
-        self._i += 1
+    def _next(self, request: httpx.Request) -> dict[str, Any]:
+        if self._index is not None:
+            body = request.content if isinstance(request.content, bytes | bytearray) else b""
+            key = self._matcher.key(
+                request.method,
+                str(request.url),
+                _digest(bytes(body)),
+                list(request.headers.multi_items()),
+            )
+            with self._lock:
+                queue = self._index.get(key)
+                if not queue:
+                    raise RuntimeError(
+                        f"cassette mismatch: no recorded interaction for {key.method} {key.url}"
+                    )
+                self._i += 1
+                it = queue.popleft()
+                if self._cycle:
+                    queue.append(it)
+                return it
+
+        with self._lock:
+            if self._i >= len(self._cassette.interactions):
+                raise RuntimeError("cassette mismatch: no more recorded interactions")
+            it = self._cassette.interactions[self._i]
+            self._i += 1
 
         rreq = it.get("request")
-        rresp = it.get("response")
-        if not isinstance(rreq, dict) or not isinstance(rresp, dict):
+        if not isinstance(rreq, dict) or not isinstance(it.get("response"), dict):
             raise RuntimeError("cassette mismatch: invalid interaction shape")
 
         method = rreq.get("method")
         url = rreq.get("url")
-        body_b64 = rreq.get("body_b64", "")
         key_expected = _Key(
             str(method).upper() if isinstance(method, str) else "",
             str(url) if isinstance(url, str) else "",
-            str(body_b64) if isinstance(body_b64, str) else "",
+            self._cassette.body_id(rreq),
         )
         key_got = self._cassette._key_for_request(request)
 
@@ -139,25 +607,39 @@ class CassetteReplayTransport(httpx.BaseTransport):
             raise RuntimeError(
                 f"cassette mismatch: expected {key_expected.method} {key_expected.url} got {key_got.method} {key_got.url}"
             )
+        return it
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        rresp = self._next(request).get("response")
+        if not isinstance(rresp, dict):
+            raise RuntimeError("cassette mismatch: invalid interaction shape")
 
         status = rresp.get("status_code")
         hdrs = rresp.get("headers")
-        body = rresp.get("body_b64", "")
+        body = rresp.get("body_sha256", rresp.get("body_b64", ""))
         if not isinstance(status, int) or not isinstance(hdrs, list) or not isinstance(body, str):
             raise RuntimeError("cassette mismatch: invalid response shape")
 
         return httpx.Response(
             status_code=status,
             headers=_headers_from_list(hdrs),
-            content=_b64d(body),
+            content=self._cassette.body(rresp),
             request=request,
         )
 
 
+class CassetteReplayTransport(_Replay, httpx.BaseTransport):
+    def close(self) -> None:
+        self.assert_exhausted()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
+
+
 class CassetteRecordTransport(httpx.BaseTransport):
     def __init__(
         self,
-        cassette: Cassette,
+        cassette: Cassette | CassetteStream,
         inner: httpx.BaseTransport,
         *,
         path: str | Path | None = None,
@@ -176,71 +658,26 @@ class CassetteRecordTransport(httpx.BaseTransport):
 
     def close(self) -> None:
         try:
-            if self._path is not None and self._cassette.interactions:
+            if isinstance(self._cassette, CassetteStream):
+                self._cassette.close()
+            elif self._path is not None and self._cassette.interactions:
                 self._cassette.save(self._path, allow_absolute=self._allow_absolute)
         finally:
             self._inner.close()
 
 
-class AsyncCassetteReplayTransport(httpx.AsyncBaseTransport):
-    def __init__(self, cassette: Cassette) -> None:
-        self._cassette = cassette
-        self._i = 0
-
-    def assert_exhausted(self) -> None:
-        if self._i != len(self._cassette.interactions):
-            raise AssertionError(
-                f"cassette not exhausted: played={self._i} total={len(self._cassette.interactions)}"
-            )
-
+class AsyncCassetteReplayTransport(_Replay, httpx.AsyncBaseTransport):
     async def aclose(self) -> None:
         self.assert_exhausted()
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
-        if self._i >= len(self._cassette.interactions):
-            raise RuntimeError("cassette mismatch: no more recorded interactions")
-
-        it = self._cassette.interactions[self._i]
-        self._i += 1
-
-        rreq = it.get("request")
-        rresp = it.get("response")
-        if not isinstance(rreq, dict) or not isinstance(rresp, dict):
-            raise RuntimeError("cassette mismatch: invalid interaction shape")
-
-        method = rreq.get("method")
-        url = rreq.get("url")
-        body_b64 = rreq.get("body_b64", "")
-        key_expected = _Key(
-            str(method).upper() if isinstance(method, str) else "",
-            str(url) if isinstance(url, str) else "",
-            str(body_b64) if isinstance(body_b64, str) else "",
-        )
-        key_got = self._cassette._key_for_request(request)
-
-        if key_expected != key_got:
-            raise RuntimeError(
-                f"cassette mismatch: expected {key_expected.method} {key_expected.url} got {key_got.method} {key_got.url}"
-            )
-
-        status = rresp.get("status_code")
-        hdrs = rresp.get("headers")
-        body = rresp.get("body_b64", "")
-        if not isinstance(status, int) or not isinstance(hdrs, list) or not isinstance(body, str):
-            raise RuntimeError("cassette mismatch: invalid response shape")
-
-        return httpx.Response(
-            status_code=status,
-            headers=_headers_from_list(hdrs),
-            content=_b64d(body),
-            request=request,
-        )
+        return self._respond(request)
 
 
 class AsyncCassetteRecordTransport(httpx.AsyncBaseTransport):
     def __init__(
         self,
-        cassette: Cassette,
+        cassette: Cassette | CassetteStream,
         inner: httpx.AsyncBaseTransport,
         *,
         path: str | Path | None = None,
@@ -259,7 +696,9 @@ class AsyncCassetteRecordTransport(httpx.AsyncBaseTransport):
 
     async def aclose(self) -> None:
         try:
-            if self._path is not None and self._cassette.interactions:
+            if isinstance(self._cassette, CassetteStream):
+                self._cassette.close()
+            elif self._path is not None and self._cassette.interactions:
                 self._cassette.save(self._path, allow_absolute=self._allow_absolute)
         finally:
             await self._inner.aclose()
@@ -271,6 +710,8 @@ def open_transport(
     *,
     upstream: httpx.BaseTransport | None = None,
     allow_absolute: bool = False,
+    match: str = "sequence",
+    matcher: Matcher | None = None,
 ) -> httpx.BaseTransport:
     p = safe_path(Path.cwd(), str(path), allow_absolute=allow_absolute)
     m = mode.lower().strip()
@@ -279,13 +720,17 @@ def open_transport(
         m = "replay" if p.exists() else "record"
     if m not in {"record", "replay"}:
         raise ValueError("cassette mode must be one of: auto, record, replay")
+    if match not in MATCH_MODES:
+        raise ValueError("cassette match must be one of: sequence, indexed")
 
     if m == "replay":
         if not p.exists():
             raise RuntimeError("cassette not found")
         cassette = Cassette.load(p, allow_absolute=True)
-        return CassetteReplayTransport(cassette)
+        return CassetteReplayTransport(cassette, match=match, matcher=matcher)
 
-    cassette = Cassette([])
     inner = upstream if upstream is not None else httpx.HTTPTransport()
+    if p.suffix == NDJSON_SUFFIX:
+        return CassetteRecordTransport(CassetteStream(p, allow_absolute=True), inner)
+    cassette = Cassette([])
     return CassetteRecordTransport(cassette, inner, path=p, allow_absolute=True)
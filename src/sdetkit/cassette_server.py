@@ -0,0 +1,221 @@
+"""``sdetkit cassette serve``: recorded interactions over plain local HTTP.
+
+Any client, not just Python ones using the replay transports, can then run
+against a cassette. Lookups use indexed matching with the origin ignored
+(requests come in for ``127.0.0.1:<port>``, not the recorded host). Each key
+cycles through its recorded responses, so a load test can go on indefinitely.
+Optional faults make the mock realistic: fixed latency plus jitter, a
+probability of answering ``503`` instead, and a per-response throughput cap.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, NoReturn
+
+import httpx
+
+from .cassette import Cassette, CassetteReplayTransport, Matcher
+from .security import SecurityError, safe_path
+
+# Not forwarded: the body is re-sent decoded and framed by this server.
+_DROP_HEADERS = frozenset(
+    {"connection", "content-encoding", "content-length", "keep-alive", "transfer-encoding"}
+)
+_CHUNK = 16 * 1024
+
+
+def _die(msg: str) -> NoReturn:
+    sys.stderr.write(msg.rstrip() + "\n")
+    raise SystemExit(2)
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    throughput_kbps: float = 0.0  # KiB/s; 0 means uncapped
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.latency_ms < 0 or self.jitter_ms < 0:
+            raise ValueError("latency and jitter must be >= 0")
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError("error rate must be between 0 and 1")
+        if self.throughput_kbps < 0:
+            raise ValueError("throughput must be >= 0")
+
+
+class CassetteServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        transport: CassetteReplayTransport,
+        faults: FaultProfile,
+        address: tuple[str, int] = ("127.0.0.1", 0),
+    ) -> None:
+        self.transport = transport
+        self.faults = faults
+        self.served = 0
+        self._rnd = random.Random(faults.seed)
+        self._lock = threading.Lock()
+        super().__init__(address, _CassetteHandler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def draw(self) -> tuple[float, bool]:
+        """Delay in seconds and whether to inject an error, for one request."""
+        f = self.faults
+        with self._lock:
+            self.served += 1
+            jitter = self._rnd.uniform(-f.jitter_ms, f.jitter_ms) if f.jitter_ms else 0.0
+            failed = f.error_rate > 0 and self._rnd.random() < f.error_rate
+        return max(0.0, f.latency_ms + jitter) / 1000.0, failed
+
+
+class _CassetteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: CassetteServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, headers: list[tuple[str, str]], body: bytes) -> None:
+        self.send_response(status)
+        for k, v in headers:
+            if k.lower() not in _DROP_HEADERS:
+                self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command == "HEAD":
+            return
+        kbps = self.server.faults.throughput_kbps
+        if not kbps:
+            self.wfile.write(body)
+            return
+        started = time.monotonic()
+        for offset in range(0, len(body), _CHUNK):
+            chunk = body[offset : offset + _CHUNK]
+            self.wfile.write(chunk)
+            ahead = (offset + len(chunk)) / (kbps * 1024.0) - (time.monotonic() - started)
+            if ahead > 0:
+                time.sleep(ahead)
+
+    def _error(self, status: int, message: str) -> None:
+        body = json.dumps({"error": message}, sort_keys=True).encode("utf-8")
+        self._send(status, [("Content-Type", "application/json")], body)
+
+    def _replay(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        content = self.rfile.read(length) if length > 0 else b""
+        delay, failed = self.server.draw()
+        if delay:
+            time.sleep(delay)
+        if failed:
+            self._error(503, "injected fault")
+            return
+        request = httpx.Request(
+            self.command,
+            "http://cassette.local" + self.path,
+            headers=list(self.headers.items()),
+            content=content,
+        )
+        try:
+            response = self.server.transport.handle_request(request)
+        except RuntimeError as exc:
+            self._error(404, str(exc))
+            return
+        self._send(response.status_code, list(response.headers.multi_items()), response.content)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = _replay
+
+
+def create_server(
+    cassette_path: Path,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    faults: FaultProfile | None = None,
+    matcher: Matcher | None = None,
+) -> CassetteServer:
+    cassette = Cassette.load(cassette_path, allow_absolute=True)
+    transport = CassetteReplayTransport(
+        cassette,
+        match="indexed",
+        matcher=matcher or Matcher(ignore_origin=True),
+        cycle=True,
+    )
+    return CassetteServer(transport, faults or FaultProfile(), (host, port))
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="sdetkit cassette", description="Cassette utilities.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    serve_p = sub.add_parser("serve", help="Serve a cassette as a local mock HTTP server")
+    serve_p.add_argument("cassette")
+    serve_p.add_argument("--host", default="127.0.0.1")
+    serve_p.add_argument("--port", type=int, default=8080, help="0 picks a free port.")
+    serve_p.add_argument("--latency-ms", type=float, default=0.0)
+    serve_p.add_argument("--jitter", type=float, default=0.0, help="Latency jitter, +/- ms.")
+    serve_p.add_argument(
+        "--error-rate", type=float, default=0.0, help="Share of requests answered with 503."
+    )
+    serve_p.add_argument(
+        "--throughput-kbps",
+        type=float,
+        default=0.0,
+        help="Per-response cap in KiB/s (1 KiB = 1024 bytes); 0 is uncapped.",
+    )
+    serve_p.add_argument("--seed", type=int, default=None, help="Seed for jitter and faults.")
+    serve_p.add_argument(
+        "--ignore-param",
+        action="append",
+        default=[],
+        help="Query parameter to leave out of matching (repeatable).",
+    )
+    serve_p.add_argument("--allow-absolute-path", action="store_true")
+    ns = ap.parse_args(argv)
+
+    try:
+        faults = FaultProfile(
+            latency_ms=ns.latency_ms,
+            jitter_ms=ns.jitter,
+            error_rate=ns.error_rate,
+            throughput_kbps=ns.throughput_kbps,
+            seed=ns.seed,
+        )
+    except ValueError as exc:
+        _die(str(exc))
+    try:
+        path = safe_path(Path.cwd(), ns.cassette, allow_absolute=bool(ns.allow_absolute_path))
+        server = create_server(
+            path,
+            host=ns.host,
+            port=ns.port,
+            faults=faults,
+            matcher=Matcher(ignore_origin=True, ignore_query_params=frozenset(ns.ignore_param)),
+        )
+    except (SecurityError, ValueError, OSError, RuntimeError) as exc:
+        _die(str(exc))
+    sys.stderr.write(f"serving {ns.cassette} on {server.url}\n")
+    sys.stderr.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
@@ -0,0 +1,514 @@
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Sequence
+from typing import NamedTuple
+
+Handler = Callable[[list[str]], int]
+
+
+class CommandSpec(NamedTuple):
+    """Declarative entry for one top-level ``sdetkit`` command.
+
+    ``target`` is a ``module:function`` reference that is only imported when the
+    command is dispatched, so building ``--help`` never pulls handler modules in.
+    ``parsed`` commands go through the root argparse parser first (their handler
+    receives the REMAINDER args); every other command is dispatched directly.
+    A ``NamedTuple`` rather than a dataclass keeps ``dataclasses``/``inspect`` off the
+    startup path.
+    """
+
+    name: str
+    target: str
+    help: str | None = None
+    aliases: tuple[str, ...] = ()
+    prefix: tuple[str, ...] = ()
+    parsed: bool = False
+
+
+def _closeout(name: str, module: str, *aliases: str) -> CommandSpec:
+    return CommandSpec(name=name, target=f"sdetkit.{module}:main", aliases=aliases)
+
+
+COMMANDS: tuple[CommandSpec, ...] = (
+    CommandSpec("baseline", "sdetkit.cli:_run_baseline", parsed=True),
+    CommandSpec(
+        "playbooks",
+        "sdetkit.playbooks_cli:main",
+        help="Discover and run adoption/rollout playbooks",
+    ),
+    CommandSpec(
+        "kits",
+        "sdetkit.kits:main",
+        help="[Stable/Core] Umbrella kit catalog and kit details",
+        parsed=True,
+    ),
+    CommandSpec(
+        "release",
+        "sdetkit.cli:_run_release",
+        help="[Stable/Core] Release Confidence Kit (primary surface)",
+        parsed=True,
+    ),
+    CommandSpec(
+        "intelligence",
+        "sdetkit.intelligence:main",
+        help="[Stable/Core] Test Intelligence Kit (primary surface)",
+        parsed=True,
+    ),
+    CommandSpec(
+        "integration",
+        "sdetkit.integration:main",
+        help="[Stable/Core] Integration Assurance Kit (primary surface)",
+        parsed=True,
+    ),
+    CommandSpec(
+        "forensics",
+        "sdetkit.forensics:main",
+        help="[Stable/Core] Failure Forensics Kit (experimental sublanes possible)",
+        parsed=True,
+    ),
+    CommandSpec(
+        "kv",
+        "sdetkit.kvcli:main",
+        help="Utility: parse key=value input into JSON (supporting surface)",
+        parsed=True,
+    ),
+    CommandSpec(
+        "apiget",
+        "sdetkit.cli:_run_apiget",
+        help="Deterministic HTTP JSON fetch and replay helper",
+    ),
+    CommandSpec(
+        "doctor",
+        "sdetkit.doctor:main",
+        help="[Stable/Compatibility] Deterministic repo and release-readiness checks",
+    ),
+    CommandSpec(
+        "gate",
+        "sdetkit.gate:main",
+        help="[Stable/Compatibility] Quick confidence and strict release gate checks",
+    ),
+    CommandSpec("ci", "sdetkit.ci:main", help="CI template and pipeline validation"),
+    CommandSpec("patch", "sdetkit.patch:main", help="Apply controlled file/text patches"),
+    CommandSpec(
+        "cassette-get",
+        "sdetkit.cli:_run_cassette_get",
+        help="Utility: record/replay HTTP captures for deterministic checks",
+    ),
+    CommandSpec(
+        "cassette",
+        "sdetkit.cassette_server:main",
+        help="Utility: serve cassettes as a local mock HTTP server",
+    ),
+    CommandSpec(
+        "load",
+        "sdetkit.loadgen:main",
+        help="Utility: HTTP load generator with latency percentiles",
+    ),
+    CommandSpec(
+        "repo",
+        "sdetkit.repo:main",
+        help="[Stable/Compatibility] Repository automation tasks",
+    ),
+    CommandSpec(
+        "dev", "sdetkit.repo:main", help="Shortcut to `repo dev` workflows", prefix=("dev",)
+    ),
+    CommandSpec("report", "sdetkit.report:main", help="Reporting workflows and output packs"),
+    CommandSpec(
+        "maintenance", "sdetkit.maintenance:main", help="Maintenance automation and cleanup"
+    ),
+    CommandSpec("agent", "sdetkit.agent.cli:main", help="Agent-centric automation workflows"),
+    # Internal diagnostics; intentionally left out of the root help listing.
+    CommandSpec("debug", "sdetkit.debug:main"),
+    CommandSpec(
+        "security",
+        "sdetkit.security_gate:main",
+        help="[Stable/Compatibility] Security policy checks and enforcement",
+    ),
+    CommandSpec("ops", "sdetkit.ops:main", help="Operational control-plane workflows"),
+    CommandSpec(
+        "notify", "sdetkit.notify:main", help="Notification adapters and delivery workflows"
+    ),
+    CommandSpec("policy", "sdetkit.policy:main", help="Policy evaluation and helper commands"),
+    CommandSpec(
+        "evidence",
+        "sdetkit.evidence:main",
+        help="[Stable/Compatibility] Generate audit-friendly release evidence",
+    ),
+    CommandSpec("onboarding", "sdetkit.onboarding:main", help="Role-based onboarding playbook"),
+    CommandSpec(
+        "onboarding-time-upgrade",
+        "sdetkit.onboarding_time_upgrade:main",
+        help="Onboarding-time improvement playbook",
+    ),
+    CommandSpec(
+        "community-activation",
+        "sdetkit.community_activation:main",
+        help="Community activation rollout playbook",
+    ),
+    CommandSpec(
+        "external-contribution-push",
+        "sdetkit.external_contribution_push:main",
+        help="External contribution rollout playbook",
+    ),
+    CommandSpec("kpi-audit", "sdetkit.kpi_audit:main", help="KPI audit and tracking playbook"),
+    _closeout("weekly-review-lane", "day28_weekly_review", "day28-weekly-review"),
+    _closeout("phase1-hardening", "day29_phase1_hardening"),
+    _closeout("phase1-wrap", "day30_phase1_wrap"),
+    _closeout("phase2-kickoff", "day31_phase2_kickoff"),
+    _closeout("release-cadence", "day32_release_cadence"),
+    _closeout("demo-asset", "day33_demo_asset"),
+    _closeout("demo-asset2", "day34_demo_asset2"),
+    _closeout("kpi-instrumentation", "day35_kpi_instrumentation"),
+    _closeout("distribution-closeout", "day36_distribution_closeout"),
+    _closeout("experiment-lane", "day37_experiment_lane"),
+    _closeout("distribution-batch", "day38_distribution_batch"),
+    _closeout("playbook-post", "day39_playbook_post"),
+    _closeout("scale-lane", "day40_scale_lane"),
+    _closeout("expansion-automation", "day41_expansion_automation", "day41-expansion-automation"),
+    _closeout(
+        "optimization-closeout-foundation",
+        "day42_optimization_closeout",
+        "day42-optimization-closeout",
+    ),
+    _closeout(
+        "acceleration-closeout", "day43_acceleration_closeout", "day43-acceleration-closeout"
+    ),
+    _closeout("scale-closeout", "day44_scale_closeout", "day44-scale-closeout"),
+    _closeout("expansion-closeout", "day45_expansion_closeout", "day45-expansion-closeout"),
+    _closeout(
+        "optimization-closeout", "day46_optimization_closeout", "day46-optimization-closeout"
+    ),
+    _closeout("reliability-closeout", "day47_reliability_closeout", "day47-reliability-closeout"),
+    _closeout("objection-closeout", "day48_objection_closeout", "day48-objection-closeout"),
+    _closeout(
+        "weekly-review-closeout",
+        "day49_weekly_review_closeout",
+        "day49-weekly-review-closeout",
+        "day49-advanced-weekly-review-control-tower",
+    ),
+    _closeout(
+        "execution-prioritization-closeout",
+        "day50_execution_prioritization_closeout",
+        "day50-execution-prioritization-closeout",
+    ),
+    _closeout(
+        "case-snippet-closeout", "day51_case_snippet_closeout", "day51-case-snippet-closeout"
+    ),
+    _closeout("narrative-closeout", "day52_narrative_closeout", "day52-narrative-closeout"),
+    _closeout("docs-loop-closeout", "day53_docs_loop_closeout", "day53-docs-loop-closeout"),
+    _closeout(
+        "contributor-activation-closeout",
+        "day55_contributor_activation_closeout",
+        "day55-contributor-activation-closeout",
+    ),
+    _closeout(
+        "stabilization-closeout", "day56_stabilization_closeout", "day56-stabilization-closeout"
+    ),
+    _closeout(
+        "kpi-deep-audit-closeout", "day57_kpi_deep_audit_closeout", "day57-kpi-deep-audit-closeout"
+    ),
+    _closeout(
+        "phase2-hardening-closeout",
+        "day58_phase2_hardening_closeout",
+        "day58-phase2-hardening-closeout",
+    ),
+    _closeout(
+        "phase3-preplan-closeout", "day59_phase3_preplan_closeout", "day59-phase3-preplan-closeout"
+    ),
+    _closeout(
+        "phase2-wrap-handoff-closeout",
+        "day60_phase2_wrap_handoff_closeout",
+        "day60-phase2-wrap-handoff-closeout",
+    ),
+    _closeout(
+        "phase3-kickoff-closeout", "day61_phase3_kickoff_closeout", "day61-phase3-kickoff-closeout"
+    ),
+    _closeout(
+        "community-program-closeout",
+        "day62_community_program_closeout",
+        "day62-community-program-closeout",
+    ),
+    _closeout(
+        "onboarding-activation-closeout",
+        "day63_onboarding_activation_closeout",
+        "day63-onboarding-activation-closeout",
+    ),
+    _closeout(
+        "integration-expansion-closeout",
+        "day64_integration_expansion_closeout",
+        "day64-integration-expansion-closeout",
+    ),
+    _closeout(
+        "weekly-review-closeout-cycle2",
+        "day65_weekly_review_closeout",
+        "day65-weekly-review-closeout",
+    ),
+    _closeout(
+        "integration-expansion2-closeout",
+        "day66_integration_expansion2_closeout",
+        "day66-integration-expansion2-closeout",
+    ),
+    _closeout(
+        "integration-expansion3-closeout",
+        "day67_integration_expansion3_closeout",
+        "day67-integration-expansion3-closeout",
+    ),
+    _closeout(
+        "integration-expansion4-closeout",
+        "day68_integration_expansion4_closeout",
+        "day68-integration-expansion4-closeout",
+    ),
+    _closeout(
+        "case-study-prep1-closeout",
+        "day69_case_study_prep1_closeout",
+        "day69-case-study-prep1-closeout",
+    ),
+    _closeout(
+        "case-study-prep2-closeout",
+        "day70_case_study_prep2_closeout",
+        "day70-case-study-prep2-closeout",
+    ),
+    _closeout(
+        "case-study-prep3-closeout",
+        "day71_case_study_prep3_closeout",
+        "day71-case-study-prep3-closeout",
+    ),
+    _closeout(
+        "case-study-prep4-closeout",
+        "day72_case_study_prep4_closeout",
+        "day72-case-study-prep4-closeout",
+    ),
+    _closeout(
+        "case-study-launch-closeout",
+        "day73_case_study_launch_closeout",
+        "day73-case-study-launch-closeout",
+    ),
+    _closeout(
+        "distribution-scaling-closeout",
+        "day74_distribution_scaling_closeout",
+        "day74-distribution-scaling-closeout",
+    ),
+    _closeout(
+        "trust-assets-refresh-closeout",
+        "day75_trust_assets_refresh_closeout",
+        "day75-trust-assets-refresh-closeout",
+    ),
+    _closeout(
+        "contributor-recognition-closeout",
+        "day76_contributor_recognition_closeout",
+        "day76-contributor-recognition-closeout",
+    ),
+    _closeout(
+        "community-touchpoint-closeout",
+        "day77_community_touchpoint_closeout",
+        "day77-community-touchpoint-closeout",
+    ),
+    _closeout(
+        "ecosystem-priorities-closeout",
+        "day78_ecosystem_priorities_closeout",
+        "day78-ecosystem-priorities-closeout",
+    ),
+    _closeout(
+        "scale-upgrade-closeout", "day79_scale_upgrade_closeout", "day79-scale-upgrade-closeout"
+    ),
+    _closeout(
+        "partner-outreach-closeout",
+        "day80_partner_outreach_closeout",
+        "day80-partner-outreach-closeout",
+    ),
+    _closeout(
+        "growth-campaign-closeout",
+        "day81_growth_campaign_closeout",
+        "day81-growth-campaign-closeout",
+    ),
+    _closeout(
+        "integration-feedback-closeout",
+        "day82_integration_feedback_closeout",
+        "day82-integration-feedback-closeout",
+    ),
+    _closeout(
+        "trust-faq-expansion-closeout",
+        "day83_trust_faq_expansion_closeout",
+        "day83-trust-faq-expansion-closeout",
+    ),
+    _closeout(
+        "evidence-narrative-closeout",
+        "day84_evidence_narrative_closeout",
+        "day84-evidence-narrative-closeout",
+    ),
+    _closeout(
+        "release-prioritization-closeout",
+        "day85_release_prioritization_closeout",
+        "day85-release-prioritization-closeout",
+    ),
+    _closeout(
+        "launch-readiness-closeout",
+        "day86_launch_readiness_closeout",
+        "day86-launch-readiness-closeout",
+    ),
+    _closeout(
+        "governance-handoff-closeout",
+        "day87_governance_handoff_closeout",
+        "day87-governance-handoff-closeout",
+    ),
+    _closeout(
+        "governance-priorities-closeout",
+        "day88_governance_priorities_closeout",
+        "day88-governance-priorities-closeout",
+    ),
+    _closeout(
+        "governance-scale-closeout",
+        "day89_governance_scale_closeout",
+        "day89-governance-scale-closeout",
+    ),
+    _closeout(
+        "phase3-wrap-publication-closeout",
+        "day90_phase3_wrap_publication_closeout",
+        "day90-phase3-wrap-publication-closeout",
+    ),
+    _closeout(
+        "continuous-upgrade-closeout",
+        "day91_continuous_upgrade_closeout",
+        "day91-continuous-upgrade-closeout",
+    ),
+    _closeout(
+        "continuous-upgrade-cycle2-closeout",
+        "day92_continuous_upgrade_cycle2_closeout",
+        "day92-continuous-upgrade-cycle2-closeout",
+    ),
+    _closeout(
+        "continuous-upgrade-cycle3-closeout",
+        "day93_continuous_upgrade_cycle3_closeout",
+        "day93-continuous-upgrade-cycle3-closeout",
+    ),
+    _closeout(
+        "continuous-upgrade-cycle4-closeout",
+        "day94_continuous_upgrade_cycle4_closeout",
+        "day94-continuous-upgrade-cycle4-closeout",
+    ),
+    _closeout(
+        "continuous-upgrade-cycle5-closeout",
+        "day95_continuous_upgrade_cycle5_closeout",
+        "day95-continuous-upgrade-cycle5-closeout",
+    ),
+    _closeout(
+        "continuous-upgrade-cycle6-closeout",
+        "day96_continuous_upgrade_cycle6_closeout",
+        "day96-continuous-upgrade-cycle6-closeout",
+    ),
+    _closeout(
+        "continuous-upgrade-cycle7-closeout",
+        "day97_continuous_upgrade_cycle7_closeout",
+        "day97-continuous-upgrade-cycle7-closeout",
+    ),
+    _closeout("continuous-upgrade-cycle8-closeout", "continuous_upgrade_cycle8_closeout"),
+    _closeout("continuous-upgrade-cycle9-closeout", "continuous_upgrade_cycle9_closeout"),
+    _closeout("continuous-upgrade-cycle10-closeout", "continuous_upgrade_cycle10_closeout"),
+    _closeout("continuous-upgrade-cycle11-closeout", "continuous_upgrade_cycle11_closeout"),
+    CommandSpec("faq-objections", "sdetkit.faq_objections:main", help="FAQ objections playbook"),
+    CommandSpec("demo", "sdetkit.demo:main"),
+    CommandSpec(
+        "first-contribution",
+        "sdetkit.first_contribution:main",
+        help="First contribution playbook",
+    ),
+    CommandSpec(
+        "contributor-funnel",
+        "sdetkit.contributor_funnel:main",
+        help="Contributor funnel playbook",
+    ),
+    CommandSpec("proof", "sdetkit.proof:main", help="Proof and evidence workflows"),
+    CommandSpec(
+        "triage-templates",
+        "sdetkit.triage_templates:main",
+        help="Issue and triage template workflows",
+    ),
+    CommandSpec("docs-qa", "sdetkit.docs_qa:main", help="Docs quality and link checks"),
+    CommandSpec("weekly-review", "sdetkit.weekly_review:main", help="Weekly review playbook"),
+    CommandSpec("docs-nav", "sdetkit.docs_navigation:main", help="Docs navigation validation"),
+    CommandSpec("roadmap", "sdetkit.roadmap:main"),
+    CommandSpec(
+        "startup-use-case", "sdetkit.startup_use_case:main", help="Startup use-case playbook"
+    ),
+    CommandSpec("sdet-package", "sdetkit.sdet_package:main"),
+    CommandSpec(
+        "enterprise-use-case",
+        "sdetkit.enterprise_use_case:main",
+        help="Enterprise use-case playbook",
+    ),
+    CommandSpec(
+        "github-actions-quickstart",
+        "sdetkit.github_actions_quickstart:main",
+        help="GitHub Actions quickstart playbook",
+    ),
+    CommandSpec(
+        "gitlab-ci-quickstart",
+        "sdetkit.gitlab_ci_quickstart:main",
+        help="GitLab CI quickstart playbook",
+    ),
+    CommandSpec(
+        "quality-contribution-delta",
+        "sdetkit.quality_contribution_delta:main",
+        help="Quality contribution delta report",
+    ),
+    CommandSpec(
+        "reliability-evidence-pack",
+        "sdetkit.reliability_evidence_pack:main",
+        help="Reliability evidence pack",
+    ),
+    CommandSpec(
+        "release-readiness-board",
+        "sdetkit.release_readiness_board:main",
+        help="Release readiness board",
+    ),
+    CommandSpec(
+        "release-narrative", "sdetkit.release_narrative:main", help="Release narrative playbook"
+    ),
+    CommandSpec(
+        "trust-signal-upgrade",
+        "sdetkit.trust_signal_upgrade:main",
+        help="Trust signal upgrade playbook",
+    ),
+    CommandSpec("phase-boost", "sdetkit.phase_boost:main"),
+    CommandSpec("production-readiness", "sdetkit.production_readiness:main"),
+)
+
+
+def _build_index(commands: Sequence[CommandSpec]) -> dict[str, CommandSpec]:
+    index: dict[str, CommandSpec] = {}
+    for spec in commands:
+        for name in (spec.name, *spec.aliases):
+            if name in index:
+                raise ValueError(f"duplicate command name: {name}")
+            index[name] = spec
+    return index
+
+
+_INDEX = _build_index(COMMANDS)
+
+
+def find_command(name: str) -> CommandSpec | None:
+    return _INDEX.get(name)
+
+
+def handler_modules() -> frozenset[str]:
+    """Top-level ``sdetkit`` submodule names referenced by the command table."""
+    names: set[str] = set()
+    for spec in COMMANDS:
+        module_name = spec.target.partition(":")[0]
+        package, _, leaf = module_name.partition(".")
+        if package == "sdetkit" and leaf and "." not in leaf:
+            names.add(leaf)
+    return frozenset(names)
+
+
+def load_handler(spec: CommandSpec) -> Handler:
+    module_name, _, attr = spec.target.partition(":")
+    module = importlib.import_module(module_name)
+    handler: Handler = getattr(module, attr or "main")
+    return handler
+
+
+def run_command(spec: CommandSpec, args: Sequence[str]) -> int:
+    return load_handler(spec)([*spec.prefix, *args])
@@ -0,0 +1,258 @@
+"""Aggregate netclient ``ClientEvent`` hooks into counters and latency histograms.
+
+A :class:`ClientMetrics` instance *is* a hook: pass it as ``hook=`` to
+``SdetHttpClient``/``SdetAsyncHttpClient`` (or call it from your own hook) and
+it keeps, per host, method and status:
+
+* responses, attempt errors, retries, hedges and backoff sleep time;
+* call latency (``complete`` events) in :class:`~sdetkit.loadgen.LatencyHistogram`
+  buckets, exported as Prometheus histograms and as JSON percentiles.
+
+Breaker state changes are counted through :meth:`ClientMetrics.breaker_hook`,
+which plugs into ``CircuitBreaker(on_transition=...)``.
+
+Recording takes no lock: each thread updates its own shard, and
+:meth:`ClientMetrics.snapshot` merges the shards when somebody reads. An
+in-flight update may land in the next snapshot instead of this one, which is
+fine for monitoring. Shards of finished threads are folded into one retired
+total, so thread-per-request servers do not grow the shard list without bound.
+
+``default_metrics`` is a process-wide instance that ``sdetkit ops serve``
+exposes on ``GET /metrics``. Nothing registers it automatically: it only sees
+clients created with ``hook=default_metrics`` (or hooks that call it).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+from urllib.parse import urlsplit
+
+from .loadgen import LatencyHistogram
+from .netclient import ClientEvent
+
+# Prometheus ``le`` bounds for the latency histogram, in seconds.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@lru_cache(maxsize=4096)
+def _host(url: str) -> str:
+    try:
+        return urlsplit(url).netloc.lower() or "unknown"
+    except ValueError:
+        return "unknown"
+
+
+class _Shard:
+    __slots__ = ("responses", "errors", "retries", "hedges", "sleep", "latency", "breakers")
+
+    def __init__(self) -> None:
+        self.responses: dict[tuple[str, str, str], int] = {}
+        self.errors: dict[tuple[str, str, str], int] = {}
+        self.retries: dict[tuple[str, str], int] = {}
+        self.hedges: dict[tuple[str, str], int] = {}
+        self.sleep: dict[tuple[str, str], float] = {}
+        self.latency: dict[tuple[str, str, str], LatencyHistogram] = {}
+        self.breakers: dict[tuple[str, str, str], int] = {}
+
+
+def _add(into: dict[Any, Any], src: dict[Any, Any]) -> None:
+    for k, v in list(src.items()):
+        into[k] = into.get(k, 0) + v
+
+
+def _fold(into: _Shard, src: _Shard) -> None:
+    _add(into.responses, src.responses)
+    _add(into.errors, src.errors)
+    _add(into.retries, src.retries)
+    _add(into.hedges, src.hedges)
+    _add(into.sleep, src.sleep)
+    _add(into.breakers, src.breakers)
+    for k, hist in list(src.latency.items()):
+        merged = into.latency.get(k)
+        if merged is None:
+            merged = into.latency[k] = LatencyHistogram(hist.sub_bits)
+        merged.merge(hist)
+
+
+class ClientMetrics:
+    def __init__(self, *, namespace: str = "sdetkit_client") -> None:
+        self.namespace = namespace
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: dict[threading.Thread, _Shard] = {}
+        self._retired = _Shard()
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._retire_finished()
+                self._shards[threading.current_thread()] = shard
+        return shard
+
+    def _retire_finished(self) -> None:
+        # Caller holds the lock. A finished thread records nothing more, so its
+        # shard can be folded into the retired totals and dropped.
+        for thread in [t for t in self._shards if not t.is_alive()]:
+            _fold(self._retired, self._shards.pop(thread))
+
+    def __call__(self, ev: ClientEvent) -> None:
+        t = ev.type
+        s = self._shard()
+        key = (_host(ev.url), ev.method)
+        if t == "attempt_response":
+            k3 = (*key, str(ev.status_code))
+            s.responses[k3] = s.responses.get(k3, 0) + 1
+        elif t == "complete":
+            if ev.elapsed_seconds is None:
+                return
+            label = str(ev.status_code) if ev.status_code is not None else "error"
+            k3 = (*key, label)
+            hist = s.latency.get(k3)
+            if hist is None:
+                hist = s.latency[k3] = LatencyHistogram()
+            hist.record(ev.elapsed_seconds)
+        elif t == "attempt_start":
+            if ev.attempt > 0:
+                s.retries[key] = s.retries.get(key, 0) + 1
+        elif t == "attempt_error":
+            k3 = (*key, ev.error or "error")
+            s.errors[k3] = s.errors.get(k3, 0) + 1
+        elif t == "sleep":
+            s.sleep[key] = s.sleep.get(key, 0.0) + (ev.sleep_seconds or 0.0)
+        elif t == "hedge":
+            s.hedges[key] = s.hedges.get(key, 0) + 1
+
+    def breaker_hook(self, name: str) -> Callable[[str, str], None]:
+        """``on_transition`` callback counting ``name``'s breaker state changes."""
+
+        def on_transition(old: str, new: str) -> None:
+            s = self._shard()
+            k = (name, old, new)
+            s.breakers[k] = s.breakers.get(k, 0) + 1
+
+        return on_transition
+
+    def _merged(self) -> _Shard:
+        out = _Shard()
+        with self._lock:
+            self._retire_finished()
+            _fold(out, self._retired)
+            shards = list(self._shards.values())
+        for s in shards:
+            _fold(out, s)
+        return out
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-ready view of everything recorded so far, merged across threads."""
+        m = self._merged()
+
+        def rows(d: dict[Any, Any], *names: str, value: str = "count") -> list[dict[str, Any]]:
+            return [{**dict(zip(names, k, strict=True)), value: v} for k, v in sorted(d.items())]
+
+        return {
+            "responses": rows(m.responses, "host", "method", "status"),
+            "errors": rows(m.errors, "host", "method", "error"),
+            "retries": rows(m.retries, "host", "method"),
+            "hedges": rows(m.hedges, "host", "method"),
+            "sleep_seconds": rows(m.sleep, "host", "method", value="seconds"),
+            "breaker_transitions": rows(m.breakers, "breaker", "from", "to"),
+            "latency": [
+                {
+                    "host": k[0],
+                    "method": k[1],
+                    "status": k[2],
+                    "count": hist.count,
+                    "sum_seconds": round(hist.total_us / 1_000_000, 6),
+                    "latency_ms": hist.summary_ms(),
+                }
+                for k, hist in sorted(m.latency.items())
+            ],
+        }
+
+    def to_prometheus(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        m = self._merged()
+        ns = self.namespace
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            full = f"{ns}_{name}"
+            lines.append(f"# HELP {full} {help_text}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        def emit(
+            name: str, kind: str, help_text: str, d: dict[Any, Any], names: tuple[str, ...]
+        ) -> None:
+            full = family(name, kind, help_text)
+            for k, v in sorted(d.items()):
+                lines.append(f"{full}{_labels(zip(names, k, strict=True))} {_num(v)}")
+
+        hm = ("host", "method")
+        emit(
+            "responses_total",
+            "counter",
+            "HTTP responses received, per attempt.",
+            m.responses,
+            (*hm, "status"),
+        )
+        emit(
+            "errors_total",
+            "counter",
+            "Attempts failed without a response.",
+            m.errors,
+            (*hm, "error"),
+        )
+        emit("retries_total", "counter", "Attempts after the first.", m.retries, hm)
+        emit("hedges_total", "counter", "Hedged duplicate attempts fired.", m.hedges, hm)
+        emit("backoff_seconds_total", "counter", "Time spent sleeping before retries.", m.sleep, hm)
+        emit(
+            "breaker_transitions_total",
+            "counter",
+            "Circuit breaker state changes.",
+            m.breakers,
+            ("breaker", "from", "to"),
+        )
+
+        full = family("request_duration_seconds", "histogram", "Call latency including retries.")
+        for k, hist in sorted(m.latency.items()):
+            base = list(zip((*hm, "status"), k, strict=True))
+            for le, n in zip(buckets, hist.cumulative(buckets), strict=True):
+                lines.append(f"{full}_bucket{_labels([*base, ('le', _num(le))])} {n}")
+            lines.append(f"{full}_bucket{_labels([*base, ('le', '+Inf')])} {hist.count}")
+            lines.append(f"{full}_sum{_labels(base)} {_num(hist.total_us / 1_000_000)}")
+            lines.append(f"{full}_count{_labels(base)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(v: str) -> str:
+    return v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs: Any) -> str:
+    inner = ",".join(f'{k}="{_escape(str(v))}"' for k, v in pairs)
+    return "{" + inner + "}" if inner else ""
+
+
+def _num(v: float) -> str:
+    return repr(float(v)) if isinstance(v, float) else str(v)
+
+
+default_metrics = ClientMetrics()
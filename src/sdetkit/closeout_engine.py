@@ -0,0 +1,620 @@
+"""Shared engine behind the ``*-closeout`` lane commands.
+
+Every closeout lane runs the same pipeline: read a handful of docs, load the
+previous lane's summary and delivery board, score a weighted checklist, and
+optionally emit an artifact pack or execute the lane's validation commands.
+The per-lane differences (paths, required doc lines, check weights, wording)
+live in ``closeout_specs/<module>.json`` and are loaded only when that lane
+runs. Checks, ``missing`` rules and CLI options that most lanes share are kept
+here once and filled in by :func:`load_spec`, so a spec only records what is
+particular to its lane.
+
+The historical ``sdetkit.dayNN_*_closeout`` / ``continuous_upgrade_cycleN_closeout``
+modules are served from those specs by a meta path finder, so existing imports,
+``-m`` style entry points and contract scripts keep working.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.abc
+import importlib.machinery
+import json
+import types
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from .evidence_runner import run_commands
+
+SPEC_SCHEMA_VERSION = "sdetkit.closeout.spec.v1"
+_SPEC_DIR = Path(__file__).resolve().parent / "closeout_specs"
+
+
+class CloseoutSpecError(ValueError):
+    """Raised when a closeout spec is missing or malformed."""
+
+
+def spec_modules() -> list[str]:
+    """Return the legacy module names that have a closeout spec."""
+    return sorted(p.stem for p in _SPEC_DIR.glob("*.json"))
+
+
+def has_spec(module: str) -> bool:
+    return (_SPEC_DIR / f"{module}.json").is_file()
+
+
+_SHARED_CHECKS: dict[str, dict[str, Any]] = {
+    "docs_page_exists": {"passed": {"exists": "page_path"}, "evidence": {"$str": "page_path"}},
+    **{
+        check_id: {"passed": {"empty": fact}, "evidence": {"$or": [fact, ok]}}
+        for check_id, fact, ok in (
+            ("required_sections", "missing_sections", "all sections present"),
+            ("required_commands", "missing_commands", "all commands present"),
+            ("contract_lock", "missing_contract_lines", "contract locked"),
+            ("quality_checklist_lock", "missing_quality_lines", "quality checklist locked"),
+            ("delivery_board_lock", "missing_board_items", "delivery board locked"),
+            (
+                "evidence_plan_targets_non_regressive",
+                "plan_trajectory_issues",
+                "target metrics are non-regressive",
+            ),
+            (
+                "evidence_plan_owner_coverage",
+                "plan_owner_issues",
+                "owner + rollback owner assigned",
+            ),
+            (
+                "evidence_plan_hygiene",
+                "plan_hygiene_issues",
+                "contributors/channels/confidence/cadence validated",
+            ),
+        )
+    },
+    **{
+        check_id: {"passed": {"empty": fact}, "evidence": {fact: {"$": fact}}}
+        for check_id, fact in (
+            ("required_sections_present", "missing_sections"),
+            ("required_commands_present", "missing_commands"),
+            ("delivery_board_locked", "missing_board_items"),
+        )
+    },
+}
+_MISSING_DEFAULTS: dict[str, dict[str, Any]] = {
+    "missing_sections": {"lines": ["_REQUIRED_SECTIONS"], "in": "page_text"},
+    "missing_commands": {"lines": ["_REQUIRED_COMMANDS"], "in": "page_text"},
+    "missing_contract_lines": {"lines": ["_REQUIRED_CONTRACT_LINES"], "in": "page_text"},
+    "missing_quality_lines": {"lines": ["_REQUIRED_QUALITY_LINES"], "in": "page_text"},
+    "missing_board_items": {"lines": ["_REQUIRED_DELIVERY_BOARD_LINES"], "in": "page_text"},
+    "missing_plan_keys": {"lines": ["_REQUIRED_DATA_KEYS"], "in": "plan_text"},
+}
+_CLI_DEFAULTS: dict[str, Any] = {
+    "formats": ["json", "text"],
+    "doc_flag": "--write-default-doc",
+    "doc_overwrite": True,
+}
+
+
+def _expand(module: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Fill in the shared defaults a compact spec leaves out.
+
+    A check written as ``[check_id, weight]`` names one of the shared checks,
+    ``missing`` rules and ``cli`` options only list what differs from the
+    defaults, ``previous`` scores are integers unless stated otherwise, and
+    ``module``/``builder`` follow from the file name.
+    """
+    data.setdefault("module", module)
+    data.setdefault("builder", f"build_{module}_summary")
+    checks = []
+    for check in data["checks"]:
+        if isinstance(check, list):
+            check_id, weight = check
+            if check_id not in _SHARED_CHECKS:
+                raise CloseoutSpecError(f"{module}: unknown shared check {check_id!r}")
+            check = {"check_id": check_id, "weight": weight, **_SHARED_CHECKS[check_id]}
+        checks.append(check)
+    data["checks"] = checks
+    data["missing"] = {
+        name: {**_MISSING_DEFAULTS.get(name, {}), **rule}
+        for name, rule in data.get("missing", {}).items()
+    }
+    data["cli"] = {**_CLI_DEFAULTS, **data["cli"]}
+    if "previous" in data:
+        data["previous"].setdefault("score", "int")
+    return data
+
+
+@cache
+def load_spec(module: str) -> dict[str, Any]:
+    path = _SPEC_DIR / f"{module}.json"
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise CloseoutSpecError(f"no closeout spec for {module!r}") from None
+    except json.JSONDecodeError as exc:
+        raise CloseoutSpecError(f"{path.name}: invalid JSON: {exc}") from None
+    if not isinstance(data, dict) or data.get("schema_version") != SPEC_SCHEMA_VERSION:
+        raise CloseoutSpecError(f"{path.name}: expected schema_version {SPEC_SCHEMA_VERSION!r}")
+    return _expand(module, data)
+
+
+def _read_text(path: Path) -> str:
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def checklist_items(markdown: str, prefix: str = "- [") -> list[str]:
+    return [line.strip() for line in markdown.splitlines() if line.strip().startswith(prefix)]
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _constant_lines(spec: dict[str, Any], names: list[str]) -> list[str]:
+    lines: list[str] = []
+    for name in names:
+        value = spec["constants"][name]
+        lines.extend([value] if isinstance(value, str) else value)
+    return lines
+
+
+def _load_previous(path: Path, score_type: str) -> tuple[float | int, bool, int]:
+    data = _load_json(path)
+    summary = data.get("summary")
+    summary = summary if isinstance(summary, dict) else {}
+    checks = data.get("checks")
+    raw_score = summary.get("activation_score")
+    score: float | int
+    if score_type == "int":
+        score = int(raw_score) if isinstance(raw_score, (int, float)) else 0
+    else:
+        score = float(raw_score) if isinstance(raw_score, (int, float)) else 0.0
+    return (
+        score,
+        bool(summary.get("strict_pass", False)),
+        len(checks) if isinstance(checks, list) else 0,
+    )
+
+
+def _plan_contract(
+    plan: dict[str, Any], required_keys: list[str], *, optional_rollback_owner: bool
+) -> tuple[list[str], list[str], list[str], list[str]]:
+    missing_keys = [key for key in required_keys if key not in plan]
+
+    trajectory: list[str] = []
+    raw_baseline, raw_target = plan.get("baseline"), plan.get("target")
+    baseline: dict[str, Any] = raw_baseline if isinstance(raw_baseline, dict) else {}
+    target: dict[str, Any] = raw_target if isinstance(raw_target, dict) else {}
+    if not baseline:
+        trajectory.append("baseline: missing or not an object")
+    if not target:
+        trajectory.append("target: missing or not an object")
+    for metric, baseline_value in baseline.items():
+        target_value = target.get(metric)
+        if isinstance(baseline_value, (int, float)):
+            if not isinstance(target_value, (int, float)):
+                trajectory.append(f"{metric}: missing numeric target")
+            elif target_value < baseline_value:
+                trajectory.append(
+                    f"{metric}: target {target_value} below baseline {baseline_value}"
+                )
+
+    owners: list[str] = []
+    for owner_field in ("owner", "rollback_owner"):
+        value = plan.get(owner_field)
+        if owner_field == "rollback_owner" and optional_rollback_owner and value is None:
+            continue
+        if not isinstance(value, str) or not value.strip():
+            owners.append(f"{owner_field}: missing owner assignment")
+
+    hygiene: list[str] = []
+    for key, noun, label in (
+        ("contributors", "contributor", "contributor"),
+        ("upgrade_channels", "lane", "channel"),
+    ):
+        items = plan.get(key)
+        if not isinstance(items, list) or not items:
+            hygiene.append(f"{key}: must contain at least one {noun}")
+        elif not all(isinstance(item, str) and item.strip() for item in items):
+            hygiene.append(f"{key}: every {label} must be a non-empty string")
+    # The first cycle's plan format predates these keys and falls back to its documented defaults.
+    lenient = optional_rollback_owner
+    confidence_floor = plan.get("confidence_floor", 0.8 if lenient else None)
+    if not isinstance(confidence_floor, (int, float)) or not 0 <= confidence_floor <= 1:
+        hygiene.append("confidence_floor: must be a number between 0 and 1")
+    cadence_days = plan.get("cadence_days", 7 if lenient else None)
+    if not isinstance(cadence_days, int) or cadence_days <= 0:
+        hygiene.append("cadence_days: must be a positive integer")
+    return missing_keys, trajectory, owners, hygiene
+
+
+def _facts(spec: dict[str, Any], root: Path) -> dict[str, Any]:
+    facts: dict[str, Any] = {"root": root}
+    for name, rel in spec.get("paths", {}).items():
+        facts[name] = root / rel
+    for name, rel in spec.get("texts", {}).items():
+        facts[name] = _read_text(root / rel)
+    for name, rel in spec.get("data", {}).items():
+        facts[name] = _load_json(root / rel)
+
+    previous = spec.get("previous")
+    if previous:
+        summary_path = root / previous["summary"]
+        board_path = root / previous["board"]
+        score, strict, check_count = _load_previous(summary_path, previous.get("score", "float"))
+        board_text = _read_text(board_path)
+        items = checklist_items(board_text, previous.get("item_prefix", "- ["))
+        facts.update(
+            prev_summary=summary_path,
+            prev_board=board_path,
+            prev_score=score,
+            prev_strict=strict,
+            prev_checks=check_count,
+            board_count=len(items),
+        )
+        # Anchors are looked up in the whole board unless the lane only trusts checklist items.
+        haystack = "\n".join(items) if previous.get("anchor_scope") == "items" else board_text
+        for name, needle in previous.get("anchors", {}).items():
+            facts[name] = needle in haystack
+
+    for name, rule in spec.get("missing", {}).items():
+        source = facts[rule["in"]]
+        prefix = rule.get("prefix", "")
+        facts[name] = [
+            prefix + line
+            for line in _constant_lines(spec, rule["lines"])
+            if prefix + line not in source
+        ]
+
+    contract = spec.get("plan_contract")
+    if contract:
+        (
+            facts["missing_plan_keys"],
+            facts["plan_trajectory_issues"],
+            facts["plan_owner_issues"],
+            facts["plan_hygiene_issues"],
+        ) = _plan_contract(
+            facts[contract["data"]],
+            _constant_lines(spec, [contract["required_keys"]]),
+            optional_rollback_owner=bool(contract.get("optional_rollback_owner")),
+        )
+    return facts
+
+
+def _test(expr: Any, facts: dict[str, Any]) -> bool:
+    """Evaluate a spec condition.
+
+    A bare string is a fact reference; otherwise the single key names the
+    operator: ``all``/``any``/``not``, ``in`` ([needle, fact]), ``ge``
+    ([fact, number]), ``empty`` (fact) and ``exists`` (path fact).
+    """
+    if isinstance(expr, str):
+        return bool(facts[expr])
+    if isinstance(expr, bool):
+        return expr
+    ((op, arg),) = expr.items()
+    if op == "all":
+        return all(_test(item, facts) for item in arg)
+    if op == "any":
+        return any(_test(item, facts) for item in arg)
+    if op == "not":
+        return not _test(arg, facts)
+    if op == "in":
+        return arg[0] in facts[arg[1]]
+    if op == "ge":
+        return bool(facts[arg[0]] >= arg[1])
+    if op == "empty":
+        return not facts[arg]
+    if op == "exists":
+        return bool(facts[arg].exists())
+    raise CloseoutSpecError(f"unknown closeout condition: {op!r}")
+
+
+def _value(expr: Any, facts: dict[str, Any]) -> Any:
+    """Render a spec value: ``{"$": fact}`` and friends are substituted, the rest is literal."""
+    if isinstance(expr, list):
+        return [_value(item, facts) for item in expr]
+    if not isinstance(expr, dict):
+        return expr
+    if len(expr) == 1:
+        ((key, arg),) = expr.items()
+        if key == "$":
+            return facts[arg]
+        if key == "$str":
+            return str(facts[arg])
+        if key == "$rel":
+            path = facts[arg]
+            return str(path.relative_to(facts["root"])) if path.exists() else str(path)
+        if key == "$or":
+            return facts[arg[0]] or arg[1]
+    return {key: _value(item, facts) for key, item in expr.items()}
+
+
+def build_summary(spec: dict[str, Any], root: Path) -> dict[str, Any]:
+    facts = _facts(spec, root)
+    checks: list[dict[str, Any]] = [
+        {
+            "check_id": check["check_id"],
+            "weight": check["weight"],
+            "passed": _test(check["passed"], facts),
+            "evidence": _value(check["evidence"], facts),
+        }
+        for check in spec["checks"]
+    ]
+    failed = [c for c in checks if not c["passed"]]
+    critical_failures = [
+        item["id"] for item in spec.get("critical_failures", []) if _test(item["when"], facts)
+    ]
+    facts["lane_complete"] = not failed and not critical_failures
+
+    wins: list[str] = []
+    misses: list[str] = []
+    handoff_actions: list[str] = []
+    for outcome in spec.get("outcomes", []):
+        if _test(outcome["when"], facts):
+            if "win" in outcome:
+                wins.append(outcome["win"].format_map(facts))
+        else:
+            if "miss" in outcome:
+                misses.append(outcome["miss"].format_map(facts))
+            handoff_actions.extend(
+                action.format_map(facts) for action in outcome.get("actions", [])
+            )
+
+    score = int(round(sum(c["weight"] for c in checks if c["passed"])))
+    payload: dict[str, Any] = {"name": spec["name"], **spec.get("payload_extra", {})}
+    if "inputs" in spec:
+        payload["inputs"] = _value(spec["inputs"], facts)
+    payload["checks"] = checks
+    if "rollup" in spec:
+        payload["rollup"] = _value(spec["rollup"], facts)
+    payload["summary"] = {
+        "activation_score": score,
+        "passed_checks": len(checks) - len(failed),
+        "failed_checks": len(failed),
+        "critical_failures": critical_failures,
+        "strict_pass": not failed and not critical_failures,
+    }
+    payload["wins"] = wins
+    payload["misses"] = misses
+    payload["handoff_actions"] = handoff_actions
+    return payload
+
+
+def render_text(spec: dict[str, Any], payload: dict[str, Any]) -> str:
+    text = spec["text"]
+    summary = payload["summary"]
+    lines = [
+        text["title"],
+        f"- Activation score: {summary['activation_score']}",
+        f"- Passed checks: {summary['passed_checks']}",
+        f"- Failed checks: {summary['failed_checks']}",
+        f"- Critical failures: {summary['critical_failures']}",
+    ]
+    for label, key in text.get("rollup", []):
+        lines.append(f"- {label}: `{payload['rollup'][key]}`")
+    if text.get("outcomes"):
+        if payload["wins"]:
+            lines.append("- Wins:")
+            lines.extend([f"  - {w}" for w in payload["wins"]])
+        if payload["misses"]:
+            lines.append("- Misses:")
+            lines.extend([f"  - {m}" for m in payload["misses"]])
+    return "\n".join(lines)
+
+
+def emit_pack(spec: dict[str, Any], root: Path, pack_dir: Path, payload: dict[str, Any]) -> None:
+    target = root / pack_dir
+    target.mkdir(parents=True, exist_ok=True)
+    strict = int(payload["summary"]["strict_pass"])
+    for name, content in spec["pack"]:
+        if isinstance(content, dict) and "lines" in content:
+            # Pack files that just list a constant (delivery board, validation commands).
+            lines = "\n".join(_constant_lines(spec, [content["lines"]]))
+            text = content.get("head", "") + lines + content.get("tail", "")
+        elif content == {"payload": "json"}:
+            text = json.dumps(payload, indent=2) + "\n"
+        elif content == {"payload": "text"}:
+            text = render_text(spec, payload) + "\n"
+        elif content == {"payload": "strict_scorecard"}:
+            kpi = {
+                "id": "strict_pass",
+                "baseline": 1,
+                "current": strict,
+                "delta": strict - 1,
+                "confidence": "high",
+            }
+            text = json.dumps({"kpis": [kpi]}, indent=2) + "\n"
+        elif content == {"payload": "priority_matrix"}:
+            summary = payload["summary"]
+            matrix = {
+                "priority_model": "weighted-weekly-review",
+                "inputs": {
+                    "passed_checks": summary["passed_checks"],
+                    "failed_checks": summary["failed_checks"],
+                    "critical_failures": summary["critical_failures"],
+                },
+                "priorities": [
+                    {"lane": "stability", "score": max(0, 100 - summary["failed_checks"] * 10)},
+                    {
+                        "lane": "delivery",
+                        "score": max(0, 100 - len(summary["critical_failures"]) * 25),
+                    },
+                ],
+            }
+            text = json.dumps(matrix, indent=2) + "\n"
+        else:
+            text = content
+        _write(target / name, text)
+
+
+def execute_commands(
+    spec: dict[str, Any],
+    root: Path,
+    evidence_dir: Path,
+    *,
+    jobs: int | None = None,
+    timeout_sec: float | None = None,
+) -> dict[str, Any]:
+    execution = spec["execution"]
+    out_dir = root / evidence_dir
+    results = run_commands(
+        spec["constants"]["_EXECUTION_COMMANDS"],
+        cwd=root,
+        timeout=timeout_sec,
+        jobs=jobs,
+        stream_dir=out_dir,
+    )
+    events: list[dict[str, Any]] = []
+    for result in results:
+        event: dict[str, Any] = {
+            "command": result.command,
+            "returncode": result.returncode,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+        }
+        if result.timed_out:
+            event["error"] = f"timed out after {timeout_sec}s"
+        events.append(event)
+        _write(out_dir / f"command-{result.index:02d}.log", json.dumps(event, indent=2) + "\n")
+    summary: dict[str, Any] = {"total_commands": len(events)}
+    if execution.get("gate"):
+        failed = [event for event in events if int(event["returncode"]) != 0]
+        summary["failed_commands"] = len(failed)
+        summary["strict_pass"] = not failed
+    summary["commands"] = events
+    _write(out_dir / execution["summary_file"], json.dumps(summary, indent=2) + "\n")
+    return summary
+
+
+def build_parser(spec: dict[str, Any]) -> argparse.ArgumentParser:
+    cli = spec["cli"]
+    parser = argparse.ArgumentParser(description=cli["description"])
+    parser.add_argument("--root", default=".")
+    parser.add_argument("--format", choices=cli["formats"], default="text")
+    parser.add_argument("--strict", action="store_true")
+    parser.add_argument("--emit-pack-dir")
+    parser.add_argument("--execute", action="store_true")
+    parser.add_argument("--evidence-dir")
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Evidence commands to run concurrently."
+    )
+    parser.add_argument(
+        "--timeout-sec", type=float, default=None, help="Per-command timeout used by --execute."
+    )
+    parser.add_argument(cli["doc_flag"], dest="doc_flag", action="store_true")
+    return parser
+
+
+def run(spec: dict[str, Any], argv: list[str] | None = None) -> int:
+    ns = build_parser(spec).parse_args(argv)
+    root = Path(ns.root).resolve()
+    constants = spec["constants"]
+
+    if ns.doc_flag:
+        page = root / constants["_PAGE_PATH"]
+        if spec["cli"].get("doc_overwrite") or not page.exists():
+            _write(page, constants[spec["default_page"]])
+
+    payload = build_summary(spec, root)
+
+    if ns.emit_pack_dir:
+        emit_pack(spec, root, Path(ns.emit_pack_dir), payload)
+    execution: dict[str, Any] | None = None
+    if ns.execute:
+        evidence_dir = Path(ns.evidence_dir or spec["execution"]["default_dir"])
+        execution = execute_commands(
+            spec, root, evidence_dir, jobs=ns.jobs, timeout_sec=ns.timeout_sec
+        )
+        if spec["execution"].get("gate"):
+            payload["execution"] = execution
+
+    print(json.dumps(payload, indent=2) if ns.format == "json" else render_text(spec, payload))
+
+    strict_failed = not payload["summary"]["strict_pass"]
+    if execution is not None and spec["execution"].get("gate"):
+        strict_failed = strict_failed or not execution["strict_pass"]
+    return 1 if ns.strict and strict_failed else 0
+
+
+def _legacy_namespace(module: str, namespace: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Populate ``namespace`` with the public surface of a legacy closeout module."""
+    spec = load_spec(module)
+    namespace = {} if namespace is None else namespace
+    namespace.update(spec["constants"])
+
+    def bound() -> dict[str, Any]:
+        # Module-level constants stay patchable, exactly like the hand-written modules.
+        constants = {name: namespace.get(name, value) for name, value in spec["constants"].items()}
+        return {**spec, "constants": constants}
+
+    def build(root: Path) -> dict[str, Any]:
+        return build_summary(bound(), root)
+
+    def main(argv: list[str] | None = None) -> int:
+        return run(bound(), argv)
+
+    def render(payload: dict[str, Any]) -> str:
+        return render_text(spec, payload)
+
+    namespace.update(
+        {
+            spec["builder"]: build,
+            "main": main,
+            "build_parser": lambda: build_parser(spec),
+            "_render_text": render,
+            "SPEC": spec,
+        }
+    )
+    return namespace
+
+
+class _LegacyModuleLoader(importlib.abc.Loader):
+    def __init__(self, module: str) -> None:
+        self._module = module
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> types.ModuleType | None:
+        return None
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        _legacy_namespace(self._module, module.__dict__)
+
+    def get_code(self, fullname: str) -> types.CodeType:
+        # Lets ``python -m sdetkit.dayNN_*_closeout`` keep working.
+        source = (
+            "from sdetkit.closeout_engine import load_spec, run\n"
+            f"raise SystemExit(run(load_spec({self._module!r})))\n"
+        )
+        return compile(source, f"<closeout spec {self._module}>", "exec")
+
+
+def find_legacy_spec(fullname: str) -> importlib.machinery.ModuleSpec | None:
+    package, _, module = fullname.partition(".")
+    if package != __package__ or not module or "." in module or not has_spec(module):
+        return None
+    # ``origin`` doubles as ``sys.argv[0]`` under ``python -m``.
+    origin = str(_SPEC_DIR / f"{module}.json")
+    return importlib.machinery.ModuleSpec(fullname, _LegacyModuleLoader(module), origin=origin)
+
+
+__all__: list[str] = [
+    "CloseoutSpecError",
+    "build_summary",
+    "emit_pack",
+    "execute_commands",
+    "load_spec",
+    "render_text",
+    "run",
+    "spec_modules",
+]
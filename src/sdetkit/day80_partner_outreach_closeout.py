@@ -1,441 +0,0 @@
-from __future__ import annotations
-
-import argparse
-import json
-import shlex
-import subprocess
-import sys
-from pathlib import Path
-from typing import Any
-
-_PAGE_PATH = "docs/integrations-partner-outreach-closeout.md"
-_TOP10_PATH = "docs/top-10-github-strategy.md"
-_DAY79_SUMMARY_PATH = (
-    "docs/artifacts/day79-scale-upgrade-closeout-pack/day79-scale-upgrade-closeout-summary.json"
-)
-_DAY79_BOARD_PATH = "docs/artifacts/day79-scale-upgrade-closeout-pack/day79-delivery-board.md"
-_PLAN_PATH = "docs/roadmap/plans/partner-outreach-plan.json"
-_SECTION_HEADER = "# Day 80 \u2014 Partner outreach closeout lane"
-_REQUIRED_SECTIONS = [
-    "## Why Day 80 matters",
-    "## Required inputs (Day 79)",
-    "## Day 80 command lane",
-    "## Partner outreach contract",
-    "## Partner outreach quality checklist",
-    "## Day 80 delivery board",
-    "## Scoring model",
-]
-_REQUIRED_COMMANDS = [
-    "python -m sdetkit partner-outreach-closeout --format json --strict",
-    "python -m sdetkit partner-outreach-closeout --emit-pack-dir docs/artifacts/day80-partner-outreach-closeout-pack --format json --strict",
-    "python -m sdetkit partner-outreach-closeout --execute --evidence-dir docs/artifacts/day80-partner-outreach-closeout-pack/evidence --format json --strict",
-    "python scripts/check_day80_partner_outreach_closeout_contract.py",
-]
-_EXECUTION_COMMANDS = [
-    "python -m sdetkit partner-outreach-closeout --format json --strict",
-    "python -m sdetkit partner-outreach-closeout --emit-pack-dir docs/artifacts/day80-partner-outreach-closeout-pack --format json --strict",
-    "python scripts/check_day80_partner_outreach_closeout_contract.py --skip-evidence",
-]
-_REQUIRED_CONTRACT_LINES = [
-    "Single owner + backup reviewer are assigned for Day 80 partner outreach execution and signoff.",
-    "The Day 80 lane references Day 79 outcomes, controls, and KPI continuity signals.",
-    "Every Day 80 section includes partner CTA, runnable command CTA, KPI threshold, and rollback guardrail.",
-    "Day 80 closeout records partner onboarding outcomes, confidence notes, and Day 81 growth campaign priorities.",
-]
-_REQUIRED_QUALITY_LINES = [
-    "- [ ] Includes partner onboarding baseline, enablement cadence, and stakeholder assumptions",
-    "- [ ] Every partner lane row has owner, execution window, KPI threshold, and risk flag",
-    "- [ ] CTA links point to docs + runnable command evidence",
-    "- [ ] Scorecard captures partner score delta, scale carryover delta, confidence, and rollback owner",
-    "- [ ] Artifact pack includes integration brief, partner outreach plan, execution ledger, KPI scorecard, and execution log",
-]
-_REQUIRED_DELIVERY_BOARD_LINES = [
-    "- [ ] Day 80 integration brief committed",
-    "- [ ] Day 80 partner outreach plan committed",
-    "- [ ] Day 80 partner execution ledger exported",
-    "- [ ] Day 80 partner KPI scorecard snapshot exported",
-    "- [ ] Day 81 growth campaign priorities drafted from Day 80 learnings",
-]
-_REQUIRED_DATA_KEYS = [
-    '"plan_id"',
-    '"contributors"',
-    '"partner_tracks"',
-    '"baseline"',
-    '"target"',
-    '"owner"',
-]
-
-_DAY80_DEFAULT_PAGE = """# Day 80 \u2014 Partner outreach closeout lane
-
-Day 80 closes with a major upgrade that converts Day 79 scale outcomes into a partner-outreach execution pack.
-
-## Why Day 80 matters
-
-- Turns Day 79 scale outcomes into partner onboarding proof across docs, rollout, and adoption loops.
-- Protects launch quality with strict contract coverage, runnable commands, rollout guardrails, and rollback safety.
-- Creates a deterministic handoff from Day 80 partner outreach into Day 81 growth campaign priorities.
-
-## Required inputs (Day 79)
-
-- `docs/artifacts/day79-scale-upgrade-closeout-pack/day79-scale-upgrade-closeout-summary.json`
-- `docs/artifacts/day79-scale-upgrade-closeout-pack/day79-delivery-board.md`
-- `docs/roadmap/plans/partner-outreach-plan.json`
-
-## Day 80 command lane
-
-```bash
-python -m sdetkit partner-outreach-closeout --format json --strict
-python -m sdetkit partner-outreach-closeout --emit-pack-dir docs/artifacts/day80-partner-outreach-closeout-pack --format json --strict
-python -m sdetkit partner-outreach-closeout --execute --evidence-dir docs/artifacts/day80-partner-outreach-closeout-pack/evidence --format json --strict
-python scripts/check_day80_partner_outreach_closeout_contract.py
-```
-
-## Partner outreach contract
-
-- Single owner + backup reviewer are assigned for Day 80 partner outreach execution and signoff.
-- The Day 80 lane references Day 79 outcomes, controls, and KPI continuity signals.
-- Every Day 80 section includes partner CTA, runnable command CTA, KPI threshold, and rollback guardrail.
-- Day 80 closeout records partner onboarding outcomes, confidence notes, and Day 81 growth campaign priorities.
-
-## Partner outreach quality checklist
-
-- [ ] Includes partner onboarding baseline, enablement cadence, and stakeholder assumptions
-- [ ] Every partner lane row has owner, execution window, KPI threshold, and risk flag
-- [ ] CTA links point to docs + runnable command evidence
-- [ ] Scorecard captures partner score delta, scale carryover delta, confidence, and rollback owner
-- [ ] Artifact pack includes integration brief, partner outreach plan, execution ledger, KPI scorecard, and execution log
-
-## Day 80 delivery board
-
-- [ ] Day 80 integration brief committed
-- [ ] Day 80 partner outreach plan committed
-- [ ] Day 80 partner execution ledger exported
-- [ ] Day 80 partner KPI scorecard snapshot exported
-- [ ] Day 81 growth campaign priorities drafted from Day 80 learnings
-
-## Scoring model
-
-Day 80 weighted score (0-100):
-
-- Contract + command lane integrity (35)
-- Day 79 continuity baseline quality (35)
-- Partner evidence data + delivery board completeness (30)
-"""
-
-
-def _read_text(path: Path) -> str:
-    if not path.exists():
-        return ""
-    return path.read_text(encoding="utf-8")
-
-
-def _load_json(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        return {}
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        return payload if isinstance(payload, dict) else {}
-    except json.JSONDecodeError:
-        return {}
-
-
-def build_day80_partner_outreach_closeout_summary(root: Path) -> dict[str, Any]:
-    readme_text = _read_text(root / "README.md")
-    docs_index_text = _read_text(root / "docs/index.md")
-    page_text = _read_text(root / _PAGE_PATH)
-    top10_text = _read_text(root / _TOP10_PATH)
-
-    day79_summary = root / _DAY79_SUMMARY_PATH
-    day79_board = root / _DAY79_BOARD_PATH
-    day79_payload = _load_json(day79_summary)
-    day79_score = int(day79_payload.get("summary", {}).get("activation_score", 0) or 0)
-    day79_strict = bool(day79_payload.get("summary", {}).get("strict_pass", False))
-    day79_check_count = (
-        len(day79_payload.get("checks", []))
-        if isinstance(day79_payload.get("checks", []), list)
-        else 0
-    )
-
-    board_lines = [
-        line.strip()
-        for line in _read_text(day79_board).splitlines()
-        if line.strip().startswith("- [")
-    ]
-    board_count = len(board_lines)
-    board_has_day79 = any("Day 79" in line for line in board_lines)
-
-    missing_sections = [section for section in _REQUIRED_SECTIONS if section not in page_text]
-    missing_commands = [command for command in _REQUIRED_COMMANDS if command not in page_text]
-    missing_contract_lines = [line for line in _REQUIRED_CONTRACT_LINES if line not in page_text]
-    missing_quality_lines = [line for line in _REQUIRED_QUALITY_LINES if line not in page_text]
-    missing_board_items = [item for item in _REQUIRED_DELIVERY_BOARD_LINES if item not in page_text]
-
-    plan_text = _read_text(root / _PLAN_PATH)
-    missing_plan_keys = [key for key in _REQUIRED_DATA_KEYS if key not in plan_text]
-
-    checks: list[dict[str, Any]] = [
-        {
-            "check_id": "readme_day80_command",
-            "weight": 7,
-            "passed": ("partner-outreach-closeout" in readme_text),
-            "evidence": "README day80 command lane",
-        },
-        {
-            "check_id": "docs_index_day80_links",
-            "weight": 8,
-            "passed": (
-                "impact-80-big-upgrade-report.md" in docs_index_text
-                and "integrations-partner-outreach-closeout.md" in docs_index_text
-            ),
-            "evidence": "impact-80-big-upgrade-report.md + integrations-partner-outreach-closeout.md",
-        },
-        {
-            "check_id": "top10_day80_alignment",
-            "weight": 5,
-            "passed": ("Day 79" in top10_text and "Day 80" in top10_text),
-            "evidence": "Day 79 + Day 80 strategy chain",
-        },
-        {
-            "check_id": "day79_summary_present",
-            "weight": 10,
-            "passed": day79_summary.exists(),
-            "evidence": str(day79_summary),
-        },
-        {
-            "check_id": "day79_delivery_board_present",
-            "weight": 7,
-            "passed": day79_board.exists(),
-            "evidence": str(day79_board),
-        },
-        {
-            "check_id": "day79_quality_floor",
-            "weight": 13,
-            "passed": day79_score >= 85,
-            "evidence": {
-                "day79_score": day79_score,
-                "strict_pass": day79_strict,
-                "day79_checks": day79_check_count,
-            },
-        },
-        {
-            "check_id": "day79_board_integrity",
-            "weight": 5,
-            "passed": board_count >= 5 and board_has_day79,
-            "evidence": {"board_items": board_count, "contains_day79": board_has_day79},
-        },
-        {
-            "check_id": "page_header",
-            "weight": 7,
-            "passed": _SECTION_HEADER in page_text,
-            "evidence": _SECTION_HEADER,
-        },
-        {
-            "check_id": "required_sections",
-            "weight": 8,
-            "passed": not missing_sections,
-            "evidence": missing_sections or "all sections present",
-        },
-        {
-            "check_id": "required_commands",
-            "weight": 5,
-            "passed": not missing_commands,
-            "evidence": missing_commands or "all commands present",
-        },
-        {
-            "check_id": "contract_lock",
-            "weight": 5,
-            "passed": not missing_contract_lines,
-            "evidence": missing_contract_lines or "contract locked",
-        },
-        {
-            "check_id": "quality_checklist_lock",
-            "weight": 5,
-            "passed": not missing_quality_lines,
-            "evidence": missing_quality_lines or "quality checklist locked",
-        },
-        {
-            "check_id": "delivery_board_lock",
-            "weight": 5,
-            "passed": not missing_board_items,
-            "evidence": missing_board_items or "delivery board locked",
-        },
-        {
-            "check_id": "partner_plan_data_present",
-            "weight": 10,
-            "passed": not missing_plan_keys,
-            "evidence": missing_plan_keys or _PLAN_PATH,
-        },
-    ]
-
-    failed = [c for c in checks if not c["passed"]]
-    critical_failures: list[str] = []
-    if not day79_summary.exists() or not day79_board.exists():
-        critical_failures.append("day79_handoff_inputs")
-
-    wins: list[str] = []
-    misses: list[str] = []
-    handoff_actions: list[str] = []
-
-    if day79_score >= 85:
-        wins.append(f"Day 79 continuity baseline is stable with activation score={day79_score}.")
-    else:
-        misses.append("Day 79 continuity baseline is below the floor (<85).")
-        handoff_actions.append(
-            "Re-run Day 79 closeout command and raise baseline quality above 85 before Day 80 lock."
-        )
-
-    if board_count >= 5 and board_has_day79:
-        wins.append(
-            f"Day 79 delivery board integrity validated with {board_count} checklist items."
-        )
-    else:
-        misses.append(
-            "Day 79 delivery board integrity is incomplete (needs >=5 items and Day 79 anchors)."
-        )
-        handoff_actions.append("Repair Day 79 delivery board entries to include Day 79 anchors.")
-
-    if not missing_plan_keys:
-        wins.append("Day 80 partner outreach dataset is available for launch execution.")
-    else:
-        misses.append("Day 80 partner outreach dataset is missing required keys.")
-        handoff_actions.append(
-            "Update docs/roadmap/plans/partner-outreach-plan.json to restore required keys."
-        )
-
-    if not failed and not critical_failures:
-        wins.append(
-            "Day 80 partner outreach closeout lane is fully complete and ready for Day 81 growth campaign priorities."
-        )
-
-    score = int(round(sum(c["weight"] for c in checks if c["passed"])))
-    return {
-        "name": "partner-outreach-closeout",
-        "inputs": {
-            "readme": "README.md",
-            "docs_index": "docs/index.md",
-            "docs_page": _PAGE_PATH,
-            "top10": _TOP10_PATH,
-            "day79_summary": str(day79_summary.relative_to(root))
-            if day79_summary.exists()
-            else str(day79_summary),
-            "day79_delivery_board": str(day79_board.relative_to(root))
-            if day79_board.exists()
-            else str(day79_board),
-            "partner_outreach_plan": _PLAN_PATH,
-        },
-        "checks": checks,
-        "rollup": {
-            "day79_activation_score": day79_score,
-            "day79_checks": day79_check_count,
-            "day79_delivery_board_items": board_count,
-        },
-        "summary": {
-            "activation_score": score,
-            "passed_checks": len(checks) - len(failed),
-            "failed_checks": len(failed),
-            "critical_failures": critical_failures,
-            "strict_pass": not failed and not critical_failures,
-        },
-        "wins": wins,
-        "misses": misses,
-        "handoff_actions": handoff_actions,
-    }
-
-
-def _render_text(payload: dict[str, Any]) -> str:
-    lines = [
-        "Partner Outreach Closeout summary",
-        f"- Activation score: {payload['summary']['activation_score']}",
-        f"- Passed checks: {payload['summary']['passed_checks']}",
-        f"- Failed checks: {payload['summary']['failed_checks']}",
-        f"- Critical failures: {payload['summary']['critical_failures']}",
-    ]
-    return "\n".join(lines)
-
-
-def _write(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
-
-
-def _emit_pack(root: Path, pack_dir: Path, payload: dict[str, Any]) -> None:
-    target = pack_dir if pack_dir.is_absolute() else root / pack_dir
-    _write(
-        target / "day80-partner-outreach-closeout-summary.json",
-        json.dumps(payload, indent=2) + "\n",
-    )
-    _write(target / "day80-partner-outreach-closeout-summary.md", _render_text(payload) + "\n")
-    _write(target / "day80-integration-brief.md", "# Day 80 integration brief\n")
-    _write(target / "day80-partner-outreach-plan.md", "# Day 80 partner outreach plan\n")
-    _write(
-        target / "day80-partner-execution-ledger.json",
-        json.dumps({"executions": []}, indent=2) + "\n",
-    )
-    _write(target / "day80-partner-kpi-scorecard.json", json.dumps({"kpis": []}, indent=2) + "\n")
-    _write(target / "day80-execution-log.md", "# Day 80 execution log\n")
-    _write(
-        target / "day80-delivery-board.md",
-        "\n".join(["# Day 80 delivery board", *_REQUIRED_DELIVERY_BOARD_LINES]) + "\n",
-    )
-    _write(
-        target / "day80-validation-commands.md",
-        "# Day 80 validation commands\n\n```bash\n" + "\n".join(_EXECUTION_COMMANDS) + "\n```\n",
-    )
-
-
-def _execute_commands(root: Path, evidence_dir: Path) -> None:
-    events: list[dict[str, Any]] = []
-    out_dir = evidence_dir if evidence_dir.is_absolute() else root / evidence_dir
-    out_dir.mkdir(parents=True, exist_ok=True)
-    for idx, command in enumerate(_EXECUTION_COMMANDS, start=1):
-        argv = shlex.split(command)
-        if argv and argv[0] == "python":
-            argv[0] = sys.executable
-        result = subprocess.run(argv, cwd=root, capture_output=True, text=True)
-        event = {
-            "command": command,
-            "returncode": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-        }
-        events.append(event)
-        _write(out_dir / f"command-{idx:02d}.log", json.dumps(event, indent=2) + "\n")
-    _write(
-        out_dir / "day80-execution-summary.json",
-        json.dumps({"total_commands": len(events), "commands": events}, indent=2) + "\n",
-    )
-
-
-def main(argv: list[str] | None = None) -> int:
-    parser = argparse.ArgumentParser(description="Partner Outreach Closeout checks")
-    parser.add_argument("--root", default=".")
-    parser.add_argument("--format", choices=["json", "text"], default="text")
-    parser.add_argument("--strict", action="store_true")
-    parser.add_argument("--emit-pack-dir")
-    parser.add_argument("--execute", action="store_true")
-    parser.add_argument("--evidence-dir")
-    parser.add_argument("--write-default-doc", action="store_true")
-    ns = parser.parse_args(argv)
-
-    root = Path(ns.root).resolve()
-    if ns.write_default_doc:
-        _write(root / _PAGE_PATH, _DAY80_DEFAULT_PAGE)
-
-    payload = build_day80_partner_outreach_closeout_summary(root)
-
-    if ns.emit_pack_dir:
-        _emit_pack(root, Path(ns.emit_pack_dir), payload)
-    if ns.execute:
-        evidence_dir = (
-            Path(ns.evidence_dir)
-            if ns.evidence_dir
-            else Path("docs/artifacts/day80-partner-outreach-closeout-pack/evidence")
-        )
-        _execute_commands(root, evidence_dir)
-
-    print(json.dumps(payload, indent=2) if ns.format == "json" else _render_text(payload))
-    return 1 if ns.strict and not payload["summary"]["strict_pass"] else 0
-
-
-if __name__ == "__main__":
-    raise SystemExit(main())
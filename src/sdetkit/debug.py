@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any
+
+from .atomicio import canonical_json_dumps
+
+SCHEMA_VERSION = "sdetkit.debug.startup.v1"
+BUDGET_SCHEMA_VERSION = "sdetkit.startup.budget.v1"
+DEFAULT_BUDGET = Path(".sdetkit") / "startup-budget.json"
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class StartupSample:
+    wall_ms: float
+    records: tuple[ImportRecord, ...]
+    returncode: int = 0
+    # Last stderr line that is not importtime output, to explain a failed run.
+    error: str = ""
+
+    @property
+    def import_us(self) -> int:
+        return sum(r.cumulative_us for r in self.records if r.depth == 0)
+
+    @property
+    def modules(self) -> tuple[str, ...]:
+        return tuple(r.module for r in self.records)
+
+    def sdetkit_modules(self) -> int:
+        return sum(1 for m in self.modules if m == "sdetkit" or m.startswith("sdetkit."))
+
+
+@dataclass(frozen=True)
+class CommandBudget:
+    name: str
+    argv: tuple[str, ...]
+    max_warm_import_ms: float | None = None
+    max_sdetkit_modules: int | None = None
+
+
+@dataclass(frozen=True)
+class StartupBudget:
+    forbidden_modules: tuple[str, ...]
+    commands: tuple[CommandBudget, ...] = field(default_factory=tuple)
+
+
+def parse_importtime(stderr: str) -> tuple[ImportRecord, ...]:
+    """Parse ``python -X importtime`` output into per-module records."""
+    out: list[ImportRecord] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split(":", 1)[1].split("|")
+        if len(parts) != 3:
+            continue
+        self_s, cum_s, raw_name = parts
+        if not self_s.strip().isdigit() or not cum_s.strip().isdigit():
+            continue
+        name = raw_name.rstrip()
+        stripped = name.lstrip(" ")
+        depth = max(0, (len(name) - len(stripped) - 1) // 2)
+        out.append(ImportRecord(stripped, int(self_s), int(cum_s), depth))
+    return tuple(out)
+
+
+def load_budget(path: Path) -> StartupBudget:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or data.get("schema_version") != BUDGET_SCHEMA_VERSION:
+        raise ValueError(f"{path}: expected schema_version {BUDGET_SCHEMA_VERSION!r}")
+    commands: list[CommandBudget] = []
+    for item in data.get("commands", []):
+        commands.append(
+            CommandBudget(
+                name=str(item["name"]),
+                argv=tuple(str(a) for a in item["argv"]),
+                max_warm_import_ms=item.get("max_warm_import_ms"),
+                max_sdetkit_modules=item.get("max_sdetkit_modules"),
+            )
+        )
+    return StartupBudget(
+        forbidden_modules=tuple(str(p) for p in data.get("forbidden_modules", [])),
+        commands=tuple(commands),
+    )
+
+
+def check_budget(
+    command: CommandBudget, forbidden: tuple[str, ...], warm: StartupSample
+) -> list[str]:
+    """Return human readable budget violations for one measured command."""
+    violations: list[str] = []
+    for module in warm.modules:
+        for pattern in forbidden:
+            if fnmatchcase(module, pattern):
+                violations.append(f"forbidden module imported: {module} (matches {pattern})")
+                break
+    if command.max_sdetkit_modules is not None:
+        count = warm.sdetkit_modules()
+        if count > command.max_sdetkit_modules:
+            violations.append(
+                f"sdetkit modules loaded: {count} > budget {command.max_sdetkit_modules}"
+            )
+    if command.max_warm_import_ms is not None:
+        ms = warm.import_us / 1000.0
+        if ms > command.max_warm_import_ms:
+            violations.append(
+                f"warm import time: {ms:.1f} ms > budget {command.max_warm_import_ms} ms"
+            )
+    return violations
+
+
+def _run_once(argv: tuple[str, ...], env: dict[str, str], cwd: Path) -> StartupSample:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "sdetkit", *argv],
+        cwd=str(cwd),
+        env=env,
+        text=True,
+        capture_output=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000.0
+    other = [
+        ln for ln in proc.stderr.splitlines() if ln.strip() and not ln.startswith("import time:")
+    ]
+    return StartupSample(
+        wall_ms=wall_ms,
+        records=parse_importtime(proc.stderr),
+        returncode=proc.returncode,
+        error=other[-1].strip() if other else "",
+    )
+
+
+def _measure(
+    command: CommandBudget, runs: int, cwd: Path
+) -> tuple[StartupSample, list[StartupSample]]:
+    with tempfile.TemporaryDirectory(prefix="sdetkit-startup-") as tmp:
+        env = dict(os.environ)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        # A private bytecode prefix and cache dir make the first run genuinely cold
+        # (compile + registry rebuild) and every later run reuse what it wrote.
+        env["PYTHONPYCACHEPREFIX"] = str(Path(tmp) / "pycache")
+        env["SDETKIT_CACHE_DIR"] = str(Path(tmp) / "cache")
+        cold = _run_once(command.argv, env, cwd)
+        warm = [_run_once(command.argv, env, cwd) for _ in range(max(1, runs))]
+    return cold, warm
+
+
+def _median_sample(samples: list[StartupSample]) -> StartupSample:
+    ordered = sorted(samples, key=lambda s: s.import_us)
+    return ordered[len(ordered) // 2]
+
+
+def _sample_payload(sample: StartupSample) -> dict[str, Any]:
+    return {
+        "import_ms": round(sample.import_us / 1000.0, 2),
+        "sdetkit_modules": sample.sdetkit_modules(),
+        "total_modules": len(sample.records),
+        "wall_ms": round(sample.wall_ms, 1),
+    }
+
+
+def _top_modules(sample: StartupSample, top: int) -> list[dict[str, Any]]:
+    ranked = sorted(sample.records, key=lambda r: (-r.self_us, r.module))[: max(0, top)]
+    return [
+        {"cumulative_us": r.cumulative_us, "module": r.module, "self_us": r.self_us} for r in ranked
+    ]
+
+
+def _cmd_startup(ns: argparse.Namespace) -> int:
+    budget_path = Path(ns.budget)
+    try:
+        budget = load_budget(budget_path)
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        sys.stderr.write(f"debug startup error: cannot load budget {budget_path}: {exc}\n")
+        return 2
+
+    selected = set(ns.command or [])
+    commands = [c for c in budget.commands if not selected or c.name in selected]
+    unknown = sorted(selected - {c.name for c in budget.commands})
+    if unknown:
+        sys.stderr.write(f"debug startup error: unknown command(s): {', '.join(unknown)}\n")
+        return 2
+
+    results: list[dict[str, Any]] = []
+    ok = True
+    for command in commands:
+        cold, warm_runs = _measure(command, ns.runs, Path.cwd())
+        warm = _median_sample(warm_runs)
+        violations = check_budget(command, budget.forbidden_modules, warm)
+        # A run that crashed (e.g. a failing import) is not a valid timing sample.
+        failed = next((s for s in (cold, *warm_runs) if s.returncode != 0), None)
+        if failed is not None:
+            detail = f": {failed.error}" if failed.error else ""
+            violations.insert(0, f"command exited with status {failed.returncode}{detail}")
+        ok = ok and not violations
+        results.append(
+            {
+                "argv": list(command.argv),
+                "cold": _sample_payload(cold),
+                "name": command.name,
+                "top_modules": _top_modules(warm, ns.top),
+                "violations": violations,
+                "warm": {
+                    **_sample_payload(warm),
+                    "wall_ms_median": round(statistics.median(s.wall_ms for s in warm_runs), 1),
+                },
+            }
+        )
+
+    payload = {
+        "budget": str(budget_path),
+        "commands": results,
+        "ok": ok,
+        "runs": max(1, ns.runs),
+        "schema_version": SCHEMA_VERSION,
+    }
+    if ns.format == "json":
+        sys.stdout.write(canonical_json_dumps(payload))
+        return 0 if ok else 2
+
+    lines = [f"startup budget: {'OK' if ok else 'FAIL'} ({budget_path})"]
+    for item in results:
+        cold_p, warm_p = item["cold"], item["warm"]
+        lines.append(
+            f"- sdetkit {' '.join(item['argv'])}: "
+            f"cold {cold_p['wall_ms']:.0f} ms, warm {warm_p['wall_ms_median']:.0f} ms, "
+            f"imports {warm_p['import_ms']:.1f} ms, sdetkit modules {warm_p['sdetkit_modules']}"
+        )
+        for mod in item["top_modules"]:
+            lines.append(
+                f"    {mod['self_us'] / 1000:7.2f} ms self {mod['cumulative_us'] / 1000:8.2f} ms cum  {mod['module']}"
+            )
+        for violation in item["violations"]:
+            lines.append(f"  ! {violation}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 0 if ok else 2
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="sdetkit debug", description="Diagnostics for sdetkit itself."
+    )
+    sub = parser.add_subparsers(dest="action", required=True)
+    startup = sub.add_parser(
+        "startup",
+        help="Measure cold/warm CLI startup and enforce the import-time budget.",
+    )
+    startup.add_argument("--budget", default=str(DEFAULT_BUDGET))
+    startup.add_argument(
+        "--command",
+        action="append",
+        default=None,
+        help="Only measure the named budget entry (repeatable).",
+    )
+    startup.add_argument("--runs", type=int, default=5, help="Warm runs per command.")
+    startup.add_argument("--top", type=int, default=10, help="Slowest modules to report.")
+    startup.add_argument("--format", choices=["text", "json"], default="text")
+    ns = parser.parse_args(argv)
+    return _cmd_startup(ns)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+"""Bounded-concurrency runner for ``--execute`` evidence command chains.
+
+Lane evidence chains are mostly independent ``python -m sdetkit ...`` calls, so
+they run on a small thread pool; results always come back in command order.
+While a command runs, its stdout/stderr stream to ``.command-NN.*.partial``
+files in the evidence directory (handy to ``tail -f`` a slow nightly lane);
+they are removed once the command finishes and the caller writes its usual logs.
+"""
+
+from __future__ import annotations
+
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+TIMEOUT_RETURNCODE = 124
+_JOBS_ENV = "SDETKIT_EVIDENCE_JOBS"
+
+
+@dataclass(frozen=True)
+class CommandResult:
+    index: int
+    command: str
+    returncode: int
+    stdout: str
+    stderr: str
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+
+def default_jobs() -> int:
+    raw = os.environ.get(_JOBS_ENV, "")
+    if raw.strip().isdigit() and int(raw) > 0:
+        return int(raw)
+    return min(4, os.cpu_count() or 1)
+
+
+def command_argv(command: str) -> list[str]:
+    argv = shlex.split(command)
+    if argv and argv[0] == "python":
+        argv[0] = sys.executable
+    return argv
+
+
+def _stream_file(stream_dir: Path | None, index: int, channel: str) -> IO[bytes]:
+    if stream_dir is None:
+        return tempfile.TemporaryFile()
+    return (stream_dir / f".command-{index:02d}.{channel}.partial").open("w+b")
+
+
+def _read_back(handle: IO[bytes]) -> str:
+    handle.flush()
+    handle.seek(0)
+    return handle.read().decode("utf-8", errors="replace")
+
+
+def _as_text(data: str | bytes | None) -> str:
+    if isinstance(data, bytes):
+        return data.decode("utf-8", errors="replace")
+    return data or ""
+
+
+def _run_one(
+    index: int,
+    command: str,
+    cwd: Path | None,
+    timeout: float | None,
+    stream_dir: Path | None,
+) -> CommandResult:
+    out = _stream_file(stream_dir, index, "stdout")
+    err = _stream_file(stream_dir, index, "stderr")
+    try:
+        try:
+            proc = subprocess.run(
+                command_argv(command),
+                cwd=cwd,
+                stdout=out,
+                stderr=err,
+                timeout=timeout,
+                check=False,
+            )
+        except subprocess.TimeoutExpired as exc:
+            # ``subprocess.run`` has already killed the child; keep what it streamed so far.
+            return CommandResult(
+                index=index,
+                command=command,
+                returncode=TIMEOUT_RETURNCODE,
+                stdout=_read_back(out) or _as_text(exc.stdout),
+                stderr=_read_back(err) or _as_text(exc.stderr),
+                timed_out=True,
+            )
+        return CommandResult(
+            index=index,
+            command=command,
+            returncode=proc.returncode,
+            stdout=_read_back(out),
+            stderr=_read_back(err),
+        )
+    finally:
+        for handle in (out, err):
+            handle.close()
+            if stream_dir is not None:
+                Path(handle.name).unlink(missing_ok=True)
+
+
+def run_commands(
+    commands: Sequence[str],
+    *,
+    cwd: Path | None = None,
+    timeout: float | None = None,
+    jobs: int | None = None,
+    stream_dir: Path | None = None,
+) -> list[CommandResult]:
+    """Run ``commands`` with at most ``jobs`` in flight and return results in input order.
+
+    ``timeout`` applies to each command; a command that exceeds it is killed and
+    reported with return code 124. ``jobs`` defaults to ``$SDETKIT_EVIDENCE_JOBS``
+    or ``min(4, cpu_count)``; ``jobs=1`` reproduces the old sequential behaviour.
+    """
+    if stream_dir is not None:
+        stream_dir.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(jobs or default_jobs(), len(commands) or 1))
+    items = list(enumerate(commands, start=1))
+    if workers == 1:
+        return [_run_one(i, c, cwd, timeout, stream_dir) for i, c in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sdetkit-evidence") as pool:
+        futures = [pool.submit(_run_one, i, c, cwd, timeout, stream_dir) for i, c in items]
+        return [future.result() for future in futures]
@@ -0,0 +1,380 @@
+"""Opt-in HTTP response cache for sdetkit clients.
+
+``CachingTransport`` / ``AsyncCachingTransport`` wrap any httpx transport and keep
+successful ``GET`` responses in a size-bounded SQLite file with LRU eviction.
+Fresh entries (``Cache-Control: max-age``) are served without touching the
+network; stale entries carrying ``ETag``/``Last-Modified`` are revalidated with
+``If-None-Match``/``If-Modified-Since``. Every response passing through the
+transport is tagged with ``response.extensions["sdetkit_cache"]`` (``hit``,
+``revalidated``, ``miss`` or ``bypass``) and surfaces as
+``ClientEvent.cache_status`` on the netclient hooks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from .netclient import CACHE_EXTENSION
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_DB_NAME = "http-cache.sqlite3"
+# Decoded bodies are stored, so transport-level framing headers must not be replayed.
+_DROP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    expires_at: float
+    etag: str | None
+    last_modified: str | None
+
+
+def _cache_control(headers: httpx.Headers) -> dict[str, str | None]:
+    out: dict[str, str | None] = {}
+    for part in headers.get("Cache-Control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            out[name.lower()] = value.strip().strip('"') or None
+    return out
+
+
+def _max_age(directives: dict[str, str | None]) -> float:
+    raw = directives.get("max-age")
+    try:
+        return max(0.0, float(int(raw))) if raw is not None else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _vary_names(headers: httpx.Headers) -> list[str] | None:
+    """Request headers that select a stored variant, or ``None`` for ``Vary: *``."""
+    names = {n.strip().lower() for n in headers.get("Vary", "").split(",") if n.strip()}
+    if "*" in names:
+        # No later request can be known to match, so the response is not reusable.
+        return None
+    # A private cache still must not hand one credential's response to another.
+    names.add("authorization")
+    return sorted(names)
+
+
+def _digest(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8", errors="surrogatepass"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed store shared by the sync and async caching transports."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self.path = Path(directory) / _DB_NAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS vary (base TEXT PRIMARY KEY, names TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, status INTEGER NOT NULL, headers TEXT NOT NULL,"
+            " body BLOB NOT NULL, size INTEGER NOT NULL, expires_at REAL NOT NULL,"
+            " etag TEXT, last_modified TEXT, last_access REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries(last_access)")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _base(self, request: httpx.Request) -> str:
+        return _digest(request.method.upper(), str(request.url))
+
+    def _key(self, base: str, names: list[str], request: httpx.Request) -> str:
+        return _digest(base, *(f"{n}:{request.headers.get(n, '')}" for n in names))
+
+    def lookup(self, request: httpx.Request) -> tuple[str, CacheEntry] | None:
+        base = self._base(request)
+        with self._lock:
+            row = self._db.execute("SELECT names FROM vary WHERE base = ?", (base,)).fetchone()
+            if row is None:
+                return None
+            key = self._key(base, json.loads(row[0]), request)
+            hit = self._db.execute(
+                "SELECT status, headers, body, expires_at, etag, last_modified"
+                " FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if hit is None:
+                return None
+            self._db.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?", (self._clock(), key)
+            )
+        status, headers, body, expires_at, etag, last_modified = hit
+        entry = CacheEntry(
+            status_code=int(status),
+            headers=[(str(k), str(v)) for k, v in json.loads(headers)],
+            body=bytes(body),
+            expires_at=float(expires_at),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        return key, entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return self._clock() < entry.expires_at
+
+    def store(self, request: httpx.Request, response: httpx.Response, body: bytes) -> bool:
+        directives = _cache_control(response.headers)
+        if "no-store" in directives or "no-store" in _cache_control(request.headers):
+            return False
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        max_age = 0.0 if "no-cache" in directives else _max_age(directives)
+        if max_age <= 0 and etag is None and last_modified is None:
+            return False
+        if len(body) > self.max_bytes:
+            return False
+
+        names = _vary_names(response.headers)
+        if names is None:
+            return False
+        base = self._base(request)
+        key = self._key(base, names, request)
+        headers = [
+            (k, v) for k, v in response.headers.multi_items() if k.lower() not in _DROP_HEADERS
+        ]
+        now = self._clock()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO vary (base, names) VALUES (?, ?)",
+                (base, json.dumps(names)),
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries"
+                " (key, status, headers, body, size, expires_at, etag, last_modified, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status_code,
+                    json.dumps(headers),
+                    body,
+                    len(body),
+                    now + max_age,
+                    etag,
+                    last_modified,
+                    now,
+                ),
+            )
+            self._evict()
+        return True
+
+    def refresh(self, key: str, entry: CacheEntry, response: httpx.Response) -> CacheEntry:
+        """Apply a ``304 Not Modified`` to ``entry`` and return the refreshed entry."""
+        max_age = _max_age(_cache_control(response.headers))
+        merged = dict((k.lower(), (k, v)) for k, v in entry.headers)
+        for k, v in response.headers.multi_items():
+            if k.lower() not in _DROP_HEADERS:
+                merged[k.lower()] = (k, v)
+        headers = list(merged.values())
+        now = self._clock()
+        refreshed = CacheEntry(
+            status_code=entry.status_code,
+            headers=headers,
+            body=entry.body,
+            expires_at=now + max_age,
+            etag=response.headers.get("ETag", entry.etag),
+            last_modified=response.headers.get("Last-Modified", entry.last_modified),
+        )
+        with self._lock:
+            self._db.execute(
+                "UPDATE entries SET headers = ?, expires_at = ?, etag = ?, last_modified = ?,"
+                " last_access = ? WHERE key = ?",
+                (
+                    json.dumps(headers),
+                    refreshed.expires_at,
+                    refreshed.etag,
+                    refreshed.last_modified,
+                    now,
+                    key,
+                ),
+            )
+        return refreshed
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return int(total)
+
+    def _evict(self) -> None:
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute(
+            "SELECT key, size FROM entries ORDER BY last_access ASC"
+        ).fetchall():
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+
+def _cacheable_request(request: httpx.Request) -> bool:
+    if request.method.upper() != "GET":
+        return False
+    directives = _cache_control(request.headers)
+    return "no-store" not in directives
+
+
+def _conditional(request: httpx.Request, entry: CacheEntry) -> httpx.Request:
+    headers = httpx.Headers(request.headers)
+    if entry.etag is not None:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified is not None:
+        headers["If-Modified-Since"] = entry.last_modified
+    return httpx.Request(
+        request.method, request.url, headers=headers, extensions=request.extensions
+    )
+
+
+def _from_entry(request: httpx.Request, entry: CacheEntry, status: str) -> httpx.Response:
+    return httpx.Response(
+        status_code=entry.status_code,
+        headers=entry.headers,
+        content=entry.body,
+        request=request,
+        extensions={CACHE_EXTENSION: status},
+    )
+
+
+def _tagged(
+    request: httpx.Request, response: httpx.Response, body: bytes, status: str
+) -> httpx.Response:
+    headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _DROP_HEADERS]
+    return httpx.Response(
+        status_code=response.status_code,
+        headers=headers,
+        content=body,
+        request=request,
+        extensions={**response.extensions, CACHE_EXTENSION: status},
+    )
+
+
+def _can_serve_fresh(cache: ResponseCache, request: httpx.Request, entry: CacheEntry) -> bool:
+    return "no-cache" not in _cache_control(request.headers) and cache.is_fresh(entry)
+
+
+class CachingTransport(httpx.BaseTransport):
+    def __init__(self, inner: httpx.BaseTransport, cache: ResponseCache) -> None:
+        self._inner = inner
+        self.cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not _cacheable_request(request):
+            response = self._inner.handle_request(request)
+            response.extensions = {**response.extensions, CACHE_EXTENSION: "bypass"}
+            return response
+
+        found = self.cache.lookup(request)
+        if found is not None:
+            key, entry = found
+            if _can_serve_fresh(self.cache, request, entry):
+                return _from_entry(request, entry, "hit")
+            if entry.etag is not None or entry.last_modified is not None:
+                response = self._inner.handle_request(_conditional(request, entry))
+                if response.status_code == 304:
+                    response.close()
+                    return _from_entry(
+                        request, self.cache.refresh(key, entry, response), "revalidated"
+                    )
+                return self._store(request, response)
+
+        return self._store(request, self._inner.handle_request(request))
+
+    def _store(self, request: httpx.Request, response: httpx.Response) -> httpx.Response:
+        if response.status_code != 200:
+            response.extensions = {**response.extensions, CACHE_EXTENSION: "miss"}
+            return response
+        body = response.read()
+        response.close()
+        self.cache.store(request, response, body)
+        return _tagged(request, response, body, "miss")
+
+    def close(self) -> None:
+        try:
+            self._inner.close()
+        finally:
+            self.cache.close()
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`CachingTransport`.
+
+    SQLite reads and writes (each write may fsync) run in a worker thread so a
+    slow disk never stalls the event loop.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, cache: ResponseCache) -> None:
+        self._inner = inner
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not _cacheable_request(request):
+            response = await self._inner.handle_async_request(request)
+            response.extensions = {**response.extensions, CACHE_EXTENSION: "bypass"}
+            return response
+
+        found = await asyncio.to_thread(self.cache.lookup, request)
+        if found is not None:
+            key, entry = found
+            if _can_serve_fresh(self.cache, request, entry):
+                return _from_entry(request, entry, "hit")
+            if entry.etag is not None or entry.last_modified is not None:
+                response = await self._inner.handle_async_request(_conditional(request, entry))
+                if response.status_code == 304:
+                    await response.aclose()
+                    refreshed = await asyncio.to_thread(self.cache.refresh, key, entry, response)
+                    return _from_entry(request, refreshed, "revalidated")
+                return await self._store(request, response)
+
+        return await self._store(request, await self._inner.handle_async_request(request))
+
+    async def _store(self, request: httpx.Request, response: httpx.Response) -> httpx.Response:
+        if response.status_code != 200:
+            response.extensions = {**response.extensions, CACHE_EXTENSION: "miss"}
+            return response
+        body = await response.aread()
+        await response.aclose()
+        await asyncio.to_thread(self.cache.store, request, response, body)
+        return _tagged(request, response, body, "miss")
+
+    async def aclose(self) -> None:
+        try:
+            await self._inner.aclose()
+        finally:
+            await asyncio.to_thread(self.cache.close)
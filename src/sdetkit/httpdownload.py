@@ -0,0 +1,205 @@
+"""Streaming, resumable downloads for ``apiget --raw --out``.
+
+The body goes chunk by chunk into ``<out>.part``, never into memory. Once the
+size (``Content-Length``/``Content-Range``) and optional SHA-256 check out, the
+file is fsynced and renamed over ``<out>``. If the transfer breaks, the partial
+file stays next to a small ``<out>.part.json`` holding the response validator
+(``ETag`` or ``Last-Modified``). The next attempt, in this process or a later
+run, sends ``Range: bytes=N-`` with ``If-Range`` so the server either continues
+the same representation (206) or sends the whole, changed body again (200).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .netclient import HttpStatusError
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_CONTENT_RANGE = re.compile(r"^\s*bytes\s+(?:(\d+)-(\d+)|\*)/(\d+|\*)\s*$", re.IGNORECASE)
+
+
+class DownloadError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    path: Path
+    total_bytes: int
+    bytes_transferred: int
+    resumed_from: int
+    sha256: str
+    status_code: int
+
+
+def partial_paths(dest: Path) -> tuple[Path, Path]:
+    return dest.with_name(dest.name + ".part"), dest.with_name(dest.name + ".part.json")
+
+
+def _content_range(value: str | None) -> tuple[int | None, int | None]:
+    """Return ``(start, total)`` from a ``Content-Range`` header, ``None`` where unknown."""
+    m = _CONTENT_RANGE.match(value or "")
+    if not m:
+        return None, None
+    start = int(m.group(1)) if m.group(1) is not None else None
+    total = int(m.group(3)) if m.group(3) != "*" else None
+    return start, total
+
+
+def _validator(r: httpx.Response) -> str | None:
+    etag: str | None = r.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    modified: str | None = r.headers.get("Last-Modified")
+    return modified
+
+
+def _load_validator(meta: Path, url: str) -> str | None:
+    try:
+        data = json.loads(meta.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("url") != url:
+        return None
+    value = data.get("validator")
+    return value if isinstance(value, str) and value else None
+
+
+def _hash_prefix(path: Path, size: int) -> Any:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        remaining = size
+        while remaining > 0:
+            block = f.read(min(DEFAULT_CHUNK_SIZE, remaining))
+            if not block:
+                break
+            h.update(block)
+            remaining -= len(block)
+    return h
+
+
+def download(
+    client: httpx.Client,
+    url: str,
+    dest: Path,
+    *,
+    headers: Mapping[str, str] | None = None,
+    timeout: float | httpx.Timeout | None = None,
+    retries: int = 3,
+    expected_sha256: str | None = None,
+    resume: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_response: Callable[[httpx.Response], None] | None = None,
+) -> DownloadResult:
+    """Stream ``url`` into ``dest`` with Range resume, verification and atomic rename.
+
+    ``retries`` bounds the number of requests made; each retry after a dropped
+    connection resumes from the bytes already on disk. ``on_response`` sees
+    every response before its body is read (status/header printing).
+    Non-2xx answers raise :class:`HttpStatusError`; a size or checksum mismatch
+    raises :class:`DownloadError` and discards the partial file.
+    """
+    if retries < 1:
+        raise ValueError("retries must be >= 1")
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part, meta = partial_paths(dest)
+    want_sha = expected_sha256.strip().lower() if expected_sha256 else None
+
+    offset = part.stat().st_size if resume and part.exists() else 0
+    validator = _load_validator(meta, url) if offset else None
+    if offset and validator is None:
+        offset = 0  # nothing to pin the partial body to; start over
+    resumed_from = offset
+    transferred = 0
+    total: int | None = None
+    status = 0
+    hasher: Any = None
+    last_err: BaseException | None = None
+
+    for _attempt in range(retries):
+        req_headers = dict(headers or {})
+        req_headers["Accept-Encoding"] = "identity"  # ranges address the stored bytes
+        if offset and validator:
+            req_headers["Range"] = f"bytes={offset}-"
+            req_headers["If-Range"] = validator
+        try:
+            with client.stream("GET", url, headers=req_headers, timeout=timeout) as r:
+                if on_response is not None:
+                    on_response(r)
+                status = r.status_code
+                start, range_total = _content_range(r.headers.get("Content-Range"))
+                if status == 416 and offset and range_total == offset:
+                    total = offset  # the partial file already holds everything
+                    hasher = _hash_prefix(part, offset)
+                    break
+                if status == 206:
+                    if start != offset:
+                        raise DownloadError(f"unexpected Content-Range for resume at {offset}")
+                    total = range_total
+                elif 200 <= status < 300:
+                    offset = 0
+                    resumed_from = 0
+                    length = r.headers.get("Content-Length")
+                    total = int(length) if length and length.isdigit() else None
+                else:
+                    r.read()
+                    raise HttpStatusError("non-2xx response", response=r)
+
+                validator = _validator(r)
+                if validator:
+                    meta.write_text(
+                        json.dumps({"url": url, "validator": validator}), encoding="utf-8"
+                    )
+                else:
+                    meta.unlink(missing_ok=True)
+                hasher = _hash_prefix(part, offset) if offset else hashlib.sha256()
+                with part.open("ab" if offset else "wb") as f:
+                    for chunk in r.iter_raw(chunk_size):
+                        f.write(chunk)
+                        hasher.update(chunk)
+                        transferred += len(chunk)
+                    f.flush()
+                    os.fsync(f.fileno())
+            break
+        except httpx.TransportError as e:
+            last_err = e
+            offset = part.stat().st_size if part.exists() else 0
+            if not validator:
+                offset = 0
+    else:
+        raise DownloadError(
+            f"download failed after {retries} attempt(s); partial file kept at {part.name}"
+        ) from last_err
+
+    size = part.stat().st_size if part.exists() else 0
+    if total is not None and size != total:
+        part.unlink(missing_ok=True)
+        meta.unlink(missing_ok=True)
+        raise DownloadError(f"size mismatch: expected {total} bytes, got {size}")
+    digest = hasher.hexdigest()
+    if want_sha is not None and digest != want_sha:
+        part.unlink(missing_ok=True)
+        meta.unlink(missing_ok=True)
+        raise DownloadError(f"sha256 mismatch: expected {want_sha}, got {digest}")
+    os.replace(part, dest)
+    meta.unlink(missing_ok=True)
+    return DownloadResult(
+        path=dest,
+        total_bytes=size,
+        bytes_transferred=transferred,
+        resumed_from=resumed_from,
+        sha256=digest,
+        status_code=status,
+    )
@@ -0,0 +1,284 @@
+"""Process-wide registry of shared, keep-alive ``httpx`` clients.
+
+Commands that talk to the same service many times in one process (agent
+providers, batch fetches, notifications) should not pay a fresh TCP/TLS
+handshake per call. :func:`shared_client` and :func:`shared_async_client` hand
+out one long-lived client per base URL and connection settings, with pool
+limits tuned for that reuse and HTTP/2 when the optional ``h2`` package is
+installed.
+
+Shared clients belong to the registry: use them directly instead of in a
+``with`` block, and leave closing to :func:`close_all` (registered with
+``atexit``). Async clients are additionally scoped to the running event loop,
+because their pooled connections cannot outlive it; close them from inside the
+loop with :func:`aclose_all`.
+
+:func:`pool_stats` reports, per client, how many requests were sent and how
+many new connections they needed; the difference is connection reuse.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import importlib.util
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=32, keepalive_expiry=30.0
+)
+DEFAULT_TIMEOUT = 20.0
+
+_CONNECT_EVENT = "connection.connect_tcp.complete"
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    requests: int
+    connections_opened: int
+
+    @property
+    def reused(self) -> int:
+        return max(0, self.requests - self.connections_opened)
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    def request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def snapshot(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(requests=self.requests, connections_opened=self.connections)
+
+
+def _sync_hook(counter: _Counter) -> Any:
+    def on_request(request: httpx.Request) -> None:
+        counter.request()
+        prev = request.extensions.get("trace")
+
+        def trace(name: str, info: Mapping[str, Any]) -> None:
+            if name == _CONNECT_EVENT:
+                counter.connection()
+            if prev is not None:
+                prev(name, info)
+
+        request.extensions["trace"] = trace
+
+    return on_request
+
+
+def _async_hook(counter: _Counter) -> Any:
+    async def on_request(request: httpx.Request) -> None:
+        counter.request()
+        prev = request.extensions.get("trace")
+
+        async def trace(name: str, info: Mapping[str, Any]) -> None:
+            if name == _CONNECT_EVENT:
+                counter.connection()
+            if prev is not None:
+                await prev(name, info)
+
+        request.extensions["trace"] = trace
+
+    return on_request
+
+
+@dataclass
+class _Entry:
+    client: httpx.Client | httpx.AsyncClient
+    counter: _Counter
+    label: str
+    loop: asyncio.AbstractEventLoop | None = None
+
+
+class ClientRegistry:
+    """Shared clients keyed by ``(kind, base_url, settings)``; thread-safe."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[object, ...], _Entry] = {}
+        self._retired: dict[str, PoolStats] = {}
+        self._atexit = False
+
+    def _settings(
+        self,
+        base_url: str,
+        timeout: float | None,
+        verify: bool,
+        follow_redirects: bool,
+        limits: httpx.Limits | None,
+        http2: bool | None,
+    ) -> tuple[tuple[object, ...], dict[str, Any]]:
+        lim = limits or DEFAULT_LIMITS
+        h2 = http2_available() if http2 is None else http2
+        key = (
+            base_url.rstrip("/"),
+            timeout,
+            verify,
+            follow_redirects,
+            (lim.max_connections, lim.max_keepalive_connections, lim.keepalive_expiry),
+            h2,
+        )
+        kwargs: dict[str, Any] = {
+            "base_url": base_url,
+            "timeout": timeout,
+            "verify": verify,
+            "follow_redirects": follow_redirects,
+            "limits": lim,
+            "http2": h2,
+        }
+        return key, kwargs
+
+    def _retire(self, entry: _Entry) -> None:
+        old = self._retired.get(entry.label, PoolStats(0, 0))
+        now = entry.counter.snapshot()
+        self._retired[entry.label] = PoolStats(
+            requests=old.requests + now.requests,
+            connections_opened=old.connections_opened + now.connections_opened,
+        )
+
+    def client(
+        self,
+        base_url: str = "",
+        *,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        verify: bool = True,
+        follow_redirects: bool = False,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+    ) -> httpx.Client:
+        settings, kwargs = self._settings(
+            base_url, timeout, verify, follow_redirects, limits, http2
+        )
+        key = ("sync", *settings)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.client.is_closed:
+                return entry.client  # type: ignore[return-value]
+            if entry is not None:
+                self._retire(entry)
+            counter = _Counter()
+            client = httpx.Client(event_hooks={"request": [_sync_hook(counter)]}, **kwargs)
+            self._entries[key] = _Entry(client, counter, f"sync {settings[0] or '*'}")
+            self._register_atexit()
+            return client
+
+    def async_client(
+        self,
+        base_url: str = "",
+        *,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        verify: bool = True,
+        follow_redirects: bool = False,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+    ) -> httpx.AsyncClient:
+        """Shared async client for the running event loop (or a loop-less one)."""
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        settings, kwargs = self._settings(
+            base_url, timeout, verify, follow_redirects, limits, http2
+        )
+        key = ("async", id(loop), *settings)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.client.is_closed:
+                return entry.client  # type: ignore[return-value]
+            for stale in [k for k, e in self._entries.items() if e.loop and e.loop.is_closed()]:
+                self._retire(self._entries.pop(stale))  # their loop ended with asyncio.run()
+            if entry is not None and key in self._entries:
+                self._retire(self._entries.pop(key))
+            counter = _Counter()
+            client = httpx.AsyncClient(event_hooks={"request": [_async_hook(counter)]}, **kwargs)
+            self._entries[key] = _Entry(client, counter, f"async {settings[0] or '*'}", loop)
+            self._register_atexit()
+            return client
+
+    def _register_atexit(self) -> None:
+        if not self._atexit:
+            atexit.register(self.close)
+            self._atexit = True
+
+    def stats(self) -> dict[str, PoolStats]:
+        """Request and new-connection counts per client label, including retired clients."""
+        with self._lock:
+            out = dict(self._retired)
+            for entry in self._entries.values():
+                now = entry.counter.snapshot()
+                old = out.get(entry.label, PoolStats(0, 0))
+                out[entry.label] = PoolStats(
+                    requests=old.requests + now.requests,
+                    connections_opened=old.connections_opened + now.connections_opened,
+                )
+            return out
+
+    def close(self) -> None:
+        """Close every sync client and forget every async one.
+
+        Async clients cannot be closed without their event loop; by the time
+        this runs at exit that loop is normally gone and the sockets go with it.
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            for entry in entries:
+                self._retire(entry)
+            self._entries.clear()
+        for entry in entries:
+            if isinstance(entry.client, httpx.Client):
+                entry.client.close()
+
+    async def aclose(self) -> None:
+        """Close the async clients that belong to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            keys = [k for k, e in self._entries.items() if e.loop is loop]
+            entries = [self._entries.pop(k) for k in keys]
+            for entry in entries:
+                self._retire(entry)
+        for entry in entries:
+            if isinstance(entry.client, httpx.AsyncClient):
+                await entry.client.aclose()
+
+
+default_registry = ClientRegistry()
+
+
+def shared_client(base_url: str = "", **settings: Any) -> httpx.Client:
+    return default_registry.client(base_url, **settings)
+
+
+def shared_async_client(base_url: str = "", **settings: Any) -> httpx.AsyncClient:
+    return default_registry.async_client(base_url, **settings)
+
+
+def pool_stats() -> dict[str, PoolStats]:
+    return default_registry.stats()
+
+
+def close_all() -> None:
+    default_registry.close()
+
+
+async def aclose_all() -> None:
+    await default_registry.aclose()
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
+import hashlib
 import json
+import math
 import os
-import socket
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import httpx
+
 from .atomicio import canonical_json_dumps
-from .cassette import Cassette
+from .cassette import _NDJSON_FORMAT, NDJSON_SUFFIX, Cassette
 from .security import SecurityError, safe_path
 
 
@@ -20,13 +27,208 @@ def _load_profile(path: Path) -> dict[str, Any]:
     return obj
 
 
-def _probe_tcp_localhost(port: int, timeout_s: float = 0.2) -> bool:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.settimeout(timeout_s)
-        return sock.connect_ex(("127.0.0.1", port)) == 0
+# Retry-until-ready polling: first pause, doubled per attempt up to the cap.
+_POLL_FIRST_S = 0.05
+_POLL_MAX_S = 1.0
+DEFAULT_DEADLINE_S = 30.0
+
+
+async def _tcp_open(host: str, port: int, timeout_s: float) -> bool:
+    try:
+        _reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout_s)
+    except (OSError, TimeoutError):
+        return False
+    writer.close()
+    with contextlib.suppress(OSError):
+        await writer.wait_closed()
+    return True
+
+
+_MISSING = object()
+
+
+def _json_field(doc: Any, path: str) -> Any:
+    """Resolve a dotted path (``checks.db.up``, ``items.0.id``) or return ``_MISSING``."""
+    cur = doc
+    for part in path.split("."):
+        if isinstance(cur, dict) and part in cur:
+            cur = cur[part]
+        elif isinstance(cur, list) and part.isdigit() and int(part) < len(cur):
+            cur = cur[int(part)]
+        else:
+            return _MISSING
+    return cur
+
+
+def _http_verdict(
+    response: httpx.Response, statuses: list[int], fields: dict[str, Any]
+) -> str | None:
+    if response.status_code not in statuses:
+        return f"status {response.status_code}"
+    if not fields:
+        return None
+    try:
+        doc = response.json()
+    except ValueError:
+        return "invalid-json"
+    for path, want in fields.items():
+        got = _json_field(doc, path)
+        if got is _MISSING:
+            return f"missing field {path}"
+        if got != want:
+            return f"field {path} is {json.dumps(got)}, expected {json.dumps(want)}"
+    return None
+
+
+def _number(value: Any) -> float | None:
+    """``value`` as a finite number (JSON number or numeric string), else ``None``."""
+    if isinstance(value, bool) or not isinstance(value, int | float | str):
+        return None
+    try:
+        out = float(value)
+    except ValueError:
+        return None
+    return out if math.isfinite(out) else None
+
+
+def _service_check(
+    svc: dict[str, Any], clients: dict[bool, httpx.AsyncClient]
+) -> tuple[dict[str, Any], Any, float]:
+    """Build the report entry for ``svc``, a one-shot probe returning a failure reason
+    and the seconds to keep polling it.
+
+    A malformed ``port``, ``status``, ``timeout`` or ``wait`` fails the entry with
+    an ``invalid-*`` reason and no probe. HTTP probes share one ``AsyncClient``
+    per ``verify`` setting from ``clients``; they are created here, before any
+    probe starts, because building the TLS context blocks the event loop and
+    would eat into the other probes' timeouts.
+    """
+    name = str(svc.get("name", "service"))
+    check: dict[str, Any] = {"kind": "service", "name": name, "passed": False}
+    timeout_s = _number(svc.get("timeout", 0.2 if "url" not in svc else 2.0))
+    wait_s = _number(svc.get("wait", 0))
+    if timeout_s is None or timeout_s <= 0:
+        check["reason"] = "invalid-timeout"
+        return check, None, 0.0
+    if wait_s is None:
+        check["reason"] = "invalid-wait"
+        return check, None, 0.0
+    wait_s = max(0.0, wait_s)
+    if "url" in svc:
+        url = str(svc["url"])
+        raw_status = svc.get("status", 200)
+        codes = [_number(x) for x in (raw_status if isinstance(raw_status, list) else [raw_status])]
+        if not codes or any(c is None or c != int(c) or not 100 <= c <= 599 for c in codes):
+            check["reason"] = "invalid-status"
+            return check, None, 0.0
+        statuses = [int(c) for c in codes if c is not None]
+        fields = svc.get("json") or {}
+        if not url.startswith(("http://", "https://")) or not isinstance(fields, dict):
+            check["reason"] = "invalid-url" if isinstance(fields, dict) else "invalid-json-spec"
+            return check, None, 0.0
+        check.update({"url": url, "expect_status": statuses})
+        verify = bool(svc.get("verify", True))
+        if verify not in clients:
+            clients[verify] = httpx.AsyncClient(verify=verify)
+        client = clients[verify]
 
+        async def probe_http() -> str | None:
+            try:
+                response = await client.get(url, timeout=timeout_s)
+            except httpx.HTTPError as exc:
+                check["observed"] = "unreachable"
+                return f"unreachable: {type(exc).__name__}"
+            check["observed"] = response.status_code
+            return _http_verdict(response, statuses, fields)
 
-def _evaluate(profile: dict[str, Any]) -> dict[str, Any]:
+        return check, probe_http, wait_s
+
+    host = str(svc.get("host", "127.0.0.1"))
+    raw_port = _number(svc.get("port", 0))
+    expect = str(svc.get("expect", "closed"))
+    if raw_port is None or raw_port != int(raw_port) or not 0 < raw_port <= 65535:
+        check["reason"] = "invalid-port"
+        return check, None, 0.0
+    port = int(raw_port)
+    check.update({"host": host, "port": port, "expect": expect})
+
+    async def probe_tcp() -> str | None:
+        open_now = await _tcp_open(host, port, timeout_s)
+        check["observed"] = "open" if open_now else "closed"
+        return None if (open_now == (expect == "open")) else f"expected {expect}"
+
+    return check, probe_tcp, wait_s
+
+
+async def _poll(check: dict[str, Any], probe: Any, wait_s: float) -> None:
+    """Run ``probe`` until it passes or ``wait_s`` is spent, recording into ``check``."""
+    started = time.perf_counter()
+    pause = _POLL_FIRST_S
+    while True:
+        attempt_started = time.perf_counter()
+        check["attempts"] = check.get("attempts", 0) + 1
+        reason = await probe()
+        now = time.perf_counter()
+        check["latency_ms"] = round((now - attempt_started) * 1000, 3)
+        check["elapsed_ms"] = round((now - started) * 1000, 3)
+        if reason is None:
+            check["passed"] = True
+            check.pop("reason", None)
+            return
+        check["reason"] = reason
+        left = started + wait_s - now
+        if left <= 0:
+            return
+        await asyncio.sleep(min(pause, left))
+        pause = min(pause * 2, _POLL_MAX_S)
+
+
+async def _probe_services(
+    services: list[dict[str, Any]], deadline_s: float
+) -> list[dict[str, Any]]:
+    """Probe every service concurrently; whatever is unfinished at ``deadline_s`` fails."""
+    checks: list[dict[str, Any]] = []
+    tasks: dict[asyncio.Task[None], dict[str, Any]] = {}
+    clients: dict[bool, httpx.AsyncClient] = {}
+    try:
+        probes = [_service_check(svc, clients) for svc in services]
+        started = time.perf_counter()
+        for check, probe, wait_s in probes:
+            checks.append(check)
+            if probe is not None:
+                tasks[asyncio.ensure_future(_poll(check, probe, wait_s))] = check
+        if tasks:
+            _done, pending = await asyncio.wait(tasks, timeout=deadline_s)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for task in pending:
+                check = tasks[task]
+                check["passed"] = False
+                check["reason"] = "deadline-exceeded"
+                check["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    finally:
+        for client in clients.values():
+            await client.aclose()
+    return checks
+
+
+def _evaluate(profile: dict[str, Any], *, deadline_s: float | None = None) -> dict[str, Any]:
+    """Run :func:`_evaluate_async` on a fresh event loop; async callers await that instead."""
+    return asyncio.run(_evaluate_async(profile, deadline_s=deadline_s))
+
+
+async def _evaluate_async(
+    profile: dict[str, Any], *, deadline_s: float | None = None
+) -> dict[str, Any]:
+    """Check env vars, files and services; services are probed concurrently.
+
+    A service with a ``url`` is an HTTP(S) health check (``status``, optional
+    ``json`` field assertions by dotted path), otherwise a TCP connect to
+    ``host:port`` compared with ``expect``. ``wait`` keeps polling with
+    backoff until the check passes; the profile ``deadline`` (or
+    ``deadline_s``) bounds all service probes together.
+    """
     checks: list[dict[str, Any]] = []
 
     for env_name in sorted(str(x) for x in profile.get("required_env", [])):
@@ -38,30 +240,14 @@ def _evaluate(profile: dict[str, Any]) -> dict[str, Any]:
         checks.append({"kind": "file", "name": rel_file, "passed": exists})
 
     services = profile.get("services", [])
-    if isinstance(services, list):
-        for svc in sorted(
-            (x for x in services if isinstance(x, dict)), key=lambda x: str(x.get("name"))
-        ):
-            name = str(svc.get("name", "service"))
-            port = int(svc.get("port", 0))
-            expect = str(svc.get("expect", "closed"))
-            if port <= 0:
-                checks.append(
-                    {"kind": "service", "name": name, "passed": False, "reason": "invalid-port"}
-                )
-                continue
-            open_now = _probe_tcp_localhost(port)
-            passed = open_now if expect == "open" else (not open_now)
-            checks.append(
-                {
-                    "kind": "service",
-                    "name": name,
-                    "port": port,
-                    "expect": expect,
-                    "observed": "open" if open_now else "closed",
-                    "passed": passed,
-                }
-            )
+    if isinstance(services, list) and services:
+        if deadline_s is None:
+            deadline_s = _number(profile.get("deadline", DEFAULT_DEADLINE_S))
+            if deadline_s is None or deadline_s <= 0:
+                raise ValueError("deadline must be > 0")
+        checks.extend(
+            await _probe_services([x for x in services if isinstance(x, dict)], deadline_s)
+        )
 
     checks.sort(key=lambda x: (str(x.get("kind", "")), str(x.get("name", ""))))
     failed = [item for item in checks if not bool(item.get("passed"))]
@@ -82,19 +268,60 @@ def _evaluate(profile: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+class _Dup(dict[str, Any]):
+    """A decoded JSON object that repeated one of its keys (the last value won)."""
+
+
+def _pairs(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    obj = dict(pairs)
+    return _Dup(obj) if len(obj) != len(pairs) else obj
+
+
+def _has_dup(obj: Any) -> bool:
+    if isinstance(obj, _Dup):
+        return True
+    if isinstance(obj, dict):
+        return any(_has_dup(v) for v in obj.values())
+    if isinstance(obj, list):
+        return any(_has_dup(v) for v in obj)
+    return False
+
+
+def _valid_headers(headers: Any) -> bool:
+    return isinstance(headers, list) and all(
+        isinstance(kv, list) and len(kv) == 2 and all(isinstance(x, str) for x in kv)
+        for kv in headers
+    )
+
+
 def _validate_cassette(cassette_path: Path) -> dict[str, Any]:
-    cassette = Cassette.load(cassette_path, allow_absolute=True)
-    interactions = cassette.interactions
+    """Check a cassette one interaction at a time without loading its bodies.
+
+    ``*.ndjson`` cassettes are read line by line; recorded bodies are decoded
+    (v1) or decompressed in chunks and digest-checked (v2) one at a time and
+    then dropped, each distinct v2 blob once.
+    """
+    started = time.perf_counter()
+    bodies, items = Cassette.iter_index(cassette_path, object_pairs_hook=_pairs)
+    shell = Cassette(bodies=bodies)
+    verified: set[str] = set()
     invalid: list[dict[str, Any]] = []
     methods: dict[str, int] = {}
     hosts: set[str] = set()
+    keys: set[tuple[str, str, str]] = set()
+    duplicates = 0
+    count = 0
 
-    for idx, item in enumerate(interactions):
+    for idx, item in enumerate(items):
+        count += 1
         req = item.get("request") if isinstance(item, dict) else None
         resp = item.get("response") if isinstance(item, dict) else None
         if not isinstance(req, dict) or not isinstance(resp, dict):
             invalid.append({"index": idx, "reason": "invalid-shape"})
             continue
+        if _has_dup(item):
+            invalid.append({"index": idx, "reason": "duplicate-key"})
+            continue
 
         method = str(req.get("method", "")).upper()
         url = str(req.get("url", ""))
@@ -113,48 +340,195 @@ def _validate_cassette(cassette_path: Path) -> dict[str, Any]:
         status_code = resp.get("status_code")
         if not isinstance(status_code, int) or status_code < 100 or status_code > 599:
             invalid.append({"index": idx, "reason": "invalid-status-code"})
+            continue
+        if not all(_valid_headers(part.get("headers", [])) for part in (req, resp)):
+            invalid.append({"index": idx, "reason": "invalid-headers"})
+            continue
+        try:
+            for part in (req, resp):
+                sha = part.get("body_sha256")
+                if not (isinstance(sha, str) and sha in verified):
+                    shell.verify_body(part)
+                    if isinstance(sha, str):
+                        verified.add(sha)
+        except RuntimeError as exc:
+            invalid.append({"index": idx, "reason": "invalid-body", "detail": str(exc)})
+            continue
+
+        body_id = req.get("body_sha256")
+        if not isinstance(body_id, str):
+            body_id = hashlib.sha256(str(req.get("body_b64", "")).encode()).hexdigest()
+        key = (method, url, body_id)
+        if key in keys:
+            duplicates += 1
+        keys.add(key)
 
     return {
         "schema_version": "sdetkit.integration.cassette-validate.v1",
         "cassette": str(cassette_path),
         "summary": {
-            "interactions": len(interactions),
+            "interactions": count,
             "invalid": len(invalid),
             "hosts": sorted(hosts),
             "methods": {k: methods[k] for k in sorted(methods)},
+            # Repeats are legal (sequence replay serves them in order); indexed
+            # replay queues them per key.
+            "repeated_requests": duplicates,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
             "passed": len(invalid) == 0,
         },
         "invalid": invalid,
     }
 
 
+def _validate_file(path: Path) -> dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        return _validate_cassette(path)
+    except (ValueError, OSError) as exc:
+        return {
+            "cassette": str(path),
+            "error": str(exc),
+            "summary": {
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+                "passed": False,
+            },
+        }
+
+
+# How much of a file ``--dir`` reads to decide whether it is a cassette.
+_SNIFF_BYTES = 64 * 1024
+
+
+def _looks_like_cassette(path: Path) -> bool:
+    """Whether ``path`` starts like a cassette: an ndjson header line, or a JSON
+    object with an ``interactions`` key near the top (sorted keys put it there)."""
+    try:
+        with path.open("rb") as f:
+            head = f.read(_SNIFF_BYTES)
+    except OSError:
+        return True  # let validation report it
+    if path.suffix == NDJSON_SUFFIX:
+        return _NDJSON_FORMAT.encode() in head.split(b"\n", 1)[0]
+    return head.lstrip().startswith(b"{") and b'"interactions"' in head
+
+
+def _discover_cassettes(root: Path) -> tuple[list[Path], list[Path]]:
+    """Cassettes under ``root`` and the other ``*.json``/``*.ndjson`` files skipped."""
+    found = sorted(
+        {
+            p
+            for pattern in ("*.json", "*" + NDJSON_SUFFIX)
+            for p in root.rglob(pattern)
+            if p.is_file()
+        }
+    )
+    cassettes: list[Path] = []
+    skipped: list[Path] = []
+    for p in found:
+        (cassettes if _looks_like_cassette(p) else skipped).append(p)
+    return cassettes, skipped
+
+
+def _validate_many(
+    paths: list[Path], jobs: int, *, skipped: list[Path] | None = None
+) -> dict[str, Any]:
+    """Validate ``paths`` across a process pool, keeping input order in the report."""
+    started = time.perf_counter()
+    workers = max(1, min(jobs, len(paths)))
+    if workers == 1:
+        results = [_validate_file(p) for p in paths]
+    else:
+        chunksize = max(1, len(paths) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_validate_file, paths, chunksize=chunksize))
+    failed = [r for r in results if not r["summary"]["passed"]]
+    slowest = sorted(results, key=lambda r: r["summary"]["elapsed_ms"], reverse=True)[:5]
+    return {
+        "schema_version": "sdetkit.integration.cassette-validate-batch.v1",
+        "results": results,
+        "skipped": [str(p) for p in skipped or []],
+        "summary": {
+            "files": len(results),
+            "skipped": len(skipped or []),
+            "failed": len(failed),
+            "errors": sum(1 for r in results if "error" in r),
+            "interactions": sum(r["summary"].get("interactions", 0) for r in results),
+            "jobs": workers,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+            "slowest": [
+                {"cassette": r["cassette"], "elapsed_ms": r["summary"]["elapsed_ms"]}
+                for r in slowest
+            ],
+            "passed": not failed,
+        },
+    }
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         prog="sdetkit integration", description="Integration Assurance Kit (offline-first)"
     )
     sub = parser.add_subparsers(dest="cmd", required=True)
     check = sub.add_parser("check", help="Evaluate environment readiness profile")
-    check.add_argument("--profile", required=True)
     matrix = sub.add_parser("matrix", help="Print compatibility summary in JSON")
-    matrix.add_argument("--profile", required=True)
+    for p in (check, matrix):
+        p.add_argument("--profile", required=True)
+        p.add_argument(
+            "--deadline",
+            type=float,
+            default=None,
+            help=f"Overall seconds for all service probes (default: profile or {DEFAULT_DEADLINE_S:g}).",
+        )
     cassette_validate = sub.add_parser(
         "cassette-validate", help="Validate deterministic cassette contract for integration replay"
     )
-    cassette_validate.add_argument("--cassette", required=True)
+    cassette_validate.add_argument(
+        "--cassette", action="append", default=[], help="Cassette file (repeatable)."
+    )
+    cassette_validate.add_argument(
+        "--dir",
+        action="append",
+        default=[],
+        help=(
+            "Validate every *.json/*.ndjson cassette under DIR (repeatable); other "
+            "JSON files are listed as skipped."
+        ),
+    )
+    cassette_validate.add_argument(
+        "--jobs", type=int, default=0, help="Worker processes for many files (default: CPUs)."
+    )
     ns = parser.parse_args(argv)
 
     try:
         if ns.cmd in {"check", "matrix"}:
             profile = _load_profile(safe_path(Path.cwd(), ns.profile, allow_absolute=True))
-            payload = _evaluate(profile)
+            if ns.deadline is not None and ns.deadline <= 0:
+                raise ValueError("deadline must be > 0")
+            payload = _evaluate(profile, deadline_s=ns.deadline)
             if ns.cmd == "matrix":
                 payload["schema_version"] = "sdetkit.integration.matrix.v1"
                 payload["compatibility"] = {
                     "profile": payload["profile_name"],
                     "status": "compatible" if payload["summary"]["passed"] else "incompatible",
                 }
+        elif len(ns.cassette) == 1 and not ns.dir:
+            payload = _validate_cassette(safe_path(Path.cwd(), ns.cassette[0], allow_absolute=True))
         else:
-            payload = _validate_cassette(safe_path(Path.cwd(), ns.cassette, allow_absolute=True))
+            if not ns.cassette and not ns.dir:
+                raise ValueError("cassette-validate needs --cassette or --dir")
+            if ns.jobs < 0:
+                raise ValueError("jobs must be >= 0")
+            paths = [safe_path(Path.cwd(), c, allow_absolute=True) for c in ns.cassette]
+            skipped: list[Path] = []
+            for d in ns.dir:
+                root = safe_path(Path.cwd(), d, allow_absolute=True)
+                if not root.is_dir():
+                    raise ValueError(f"not a directory: {d}")
+                found, other = _discover_cassettes(root)
+                paths.extend(found)
+                skipped.extend(other)
+            payload = _validate_many(paths, ns.jobs or os.cpu_count() or 1, skipped=skipped)
     except (ValueError, OSError, SecurityError) as exc:
         sys.stderr.write(f"integration error: {exc}\n")
         return 2
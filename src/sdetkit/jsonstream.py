@@ -0,0 +1,152 @@
+"""Incremental decoding of a top-level JSON array from byte chunks.
+
+``response.json()`` needs the whole body, its decoded text and the full object
+graph in memory at once. :class:`JsonArrayDecoder` instead takes the body as it
+arrives (``iter_bytes()`` chunks) and hands back each array element as soon as
+it is complete, so only the elements still being processed and one partial
+element are held at a time. Elements are decoded with the stdlib
+``json.JSONDecoder.raw_decode``; this module only scans the array framing.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Any
+
+_WS = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = frozenset("0123456789.eE+-")
+# Consumed text is dropped from the buffer once it is at least this long.
+_COMPACT_AT = 64 * 1024
+
+
+class JsonArrayDecoder:
+    """Push-style decoder: :meth:`feed` bytes, get back the elements completed by them.
+
+    Raises ``ValueError`` for anything that is not a single JSON array
+    (optionally surrounded by whitespace). A value that is still incomplete is
+    only re-parsed once the buffered text has doubled, which keeps very large
+    elements split over many chunks linear rather than quadratic.
+    """
+
+    def __init__(self, decoder: json.JSONDecoder | None = None) -> None:
+        self._text = codecs.getincrementaldecoder("utf-8-sig")()
+        self._decoder = decoder or json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._pending: list[str] = []
+        self._pending_len = 0
+        self._need = 0
+        self._state = "start"  # start, first, value, sep, done
+        self._offset = 0  # characters dropped from the front of the buffer
+        self.count = 0
+
+    @property
+    def done(self) -> bool:
+        return self._state == "done"
+
+    def feed(self, data: bytes) -> list[Any]:
+        text = self._text.decode(data)
+        if text:
+            self._pending.append(text)
+            self._pending_len += len(text)
+        if len(self._buf) - self._pos + self._pending_len < self._need:
+            return []
+        return self._drain(final=False)
+
+    def close(self) -> list[Any]:
+        """Flush the end of the stream; raises ``ValueError`` if the array is incomplete."""
+        text = self._text.decode(b"", final=True)
+        if text:
+            self._pending.append(text)
+            self._pending_len += len(text)
+        out = self._drain(final=True)
+        if self._state != "done":
+            raise ValueError("truncated JSON array")
+        return out
+
+    def _error(self, msg: str, pos: int) -> ValueError:
+        return ValueError(f"{msg} at char {self._offset + pos}")
+
+    def _drain(self, *, final: bool) -> list[Any]:
+        if self._pending:
+            self._buf = self._buf[self._pos :] + "".join(self._pending)
+            self._offset += self._pos
+            self._pos = 0
+            self._pending.clear()
+            self._pending_len = 0
+        buf, pos, n = self._buf, self._pos, len(self._buf)
+        out: list[Any] = []
+        while True:
+            pos = _WS.match(buf, pos).end()  # type: ignore[union-attr]
+            if pos >= n:
+                break
+            state = self._state
+            if state == "sep":
+                ch = buf[pos]
+                if ch == ",":
+                    self._state = "value"
+                elif ch == "]":
+                    self._state = "done"
+                else:
+                    raise self._error("expected ',' or ']'", pos)
+                pos += 1
+                continue
+            if state == "start":
+                if buf[pos] != "[":
+                    raise self._error("expected a JSON array", pos)
+                self._state = "first"
+                pos += 1
+                continue
+            if state == "done":
+                raise self._error("extra data after JSON array", pos)
+            if state == "first" and buf[pos] == "]":
+                self._state = "done"
+                pos += 1
+                continue
+            try:
+                value, end = self._decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError as exc:
+                if final:
+                    raise self._error(f"invalid JSON array element ({exc.msg})", pos) from None
+                self._need = 2 * (n - pos)
+                break
+            if (
+                not final
+                and isinstance(value, int | float)
+                and (end >= n or buf[end] in _NUMBER_TAIL)
+            ):
+                # "12" or "-1." at the end of a chunk may continue in the next one.
+                self._need = n - pos + 1
+                break
+            out.append(value)
+            self.count += 1
+            self._need = 0
+            self._state = "sep"
+            pos = end
+        self._pos = pos
+        if pos >= _COMPACT_AT:
+            self._buf = buf[pos:]
+            self._offset += pos
+            self._pos = 0
+        return out
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the elements of the JSON array spread over ``chunks``."""
+    decoder = JsonArrayDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Async variant of :func:`iter_json_array`, e.g. over ``response.aiter_bytes()``."""
+    decoder = JsonArrayDecoder()
+    async for chunk in chunks:
+        for item in decoder.feed(chunk):
+            yield item
+    for item in decoder.close():
+        yield item
@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import argparse
 import json
-import shlex
-import subprocess
-import sys
 from pathlib import Path
 from typing import Any
 
+from .evidence_runner import run_commands
+
 _PAGE_PATH = "docs/integrations-kpi-audit.md"
 _TOP10_PATH = "docs/top-10-github-strategy.md"
 _SECTION_HEADER = "# KPI audit (Day 27)"
@@ -374,22 +373,23 @@ def emit_pack(root: Path, out_dir: Path, payload: dict[str, Any]) -> list[str]:
     ]
 
 
-def execute_commands(root: Path, evidence_dir: Path, timeout_sec: int) -> dict[str, Any]:
+def execute_commands(
+    root: Path, evidence_dir: Path, timeout_sec: int, jobs: int | None = None
+) -> dict[str, Any]:
     evidence_dir.mkdir(parents=True, exist_ok=True)
     results: list[dict[str, Any]] = []
-    for command in _EXECUTION_COMMANDS:
-        argv = shlex.split(command)
-        if argv and argv[0] == "python":
-            argv[0] = sys.executable
-        proc = subprocess.run(argv, cwd=root, text=True, capture_output=True, timeout=timeout_sec)
-        results.append(
-            {
-                "command": command,
-                "returncode": proc.returncode,
-                "stdout": proc.stdout,
-                "stderr": proc.stderr,
-            }
-        )
+    for result in run_commands(
+        _EXECUTION_COMMANDS, cwd=root, timeout=timeout_sec, jobs=jobs, stream_dir=evidence_dir
+    ):
+        row: dict[str, Any] = {
+            "command": result.command,
+            "returncode": result.returncode,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+        }
+        if result.timed_out:
+            row["error"] = f"timed out after {timeout_sec}s"
+        results.append(row)
 
     payload = {
         "name": "day27-kpi-audit-execution",
@@ -441,6 +441,9 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--timeout-sec", type=int, default=120, help="Per-command timeout used by --execute."
     )
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Evidence commands to run concurrently."
+    )
     parser.add_argument(
         "--min-score", type=float, default=90.0, help="Minimum score for strict pass."
     )
@@ -478,7 +481,9 @@ def main(argv: list[str] | None = None) -> int:
     if ns.emit_pack_dir:
         payload["emitted_pack_files"] = emit_pack(root, root / ns.emit_pack_dir, payload)
     if ns.execute:
-        payload["execution"] = execute_commands(root, root / ns.evidence_dir, ns.timeout_sec)
+        payload["execution"] = execute_commands(
+            root, root / ns.evidence_dir, ns.timeout_sec, jobs=ns.jobs
+        )
 
     strict_failed = (
         bool(payload["strict_failures"])
@@ -0,0 +1,346 @@
+"""``sdetkit load``: a small HTTP load generator on top of :class:`SdetAsyncHttpClient`.
+
+Two modes:
+
+* closed loop (default): ``--concurrency`` workers each send the next request
+  as soon as the previous one finishes, so throughput follows the service;
+* open loop (``--rate``): requests are scheduled at a fixed arrival rate and
+  latency is measured from the *scheduled* start, so a stalled service shows
+  up as queueing delay instead of silently lowering the offered load
+  (coordinated omission). ``--concurrency`` then caps requests in flight.
+
+Latencies go into a :class:`LatencyHistogram` with log-bucketed, HDR-style
+buckets (about 1% relative error, fixed memory regardless of run length).
+The report is JSON: percentiles, throughput, status codes and an error
+breakdown.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, NoReturn
+
+import httpx
+
+from .netclient import (
+    CircuitOpenError,
+    ClientEvent,
+    HttpStatusError,
+    RetryPolicy,
+    SdetAsyncHttpClient,
+)
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def _die(msg: str) -> NoReturn:
+    sys.stderr.write(msg.rstrip() + "\n")
+    raise SystemExit(2)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram in whole microseconds.
+
+    Values below ``2**sub_bits`` get a bucket each; above that, every
+    power-of-two range is split into ``2**(sub_bits - 1)`` equal buckets, so
+    the relative error stays under ``2**-(sub_bits - 1)`` at any magnitude.
+    Percentiles report the upper edge of the bucket (clamped to the maximum
+    seen), as HDR histograms do.
+    """
+
+    def __init__(self, sub_bits: int = 7) -> None:
+        if not 2 <= sub_bits <= 16:
+            raise ValueError("sub_bits must be between 2 and 16")
+        self.sub_bits = sub_bits
+        self._linear = 1 << sub_bits
+        self._half = self._linear >> 1
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: int | None = None
+        self.max_us = 0
+
+    def _index(self, us: int) -> int:
+        if us < self._linear:
+            return us
+        shift = us.bit_length() - self.sub_bits
+        return self._linear + (shift - 1) * self._half + (us >> shift) - self._half
+
+    def _upper(self, index: int) -> int:
+        if index < self._linear:
+            return index
+        shift, sub = divmod(index - self._linear, self._half)
+        return ((sub + self._half + 1) << (shift + 1)) - 1
+
+    def record(self, seconds: float) -> None:
+        us = max(0, int(round(seconds * 1_000_000)))
+        i = self._index(us)
+        self.counts[i] = self.counts.get(i, 0) + 1
+        self.count += 1
+        self.total_us += us
+        self.min_us = us if self.min_us is None else min(self.min_us, us)
+        self.max_us = max(self.max_us, us)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        if other.sub_bits != self.sub_bits:
+            raise ValueError("cannot merge histograms with different precision")
+        # Copy first: ``other`` may still be recording on another thread.
+        for i, n in dict(other.counts).items():
+            self.counts[i] = self.counts.get(i, 0) + n
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, p: float) -> float:
+        """Latency in seconds at or below which ``p`` percent of samples fall."""
+        if not 0.0 <= p <= 100.0:
+            raise ValueError("percentile must be between 0 and 100")
+        if not self.count:
+            return 0.0
+        rank = max(1, int(-(-p * self.count // 100)))  # ceil
+        seen = 0
+        for i in sorted(self.counts):
+            seen += self.counts[i]
+            if seen >= rank:
+                return min(self._upper(i), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    def cumulative(self, bounds: tuple[float, ...]) -> list[int]:
+        """Samples at or below each bound in seconds (ascending), by bucket upper edge."""
+        limits = [int(round(b * 1_000_000)) for b in bounds]
+        out = [0] * len(limits)
+        for i, n in list(self.counts.items()):
+            upper = min(self._upper(i), self.max_us)
+            for j, limit in enumerate(limits):
+                if upper <= limit:
+                    out[j] += n
+        return out
+
+    def summary_ms(self) -> dict[str, float]:
+        out = {
+            "min": (self.min_us or 0) / 1000,
+            "mean": (self.total_us / self.count / 1000) if self.count else 0.0,
+            "max": self.max_us / 1000,
+        }
+        for p in PERCENTILES:
+            out[f"p{p:g}"] = self.percentile(p) * 1000
+        return {k: round(v, 3) for k, v in out.items()}
+
+
+@dataclass(frozen=True)
+class LoadConfig:
+    url: str
+    concurrency: int = 10
+    duration: float = 10.0
+    rate: float | None = None  # requests/second; None runs closed loop
+    max_requests: int | None = None
+    headers: dict[str, str] | None = None
+
+    def __post_init__(self) -> None:
+        if self.concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if self.duration <= 0:
+            raise ValueError("duration must be > 0")
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError("rate must be > 0")
+        if self.max_requests is not None and self.max_requests < 1:
+            raise ValueError("max requests must be >= 1")
+
+    @property
+    def mode(self) -> str:
+        return "closed" if self.rate is None else "open"
+
+
+@dataclass
+class LoadReport:
+    config: LoadConfig
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    ok: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+    status_codes: Counter[int] = field(default_factory=Counter)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        return self.ok + sum(self.errors.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        cfg = self.config
+        elapsed = self.elapsed_seconds
+        return {
+            "url": cfg.url,
+            "mode": cfg.mode,
+            "concurrency": cfg.concurrency,
+            "rate": cfg.rate,
+            "elapsed_seconds": round(elapsed, 3),
+            "requests": self.requests,
+            "ok": self.ok,
+            "throughput_rps": round(self.requests / elapsed, 2) if elapsed > 0 else 0.0,
+            "latency_ms": self.latency.summary_ms(),
+            "status_codes": {str(k): v for k, v in sorted(self.status_codes.items())},
+            "errors": dict(sorted(self.errors.items())),
+        }
+
+
+def _error_kind(exc: BaseException) -> str:
+    if isinstance(exc, HttpStatusError):
+        return f"http_{exc.status_code}"
+    if isinstance(exc, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(exc, TimeoutError):
+        return "timeout"
+    if isinstance(exc, ValueError):
+        return "invalid_json"
+    if isinstance(exc, RuntimeError) and isinstance(exc.__cause__, httpx.RequestError):
+        return type(exc.__cause__).__name__
+    return type(exc).__name__
+
+
+async def run_load(
+    client: SdetAsyncHttpClient,
+    config: LoadConfig,
+    *,
+    clock: Callable[[], float] = time.monotonic,
+) -> LoadReport:
+    """Drive ``config.url`` through ``client`` and return the aggregated report.
+
+    Responses must be JSON, as for every ``SdetAsyncHttpClient`` call; anything
+    else is counted under ``errors["invalid_json"]``.
+    """
+    report = LoadReport(config)
+
+    def on_event(ev: ClientEvent) -> None:
+        if ev.type == "attempt_response" and ev.status_code is not None:
+            report.status_codes[ev.status_code] += 1
+
+    start = clock()
+    stop_at = start + config.duration
+    budget = config.max_requests
+
+    def take() -> bool:
+        nonlocal budget
+        if clock() >= stop_at:
+            return False
+        if budget is not None:
+            if budget <= 0:
+                return False
+            budget -= 1
+        return True
+
+    async def one(started: float) -> None:
+        try:
+            await client.get_json_any(config.url, headers=config.headers, hook=on_event)
+        except Exception as exc:  # every failure is a data point, not a crash
+            report.errors[_error_kind(exc)] += 1
+        else:
+            report.ok += 1
+        report.latency.record(clock() - started)
+
+    if config.rate is None:
+
+        async def worker() -> None:
+            while take():
+                await one(clock())
+
+        await asyncio.gather(*(worker() for _ in range(config.concurrency)))
+    else:
+        interval = 1.0 / config.rate
+        slots = asyncio.Semaphore(config.concurrency)
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def scheduled(at: float) -> None:
+            async with slots:
+                await one(at)
+
+        n = 0
+        while True:
+            at = start + n * interval
+            delay = at - clock()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if at >= stop_at or not take():
+                break
+            task = asyncio.ensure_future(scheduled(at))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            n += 1
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    report.elapsed_seconds = clock() - start
+    return report
+
+
+def _parse_headers(values: list[str]) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for raw in values:
+        k, sep, v = raw.partition(":")
+        if not sep or not k.strip():
+            _die("header must be KEY:VALUE")
+        out[k.strip()] = v.strip()
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="sdetkit load",
+        description="Generate HTTP load against a JSON endpoint and report latency percentiles.",
+    )
+    ap.add_argument("url")
+    ap.add_argument("--concurrency", type=int, default=10, help="Workers, or max in flight.")
+    ap.add_argument("--duration", type=float, default=10.0, help="Seconds to generate load.")
+    ap.add_argument(
+        "--rate",
+        type=float,
+        default=None,
+        help="Open loop: requests per second. Omit for closed loop.",
+    )
+    ap.add_argument("--max-requests", type=int, default=None, help="Stop after this many.")
+    ap.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout (seconds).")
+    ap.add_argument("--retries", type=int, default=1, help="Attempts per request (default: 1).")
+    ap.add_argument("--header", action="append", default=[], help="KEY:VALUE (repeatable).")
+    ap.add_argument("--insecure", action="store_true", help="Disable TLS verification (unsafe).")
+    ap.add_argument("--pretty", action="store_true", help="Pretty-print the JSON report.")
+    ns = ap.parse_args(argv)
+
+    try:
+        config = LoadConfig(
+            url=ns.url,
+            concurrency=ns.concurrency,
+            duration=ns.duration,
+            rate=ns.rate,
+            max_requests=ns.max_requests,
+            headers=_parse_headers(ns.header) or None,
+        )
+    except ValueError as exc:
+        _die(str(exc))
+    if ns.retries < 1:
+        _die("retries must be >= 1")
+    if httpx.URL(ns.url).scheme not in {"http", "https"}:
+        _die("url must be http or https")
+
+    async def go() -> LoadReport:
+        limits = httpx.Limits(
+            max_connections=config.concurrency, max_keepalive_connections=config.concurrency
+        )
+        async with httpx.AsyncClient(
+            timeout=ns.timeout, limits=limits, verify=not ns.insecure
+        ) as raw:
+            return await run_load(
+                SdetAsyncHttpClient(raw, retry=RetryPolicy(retries=ns.retries)), config
+            )
+
+    report = asyncio.run(go())
+    sys.stdout.write(
+        json.dumps(report.to_dict(), indent=2 if ns.pretty else None, sort_keys=True) + "\n"
+    )
+    return 0
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import itertools
+import math
 import random
+import threading
 import time
 import uuid
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from typing import Any, Literal
-from urllib.parse import urljoin
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 
+import anyio
 import httpx
 
 from .security import default_http_timeout, ensure_allowed_scheme
@@ -18,6 +25,7 @@ EventType = Literal[
     "attempt_error",
     "attempt_response",
     "sleep",
+    "hedge",
     "complete",
 ]
 
@@ -34,6 +42,8 @@ class ClientEvent:
     sleep_seconds: float | None = None
     elapsed_seconds: float | None = None
     ok: bool | None = None
+    cache_status: str | None = None
+    method: str = "GET"
 
 
 Hook = Callable[[ClientEvent], None]
@@ -47,6 +57,13 @@ class RetryPolicy:
     backoff_base: float = 0.0
     backoff_factor: float = 2.0
     backoff_jitter: float = 0.0
+    # Overall budget in seconds for the whole call: caps each attempt's timeout and
+    # stops retrying once spent (TimeoutError "deadline exceeded").
+    deadline: float | None = None
+    # Async GETs only: after this many seconds without an answer, fire a second
+    # identical attempt and keep whichever responds first. "p95" uses the p95 of
+    # recent latencies to the same host once enough samples exist.
+    hedge_after: float | Literal["p95"] | None = None
 
 
 class CircuitOpenError(RuntimeError):
@@ -61,8 +78,90 @@ class HttpStatusError(RuntimeError):
         try:
             self.url = str(response.request.url)
         except Exception:
-            self.url = str(response.url)
-        self.body = response.content if body is None else body
+            self.url = str(getattr(response, "url", ""))
+        # Duck-typed responses (apiclient accepts any client with ``get``) may lack these.
+        self.body = getattr(response, "content", None) if body is None else body
+
+
+@dataclass(frozen=True)
+class BatchRequest:
+    """One GET in a :meth:`SdetAsyncHttpClient.fetch_many` batch.
+
+    ``expect`` selects the JSON shape check (``get_json_dict``/``get_json_list``/
+    ``get_json_any``); ``retry`` overrides the client's policy for this request only.
+    """
+
+    url: str
+    expect: Literal["dict", "list", "any"] = "any"
+    headers: dict[str, str] | None = None
+    request_id: str | None = None
+    timeout: float | httpx.Timeout | None = None
+    retry: RetryPolicy | None = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    index: int
+    url: str
+    value: Any = None
+    error: Exception | None = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    count: int
+    succeeded: int
+    failed: int
+    wall_seconds: float | None
+    min_seconds: float
+    mean_seconds: float
+    p50_seconds: float
+    p95_seconds: float
+    max_seconds: float
+
+
+def batch_stats(results: Iterable[BatchResult], *, wall_seconds: float | None = None) -> BatchStats:
+    """Aggregate per-request latencies (time spent holding a slot, not queueing)."""
+    done = list(results)
+    latencies = sorted(r.elapsed_seconds for r in done)
+    failed = sum(1 for r in done if not r.ok)
+
+    def rank(q: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[max(0, math.ceil(q * len(latencies)) - 1)]
+
+    return BatchStats(
+        count=len(done),
+        succeeded=len(done) - failed,
+        failed=failed,
+        wall_seconds=wall_seconds,
+        min_seconds=latencies[0] if latencies else 0.0,
+        mean_seconds=sum(latencies) / len(latencies) if latencies else 0.0,
+        p50_seconds=rank(0.50),
+        p95_seconds=rank(0.95),
+        max_seconds=latencies[-1] if latencies else 0.0,
+    )
+
+
+def _batch_requests(
+    requests: Iterable[BatchRequest | str], concurrency: int, per_host: int | None
+) -> list[BatchRequest]:
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if per_host is not None and per_host < 1:
+        raise ValueError("per_host must be >= 1")
+    return [r if isinstance(r, BatchRequest) else BatchRequest(url=r) for r in requests]
+
+
+def _host_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
 
 
 @dataclass
@@ -72,30 +171,128 @@ class CircuitBreaker:
     _failures: int = 0
     _opened_at: float | None = None
     _half_open_used: bool = False
+    # Called as on_transition(old_state, new_state) on every state change.
+    on_transition: Callable[[str, str], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+    # Thread-pool batches share one breaker; only one caller may take the half-open probe.
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def state(self) -> Literal["closed", "open", "half_open"]:
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if self._half_open_used else "open"
+
+    def _moved(self, old: str) -> None:
+        new = self.state
+        if new != old and self.on_transition is not None:
+            self.on_transition(old, new)
 
     def allow(self, now: float) -> None:
-        if self._opened_at is None:
-            return
+        with self._lock:
+            if self._opened_at is None:
+                return
 
-        dt = now - self._opened_at
-        if dt < self.reset_seconds:
-            raise CircuitOpenError("circuit open")
+            dt = now - self._opened_at
+            if dt < self.reset_seconds:
+                raise CircuitOpenError("circuit open")
 
-        if self._half_open_used:
-            raise CircuitOpenError("circuit open")
+            if self._half_open_used:
+                raise CircuitOpenError("circuit open")
 
-        self._half_open_used = True
+            self._half_open_used = True
+        self._moved("open")
 
     def record_success(self) -> None:
-        self._failures = 0
-        self._opened_at = None
-        self._half_open_used = False
+        with self._lock:
+            old = self.state
+            self._failures = 0
+            self._opened_at = None
+            self._half_open_used = False
+        self._moved(old)
 
     def record_failure(self, now: float) -> None:
-        self._failures += 1
-        if self._failures >= self.failure_threshold:
-            self._opened_at = now
-            self._half_open_used = False
+        with self._lock:
+            old = self.state
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = now
+                self._half_open_used = False
+        self._moved(old)
+
+
+class RateLimiter:
+    """Proactive per-host token buckets, shareable across client instances.
+
+    ``rate`` is the sustained requests per second for each scheme+host and
+    ``burst`` the bucket size. Clients call :meth:`reserve` before every attempt
+    and sleep for the delay it returns; reservations may drive a bucket negative,
+    so concurrent callers queue up at ``1 / rate`` spacing instead of racing.
+    :meth:`observe` tightens a bucket from server feedback: ``Retry-After`` (or a
+    bare 429) and ``X-RateLimit-Remaining``/``X-RateLimit-Reset``. Pass the same
+    instance to several clients, sync or async, to share one budget per host.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self.rate = float(rate)
+        self.burst = burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[str, list[float]] = {}
+
+    def _bucket(self, key: str, now: float) -> list[float]:
+        # [tokens, updated_at]; caller holds the lock.
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(self.burst), now]
+        else:
+            bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        return bucket
+
+    def reserve(self, url: str) -> float:
+        """Take a token for ``url``'s host; return how long to wait before sending."""
+        with self._lock:
+            bucket = self._bucket(_host_key(url), self._clock())
+            bucket[0] -= 1.0
+            return max(0.0, -bucket[0] / self.rate)
+
+    def release(self, url: str) -> None:
+        """Give back a token from :meth:`reserve` whose request will not be sent."""
+        with self._lock:
+            bucket = self._bucket(_host_key(url), self._clock())
+            bucket[0] = min(float(self.burst), bucket[0] + 1.0)
+
+    def observe(self, url: str, status_code: int, headers: Any) -> None:
+        block = _retry_after_seconds(headers)
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        if block is None and remaining is not None and remaining <= 0:
+            reset = _header_number(headers, "X-RateLimit-Reset")
+            if reset is not None and reset > 1e9:
+                reset -= time.time()  # epoch-seconds flavour
+            block = reset
+        if block is None and status_code != 429 and remaining is None:
+            return
+        with self._lock:
+            bucket = self._bucket(_host_key(url), self._clock())
+            cap = 0.0 if status_code == 429 else float(self.burst)
+            if remaining is not None:
+                cap = min(cap, max(0.0, remaining))
+            if block is not None and block > 0:
+                # The next reservation waits ``block`` seconds.
+                cap = min(cap, 1.0 - block * self.rate)
+            bucket[0] = min(bucket[0], cap)
 
 
 def _backoff_delay(attempt: int, base: float, factor: float, jitter: float) -> float:
@@ -120,6 +317,29 @@ def _retry_after_seconds(headers: Any) -> float | None:
         return None
 
 
+def _header_number(headers: Any, name: str) -> float | None:
+    try:
+        v = headers.get(name)
+    except Exception:
+        v = None
+    if not v:
+        return None
+    try:
+        return float(str(v).strip())
+    except ValueError:
+        return None
+
+
+CACHE_EXTENSION = "sdetkit_cache"
+
+
+def _cache_status(r: Any) -> str | None:
+    # Set by sdetkit.httpcache transports: "hit", "revalidated", "miss" or "bypass".
+    extensions = getattr(r, "extensions", None)
+    value = extensions.get(CACHE_EXTENSION) if isinstance(extensions, dict) else None
+    return value if isinstance(value, str) else None
+
+
 def _link_next_url(r: httpx.Response) -> str | None:
     link = r.headers.get("Link")
     if not link:
@@ -151,6 +371,65 @@ def _link_next_url(r: httpx.Response) -> str | None:
     return None
 
 
+def _envelope_page(
+    r: httpx.Response, data: Any, items_key: str, next_key: str
+) -> tuple[list, str | None]:
+    if not isinstance(data, dict):
+        raise ValueError("expected json object")
+
+    page_items = data.get(items_key)
+    if not isinstance(page_items, list):
+        raise ValueError(f"expected json array at key '{items_key}'")
+
+    nxt_raw = data.get(next_key)
+    if nxt_raw is None or str(nxt_raw).strip() == "":
+        return page_items, None
+    if not isinstance(nxt_raw, str):
+        raise ValueError(f"expected string or null at key '{next_key}'")
+    return page_items, str(urljoin(str(r.url), nxt_raw))
+
+
+def _envelope_page_count(data: dict, total_key: str, per_page_key: str) -> int | None:
+    total = data.get(total_key)
+    per_page = data.get(per_page_key)
+    if isinstance(total, bool) or isinstance(per_page, bool):
+        return None
+    if not isinstance(total, int) or not isinstance(per_page, int) or total < 0 or per_page < 1:
+        return None
+    return max(1, -(-total // per_page))
+
+
+def _envelope_first_page(data: dict, page_param: str) -> int:
+    page = data.get(page_param)
+    return page if isinstance(page, int) and not isinstance(page, bool) else 1
+
+
+def _with_query_param(url: str, name: str, value: str) -> str:
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != name]
+    query.append((name, value))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+_HEDGE_WINDOW = 100
+_HEDGE_MIN_SAMPLES = 20
+
+
+def _attempt_timeout(
+    timeout: float | httpx.Timeout | None, remaining: float | None
+) -> httpx.Timeout:
+    t = default_http_timeout(timeout)
+    if remaining is None:
+        return t
+
+    def cap(v: float | None) -> float:
+        return remaining if v is None else min(v, remaining)
+
+    return httpx.Timeout(
+        connect=cap(t.connect), read=cap(t.read), write=cap(t.write), pool=cap(t.pool)
+    )
+
+
 def _merge_headers(
     headers: dict[str, str] | None,
     trace_header: str | None,
@@ -191,6 +470,7 @@ class SdetHttpClient:
         clock: Callable[[], float] = time.monotonic,
         sleep: Callable[[float], None] = time.sleep,
         allowed_schemes: set[str] | None = None,
+        limiter: RateLimiter | None = None,
     ):
         self._client = client
         self._retry = retry or RetryPolicy()
@@ -200,6 +480,37 @@ class SdetHttpClient:
         self._clock = clock
         self._sleep = sleep
         self._allowed_schemes = allowed_schemes or {"http", "https"}
+        self._limiter = limiter
+
+    def _throttle(
+        self,
+        limiter: RateLimiter,
+        url: str,
+        attempt: int,
+        retries: int,
+        rid: str | None,
+        h: Hook | None,
+        deadline_at: float | None,
+    ) -> bool:
+        """Wait for a limiter slot; return False if it would open after the deadline."""
+        d = limiter.reserve(url)
+        if deadline_at is not None and self._clock() + d >= deadline_at:
+            limiter.release(url)
+            return False
+        if d > 0:
+            _emit(
+                h,
+                ClientEvent(
+                    type="sleep",
+                    url=url,
+                    attempt=attempt,
+                    retries=retries,
+                    request_id=rid,
+                    sleep_seconds=d,
+                ),
+            )
+            self._sleep(d)
+        return True
 
     def request(
         self,
@@ -214,19 +525,40 @@ class SdetHttpClient:
         retry: RetryPolicy | None = None,
         hook: Hook | None = None,
         breaker: CircuitBreaker | None = None,
+        stream: bool = False,
     ) -> httpx.Response:
+        """Send one request with the client's retry, breaker and limiter handling.
+
+        Any status is returned; only transport errors (and 429 with
+        ``retry_on_429``) are retried. With ``stream=True`` the body is left
+        unread so it can be consumed with ``iter_bytes()``; the caller must
+        close the response.
+        """
         pol = retry or self._retry
         ensure_allowed_scheme(url, allowed=self._allowed_schemes)
         if pol.retries < 1:
             raise ValueError("retries must be >= 1")
+        if pol.deadline is not None and pol.deadline <= 0:
+            raise ValueError("deadline must be > 0")
 
         hdrs, rid = _merge_headers(headers, self._trace_header, request_id)
         h = hook or self._hook
         b = breaker or self._breaker
         start = self._clock()
         last_err: BaseException | None = None
+        deadline_at = None if pol.deadline is None else start + pol.deadline
+        expired = False
 
         for attempt in range(pol.retries):
+            if self._limiter is not None and not self._throttle(
+                self._limiter, url, attempt, pol.retries, rid, h, deadline_at
+            ):
+                expired = True
+                break
+            remaining = None if deadline_at is None else deadline_at - self._clock()
+            if remaining is not None and remaining <= 0:
+                expired = True
+                break
             if b is not None:
                 b.allow(self._clock())
 
@@ -235,6 +567,7 @@ class SdetHttpClient:
                 ClientEvent(
                     type="attempt_start",
                     url=url,
+                    method=method.upper(),
                     attempt=attempt,
                     retries=pol.retries,
                     request_id=rid,
@@ -249,9 +582,12 @@ class SdetHttpClient:
                     kwargs["content"] = content
                 if json is not None:
                     kwargs["json"] = json
-                r = self._client.request(
-                    method, url, timeout=default_http_timeout(timeout), **kwargs
-                )
+                t = _attempt_timeout(timeout, remaining)
+                if stream:
+                    req = self._client.build_request(method, url, timeout=t, **kwargs)
+                    r = self._client.send(req, stream=True)
+                else:
+                    r = self._client.request(method, url, timeout=t, **kwargs)
             except httpx.TimeoutException as e:
                 if b is not None:
                     b.record_failure(self._clock())
@@ -260,12 +596,15 @@ class SdetHttpClient:
                     ClientEvent(
                         type="attempt_error",
                         url=url,
+                        method=method.upper(),
                         attempt=attempt,
                         retries=pol.retries,
                         request_id=rid,
                         error="timeout",
                     ),
                 )
+                if deadline_at is not None and self._clock() >= deadline_at:
+                    raise TimeoutError("deadline exceeded") from e
                 raise TimeoutError("request timed out") from e
             except httpx.RequestError as e:
                 last_err = e
@@ -276,6 +615,7 @@ class SdetHttpClient:
                     ClientEvent(
                         type="attempt_error",
                         url=url,
+                        method=method.upper(),
                         attempt=attempt,
                         retries=pol.retries,
                         request_id=rid,
@@ -286,12 +626,16 @@ class SdetHttpClient:
                     d = _backoff_delay(
                         attempt, pol.backoff_base, pol.backoff_factor, pol.backoff_jitter
                     )
+                    if deadline_at is not None and self._clock() + d >= deadline_at:
+                        expired = True
+                        break
                     if d > 0:
                         _emit(
                             h,
                             ClientEvent(
                                 type="sleep",
                                 url=url,
+                                method=method.upper(),
                                 attempt=attempt,
                                 retries=pol.retries,
                                 request_id=rid,
@@ -302,19 +646,24 @@ class SdetHttpClient:
                     continue
                 break
 
+            if self._limiter is not None:
+                self._limiter.observe(url, r.status_code, r.headers)
             _emit(
                 h,
                 ClientEvent(
                     type="attempt_response",
                     url=url,
+                    method=method.upper(),
                     attempt=attempt,
                     retries=pol.retries,
                     request_id=rid,
                     status_code=r.status_code,
+                    cache_status=_cache_status(r),
                 ),
             )
 
             if r.status_code == 429 and pol.retry_on_429 and attempt < pol.retries - 1:
+                r.close()
                 if b is not None:
                     b.record_failure(self._clock())
                 ra = _retry_after_seconds(r.headers)
@@ -325,12 +674,16 @@ class SdetHttpClient:
                         attempt, pol.backoff_base, pol.backoff_factor, pol.backoff_jitter
                     )
                 )
+                if deadline_at is not None and self._clock() + d >= deadline_at:
+                    expired = True
+                    break
                 if d > 0:
                     _emit(
                         h,
                         ClientEvent(
                             type="sleep",
                             url=url,
+                            method=method.upper(),
                             attempt=attempt,
                             retries=pol.retries,
                             request_id=rid,
@@ -353,10 +706,12 @@ class SdetHttpClient:
                 ClientEvent(
                     type="complete",
                     url=url,
+                    method=method.upper(),
                     attempt=attempt,
                     retries=pol.retries,
                     request_id=rid,
                     ok=ok,
+                    status_code=r.status_code,
                     elapsed_seconds=elapsed,
                 ),
             )
@@ -368,6 +723,7 @@ class SdetHttpClient:
             ClientEvent(
                 type="complete",
                 url=url,
+                method=method.upper(),
                 attempt=pol.retries - 1,
                 retries=pol.retries,
                 request_id=rid,
@@ -375,6 +731,8 @@ class SdetHttpClient:
                 elapsed_seconds=elapsed,
             ),
         )
+        if expired:
+            raise TimeoutError("deadline exceeded") from last_err
         if last_err is not None:
             raise RuntimeError("request failed") from last_err
         raise RuntimeError("request failed")
@@ -439,10 +797,62 @@ class SdetHttpClient:
         hook: Hook | None = None,
         breaker: CircuitBreaker | None = None,
     ) -> list:
+        return list(
+            self.iter_json_list_paginated(
+                url,
+                max_pages=max_pages,
+                headers=headers,
+                request_id=request_id,
+                timeout=timeout,
+                retry=retry,
+                hook=hook,
+                breaker=breaker,
+            )
+        )
+
+    def iter_json_list_paginated(
+        self,
+        url: str,
+        *,
+        max_pages: int = 100,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> Iterator[Any]:
+        """Yield list items page by page, following ``Link: rel=next``.
+
+        Items of a page are yielded before the next page is requested; the page
+        limit and loop detection errors are raised when the offending page is reached.
+        """
         if max_pages < 1:
             raise ValueError("max_pages must be >= 1")
+        pages = self._iter_link_pages(
+            url,
+            max_pages=max_pages,
+            headers=headers,
+            request_id=request_id,
+            timeout=timeout,
+            retry=retry,
+            hook=hook,
+            breaker=breaker,
+        )
+        return (item for _r, page in pages for item in page)
 
-        out: list = []
+    def _iter_link_pages(
+        self,
+        url: str,
+        *,
+        max_pages: int,
+        headers: dict[str, str] | None,
+        request_id: str | None,
+        timeout: float | httpx.Timeout | None,
+        retry: RetryPolicy | None,
+        hook: Hook | None,
+        breaker: CircuitBreaker | None,
+    ) -> Iterator[tuple[httpx.Response, list]]:
         seen: set[str] = set()
         cur = url
 
@@ -458,11 +868,11 @@ class SdetHttpClient:
             )
             if not isinstance(data, list):
                 raise ValueError("expected json array")
-            out.extend(data)
+            yield r, data
 
             nxt = _link_next_url(r)
             if not nxt:
-                return out
+                return
             if nxt in seen:
                 raise RuntimeError("pagination impact")
             seen.add(nxt)
@@ -484,14 +894,70 @@ class SdetHttpClient:
         hook: Hook | None = None,
         breaker: CircuitBreaker | None = None,
     ) -> list:
+        return list(
+            self.iter_json_list_paginated_envelope(
+                url,
+                items_key=items_key,
+                next_key=next_key,
+                max_pages=max_pages,
+                headers=headers,
+                request_id=request_id,
+                timeout=timeout,
+                retry=retry,
+                hook=hook,
+                breaker=breaker,
+            )
+        )
+
+    def iter_json_list_paginated_envelope(
+        self,
+        url: str,
+        *,
+        items_key: str = "items",
+        next_key: str = "next",
+        max_pages: int = 100,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> Iterator[Any]:
+        """Yield envelope items page by page (``{items_key: [...], next_key: url|null}``)."""
         if max_pages < 1:
             raise ValueError("max_pages must be >= 1")
         if not str(items_key).strip():
             raise ValueError("items_key must not be empty")
         if not str(next_key).strip():
             raise ValueError("next_key must not be empty")
+        pages = self._iter_envelope_pages(
+            url,
+            items_key=items_key,
+            next_key=next_key,
+            max_pages=max_pages,
+            headers=headers,
+            request_id=request_id,
+            timeout=timeout,
+            retry=retry,
+            hook=hook,
+            breaker=breaker,
+        )
+        return (item for _r, page in pages for item in page)
 
-        out: list = []
+    def _iter_envelope_pages(
+        self,
+        url: str,
+        *,
+        items_key: str,
+        next_key: str,
+        max_pages: int,
+        headers: dict[str, str] | None,
+        request_id: str | None,
+        timeout: float | httpx.Timeout | None,
+        retry: RetryPolicy | None,
+        hook: Hook | None,
+        breaker: CircuitBreaker | None,
+    ) -> Iterator[tuple[httpx.Response, list]]:
         seen: set[str] = {str(url)}
         cur = str(url)
 
@@ -505,20 +971,11 @@ class SdetHttpClient:
                 hook=hook,
                 breaker=breaker,
             )
-            if not isinstance(data, dict):
-                raise ValueError("expected json object")
+            page_items, nxt = _envelope_page(r, data, items_key, next_key)
+            yield r, page_items
 
-            page_items = data.get(items_key)
-            if not isinstance(page_items, list):
-                raise ValueError(f"expected json array at key '{items_key}'")
-            out.extend(page_items)
-
-            nxt_raw = data.get(next_key)
-            if nxt_raw is None or str(nxt_raw).strip() == "":
-                return out
-            if not isinstance(nxt_raw, str):
-                raise ValueError(f"expected string or null at key '{next_key}'")
-            nxt = str(urljoin(str(r.url), nxt_raw))
+            if nxt is None:
+                return
             if nxt in seen:
                 raise RuntimeError("pagination impact")
             seen.add(nxt)
@@ -550,6 +1007,148 @@ class SdetHttpClient:
             raise ValueError("expected json object or array")
         return data
 
+    def iter_json_array(
+        self,
+        url: str,
+        *,
+        method: str = "GET",
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        json: Any | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> Iterator[Any]:
+        """Yield the elements of a top-level JSON array response as they arrive.
+
+        The body is streamed through :class:`~sdetkit.jsonstream.JsonArrayDecoder`
+        instead of being buffered and decoded whole, so memory stays proportional
+        to one element. Retries only cover getting the response; once elements
+        have been yielded, a broken stream raises. Non-2xx raises
+        ``HttpStatusError``; a body that is not a JSON array raises ``ValueError``.
+        """
+        from .jsonstream import JsonArrayDecoder
+
+        r = self.request(
+            method,
+            url,
+            headers=headers,
+            request_id=request_id,
+            json=json,
+            timeout=timeout,
+            retry=retry,
+            hook=hook,
+            breaker=breaker,
+            stream=True,
+        )
+        try:
+            if r.status_code < 200 or r.status_code >= 300:
+                raise HttpStatusError("non-2xx response", response=r, body=r.read())
+            decoder = JsonArrayDecoder()
+            for chunk in r.iter_bytes():
+                yield from decoder.feed(chunk)
+            yield from decoder.close()
+        finally:
+            r.close()
+
+    def iter_many(
+        self,
+        requests: Iterable[BatchRequest | str],
+        *,
+        concurrency: int = 10,
+        per_host: int | None = None,
+    ) -> Iterator[BatchResult]:
+        """Thread-pool counterpart of :meth:`SdetAsyncHttpClient.iter_many`.
+
+        ``httpx.Client`` is thread-safe, so the batch shares this client's pool,
+        hooks and breaker. Breakers and limiters lock their own state, but hooks
+        are called from the worker threads concurrently and must be thread-safe
+        (``ClientMetrics`` is). Results are yielded in completion order.
+        """
+        items = _batch_requests(requests, concurrency, per_host)
+        return self._iter_many(items, concurrency, per_host)
+
+    def _iter_many(
+        self, items: list[BatchRequest], concurrency: int, per_host: int | None
+    ) -> Iterator[BatchResult]:
+        def run(index: int, req: BatchRequest) -> BatchResult:
+            start = self._clock()
+            try:
+                value = self._fetch_one(req)
+            except Exception as exc:
+                return BatchResult(index, req.url, error=exc, elapsed_seconds=self._clock() - start)
+            return BatchResult(index, req.url, value=value, elapsed_seconds=self._clock() - start)
+
+        if not items:
+            return
+        # Requests wait in per-host queues and only take a worker once their host
+        # has a free slot, so a busy host never ties up threads the rest need.
+        host_limit = concurrency if per_host is None else per_host
+        queues: dict[str, deque[int]] = {}
+        for index, req in enumerate(items):
+            key = "" if per_host is None else _host_key(req.url)
+            queues.setdefault(key, deque()).append(index)
+        active = dict.fromkeys(queues, 0)
+        running: dict[Future[BatchResult], str] = {}
+        pool = ThreadPoolExecutor(
+            max_workers=min(concurrency, len(items)), thread_name_prefix="sdetkit-batch"
+        )
+
+        def submit_ready() -> None:
+            while len(running) < concurrency:
+                ready = [key for key, queue in queues.items() if queue and active[key] < host_limit]
+                if not ready:
+                    return
+                key = min(ready, key=lambda k: queues[k][0])
+                index = queues[key].popleft()
+                active[key] += 1
+                running[pool.submit(run, index, items[index])] = key
+
+        try:
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    active[running.pop(future)] -= 1
+                submit_ready()
+                for future in done:
+                    yield future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def fetch_many(
+        self,
+        requests: Iterable[BatchRequest | str],
+        *,
+        concurrency: int = 10,
+        per_host: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[BatchResult]:
+        """Blocking facade over :meth:`iter_many`; see the async ``fetch_many``."""
+        items = _batch_requests(requests, concurrency, per_host)
+        out: list[BatchResult | None] = [None] * len(items)
+        with contextlib.closing(self._iter_many(items, concurrency, per_host)) as it:
+            for res in it:
+                if res.error is not None and not return_exceptions:
+                    raise res.error
+                out[res.index] = res
+        return [r for r in out if r is not None]
+
+    def _fetch_one(self, req: BatchRequest) -> Any:
+        fetch = {
+            "dict": self.get_json_dict,
+            "list": self.get_json_list,
+            "any": self.get_json_any,
+        }[req.expect]
+        return fetch(
+            req.url,
+            headers=req.headers,
+            request_id=req.request_id,
+            timeout=req.timeout,
+            retry=req.retry,
+        )
+
     def _request_json(
         self,
         url: str,
@@ -565,14 +1164,27 @@ class SdetHttpClient:
         ensure_allowed_scheme(url, allowed=self._allowed_schemes)
         if pol.retries < 1:
             raise ValueError("retries must be >= 1")
+        if pol.deadline is not None and pol.deadline <= 0:
+            raise ValueError("deadline must be > 0")
 
         hdrs, rid = _merge_headers(headers, self._trace_header, request_id)
         h = hook or self._hook
         b = breaker or self._breaker
         start = self._clock()
         last_err: BaseException | None = None
+        deadline_at = None if pol.deadline is None else start + pol.deadline
+        expired = False
 
         for attempt in range(pol.retries):
+            if self._limiter is not None and not self._throttle(
+                self._limiter, url, attempt, pol.retries, rid, h, deadline_at
+            ):
+                expired = True
+                break
+            remaining = None if deadline_at is None else deadline_at - self._clock()
+            if remaining is not None and remaining <= 0:
+                expired = True
+                break
             if b is not None:
                 b.allow(self._clock())
 
@@ -589,9 +1201,11 @@ class SdetHttpClient:
 
             try:
                 if hdrs is None:
-                    r = self._client.get(url, timeout=default_http_timeout(timeout))
+                    r = self._client.get(url, timeout=_attempt_timeout(timeout, remaining))
                 else:
-                    r = self._client.get(url, headers=hdrs, timeout=default_http_timeout(timeout))
+                    r = self._client.get(
+                        url, headers=hdrs, timeout=_attempt_timeout(timeout, remaining)
+                    )
             except httpx.TimeoutException as e:
                 if b is not None:
                     b.record_failure(self._clock())
@@ -606,6 +1220,8 @@ class SdetHttpClient:
                         error="timeout",
                     ),
                 )
+                if deadline_at is not None and self._clock() >= deadline_at:
+                    raise TimeoutError("deadline exceeded") from e
                 raise TimeoutError("request timed out") from e
             except httpx.RequestError as e:
                 last_err = e
@@ -627,6 +1243,9 @@ class SdetHttpClient:
                     d = _backoff_delay(
                         attempt, pol.backoff_base, pol.backoff_factor, pol.backoff_jitter
                     )
+                    if deadline_at is not None and self._clock() + d >= deadline_at:
+                        expired = True
+                        break
                     if d > 0:
                         _emit(
                             h,
@@ -643,6 +1262,8 @@ class SdetHttpClient:
                     continue
                 break
 
+            if self._limiter is not None:
+                self._limiter.observe(url, r.status_code, r.headers)
             _emit(
                 h,
                 ClientEvent(
@@ -652,6 +1273,7 @@ class SdetHttpClient:
                     retries=pol.retries,
                     request_id=rid,
                     status_code=r.status_code,
+                    cache_status=_cache_status(r),
                 ),
             )
 
@@ -666,6 +1288,9 @@ class SdetHttpClient:
                         attempt, pol.backoff_base, pol.backoff_factor, pol.backoff_jitter
                     )
                 )
+                if deadline_at is not None and self._clock() + d >= deadline_at:
+                    expired = True
+                    break
                 if d > 0:
                     _emit(
                         h,
@@ -694,10 +1319,11 @@ class SdetHttpClient:
                         retries=pol.retries,
                         request_id=rid,
                         ok=False,
+                        status_code=r.status_code,
                         elapsed_seconds=elapsed,
                     ),
                 )
-                raise HttpStatusError("non-2xx response", response=r, body=r.content)
+                raise HttpStatusError("non-2xx response", response=r)
 
             data = r.json()
             if b is not None:
@@ -712,6 +1338,7 @@ class SdetHttpClient:
                     retries=pol.retries,
                     request_id=rid,
                     ok=True,
+                    status_code=r.status_code,
                     elapsed_seconds=elapsed,
                 ),
             )
@@ -730,6 +1357,8 @@ class SdetHttpClient:
                 elapsed_seconds=elapsed,
             ),
         )
+        if expired:
+            raise TimeoutError("deadline exceeded") from last_err
         if last_err is not None:
             raise RuntimeError("request failed") from last_err
         raise RuntimeError("request failed")
@@ -747,6 +1376,7 @@ class SdetAsyncHttpClient:
         clock: Callable[[], float] = time.monotonic,
         sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
         allowed_schemes: set[str] | None = None,
+        limiter: RateLimiter | None = None,
     ):
         self._client = client
         self._retry = retry or RetryPolicy()
@@ -756,6 +1386,123 @@ class SdetAsyncHttpClient:
         self._clock = clock
         self._sleep = sleep
         self._allowed_schemes = allowed_schemes or {"http", "https"}
+        self._limiter = limiter
+        self._latencies: dict[str, deque[float]] = {}
+
+    async def _throttle(
+        self,
+        limiter: RateLimiter,
+        url: str,
+        attempt: int,
+        retries: int,
+        rid: str | None,
+        h: Hook | AsyncHook | None,
+        deadline_at: float | None,
+    ) -> bool:
+        """Wait for a limiter slot; return False if it would open after the deadline."""
+        d = limiter.reserve(url)
+        if deadline_at is not None and self._clock() + d >= deadline_at:
+            limiter.release(url)
+            return False
+        if d > 0:
+            await _emit_async(
+                h,
+                ClientEvent(
+                    type="sleep",
+                    url=url,
+                    attempt=attempt,
+                    retries=retries,
+                    request_id=rid,
+                    sleep_seconds=d,
+                ),
+            )
+            await self._sleep(d)
+        return True
+
+    async def _attempt_get(
+        self,
+        url: str,
+        hdrs: dict[str, str] | None,
+        timeout: float | httpx.Timeout | None,
+        remaining: float | None,
+        pol: RetryPolicy,
+        h: Hook | AsyncHook | None,
+        attempt: int,
+        rid: str | None,
+    ) -> httpx.Response:
+        kwargs: dict[str, Any] = {"timeout": _attempt_timeout(timeout, remaining)}
+        if hdrs is not None:
+            kwargs["headers"] = hdrs
+        hedge = self._hedge_delay(url, pol.hedge_after)
+        if hedge is not None and remaining is not None and hedge >= remaining:
+            hedge = None  # it could only start once the deadline has already passed
+        started = self._clock()
+        try:
+            # httpx timeouts are per phase; this bounds the attempt as a whole. An
+            # anyio scope (httpx's own dependency) works under asyncio and trio alike.
+            with anyio.fail_after(remaining):
+                if hedge is None:
+                    r = await self._client.get(url, **kwargs)
+                else:
+                    r = await self._hedged_get(url, kwargs, hedge, h, attempt, pol.retries, rid)
+        except TimeoutError as e:
+            raise httpx.ReadTimeout("deadline exceeded") from e
+        window = self._latencies.setdefault(_host_key(url), deque(maxlen=_HEDGE_WINDOW))
+        window.append(self._clock() - started)
+        return r
+
+    def _hedge_delay(self, url: str, hedge_after: float | str | None) -> float | None:
+        if hedge_after is None or isinstance(hedge_after, float | int):
+            return hedge_after
+        window = self._latencies.get(_host_key(url))
+        if window is None or len(window) < _HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(window)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    async def _hedged_get(
+        self,
+        url: str,
+        kwargs: dict[str, Any],
+        delay: float,
+        h: Hook | AsyncHook | None,
+        attempt: int,
+        retries: int,
+        rid: str | None,
+    ) -> httpx.Response:
+        tasks = [asyncio.ensure_future(self._client.get(url, **kwargs))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return tasks[0].result()
+            await _emit_async(
+                h,
+                ClientEvent(
+                    type="hedge",
+                    url=url,
+                    attempt=attempt,
+                    retries=retries,
+                    request_id=rid,
+                    elapsed_seconds=delay,
+                ),
+            )
+            tasks.append(asyncio.ensure_future(self._client.get(url, **kwargs)))
+            pending: set[asyncio.Future[httpx.Response]] = set(tasks)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        return task.result()
+                    error = error or exc
+            raise error if error is not None else RuntimeError("request failed")
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # loser may have failed; mark it retrieved
 
     async def get_json_dict(
         self,
@@ -805,6 +1552,121 @@ class SdetAsyncHttpClient:
             raise ValueError("expected json array")
         return data
 
+    async def get_json_any(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | AsyncHook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> dict | list:
+        r, data, rid = await self._request_json(
+            url,
+            headers=headers,
+            request_id=request_id,
+            timeout=timeout,
+            retry=retry,
+            hook=hook,
+            breaker=breaker,
+        )
+        if not isinstance(data, dict | list):
+            raise ValueError("expected json object or array")
+        return data
+
+    def iter_many(
+        self,
+        requests: Iterable[BatchRequest | str],
+        *,
+        concurrency: int = 10,
+        per_host: int | None = None,
+    ) -> AsyncIterator[BatchResult]:
+        """Run a batch of GETs and yield each :class:`BatchResult` as it completes.
+
+        At most ``concurrency`` requests are in flight overall and at most
+        ``per_host`` against any one scheme+host+port. A request waits for its
+        host slot before taking a global slot, so a slow host cannot starve the
+        rest of the batch. Each request's own ``retry`` policy applies, and
+        ``elapsed_seconds`` excludes time spent queueing. Failures are yielded
+        as results, never raised; stopping iteration cancels whatever is left.
+        """
+        items = _batch_requests(requests, concurrency, per_host)
+        return self._aiter_many(items, concurrency, per_host)
+
+    async def _aiter_many(
+        self, items: list[BatchRequest], concurrency: int, per_host: int | None
+    ) -> AsyncIterator[BatchResult]:
+        limit = asyncio.Semaphore(concurrency)
+        hosts: dict[str, asyncio.Semaphore] = {}
+        done: asyncio.Queue[BatchResult] = asyncio.Queue()
+
+        async def run(index: int, req: BatchRequest) -> None:
+            slot: Any = contextlib.nullcontext()
+            if per_host is not None:
+                slot = hosts.setdefault(_host_key(req.url), asyncio.Semaphore(per_host))
+            async with slot, limit:
+                start = self._clock()
+                try:
+                    value = await self._fetch_one(req)
+                except Exception as exc:
+                    res = BatchResult(
+                        index, req.url, error=exc, elapsed_seconds=self._clock() - start
+                    )
+                else:
+                    res = BatchResult(
+                        index, req.url, value=value, elapsed_seconds=self._clock() - start
+                    )
+            done.put_nowait(res)
+
+        tasks = [asyncio.ensure_future(run(i, req)) for i, req in enumerate(items)]
+        try:
+            for _ in tasks:
+                yield await done.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def fetch_many(
+        self,
+        requests: Iterable[BatchRequest | str],
+        *,
+        concurrency: int = 10,
+        per_host: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[BatchResult]:
+        """Run a batch through :meth:`iter_many` and return results in input order.
+
+        Plain URL strings are accepted as ``BatchRequest(url)``. With
+        ``return_exceptions=False`` the first failure to complete is raised and
+        the outstanding requests are cancelled; otherwise failed entries carry
+        ``error``. Pass the result to :func:`batch_stats` for latency figures.
+        """
+        items = _batch_requests(requests, concurrency, per_host)
+        out: list[BatchResult | None] = [None] * len(items)
+        async with contextlib.aclosing(self._aiter_many(items, concurrency, per_host)) as it:
+            async for res in it:
+                if res.error is not None and not return_exceptions:
+                    raise res.error
+                out[res.index] = res
+        return [r for r in out if r is not None]
+
+    async def _fetch_one(self, req: BatchRequest) -> Any:
+        fetch = {
+            "dict": self.get_json_dict,
+            "list": self.get_json_list,
+            "any": self.get_json_any,
+        }[req.expect]
+        return await fetch(
+            req.url,
+            headers=req.headers,
+            request_id=req.request_id,
+            timeout=req.timeout,
+            retry=req.retry,
+        )
+
     async def get_json_list_paginated(
         self,
         url: str,
@@ -817,10 +1679,58 @@ class SdetAsyncHttpClient:
         hook: Hook | AsyncHook | None = None,
         breaker: CircuitBreaker | None = None,
     ) -> list:
+        return [
+            item
+            async for item in self.aiter_json_list_paginated(
+                url,
+                max_pages=max_pages,
+                headers=headers,
+                request_id=request_id,
+                timeout=timeout,
+                retry=retry,
+                hook=hook,
+                breaker=breaker,
+            )
+        ]
+
+    def aiter_json_list_paginated(
+        self,
+        url: str,
+        *,
+        max_pages: int = 100,
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | AsyncHook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> AsyncIterator[Any]:
+        """Async counterpart of :meth:`SdetHttpClient.iter_json_list_paginated`."""
         if max_pages < 1:
             raise ValueError("max_pages must be >= 1")
+        return self._aiter_link_items(
+            url,
+            max_pages=max_pages,
+            headers=headers,
+            request_id=request_id,
+            timeout=timeout,
+            retry=retry,
+            hook=hook,
+            breaker=breaker,
+        )
 
-        out: list = []
+    async def _aiter_link_items(
+        self,
+        url: str,
+        *,
+        max_pages: int,
+        headers: dict[str, str] | None,
+        request_id: str | None,
+        timeout: float | httpx.Timeout | None,
+        retry: RetryPolicy | None,
+        hook: Hook | AsyncHook | None,
+        breaker: CircuitBreaker | None,
+    ) -> AsyncIterator[Any]:
         seen: set[str] = set()
         cur = url
 
@@ -836,11 +1746,12 @@ class SdetAsyncHttpClient:
             )
             if not isinstance(data, list):
                 raise ValueError("expected json array")
-            out.extend(data)
+            for item in data:
+                yield item
 
             nxt = _link_next_url(r)
             if not nxt:
-                return out
+                return
             if nxt in seen:
                 raise RuntimeError("pagination impact")
             seen.add(nxt)
@@ -848,6 +1759,192 @@ class SdetAsyncHttpClient:
 
         raise RuntimeError("pagination limit exceeded")
 
+    async def get_json_list_paginated_envelope(
+        self,
+        url: str,
+        *,
+        items_key: str = "items",
+        next_key: str = "next",
+        max_pages: int = 100,
+        prefetch: int = 0,
+        page_param: str = "page",
+        total_key: str = "total",
+        per_page_key: str = "per_page",
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | AsyncHook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> list:
+        return [
+            item
+            async for item in self.aiter_json_list_paginated_envelope(
+                url,
+                items_key=items_key,
+                next_key=next_key,
+                max_pages=max_pages,
+                prefetch=prefetch,
+                page_param=page_param,
+                total_key=total_key,
+                per_page_key=per_page_key,
+                headers=headers,
+                request_id=request_id,
+                timeout=timeout,
+                retry=retry,
+                hook=hook,
+                breaker=breaker,
+            )
+        ]
+
+    def aiter_json_list_paginated_envelope(
+        self,
+        url: str,
+        *,
+        items_key: str = "items",
+        next_key: str = "next",
+        max_pages: int = 100,
+        prefetch: int = 0,
+        page_param: str = "page",
+        total_key: str = "total",
+        per_page_key: str = "per_page",
+        headers: dict[str, str] | None = None,
+        request_id: str | None = None,
+        timeout: float | httpx.Timeout | None = None,
+        retry: RetryPolicy | None = None,
+        hook: Hook | AsyncHook | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> AsyncIterator[Any]:
+        """Yield envelope items page by page.
+
+        With ``prefetch=N`` (N > 1) and a first page that reports ``total_key`` and
+        ``per_page_key``, the remaining pages are requested by setting ``page_param``
+        on ``url`` and up to N of them are in flight at once. Items are still yielded
+        in page order and every request goes through the normal retry/breaker path.
+        Envelopes without those counts fall back to following ``next_key``.
+        """
+        if max_pages < 1:
+            raise ValueError("max_pages must be >= 1")
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
+        if not str(items_key).strip():
+            raise ValueError("items_key must not be empty")
+        if not str(next_key).strip():
+            raise ValueError("next_key must not be empty")
+        return self._aiter_envelope_items(
+            url,
+            items_key=items_key,
+            next_key=next_key,
+            max_pages=max_pages,
+            prefetch=prefetch,
+            page_param=page_param,
+            total_key=total_key,
+            per_page_key=per_page_key,
+            request_kwargs={
+                "headers": headers,
+                "request_id": request_id,
+                "timeout": timeout,
+                "retry": retry,
+                "hook": hook,
+                "breaker": breaker,
+            },
+        )
+
+    async def _aiter_envelope_items(
+        self,
+        url: str,
+        *,
+        items_key: str,
+        next_key: str,
+        max_pages: int,
+        prefetch: int,
+        page_param: str,
+        total_key: str,
+        per_page_key: str,
+        request_kwargs: dict[str, Any],
+    ) -> AsyncIterator[Any]:
+        r, data, rid = await self._request_json(str(url), **request_kwargs)
+        page_items, nxt = _envelope_page(r, data, items_key, next_key)
+        for item in page_items:
+            yield item
+
+        page_count = _envelope_page_count(data, total_key, per_page_key)
+        if prefetch > 1 and page_count is not None:
+            pages = self._aiter_prefetched_pages(
+                str(url),
+                page_count=page_count,
+                first_page=_envelope_first_page(data, page_param),
+                items_key=items_key,
+                max_pages=max_pages,
+                prefetch=prefetch,
+                page_param=page_param,
+                request_kwargs=request_kwargs,
+            )
+            # Close it with this generator so pending page fetches are reaped right away.
+            async with contextlib.aclosing(pages):
+                async for item in pages:
+                    yield item
+            return
+
+        seen: set[str] = {str(url)}
+        for _ in range(max_pages - 1):
+            if nxt is None:
+                return
+            if nxt in seen:
+                raise RuntimeError("pagination impact")
+            seen.add(nxt)
+            r, data, rid = await self._request_json(nxt, **request_kwargs)
+            page_items, nxt = _envelope_page(r, data, items_key, next_key)
+            for item in page_items:
+                yield item
+        if nxt is not None:
+            raise RuntimeError("pagination limit exceeded")
+
+    async def _aiter_prefetched_pages(
+        self,
+        url: str,
+        *,
+        page_count: int,
+        first_page: int,
+        items_key: str,
+        max_pages: int,
+        prefetch: int,
+        page_param: str,
+        request_kwargs: dict[str, Any],
+    ) -> AsyncIterator[Any]:
+        numbers = range(first_page + 1, first_page + min(page_count, max_pages))
+
+        async def fetch(number: int) -> list:
+            r, data, rid = await self._request_json(
+                _with_query_param(url, page_param, str(number)), **request_kwargs
+            )
+            if not isinstance(data, dict):
+                raise ValueError("expected json object")
+            page_items = data.get(items_key)
+            if not isinstance(page_items, list):
+                raise ValueError(f"expected json array at key '{items_key}'")
+            return page_items
+
+        pending: deque[asyncio.Task[list]] = deque()
+        upcoming = iter(numbers)
+        try:
+            for number in itertools.islice(upcoming, prefetch):
+                pending.append(asyncio.ensure_future(fetch(number)))
+            while pending:
+                page_items = await pending.popleft()
+                for number in itertools.islice(upcoming, 1):
+                    pending.append(asyncio.ensure_future(fetch(number)))
+                for item in page_items:
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+            # Let the cancelled fetches unwind so none outlives the iterator; this
+            # also retrieves the exception of any page that had already failed.
+            await asyncio.gather(*pending, return_exceptions=True)
+        if page_count > max_pages:
+            raise RuntimeError("pagination limit exceeded")
+
     async def _request_json(
         self,
         url: str,
@@ -863,14 +1960,27 @@ class SdetAsyncHttpClient:
         ensure_allowed_scheme(url, allowed=self._allowed_schemes)
         if pol.retries < 1:
             raise ValueError("retries must be >= 1")
+        if pol.deadline is not None and pol.deadline <= 0:
+            raise ValueError("deadline must be > 0")
 
         hdrs, rid = _merge_headers(headers, self._trace_header, request_id)
         h = hook or self._hook
         b = breaker or self._breaker
         start = self._clock()
         last_err: BaseException | None = None
+        deadline_at = None if pol.deadline is None else start + pol.deadline
+        expired = False
 
         for attempt in range(pol.retries):
+            if self._limiter is not None and not await self._throttle(
+                self._limiter, url, attempt, pol.retries, rid, h, deadline_at
+            ):
+                expired = True
+                break
+            remaining = None if deadline_at is None else deadline_at - self._clock()
+            if remaining is not None and remaining <= 0:
+                expired = True
+                break
             if b is not None:
                 b.allow(self._clock())
 
@@ -886,12 +1996,7 @@ class SdetAsyncHttpClient:
             )
 
             try:
-                if hdrs is None:
-                    r = await self._client.get(url, timeout=default_http_timeout(timeout))
-                else:
-                    r = await self._client.get(
-                        url, headers=hdrs, timeout=default_http_timeout(timeout)
-                    )
+                r = await self._attempt_get(url, hdrs, timeout, remaining, pol, h, attempt, rid)
             except httpx.TimeoutException as e:
                 if b is not None:
                     b.record_failure(self._clock())
@@ -906,6 +2011,8 @@ class SdetAsyncHttpClient:
                         error="timeout",
                     ),
                 )
+                if deadline_at is not None and self._clock() >= deadline_at:
+                    raise TimeoutError("deadline exceeded") from e
                 raise TimeoutError("request timed out") from e
             except httpx.RequestError as e:
                 last_err = e
@@ -927,6 +2034,9 @@ class SdetAsyncHttpClient:
                     d = _backoff_delay(
                         attempt, pol.backoff_base, pol.backoff_factor, pol.backoff_jitter
                     )
+                    if deadline_at is not None and self._clock() + d >= deadline_at:
+                        expired = True
+                        break
                     if d > 0:
                         await _emit_async(
                             h,
@@ -943,6 +2053,8 @@ class SdetAsyncHttpClient:
                     continue
                 break
 
+            if self._limiter is not None:
+                self._limiter.observe(url, r.status_code, r.headers)
             await _emit_async(
                 h,
                 ClientEvent(
@@ -952,6 +2064,7 @@ class SdetAsyncHttpClient:
                     retries=pol.retries,
                     request_id=rid,
                     status_code=r.status_code,
+                    cache_status=_cache_status(r),
                 ),
             )
 
@@ -966,6 +2079,9 @@ class SdetAsyncHttpClient:
                         attempt, pol.backoff_base, pol.backoff_factor, pol.backoff_jitter
                     )
                 )
+                if deadline_at is not None and self._clock() + d >= deadline_at:
+                    expired = True
+                    break
                 if d > 0:
                     await _emit_async(
                         h,
@@ -994,10 +2110,11 @@ class SdetAsyncHttpClient:
                         retries=pol.retries,
                         request_id=rid,
                         ok=False,
+                        status_code=r.status_code,
                         elapsed_seconds=elapsed,
                     ),
                 )
-                raise HttpStatusError("non-2xx response", response=r, body=r.content)
+                raise HttpStatusError("non-2xx response", response=r)
 
             data = r.json()
             if b is not None:
@@ -1012,6 +2129,7 @@ class SdetAsyncHttpClient:
                     retries=pol.retries,
                     request_id=rid,
                     ok=True,
+                    status_code=r.status_code,
                     elapsed_seconds=elapsed,
                 ),
             )
@@ -1030,6 +2148,8 @@ class SdetAsyncHttpClient:
                 elapsed_seconds=elapsed,
             ),
         )
+        if expired:
+            raise TimeoutError("deadline exceeded") from last_err
         if last_err is not None:
             raise RuntimeError("request failed") from last_err
         raise RuntimeError("request failed")
@@ -796,10 +796,24 @@ class _OpsHandler(BaseHTTPRequestHandler):
         self.wfile.write(body)
 
     def do_GET(self) -> None:  # noqa: N802
-        path, _query = _parse_http_path(self.path)
+        path, query = _parse_http_path(self.path)
         if path == "/health":
             self._json(200, {"ok": True})
             return
+        if path == "/metrics":
+            from . import clientmetrics
+
+            metrics = clientmetrics.default_metrics
+            if query.get("format") == ["json"]:
+                self._json(200, metrics.snapshot())
+                return
+            body = metrics.to_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
         if path == "/actions":
             self._json(200, {"actions": self.registry.list_specs()})
             return
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import sys
+import zlib
 from collections.abc import Sequence
 from importlib import import_module
 from pathlib import Path
 
+from . import __version__
+
 RECOMMENDED_PLAYBOOKS: list[str] = [
     "onboarding",
     "weekly-review",
@@ -32,6 +36,8 @@ CORE_COMMANDS: set[str] = {
     "kv",
     "apiget",
     "cassette-get",
+    "cassette",
+    "load",
     "doctor",
     "gate",
     "ci",
@@ -116,15 +122,20 @@ def _is_legacy_module(mod: str) -> bool:
     return False
 
 
+def _module_exists(pkg_dir: Path, mod: str) -> bool:
+    return (pkg_dir / f"{mod}.py").exists() or (pkg_dir / "closeout_specs" / f"{mod}.json").exists()
+
+
 def _discover_legacy_modules(pkg_dir: Path) -> list[str]:
     mods: list[str] = []
-    for p in pkg_dir.glob("*.py"):
+    # Most closeout lanes are JSON specs served by sdetkit.closeout_engine.
+    for p in [*pkg_dir.glob("*.py"), *pkg_dir.glob("closeout_specs/*.json")]:
         if not p.is_file():
             continue
         stem = p.stem
         if stem.startswith("__"):
             continue
-        if stem in {"cli", "playbooks_cli"}:
+        if stem in {"cli", "playbooks_cli", "closeout_engine"}:
             continue
         if _is_legacy_module(stem):
             mods.append(stem)
@@ -160,7 +171,7 @@ def _build_registry(pkg_dir: Path) -> tuple[dict[str, str], dict[str, str]]:
 
     for cmd in RECOMMENDED_PLAYBOOKS:
         mod = _cmd_to_mod(cmd)
-        if (pkg_dir / f"{mod}.py").exists():
+        if _module_exists(pkg_dir, mod):
             cmd_to_mod[cmd] = mod
 
     for mod in _discover_legacy_modules(pkg_dir):
@@ -176,6 +187,85 @@ def _build_registry(pkg_dir: Path) -> tuple[dict[str, str], dict[str, str]]:
     return cmd_to_mod, alias_to_canonical
 
 
+_REGISTRY_MANIFEST_SCHEMA = "sdetkit.playbooks.registry.v1"
+
+
+def _cache_dir() -> Path:
+    env = os.environ.get("SDETKIT_CACHE_DIR")
+    if env:
+        return Path(env)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    return (Path(xdg) if xdg else Path.home() / ".cache") / "sdetkit"
+
+
+def _registry_manifest_key(pkg_dir: Path) -> dict[str, object] | None:
+    # The registry is a pure function of the module files in pkg_dir, its closeout
+    # specs and the constants in this module; adding, removing or reinstalling files
+    # bumps the directory mtimes, edits here bump this file's mtime, and the version
+    # covers upgrades that preserve mtimes.
+    try:
+        resolved = pkg_dir.resolve()
+        mtime_ns = resolved.stat().st_mtime_ns
+        module_mtime_ns = Path(__file__).stat().st_mtime_ns
+    except OSError:
+        return None
+    try:
+        specs_mtime_ns = (resolved / "closeout_specs").stat().st_mtime_ns
+    except OSError:
+        specs_mtime_ns = 0
+    return {
+        "schema": _REGISTRY_MANIFEST_SCHEMA,
+        "version": __version__,
+        "module_mtime_ns": module_mtime_ns,
+        "pkg_dir": str(resolved),
+        "mtime_ns": mtime_ns,
+        "specs_mtime_ns": specs_mtime_ns,
+    }
+
+
+def _registry_manifest_path(key: dict[str, object]) -> Path:
+    digest = f"{zlib.crc32(str(key['pkg_dir']).encode('utf-8')):08x}"
+    return _cache_dir() / f"playbooks-registry-{digest}.json"
+
+
+def _read_registry_manifest(
+    path: Path, key: dict[str, object]
+) -> tuple[dict[str, str], dict[str, str]] | None:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, dict) or raw.get("key") != key:
+        return None
+    cmd_to_mod = raw.get("cmd_to_mod")
+    alias_to_canonical = raw.get("alias_to_canonical")
+    if not isinstance(cmd_to_mod, dict) or not isinstance(alias_to_canonical, dict):
+        return None
+    return cmd_to_mod, alias_to_canonical
+
+
+def _load_registry(pkg_dir: Path) -> tuple[dict[str, str], dict[str, str]]:
+    """Return the playbook registry, reusing the cached manifest while it is fresh."""
+    key = _registry_manifest_key(pkg_dir)
+    if key is None:
+        return _build_registry(pkg_dir)
+
+    path = _registry_manifest_path(key)
+    cached = _read_registry_manifest(path, key)
+    if cached is not None:
+        return cached
+
+    cmd_to_mod, alias_to_canonical = _build_registry(pkg_dir)
+    payload = {"key": key, "cmd_to_mod": cmd_to_mod, "alias_to_canonical": alias_to_canonical}
+    try:
+        from .atomicio import atomic_write_text
+
+        atomic_write_text(path, json.dumps(payload, sort_keys=True) + "\n")
+    except OSError:
+        pass
+    return cmd_to_mod, alias_to_canonical
+
+
 def _apply_search_list(xs: list[str], search: str | None) -> list[str]:
     xs = [x for x in xs if not _contains_day_token(x)]
     if not search:
@@ -223,7 +313,7 @@ def _list_payload(
     search: str | None,
 ) -> dict[str, object]:
     pkg_dir = _pkg_dir()
-    cmd_to_mod, alias_to_canonical = _build_registry(pkg_dir)
+    cmd_to_mod, alias_to_canonical = _load_registry(pkg_dir)
 
     recommended = [c for c in RECOMMENDED_PLAYBOOKS if c in cmd_to_mod]
     recommended = _apply_search_list(recommended, search)
@@ -330,7 +420,7 @@ def _cmd_list(ns: argparse.Namespace) -> int:
 
 def _cmd_run(ns: argparse.Namespace) -> int:
     pkg_dir = _pkg_dir()
-    cmd_to_mod, _alias_to_canonical = _build_registry(pkg_dir)
+    cmd_to_mod, _alias_to_canonical = _load_registry(pkg_dir)
 
     name = getattr(ns, "name", "")
     if not isinstance(name, str) or name not in cmd_to_mod:
@@ -372,7 +462,7 @@ def _selected_playbooks(
 
 def _cmd_validate(ns: argparse.Namespace) -> int:
     pkg_dir = _pkg_dir()
-    cmd_to_mod, alias_to_canonical = _build_registry(pkg_dir)
+    cmd_to_mod, alias_to_canonical = _load_registry(pkg_dir)
     all_names = sorted(cmd_to_mod.keys())
     selected = _selected_playbooks(ns, all_names, alias_to_canonical)
 
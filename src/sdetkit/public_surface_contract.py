@@ -46,6 +46,8 @@ PUBLIC_SURFACE_CONTRACT: tuple[CommandFamilyContract, ...] = (
             "kv",
             "apiget",
             "cassette-get",
+            "cassette",
+            "load",
             "patch",
             "ops",
             "notify",
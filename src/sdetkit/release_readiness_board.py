@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import argparse
 import json
-import shlex
-import subprocess
-import sys
 from pathlib import Path
 from typing import Any
 
+from .evidence_runner import run_commands
+
 _PAGE_PATH = "docs/integrations-release-readiness-board.md"
 
 _SECTION_HEADER = "# Release readiness board (Day 19)"
@@ -243,43 +242,26 @@ def _emit_pack(path: str, payload: dict[str, Any], root: Path) -> list[str]:
     ]
 
 
-def _execute_commands(commands: list[str], timeout_sec: int) -> list[dict[str, Any]]:
+def _execute_commands(
+    commands: list[str],
+    timeout_sec: int,
+    *,
+    jobs: int | None = None,
+    stream_dir: Path | None = None,
+) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
-    for idx, command in enumerate(commands, start=1):
-        try:
-            argv = shlex.split(command)
-            if argv and argv[0] == "python":
-                argv[0] = sys.executable
-            proc = subprocess.run(
-                argv,
-                shell=False,
-                capture_output=True,
-                text=True,
-                timeout=timeout_sec,
-                check=False,
-            )
-            rows.append(
-                {
-                    "index": idx,
-                    "command": command,
-                    "returncode": proc.returncode,
-                    "ok": proc.returncode == 0,
-                    "stdout": proc.stdout,
-                    "stderr": proc.stderr,
-                }
-            )
-        except subprocess.TimeoutExpired as exc:
-            rows.append(
-                {
-                    "index": idx,
-                    "command": command,
-                    "returncode": 124,
-                    "ok": False,
-                    "stdout": (exc.stdout or "") if isinstance(exc.stdout, str) else "",
-                    "stderr": (exc.stderr or "") if isinstance(exc.stderr, str) else "",
-                    "error": f"timed out after {timeout_sec}s",
-                }
-            )
+    for result in run_commands(commands, timeout=timeout_sec, jobs=jobs, stream_dir=stream_dir):
+        row: dict[str, Any] = {
+            "index": result.index,
+            "command": result.command,
+            "returncode": result.returncode,
+            "ok": result.ok,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+        }
+        if result.timed_out:
+            row["error"] = f"timed out after {timeout_sec}s"
+        rows.append(row)
     return rows
 
 
@@ -346,6 +328,7 @@ def _build_parser() -> argparse.ArgumentParser:
         default="docs/artifacts/day19-release-readiness-pack/evidence",
     )
     parser.add_argument("--timeout-sec", type=int, default=120)
+    parser.add_argument("--jobs", type=int, default=None)
     parser.add_argument("--strict", action="store_true")
     parser.add_argument("--format", choices=["text", "json", "markdown"], default="text")
     parser.add_argument("--output", default="")
@@ -380,7 +363,12 @@ def main(argv: list[str] | None = None) -> int:
         payload["execution_artifacts"] = _write_execution_evidence(
             root,
             args.evidence_dir,
-            _execute_commands(_EXECUTION_COMMANDS, args.timeout_sec),
+            _execute_commands(
+                _EXECUTION_COMMANDS,
+                args.timeout_sec,
+                jobs=args.jobs,
+                stream_dir=root / args.evidence_dir,
+            ),
         )
 
     strict_failed = (
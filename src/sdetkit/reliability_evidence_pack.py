@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import argparse
 import json
-import shlex
-import subprocess
-import sys
 from pathlib import Path
 from typing import Any
 
+from .evidence_runner import run_commands
+
 _PAGE_PATH = "docs/integrations-reliability-evidence-pack.md"
 
 _SECTION_HEADER = "# Reliability evidence pack (Day 18)"
@@ -258,43 +257,26 @@ def _emit_pack(path: str, payload: dict[str, Any], base: Path) -> list[str]:
     ]
 
 
-def _execute_commands(commands: list[str], timeout_sec: int) -> list[dict[str, Any]]:
+def _execute_commands(
+    commands: list[str],
+    timeout_sec: int,
+    *,
+    jobs: int | None = None,
+    stream_dir: Path | None = None,
+) -> list[dict[str, Any]]:
     results: list[dict[str, Any]] = []
-    for idx, command in enumerate(commands, start=1):
-        try:
-            argv = shlex.split(command)
-            if argv and argv[0] == "python":
-                argv[0] = sys.executable
-            proc = subprocess.run(
-                argv,
-                shell=False,
-                capture_output=True,
-                text=True,
-                timeout=timeout_sec,
-                check=False,
-            )
-            results.append(
-                {
-                    "index": idx,
-                    "command": command,
-                    "returncode": proc.returncode,
-                    "ok": proc.returncode == 0,
-                    "stdout": proc.stdout,
-                    "stderr": proc.stderr,
-                }
-            )
-        except subprocess.TimeoutExpired as exc:
-            results.append(
-                {
-                    "index": idx,
-                    "command": command,
-                    "returncode": 124,
-                    "ok": False,
-                    "stdout": (exc.stdout or "") if isinstance(exc.stdout, str) else "",
-                    "stderr": (exc.stderr or "") if isinstance(exc.stderr, str) else "",
-                    "error": f"timed out after {timeout_sec}s",
-                }
-            )
+    for result in run_commands(commands, timeout=timeout_sec, jobs=jobs, stream_dir=stream_dir):
+        row: dict[str, Any] = {
+            "index": result.index,
+            "command": result.command,
+            "returncode": result.returncode,
+            "ok": result.ok,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+        }
+        if result.timed_out:
+            row["error"] = f"timed out after {timeout_sec}s"
+        results.append(row)
     return results
 
 
@@ -376,6 +358,7 @@ def _build_parser() -> argparse.ArgumentParser:
         "--evidence-dir", default="", help="Output directory for Day 18 command execution logs."
     )
     parser.add_argument("--timeout-sec", type=int, default=120)
+    parser.add_argument("--jobs", type=int, default=None)
     parser.add_argument("--format", choices=["text", "markdown", "json"], default="text")
     parser.add_argument("--output", default="")
     return parser
@@ -435,10 +418,15 @@ def main(argv: list[str] | None = None) -> int:
             "python scripts/check_day18_reliability_evidence_pack_contract.py --skip-evidence",
             "python -m pytest -q tests/test_cli_help_lists_subcommands.py",
         ]
-        results = _execute_commands(commands, timeout_sec=ns.timeout_sec)
         evidence_dir = ns.evidence_dir or (
             ns.emit_pack_dir + "/evidence" if ns.emit_pack_dir else ""
         )
+        results = _execute_commands(
+            commands,
+            timeout_sec=ns.timeout_sec,
+            jobs=ns.jobs,
+            stream_dir=base / evidence_dir if evidence_dir else None,
+        )
         payload["executed_commands"] = results
         if evidence_dir:
             emitted.extend(_write_execution_evidence(base, evidence_dir, results))
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
 import json
 import re
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
@@ -53,32 +55,112 @@ def redact_header_value(name: str, value: str, *, enabled: bool, keys: set[str])
     return value
 
 
+_REDACTED = "<redacted>"
+_SENSITIVE_MEMO_MAX = 4096
+
+
+class Redactor:
+    """Redaction engine for one key set, built once and reused.
+
+    Text redaction is a single pass of one alternation regex (longest keys
+    first) instead of one ``re.sub`` per key, skipped outright when the text
+    has no ``:``/``=`` separator. JSON is walked iteratively, so deep documents
+    cannot hit the recursion limit; key verdicts are memoised and lists are
+    copied in one step, revisiting only their nested containers. Output matches the module-level
+    helpers: dict keys are emitted sorted and containers are always copies.
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        self.keys = frozenset(keys)
+        self._memo: dict[str, bool] = {}
+        tokens = sorted(
+            (re.escape(k).replace("\\-", "[-_]") for k in self.keys), key=len, reverse=True
+        )
+        self._text_re = (
+            re.compile(rf"(?i)(\b(?:{'|'.join(tokens)})\b\s*[:=]\s*)([^\s,;]+)") if tokens else None
+        )
+
+    def is_sensitive(self, name: str) -> bool:
+        hit = self._memo.get(name)
+        if hit is None:
+            key = str(name).strip().lower()
+            hit = key in self.keys or key.replace("-", "_") in self.keys
+            if len(self._memo) >= _SENSITIVE_MEMO_MAX:
+                self._memo.clear()
+            self._memo[name] = hit
+        return hit
+
+    def text(self, text: str) -> str:
+        if self._text_re is None or ("=" not in text and ":" not in text):
+            return text
+        return self._text_re.sub(r"\1<redacted>", text)
+
+    def json(self, value: object) -> object:
+        if isinstance(value, dict):
+            root: dict[object, object] | list[object] = {}
+        elif isinstance(value, list):
+            root = list(value)
+        else:
+            return value
+        memo = self._memo
+        stack: list[tuple[object, object]] = [(value, root)]
+        pop, push = stack.pop, stack.append
+        while stack:
+            src, dst = pop()
+            if isinstance(dst, dict) and isinstance(src, dict):
+                for k in sorted(src, key=str):
+                    if isinstance(k, str):
+                        hit = memo.get(k)
+                        if hit is None:
+                            hit = self.is_sensitive(k)
+                        if hit:
+                            dst[k] = _REDACTED
+                            continue
+                    v = src[k]
+                    if isinstance(v, dict):
+                        child_d: dict[object, object] = {}
+                        dst[k] = child_d
+                        push((v, child_d))
+                    elif isinstance(v, list):
+                        child_l: list[object] = list(v)
+                        dst[k] = child_l
+                        push((v, child_l))
+                    else:
+                        dst[k] = v
+            elif isinstance(dst, list) and isinstance(src, list):
+                # ``dst`` starts as a shallow copy; only nested containers need replacing.
+                for i, v in enumerate(src):
+                    if isinstance(v, dict):
+                        child_d = {}
+                        dst[i] = child_d
+                        push((v, child_d))
+                    elif isinstance(v, list):
+                        child_l = list(v)
+                        dst[i] = child_l
+                        push((v, child_l))
+        return root
+
+
+@functools.lru_cache(maxsize=32)
+def _redactor_for(keys: frozenset[str]) -> Redactor:
+    return Redactor(keys)
+
+
+def redactor(keys: Iterable[str]) -> Redactor:
+    """Shared :class:`Redactor` for ``keys`` (compiled once per distinct key set)."""
+    return _redactor_for(frozenset(keys))
+
+
 def redact_json(value: object, *, enabled: bool, keys: set[str]) -> object:
     if not enabled:
         return value
-    if isinstance(value, dict):
-        out: dict[object, object] = {}
-        for k in sorted(value.keys(), key=str):
-            v = value[k]
-            if isinstance(k, str) and is_sensitive_key(k, keys):
-                out[k] = "<redacted>"
-            else:
-                out[k] = redact_json(v, enabled=enabled, keys=keys)
-        return out
-    if isinstance(value, list):
-        return [redact_json(v, enabled=enabled, keys=keys) for v in value]
-    return value
+    return redactor(keys).json(value)
 
 
 def redact_secrets_text(text: str, *, enabled: bool, keys: set[str]) -> str:
     if not enabled:
         return text
-    out = text
-    for key in sorted(keys):
-        token = re.escape(key).replace("\\-", "[-_]").replace("\\_", "[-_]")
-        pattern = rf"(?i)(\b{token}\b\s*[:=]\s*)([^\s,;]+)"
-        out = re.sub(pattern, r"\1<redacted>", out)
-    return out
+    return redactor(keys).text(text)
 
 
 def redact_secrets_headers(
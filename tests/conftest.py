@@ -4,6 +4,8 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
+
 _REPO_ROOT = Path(__file__).resolve().parents[1]
 _SRC = _REPO_ROOT / "src"
 
@@ -16,3 +18,8 @@ if _existing:
         os.environ["PYTHONPATH"] = f"{_SRC}{os.pathsep}{_existing}"
 else:
     os.environ["PYTHONPATH"] = str(_SRC)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_sdetkit_cache(tmp_path_factory: pytest.TempPathFactory, monkeypatch) -> None:
+    monkeypatch.setenv("SDETKIT_CACHE_DIR", str(tmp_path_factory.mktemp("sdetkit-cache")))
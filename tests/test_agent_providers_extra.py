@@ -3,34 +3,28 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import httpx
 import pytest
 
 from sdetkit.agent.providers import CachedProvider, FakeProvider, LocalHTTPProvider
 
 
-class _HTTPResponse:
-    def __init__(self, payload: str) -> None:
-        self._payload = payload
+def _serve(monkeypatch, handler) -> None:
+    def shared_client(base_url: str = "", **settings: object) -> httpx.Client:
+        return httpx.Client(transport=httpx.MockTransport(handler), **settings)
 
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):
-        return None
-
-    def read(self) -> bytes:
-        return self._payload.encode("utf-8")
+    monkeypatch.setattr("sdetkit.httppool.shared_client", shared_client)
 
 
 def test_local_http_provider_prefers_response_text(monkeypatch) -> None:
     payload: dict[str, object] = {}
 
-    def _fake_urlopen(req, timeout):
-        payload["url"] = req.full_url
-        payload["body"] = json.loads(req.data.decode("utf-8"))
-        return _HTTPResponse('{"response": "ok"}')
+    def _handler(request: httpx.Request) -> httpx.Response:
+        payload["url"] = str(request.url)
+        payload["body"] = json.loads(request.content.decode("utf-8"))
+        return httpx.Response(200, text='{"response": "ok"}')
 
-    monkeypatch.setattr("urllib.request.urlopen", _fake_urlopen)
+    _serve(monkeypatch, _handler)
     provider = LocalHTTPProvider(endpoint="https://example.test/complete", model="m")
 
     out = provider.complete(role="manager", task="do", context={"x": 1})
@@ -40,15 +34,27 @@ def test_local_http_provider_prefers_response_text(monkeypatch) -> None:
     assert payload["body"] == {"model": "m", "prompt": "[manager] do", "context": {"x": 1}}
 
 
+def test_local_http_provider_follows_redirects(monkeypatch) -> None:
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/complete":
+            return httpx.Response(307, headers={"Location": "/v2/complete"})
+        assert json.loads(request.content)["model"] == "m"
+        return httpx.Response(200, text='{"response": "moved"}')
+
+    _serve(monkeypatch, _handler)
+    provider = LocalHTTPProvider(endpoint="https://example.test/complete", model="m")
+    assert provider.complete(role="worker", task="x", context={}) == "moved"
+
+
 def test_local_http_provider_non_json_response(monkeypatch) -> None:
-    monkeypatch.setattr("urllib.request.urlopen", lambda req, timeout: _HTTPResponse("plain text"))
+    _serve(monkeypatch, lambda request: httpx.Response(200, text="plain text"))
     provider = LocalHTTPProvider(endpoint="https://example.test/complete", model="m")
     assert provider.complete(role="worker", task="x", context={}) == "plain text"
 
 
 @pytest.mark.parametrize("raw", ['{"text":"t"}', '{"output":"o"}', '{"x":1}'])
 def test_local_http_provider_fallback_fields(monkeypatch, raw: str) -> None:
-    monkeypatch.setattr("urllib.request.urlopen", lambda req, timeout: _HTTPResponse(raw))
+    _serve(monkeypatch, lambda request: httpx.Response(200, text=raw))
     provider = LocalHTTPProvider(endpoint="https://example.test/complete", model="m")
     out = provider.complete(role="worker", task="x", context={})
     assert out in {"t", "o", raw}
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from sdetkit import apiclient
+from sdetkit.netclient import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ClientEvent,
+    SdetAsyncHttpClient,
+    SdetHttpClient,
+)
+
+_SCENARIOS = {
+    "ok": ["ok"],
+    "connect-then-ok": ["connect", "connect", "ok"],
+    "connect-exhausted": ["connect", "connect", "connect"],
+    "timeout": ["timeout", "ok"],
+    "429-then-ok": ["429", "ok"],
+    "429-exhausted": ["429", "429", "429"],
+    "non-2xx": ["500", "ok"],
+    "wrong-shape": ["wrong"],
+}
+
+
+def _handler(script: list[str], expect: str, calls: list[str]):
+    def handler(req: httpx.Request) -> httpx.Response:
+        step = script[min(len(calls), len(script) - 1)]
+        calls.append(req.url.path)
+        if step == "connect":
+            raise httpx.ConnectError("refused", request=req)
+        if step == "timeout":
+            raise httpx.ReadTimeout("slow", request=req)
+        if step == "429":
+            return httpx.Response(429, headers={"Retry-After": "2"})
+        if step == "500":
+            return httpx.Response(500)
+        good = {"ok": True} if expect == "dict" else [1, 2]
+        return httpx.Response(200, json=good if step == "ok" else [good])
+
+    return handler
+
+
+def _outcome(fn) -> object:
+    try:
+        return ("ok", fn())
+    except Exception as exc:  # noqa: BLE001
+        cause = type(exc.__cause__).__name__ if exc.__cause__ else None
+        return (type(exc).__name__, str(exc), cause)
+
+
+def _run_sync(name: str, script: list[str], expect: str) -> tuple:
+    calls: list[str] = []
+    sleeps: list[float] = []
+    events: list[ClientEvent] = []
+    fn = getattr(apiclient, name)
+    with httpx.Client(transport=httpx.MockTransport(_handler(script, expect, calls))) as c:
+        out = _outcome(
+            lambda: fn(
+                c,
+                "https://example.test/x",
+                3,
+                retry_on_429=True,
+                backoff_base=0.5,
+                sleep=sleeps.append,
+                hook=events.append,
+            )
+        )
+    return out, calls, sleeps, [(e.type, e.attempt, e.status_code, e.error) for e in events]
+
+
+def _run_async(name: str, script: list[str], expect: str) -> tuple:
+    calls: list[str] = []
+    sleeps: list[float] = []
+    events: list[ClientEvent] = []
+    fn = getattr(apiclient, name + "_async")
+
+    async def pause(d: float) -> None:
+        sleeps.append(d)
+
+    async def go() -> object:
+        transport = httpx.MockTransport(_handler(script, expect, calls))
+        async with httpx.AsyncClient(transport=transport) as c:
+            try:
+                return (
+                    "ok",
+                    await fn(
+                        c,
+                        "https://example.test/x",
+                        3,
+                        retry_on_429=True,
+                        backoff_base=0.5,
+                        sleep=pause,
+                        hook=events.append,
+                    ),
+                )
+            except Exception as exc:  # noqa: BLE001
+                cause = type(exc.__cause__).__name__ if exc.__cause__ else None
+                return (type(exc).__name__, str(exc), cause)
+
+    out = asyncio.run(go())
+    return out, calls, sleeps, [(e.type, e.attempt, e.status_code, e.error) for e in events]
+
+
+@pytest.mark.parametrize("scenario", sorted(_SCENARIOS))
+@pytest.mark.parametrize(
+    ("name", "expect"),
+    [
+        ("fetch_json_dict", "dict"),
+        ("fetch_json_list", "list"),
+        ("fetch_json_list_paginated", "list"),
+    ],
+)
+def test_sync_and_async_behave_identically(name: str, expect: str, scenario: str) -> None:
+    script = _SCENARIOS[scenario]
+    sync = _run_sync(name, script, expect)
+    assert sync == _run_async(name, script, expect)
+
+    outcome, calls, sleeps, events = sync
+    if scenario in {"ok", "connect-then-ok", "429-then-ok"}:
+        assert outcome[0] == "ok"
+    assert {
+        "connect-exhausted": (
+            "RuntimeError",
+            "request failed",
+            "ConnectError",
+        ),
+        "timeout": ("TimeoutError", "request timed out", "ReadTimeout"),
+        "429-exhausted": ("RuntimeError", "non-2xx response", None),
+        "non-2xx": ("RuntimeError", "non-2xx response", None),
+    }.get(scenario, outcome) == outcome
+    assert len(calls) == {"connect-then-ok": 3, "connect-exhausted": 3, "429-exhausted": 3}.get(
+        scenario, 2 if scenario == "429-then-ok" else 1
+    )
+    assert sleeps == {
+        "connect-then-ok": [0.5, 1.0],
+        "connect-exhausted": [0.5, 1.0],
+        "429-then-ok": [2.0],
+        "429-exhausted": [2.0, 2.0],
+    }.get(scenario, [])
+    assert events[0] == ("attempt_start", 0, None, None)
+    # Like SdetHttpClient.request, a timeout raises straight after its attempt_error.
+    assert events[-1][0] == ("attempt_error" if scenario == "timeout" else "complete")
+    assert sum(e[0] == "sleep" for e in events) == len(sleeps)
+
+
+def test_breaker_is_shared_across_sync_and_async_calls() -> None:
+    calls: list[str] = []
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    handler = _handler(["500"], "dict", calls)
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as c:
+        with pytest.raises(RuntimeError, match="^non-2xx response$"):
+            apiclient.fetch_json_dict(c, "https://example.test/a", breaker=breaker)
+
+    async def go() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            with pytest.raises(RuntimeError, match="^non-2xx response$"):
+                await apiclient.fetch_json_dict_async(c, "https://example.test/a", breaker=breaker)
+            with pytest.raises(CircuitOpenError):
+                await apiclient.fetch_json_dict_async(c, "https://example.test/a", breaker=breaker)
+
+    asyncio.run(go())
+    with httpx.Client(transport=httpx.MockTransport(handler)) as c:
+        with pytest.raises(CircuitOpenError):
+            apiclient.fetch_json_list_paginated(c, "https://example.test/a", breaker=breaker)
+    assert len(calls) == 2
+
+
+def test_sync_calls_work_inside_a_running_loop_and_with_async_hooks() -> None:
+    class Resp:
+        status_code = 200
+        headers: dict[str, str] = {}
+
+        def json(self) -> dict:
+            return {"ok": 1}
+
+    class Client:
+        def get(self, *_a: object, **_k: object) -> Resp:
+            return Resp()
+
+    async def inside_running_loop() -> dict:
+        return apiclient.fetch_json_dict(Client(), "https://example.test/x")
+
+    assert asyncio.run(inside_running_loop()) == {"ok": 1}
+
+    seen: list[str] = []
+
+    async def async_hook(ev: ClientEvent) -> None:
+        await asyncio.sleep(0)
+        seen.append(ev.type)
+
+    async def with_async_hook() -> dict:
+        return apiclient.fetch_json_dict(Client(), "https://example.test/x", hook=async_hook)
+
+    assert apiclient.fetch_json_dict(Client(), "/x", hook=async_hook) == {"ok": 1}
+    assert asyncio.run(with_async_hook()) == {"ok": 1}
+    assert seen == ["attempt_start", "attempt_response", "complete"] * 2
+
+
+def test_fetch_functions_run_the_netclient_retry_loops(monkeypatch) -> None:
+    seen: list[str] = []
+    sync_core = SdetHttpClient._request_json
+    async_core = SdetAsyncHttpClient._request_json
+
+    def spy(self: SdetHttpClient, url: str, **kw: object) -> object:
+        seen.append("sync")
+        return sync_core(self, url, **kw)  # type: ignore[arg-type]
+
+    async def async_spy(self: SdetAsyncHttpClient, url: str, **kw: object) -> object:
+        seen.append("async")
+        return await async_core(self, url, **kw)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(SdetHttpClient, "_request_json", spy)
+    monkeypatch.setattr(SdetAsyncHttpClient, "_request_json", async_spy)
+    assert _run_sync("fetch_json_dict", ["ok"], "dict")[0] == ("ok", {"ok": True})
+    assert _run_async("fetch_json_list", ["ok"], "list")[0] == ("ok", [1, 2])
+    assert seen == ["sync", "async"]
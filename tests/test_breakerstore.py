@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sdetkit import apiget
+from sdetkit.breakerstore import SharedCircuitBreaker
+from sdetkit.netclient import CircuitOpenError, SdetHttpClient
+
+_HOST = "https://api.example.test"
+
+
+class _Wall:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _pair(tmp_path: Path, wall: _Wall, **kwargs) -> tuple[SharedCircuitBreaker, ...]:
+    db = tmp_path / "breakers.sqlite3"
+    return tuple(
+        SharedCircuitBreaker(db, _HOST, read_interval=0.0, clock=wall, **kwargs) for _ in range(2)
+    )
+
+
+def test_failures_from_one_process_open_the_breaker_for_another(tmp_path: Path) -> None:
+    wall = _Wall()
+    a, b = _pair(tmp_path, wall, failure_threshold=3, reset_seconds=10)
+    a.record_failure(0)
+    b.record_failure(0)
+    b.allow(0)
+    a.record_failure(0)
+    with pytest.raises(CircuitOpenError):
+        b.allow(0)
+    other = SharedCircuitBreaker(tmp_path / "breakers.sqlite3", "https://other.test", clock=wall)
+    other.allow(0)
+
+
+def test_only_one_process_wins_the_half_open_probe(tmp_path: Path) -> None:
+    wall = _Wall()
+    a, b = _pair(tmp_path, wall, failure_threshold=1, reset_seconds=10)
+    a.record_failure(0)
+    wall.now += 11
+    a.allow(0)
+    with pytest.raises(CircuitOpenError):
+        b.allow(0)
+
+    a.record_failure(0)  # probe failed: open again for a full reset window
+    wall.now += 5
+    with pytest.raises(CircuitOpenError):
+        b.allow(0)
+    wall.now += 6
+    b.allow(0)
+    b.record_success()
+    a.allow(0)
+
+
+def test_abandoned_probe_expires(tmp_path: Path) -> None:
+    wall = _Wall()
+    a, b = _pair(tmp_path, wall, failure_threshold=1, reset_seconds=10)
+    a.record_failure(0)
+    wall.now += 11
+    a.allow(0)  # a claims the probe and never reports back
+    wall.now += 11
+    b.allow(0)
+
+
+def test_state_and_transitions_follow_the_store(tmp_path: Path) -> None:
+    wall = _Wall()
+    seen: list[tuple[str, str]] = []
+    a, b = _pair(tmp_path, wall, failure_threshold=2, reset_seconds=10)
+    a.on_transition = lambda old, new: seen.append((old, new))
+    a.record_failure(0)
+    assert a.state == b.state == "closed"
+    b.record_failure(0)
+    assert a.state == b.state == "open"
+    wall.now += 11
+    a.allow(0)
+    assert a.state == b.state == "half_open"
+    a.record_failure(0)
+    assert a.state == "open"
+    wall.now += 11
+    a.allow(0)
+    a.record_success()
+    assert a.state == b.state == "closed"
+    # b opened the breaker, so a only reports the transitions it wrote itself.
+    assert seen == [
+        ("open", "half_open"),
+        ("half_open", "open"),
+        ("open", "half_open"),
+        ("half_open", "closed"),
+    ]
+
+
+def test_successes_on_a_closed_breaker_do_not_write(tmp_path: Path) -> None:
+    wall = _Wall()
+    a, _ = _pair(tmp_path, wall)
+    for _ in range(50):
+        a.allow(0)
+        a.record_success()
+    assert a.writes == 0
+    a.record_failure(0)
+    a.record_success()
+    assert a.writes == 2
+
+
+def test_snapshot_bounds_reads(tmp_path: Path) -> None:
+    wall = _Wall()
+    db = tmp_path / "breakers.sqlite3"
+    writer = SharedCircuitBreaker(db, _HOST, failure_threshold=1, clock=wall)
+    reader = SharedCircuitBreaker(db, _HOST, read_interval=1.0, clock=wall)
+    reader.allow(0)
+    writer.record_failure(0)
+    reader.allow(0)  # still inside the snapshot window
+    wall.now += 1
+    with pytest.raises(CircuitOpenError):
+        reader.allow(0)
+
+
+def test_client_uses_shared_breaker(tmp_path: Path) -> None:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        raise httpx.ConnectError("down", request=request)
+
+    db = tmp_path / "breakers.sqlite3"
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        for _ in range(2):
+            c = SdetHttpClient(
+                raw, breaker=SharedCircuitBreaker.for_url(db, _HOST + "/x", failure_threshold=2)
+            )
+            with pytest.raises(RuntimeError):
+                c.get_json_dict(_HOST + "/x")
+        fresh = SdetHttpClient(raw, breaker=SharedCircuitBreaker.for_url(db, _HOST + "/y"))
+        with pytest.raises(CircuitOpenError):
+            fresh.get_json_dict(_HOST + "/y")
+    assert calls["n"] == 2
+
+
+def test_apiget_circuit_breaker_fails_fast_across_processes(tmp_path: Path) -> None:
+    db = tmp_path / "cb.sqlite3"
+    url = "http://127.0.0.1:9/unreachable"
+    SharedCircuitBreaker.for_url(db, url, failure_threshold=1).record_failure(0)
+    proc = subprocess.run(
+        [sys.executable, "-m", "sdetkit", "apiget", url, "--circuit-breaker", str(db)],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=tmp_path,
+    )
+    assert proc.returncode == 2
+    assert "circuit open" in proc.stderr
+
+
+def test_apiget_circuit_breaker_validates_threshold(capsys) -> None:
+    with pytest.raises(SystemExit) as exc:
+        apiget.main([_HOST, "--circuit-breaker", "--breaker-threshold", "0"])
+    assert exc.value.code == 2
+    assert "breaker-threshold must be >= 1" in capsys.readouterr().err
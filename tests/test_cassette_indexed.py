@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sdetkit import cli
+from sdetkit.cassette import (
+    AsyncCassetteReplayTransport,
+    Cassette,
+    CassetteRecordTransport,
+    CassetteReplayTransport,
+    Matcher,
+)
+
+
+def _record(urls: list[str], **headers: str) -> Cassette:
+    cassette = Cassette()
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"url": str(req.url), "n": len(cassette.interactions)})
+
+    with httpx.Client(
+        transport=CassetteRecordTransport(cassette, httpx.MockTransport(handler))
+    ) as c:
+        for url in urls:
+            c.get(url, headers=headers)
+    return cassette
+
+
+def test_indexed_replay_tolerates_concurrent_out_of_order_requests() -> None:
+    urls = [f"https://api.example.test/items/{i}" for i in range(50)]
+    cassette = _record(urls)
+    transport = AsyncCassetteReplayTransport(cassette, match="indexed")
+
+    async def go() -> list[object]:
+        async with httpx.AsyncClient(transport=transport) as c:
+            rs = await asyncio.gather(*(c.get(u) for u in reversed(urls)))
+        return [r.json()["url"] for r in rs]
+
+    assert asyncio.run(go()) == list(reversed(urls))
+    transport.assert_exhausted()
+
+    seq = AsyncCassetteReplayTransport(cassette)
+
+    async def out_of_order() -> None:
+        await httpx.AsyncClient(transport=seq).get(urls[1])  # closing would assert exhaustion
+
+    with pytest.raises(RuntimeError, match="cassette mismatch: expected"):
+        asyncio.run(out_of_order())
+
+
+def test_indexed_replay_serves_repeated_requests_in_recorded_order() -> None:
+    cassette = _record(["https://api.example.test/poll"] * 3)
+    with httpx.Client(transport=CassetteReplayTransport(cassette, match="indexed")) as c:
+        assert [c.get("https://api.example.test/poll").json()["n"] for _ in range(3)] == [0, 1, 2]
+        with pytest.raises(RuntimeError, match="no recorded interaction for GET"):
+            c.get("https://api.example.test/poll")
+
+
+def test_matcher_query_order_params_and_headers() -> None:
+    cassette = _record(["https://api.example.test/q?b=2&a=1&ts=100"], **{"X-Tenant": "acme"})
+
+    loose = Matcher(ignore_query_params=frozenset({"ts"}))
+    with httpx.Client(
+        transport=CassetteReplayTransport(cassette, match="indexed", matcher=loose)
+    ) as c:
+        assert c.get("https://api.example.test/q?a=1&ts=999&b=2").status_code == 200
+
+    strict = Matcher(ignore_query_order=False)
+    c = httpx.Client(transport=CassetteReplayTransport(cassette, match="indexed", matcher=strict))
+    with pytest.raises(RuntimeError):
+        c.get("https://api.example.test/q?a=1&b=2&ts=100")
+
+    by_header = Matcher(match_headers=True)
+    url = "https://api.example.test/q?b=2&a=1&ts=100"
+    t = CassetteReplayTransport(cassette, match="indexed", matcher=by_header)
+    with httpx.Client(transport=t) as c:
+        with pytest.raises(RuntimeError):
+            c.get(url, headers={"X-Tenant": "other"})
+        assert c.get(url, headers={"X-Tenant": "acme", "User-Agent": "x"}).is_success
+
+
+def test_unknown_match_mode_is_rejected() -> None:
+    with pytest.raises(ValueError, match="sequence, indexed"):
+        CassetteReplayTransport(Cassette(), match="fuzzy")
+
+
+def test_apiget_cassette_match_flag(tmp_path: Path, monkeypatch, capsys) -> None:
+    monkeypatch.chdir(tmp_path)
+    _record(["https://api.example.test/x?b=2&a=1"]).save("c.json")
+    rc = cli.main(
+        [
+            "apiget",
+            "https://api.example.test/x?a=1&b=2",
+            "--expect",
+            "dict",
+            "--cassette",
+            "c.json",
+            "--cassette-mode",
+            "replay",
+            "--cassette-match",
+            "indexed",
+        ]
+    )
+    assert rc == 0
+    assert json.loads(capsys.readouterr().out)["n"] == 0
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sdetkit import cassette_server
+from sdetkit.cassette import Cassette, CassetteRecordTransport
+from sdetkit.cassette_server import FaultProfile, create_server
+
+
+@pytest.fixture()
+def recorded(tmp_path: Path) -> Path:
+    cassette = Cassette()
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        if req.url.path == "/blob":
+            return httpx.Response(200, content=b"x" * 64 * 1024)
+        return httpx.Response(
+            200 if req.method == "GET" else 201,
+            json={"path": req.url.path, "q": dict(req.url.params), "n": len(cassette.interactions)},
+            headers={"X-Upstream": "yes"},
+        )
+
+    with httpx.Client(
+        transport=CassetteRecordTransport(cassette, httpx.MockTransport(handler))
+    ) as c:
+        for i in range(20):
+            c.get(f"https://api.example.test/items/{i}?b=2&a=1")
+        c.get("https://api.example.test/poll")
+        c.get("https://api.example.test/poll")
+        c.post("https://api.example.test/orders", json={"sku": "x"})
+        c.get("https://api.example.test/blob")
+    path = tmp_path / "rec.json"
+    cassette.save(path, allow_absolute=True)
+    return path
+
+
+def _serving(path: Path, faults: FaultProfile | None = None):
+    server = create_server(path, faults=faults)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def test_serves_recorded_interactions_to_concurrent_clients(recorded: Path) -> None:
+    server = _serving(recorded)
+    try:
+        with httpx.Client(base_url=server.url) as c:
+
+            def fetch(i: int) -> dict[str, object]:
+                r = c.get(f"/items/{i}?a=1&b=2")
+                assert r.headers["X-Upstream"] == "yes"
+                return r.json()
+
+            with ThreadPoolExecutor(8) as pool:
+                got = list(pool.map(fetch, reversed(range(20))))
+            assert [g["path"] for g in got] == [f"/items/{i}" for i in reversed(range(20))]
+
+            polls = [c.get("/poll").json()["n"] for _ in range(3)]
+            assert polls == [20, 21, 20]  # responses cycle per key
+            assert c.post("/orders", json={"sku": "x"}).status_code == 201
+
+            missing = c.get("/nope")
+            assert missing.status_code == 404
+            assert "no recorded interaction" in missing.json()["error"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_injects_latency_errors_and_throughput_caps(recorded: Path) -> None:
+    server = _serving(recorded, FaultProfile(latency_ms=80, error_rate=1.0, seed=1))
+    try:
+        start = time.monotonic()
+        r = httpx.get(server.url + "/poll")
+        assert r.status_code == 503 and r.json() == {"error": "injected fault"}
+        assert time.monotonic() - start >= 0.08
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    server = _serving(recorded, FaultProfile(throughput_kbps=256))
+    try:
+        start = time.monotonic()
+        r = httpx.get(server.url + "/blob")
+        assert len(r.content) == 64 * 1024
+        assert time.monotonic() - start >= 0.2  # 64 KiB at 256 KiB/s
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fault_profile_validation_and_cli_errors(recorded: Path, capsys) -> None:
+    with pytest.raises(ValueError, match="error rate"):
+        FaultProfile(error_rate=1.5)
+    malformed = recorded.parent / "malformed.json"
+    malformed.write_text('{"version": 1, "interactions": [{"request": "GET /"}]}', encoding="utf-8")
+    for argv in (
+        ["serve", str(recorded), "--allow-absolute-path", "--error-rate", "2"],
+        ["serve", str(recorded), "--latency-ms", "-1"],
+        ["serve", str(recorded.parent / "missing.json"), "--allow-absolute-path"],
+        ["serve", str(malformed), "--allow-absolute-path"],
+    ):
+        with pytest.raises(SystemExit) as exc:
+            cassette_server.main(argv)
+        assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert "error rate" in err and "invalid interaction shape" in err
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import gc
+import subprocess
+import sys
+import textwrap
+import tracemalloc
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sdetkit.cassette import (
+    AsyncCassetteRecordTransport,
+    Cassette,
+    CassetteReplayTransport,
+    CassetteStream,
+    open_transport,
+)
+
+_MIB = 1024 * 1024
+
+
+def _body(i: int) -> bytes:
+    return f"{i:08d}".encode() * (_MIB // 8)  # 1 MiB, distinct, compresses well
+
+
+def test_stream_records_replays_and_keeps_memory_flat(tmp_path: Path) -> None:
+    path = tmp_path / "big.ndjson"
+    handler = httpx.MockTransport(lambda r: httpx.Response(200, content=_body(int(r.url.path[1:]))))
+    with httpx.Client(
+        transport=open_transport(path, "record", upstream=handler, allow_absolute=True)
+    ) as c:
+        for i in range(48):
+            assert len(c.get(f"https://api.example.test/{i}").content) == _MIB
+    assert len(path.read_text().splitlines()) == 1 + 48
+
+    tracemalloc.start()
+    try:
+        cassette = Cassette.load(path, allow_absolute=True)
+        with httpx.Client(transport=CassetteReplayTransport(cassette, match="indexed")) as c:
+            for i in reversed(range(48)):
+                assert c.get(f"https://api.example.test/{i}").content[:8] == f"{i:08d}".encode()
+                gc.collect()  # responses sit in reference cycles; only measure what we retain
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 24 * _MIB  # 48 MiB of bodies; only the bounded body cache is retained
+
+
+def test_killed_recording_keeps_completed_interactions(tmp_path: Path) -> None:
+    script = textwrap.dedent(
+        """
+        import os, sys, httpx
+        from sdetkit.cassette import CassetteRecordTransport, CassetteStream
+
+        stream = CassetteStream(sys.argv[1], allow_absolute=True)
+        inner = httpx.MockTransport(lambda r: httpx.Response(200, json={"path": r.url.path}))
+        client = httpx.Client(transport=CassetteRecordTransport(stream, inner))
+        for i in range(5):
+            client.get(f"https://api.example.test/{i}")
+        stream._f.write('{"request": {"method": "GET"')  # torn write, then no close()
+        stream._f.flush()
+        os._exit(0)
+        """
+    )
+    path = tmp_path / "killed.ndjson"
+    subprocess.run([sys.executable, "-c", script, str(path)], check=True)
+
+    cassette = Cassette.load(path, allow_absolute=True)
+    assert len(cassette.interactions) == 5
+    with httpx.Client(transport=CassetteReplayTransport(cassette)) as c:
+        assert [c.get(f"https://api.example.test/{i}").json()["path"] for i in range(5)] == [
+            f"/{i}" for i in range(5)
+        ]
+
+
+def test_async_record_and_save_roundtrip_through_ndjson(tmp_path: Path) -> None:
+    import asyncio
+
+    stream = CassetteStream(tmp_path / "a.ndjson", allow_absolute=True)
+    inner = httpx.MockTransport(lambda r: httpx.Response(201, content=r.content))
+
+    async def go() -> None:
+        async with httpx.AsyncClient(transport=AsyncCassetteRecordTransport(stream, inner)) as c:
+            await asyncio.gather(
+                *(c.post("https://api.example.test/x", content=b"%d" % i) for i in range(3))
+            )
+
+    asyncio.run(go())
+    assert stream.recorded == 3
+
+    loaded = Cassette.load(tmp_path / "a.ndjson", allow_absolute=True)
+    loaded.save(tmp_path / "copy.json", allow_absolute=True, version=1)
+    v1 = Cassette.load(tmp_path / "copy.json", allow_absolute=True)
+    v1.save(tmp_path / "again.ndjson", allow_absolute=True)
+    again = Cassette.load(tmp_path / "again.ndjson", allow_absolute=True)
+    assert again.to_json() == v1.to_json()
+    assert sorted(again.body(it["response"]) for it in again.interactions) == [b"0", b"1", b"2"]
+
+
+def test_ndjson_rejects_missing_header_and_corrupt_lines(tmp_path: Path) -> None:
+    bad = tmp_path / "bad.ndjson"
+    bad.write_text('{"interactions": []}\n')
+    with pytest.raises(ValueError, match="ndjson header"):
+        Cassette.load(bad, allow_absolute=True)
+
+    with CassetteStream(bad, allow_absolute=True):
+        pass
+    bad.write_text(bad.read_text() + "not json\n{}\n")
+    with pytest.raises(ValueError, match="line 2"):
+        Cassette.load(bad, allow_absolute=True)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sdetkit import cassette as cassette_mod
+from sdetkit.cassette import Cassette, CassetteRecordTransport, CassetteReplayTransport
+
+_BIG = json.dumps({"items": [{"id": i, "name": f"n{i}"} for i in range(500)]}).encode()
+
+
+def _recorded(n: int = 6) -> Cassette:
+    cassette = Cassette()
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_BIG if req.url.path == "/big" else b'{"small": 1}')
+
+    with httpx.Client(
+        transport=CassetteRecordTransport(cassette, httpx.MockTransport(handler))
+    ) as c:
+        for i in range(n):
+            c.post(
+                "https://api.example.test/big" if i % 2 else "https://api.example.test/s",
+                json={"i": i},
+            )
+    return cassette
+
+
+def _replay(cassette: Cassette, n: int = 6) -> list[bytes]:
+    with httpx.Client(transport=CassetteReplayTransport(cassette)) as c:
+        return [
+            c.post(
+                "https://api.example.test/big" if i % 2 else "https://api.example.test/s",
+                json={"i": i},
+            ).content
+            for i in range(n)
+        ]
+
+
+def test_v2_stores_each_body_once_and_replays(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(cassette_mod, "_zstd", lambda: None)
+    rec = _recorded()
+    rec.save(tmp_path / "v1.json", allow_absolute=True, version=1)
+    rec.save(tmp_path / "v2.json", allow_absolute=True)
+
+    raw = json.loads((tmp_path / "v2.json").read_text())
+    assert raw["version"] == 2 and raw["bodies"] == "v2.bodies"
+    assert "body_b64" not in json.dumps(raw)
+    blobs = sorted(p.name for p in (tmp_path / "v2.bodies").iterdir())
+    assert len(blobs) == 2 + 6  # two response bodies, six distinct request bodies
+    assert all(b.endswith(".gz") for b in blobs)
+    v2_size = (tmp_path / "v2.json").stat().st_size + sum(
+        p.stat().st_size for p in (tmp_path / "v2.bodies").iterdir()
+    )
+    assert v2_size * 2 < (tmp_path / "v1.json").stat().st_size
+
+    expected = [b'{"small": 1}', _BIG] * 3
+    assert _replay(Cassette.load(tmp_path / "v1.json", allow_absolute=True)) == expected
+    loaded = Cassette.load(tmp_path / "v2.json", allow_absolute=True)
+    assert _replay(loaded) == expected
+    assert loaded.to_json() == rec.to_json()  # v1 view inlines the bodies again
+
+
+def test_resaving_prunes_unreferenced_bodies(tmp_path: Path) -> None:
+    path = tmp_path / "c.json"
+    _recorded(6).save(path, allow_absolute=True)
+    loaded = Cassette.load(path, allow_absolute=True)
+    loaded.interactions = loaded.interactions[:1]
+    loaded.save(path, allow_absolute=True)
+    assert len(list((tmp_path / "c.bodies").iterdir())) == 2
+    assert _replay(Cassette.load(path, allow_absolute=True), 1) == [b'{"small": 1}']
+
+
+def test_v2_rejects_escaping_store_and_reports_missing_bodies(tmp_path: Path) -> None:
+    path = tmp_path / "c.json"
+    _recorded(2).save(path, allow_absolute=True)
+    raw = json.loads(path.read_text())
+
+    raw["bodies"] = "../elsewhere"
+    path.write_text(json.dumps(raw))
+    with pytest.raises(ValueError, match="sibling directory"):
+        Cassette.load(path, allow_absolute=True)
+
+    raw["bodies"] = "c.bodies"
+    path.write_text(json.dumps(raw))
+    for blob in (tmp_path / "c.bodies").iterdir():
+        blob.unlink()
+    transport = CassetteReplayTransport(Cassette.load(path, allow_absolute=True))
+    with pytest.raises(RuntimeError, match="missing from c.bodies"):
+        transport.handle_request(httpx.Request("POST", "https://api.example.test/s", json={"i": 0}))
+
+
+def test_unknown_version_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="1 or 2"):
+        Cassette().save(tmp_path / "c.json", allow_absolute=True, version=3)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from sdetkit import cli, cli_registry
+
+
+def test_every_command_target_resolves_to_callable() -> None:
+    for spec in cli_registry.COMMANDS:
+        assert callable(cli_registry.load_handler(spec)), spec.target
+
+
+def test_aliases_resolve_to_canonical_spec() -> None:
+    spec = cli_registry.find_command("day61-phase3-kickoff-closeout")
+    assert spec is not None
+    assert spec.name == "phase3-kickoff-closeout"
+    assert cli_registry.find_command("nope") is None
+
+
+def test_duplicate_names_are_rejected() -> None:
+    a = cli_registry.CommandSpec("x", "sdetkit.kits:main")
+    b = cli_registry.CommandSpec("y", "sdetkit.kits:main", aliases=("x",))
+    with pytest.raises(ValueError, match="duplicate command name: x"):
+        cli_registry._build_index([a, b])
+
+
+def test_dispatch_imports_only_target_module(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: list[list[str]] = []
+    monkeypatch.setattr("sdetkit.repo.main", lambda argv: seen.append(list(argv)) or 0)
+    assert cli.main(["dev", "--x"]) == 0
+    assert seen == [["dev", "--x"]]
+
+
+def test_cli_import_does_not_load_handler_modules() -> None:
+    code = (
+        "import json, sys\n"
+        "import sdetkit.cli\n"
+        "from sdetkit.cli import _build_root_parser\n"
+        "_build_root_parser()\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.split('.')[0] in {'sdetkit', 'httpx'})))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], text=True, capture_output=True, check=True)
+    loaded = set(json.loads(proc.stdout))
+    assert "sdetkit.cli_registry" in loaded
+    for heavy in ("httpx", "sdetkit.apiget", "sdetkit.repo", "sdetkit.day42_optimization_closeout"):
+        assert heavy not in loaded
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import json
+import threading
+import urllib.request
+from dataclasses import replace
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sdetkit import clientmetrics
+from sdetkit.clientmetrics import ClientMetrics
+from sdetkit.netclient import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ClientEvent,
+    RetryPolicy,
+    SdetHttpClient,
+)
+from sdetkit.ops import create_server
+
+
+def _client(handler, metrics: ClientMetrics) -> SdetHttpClient:
+    raw = httpx.Client(transport=httpx.MockTransport(handler))
+    return SdetHttpClient(raw, retry=RetryPolicy(retries=3), hook=metrics)
+
+
+def test_aggregates_responses_retries_errors_and_latency() -> None:
+    metrics = ClientMetrics()
+    calls = {"n": 0}
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if req.url.path == "/down" or calls["n"] == 1:
+            raise httpx.ConnectError("refused", request=req)
+        if req.url.path == "/busy":
+            return httpx.Response(503)
+        return httpx.Response(200, json={"ok": True})
+
+    c = _client(handler, metrics)
+    c.request("post", "https://API.example.test/flaky")  # refused, then 200
+    assert c.request("POST", "https://api.example.test/busy").status_code == 503
+    assert c.get_json_dict("https://api.example.test/ok") == {"ok": True}
+    with pytest.raises(RuntimeError):
+        c.get_json_dict("http://down.test:8080/down")
+
+    snap = metrics.snapshot()
+    assert snap["responses"] == [
+        {"host": "api.example.test", "method": "GET", "status": "200", "count": 1},
+        {"host": "api.example.test", "method": "POST", "status": "200", "count": 1},
+        {"host": "api.example.test", "method": "POST", "status": "503", "count": 1},
+    ]
+    assert snap["retries"] == [
+        {"host": "api.example.test", "method": "POST", "count": 1},
+        {"host": "down.test:8080", "method": "GET", "count": 2},
+    ]
+    assert snap["errors"] == [
+        {"host": "api.example.test", "method": "POST", "error": "request_error", "count": 1},
+        {"host": "down.test:8080", "method": "GET", "error": "request_error", "count": 3},
+    ]
+    latency = {(r["method"], r["status"]): r["count"] for r in snap["latency"]}
+    assert latency == {
+        ("GET", "200"): 1,
+        ("POST", "200"): 1,
+        ("POST", "503"): 1,
+        ("GET", "error"): 1,
+    }
+    json.dumps(snap)
+
+
+def test_thread_shards_merge_on_read() -> None:
+    metrics = ClientMetrics()
+    ev = ClientEvent(
+        type="attempt_response", url="http://h.test/x", attempt=0, retries=1, status_code=204
+    )
+    done = ClientEvent(
+        type="complete",
+        url="http://h.test/x",
+        attempt=0,
+        retries=1,
+        ok=True,
+        elapsed_seconds=0.01,
+        status_code=204,
+    )
+
+    def work() -> None:
+        for _ in range(2000):
+            metrics(ev)
+            metrics(done)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    snap = metrics.snapshot()
+    assert snap["responses"][0]["count"] == 16000
+    assert snap["latency"][0]["count"] == 16000
+    assert snap["latency"][0]["latency_ms"]["p99"] == pytest.approx(10.0, rel=0.01)
+
+
+def test_finished_thread_shards_are_retired_and_reads_race_writes_safely() -> None:
+    metrics = ClientMetrics()
+    ev = ClientEvent(
+        type="complete",
+        url="http://h.test/x",
+        attempt=0,
+        retries=1,
+        elapsed_seconds=0.001,
+        status_code=200,
+    )
+    for _ in range(50):  # one short-lived thread per request, like ThreadingHTTPServer
+        t = threading.Thread(target=metrics, args=(ev,))
+        t.start()
+        t.join()
+    assert metrics.snapshot()["latency"][0]["count"] == 50
+    assert metrics._shards == {}
+
+    stop = threading.Event()
+
+    def writer() -> None:
+        i = 0
+        while not stop.is_set():
+            i += 1
+            metrics(replace(ev, elapsed_seconds=i * 1e-6, url=f"http://h{i % 7}.test/"))
+
+    t = threading.Thread(target=writer)
+    t.start()
+    try:
+        for _ in range(200):
+            metrics.snapshot()
+    finally:
+        stop.set()
+        t.join()
+    assert sum(r["count"] for r in metrics.snapshot()["latency"]) > 50
+    assert metrics._shards == {}
+
+
+def test_breaker_transitions_and_prometheus_text() -> None:
+    metrics = ClientMetrics(namespace="t")
+    clock = {"now": 0.0}
+    breaker = CircuitBreaker(
+        failure_threshold=2, reset_seconds=5.0, on_transition=metrics.breaker_hook("api")
+    )
+    breaker.record_failure(clock["now"])
+    assert breaker.state == "closed"
+    breaker.record_failure(clock["now"])
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.allow(1.0)
+    breaker.allow(6.0)
+    assert breaker.state == "half_open"
+    breaker.record_failure(6.0)
+    breaker.allow(12.0)
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+    metrics(
+        ClientEvent(
+            type="complete",
+            url='http://q"t.test/',
+            attempt=0,
+            retries=1,
+            elapsed_seconds=0.2,
+            status_code=200,
+        )
+    )
+    text = metrics.to_prometheus()
+    assert "# TYPE t_breaker_transitions_total counter" in text
+    assert 't_breaker_transitions_total{breaker="api",from="closed",to="open"} 1' in text
+    assert 't_breaker_transitions_total{breaker="api",from="half_open",to="open"} 1' in text
+    assert 't_breaker_transitions_total{breaker="api",from="open",to="half_open"} 2' in text
+    assert 't_breaker_transitions_total{breaker="api",from="half_open",to="closed"} 1' in text
+    assert "# TYPE t_request_duration_seconds histogram" in text
+    assert 'host="q\\"t.test",method="GET",status="200",le="0.1"} 0' in text
+    assert 'host="q\\"t.test",method="GET",status="200",le="0.25"} 1' in text
+    assert 't_request_duration_seconds_count{host="q\\"t.test",method="GET",status="200"} 1' in text
+
+
+def test_ops_server_exposes_default_metrics(tmp_path: Path, monkeypatch) -> None:
+    metrics = ClientMetrics()
+    monkeypatch.setattr(clientmetrics, "default_metrics", metrics)
+    metrics(
+        ClientEvent(
+            type="attempt_response", url="https://x.test/", attempt=0, retries=1, status_code=200
+        )
+    )
+    server = create_server("127.0.0.1", 0, tmp_path)
+    port = int(server.server_address[1])
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as r:
+            assert r.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            text = r.read().decode("utf-8")
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics?format=json", timeout=5) as r:
+            snap = json.loads(r.read())
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert 'sdetkit_client_responses_total{host="x.test",method="GET",status="200"} 1' in text
+    assert snap["responses"][0]["count"] == 1
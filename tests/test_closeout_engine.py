@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import importlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from sdetkit import closeout_engine as eng
+
+
+def test_every_spec_loads_with_builder_and_constants() -> None:
+    modules = eng.spec_modules()
+    assert len(modules) >= 50
+    for module in modules:
+        spec = eng.load_spec(module)
+        assert spec["module"] == module
+        assert spec["builder"].startswith("build_")
+        assert "_EXECUTION_COMMANDS" in spec["constants"]
+
+
+def test_legacy_module_import_is_served_from_spec(tmp_path: Path) -> None:
+    mod = importlib.import_module("sdetkit.day91_continuous_upgrade_closeout")
+    assert mod.SPEC is eng.load_spec("day91_continuous_upgrade_closeout")
+    payload = mod.build_day91_continuous_upgrade_closeout_summary(tmp_path)
+    assert payload["summary"]["strict_pass"] is False
+    assert payload["summary"]["failed_checks"] > 0
+    assert mod._render_text(payload).splitlines()[1].startswith("- Activation score:")
+
+
+def test_legacy_module_constants_are_patchable(tmp_path: Path, monkeypatch) -> None:
+    mod = importlib.import_module("sdetkit.day91_continuous_upgrade_closeout")
+    monkeypatch.setattr(mod, "_EXECUTION_COMMANDS", ['python -c "print(1)"'])
+    rc = mod.main(["--root", str(tmp_path), "--execute", "--evidence-dir", "ev"])
+    assert rc == 0
+    logs = sorted((tmp_path / "ev").glob("command-*.log"))
+    assert [json.loads(p.read_text(encoding="utf-8"))["stdout"] for p in logs] == ["1\n"]
+
+
+def test_hand_written_lane_module_wins_over_spec() -> None:
+    mod = importlib.import_module("sdetkit.day36_distribution_closeout")
+    assert mod.__file__ is not None and mod.__file__.endswith(".py")
+    assert not eng.has_spec("day36_distribution_closeout")
+
+
+def test_legacy_module_runs_with_dash_m(tmp_path: Path) -> None:
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "sdetkit.day91_continuous_upgrade_closeout",
+            "--root",
+            str(tmp_path),
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "- Activation score:" in proc.stdout
+
+
+def test_unknown_and_malformed_specs_raise(tmp_path: Path, monkeypatch) -> None:
+    with pytest.raises(eng.CloseoutSpecError):
+        eng.load_spec("day0_missing_closeout")
+    (tmp_path / "bad_closeout.json").write_text('{"schema_version": "v0"}', encoding="utf-8")
+    monkeypatch.setattr(eng, "_SPEC_DIR", tmp_path)
+    eng.load_spec.cache_clear()
+    try:
+        with pytest.raises(eng.CloseoutSpecError, match="schema_version"):
+            eng.load_spec("bad_closeout")
+    finally:
+        eng.load_spec.cache_clear()
+
+
+def test_compact_specs_expand_shared_defaults(tmp_path: Path, monkeypatch) -> None:
+    spec = {
+        "schema_version": eng.SPEC_SCHEMA_VERSION,
+        "previous": {"summary": "s.json", "board": "b.md"},
+        "missing": {"missing_commands": {}, "missing_sections": {"prefix": "- "}},
+        "checks": [["required_commands", 5]],
+        "cli": {"description": "x"},
+    }
+    (tmp_path / "day0_x_closeout.json").write_text(json.dumps(spec), encoding="utf-8")
+    monkeypatch.setattr(eng, "_SPEC_DIR", tmp_path)
+    eng.load_spec.cache_clear()
+    try:
+        loaded = eng.load_spec("day0_x_closeout")
+        assert loaded["module"] == "day0_x_closeout"
+        assert loaded["builder"] == "build_day0_x_closeout_summary"
+        assert loaded["previous"]["score"] == "int"
+        assert loaded["checks"] == [
+            {
+                "check_id": "required_commands",
+                "weight": 5,
+                "passed": {"empty": "missing_commands"},
+                "evidence": {"$or": ["missing_commands", "all commands present"]},
+            }
+        ]
+        assert loaded["missing"]["missing_commands"] == {
+            "lines": ["_REQUIRED_COMMANDS"],
+            "in": "page_text",
+        }
+        assert loaded["missing"]["missing_sections"]["prefix"] == "- "
+        assert loaded["cli"]["doc_flag"] == "--write-default-doc"
+
+        spec["checks"] = [["no_such_check", 1]]
+        (tmp_path / "day0_x_closeout.json").write_text(json.dumps(spec), encoding="utf-8")
+        eng.load_spec.cache_clear()
+        with pytest.raises(eng.CloseoutSpecError, match="no_such_check"):
+            eng.load_spec("day0_x_closeout")
+    finally:
+        eng.load_spec.cache_clear()
+
+
+def test_pack_files_can_list_a_constant(tmp_path: Path) -> None:
+    mod = importlib.import_module("sdetkit.day91_continuous_upgrade_closeout")
+    payload = mod.build_day91_continuous_upgrade_closeout_summary(tmp_path)
+    eng.emit_pack(mod.SPEC, tmp_path, Path("pack"), payload)
+    board = (tmp_path / "pack" / "day91-delivery-board.md").read_text(encoding="utf-8")
+    assert board.endswith("\n".join(mod._REQUIRED_DELIVERY_BOARD_LINES) + "\n")
+    assert board.startswith("# Day 91 delivery board\n")
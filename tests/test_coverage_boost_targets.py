@@ -154,7 +154,9 @@ def test_netclient_helper_branches() -> None:
     assert netclient._link_next_url(resp) == "https://example.test/b"
 
 
-def test_cli_alias_resolver_fallback_and_hit(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_cli_alias_resolver_fallback_and_hit(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
     monkeypatch.setattr(
         playbooks_cli,
         "_build_registry",
@@ -173,6 +175,7 @@ def test_cli_alias_resolver_fallback_and_hit(monkeypatch: pytest.MonkeyPatch) ->
         raise RuntimeError("boom")
 
     monkeypatch.setattr(playbooks_cli, "_build_registry", _boom)
+    monkeypatch.setattr(playbooks_cli, "_pkg_dir", lambda: tmp_path)
     assert cli._resolve_non_day_playbook_alias("weekly-review-closeout") == "weekly-review-closeout"
 
 
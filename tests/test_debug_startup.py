@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from sdetkit import debug
+
+_BUDGET = Path(__file__).resolve().parents[1] / ".sdetkit" / "startup-budget.json"
+
+_IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | sdetkit
+import time:        40 |         40 |   sdetkit.cli_registry
+import time:       300 |        900 | sdetkit.cli
+import time:       500 |        500 |   sqlite3
+import time:        80 |         80 |     sdetkit.day42_optimization_closeout
+"""
+
+
+def test_parse_importtime_tracks_depth_and_totals() -> None:
+    records = debug.parse_importtime(_IMPORTTIME)
+    assert [(r.module, r.depth) for r in records] == [
+        ("sdetkit", 0),
+        ("sdetkit.cli_registry", 1),
+        ("sdetkit.cli", 0),
+        ("sqlite3", 1),
+        ("sdetkit.day42_optimization_closeout", 2),
+    ]
+    sample = debug.StartupSample(wall_ms=1.0, records=records)
+    assert sample.import_us == 1020
+    assert sample.sdetkit_modules() == 4
+
+
+def test_check_budget_flags_forbidden_modules_and_limits() -> None:
+    budget = debug.load_budget(_BUDGET)
+    sample = debug.StartupSample(wall_ms=1.0, records=debug.parse_importtime(_IMPORTTIME))
+    command = debug.CommandBudget(
+        "x", ("--version",), max_warm_import_ms=0.5, max_sdetkit_modules=2
+    )
+    violations = debug.check_budget(command, budget.forbidden_modules, sample)
+    assert any("sqlite3" in v for v in violations)
+    assert any("day42_optimization_closeout" in v for v in violations)
+    assert any("sdetkit modules loaded: 4 > budget 2" in v for v in violations)
+    assert any(v.startswith("warm import time") for v in violations)
+
+
+def test_startup_version_stays_within_checked_in_budget(capsys) -> None:
+    rc = debug.main(
+        [
+            "startup",
+            "--budget",
+            str(_BUDGET),
+            "--command",
+            "version",
+            "--runs",
+            "1",
+            "--format",
+            "json",
+        ]
+    )
+    payload = json.loads(capsys.readouterr().out)
+    violations = payload["commands"][0]["violations"]
+    assert [v for v in violations if "forbidden" in v or "exited" in v] == []
+    assert payload["commands"][0]["warm"]["sdetkit_modules"] > 0
+    # Only the wall-clock import budget may trip on a loaded machine.
+    assert rc == (0 if not violations else 2)
+    assert all(v.startswith("warm import time") for v in violations)
+
+
+def _budget(tmp_path: Path, argv: list[str]) -> Path:
+    path = tmp_path / "budget.json"
+    path.write_text(
+        json.dumps(
+            {
+                "schema_version": debug.BUDGET_SCHEMA_VERSION,
+                "forbidden_modules": ["sqlite3"],
+                "commands": [{"name": "probe", "argv": argv}],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_startup_passes_without_time_limits(tmp_path: Path, capsys) -> None:
+    budget = _budget(tmp_path, ["--version"])
+    rc = debug.main(["startup", "--budget", str(budget), "--runs", "1", "--format", "json"])
+    assert rc == 0
+    assert json.loads(capsys.readouterr().out)["commands"][0]["violations"] == []
+
+
+def test_startup_fails_when_the_command_exits_non_zero(tmp_path: Path, capsys) -> None:
+    budget = _budget(tmp_path, ["no-such-command"])
+    rc = debug.main(["startup", "--budget", str(budget), "--runs", "1", "--format", "json"])
+    assert rc == 2
+    violations = json.loads(capsys.readouterr().out)["commands"][0]["violations"]
+    assert violations[0].startswith("command exited with status 2: ")
+    assert "no-such-command" in violations[0]
+
+
+def test_startup_rejects_unknown_command(capsys) -> None:
+    rc = debug.main(["startup", "--budget", str(_BUDGET), "--command", "nope"])
+    assert rc == 2
+    assert "unknown command(s): nope" in capsys.readouterr().err
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from sdetkit import evidence_runner
+from sdetkit.closeout_engine import execute_commands, load_spec
+
+
+def _py(code: str) -> str:
+    return f'python -c "{code}"'
+
+
+def test_run_commands_preserves_input_order_under_concurrency(tmp_path: Path) -> None:
+    commands = [
+        _py("import time; time.sleep(0.4); print('slow')"),
+        _py("print('fast')"),
+        _py("import sys; sys.stderr.write('err'); sys.exit(3)"),
+    ]
+    results = evidence_runner.run_commands(commands, jobs=3, stream_dir=tmp_path)
+    assert [r.index for r in results] == [1, 2, 3]
+    assert [r.stdout.strip() for r in results] == ["slow", "fast", ""]
+    assert results[2].returncode == 3 and results[2].stderr == "err"
+    assert [r.ok for r in results] == [True, True, False]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_run_commands_runs_commands_concurrently() -> None:
+    commands = [_py("import time; time.sleep(0.5)")] * 4
+    start = time.perf_counter()
+    results = evidence_runner.run_commands(commands, jobs=4)
+    assert all(r.ok for r in results)
+    assert time.perf_counter() - start < 1.5
+
+
+def test_run_commands_times_out_per_command(tmp_path: Path) -> None:
+    commands = [_py("import time; print('started', flush=True); time.sleep(30)"), _py("print(1)")]
+    results = evidence_runner.run_commands(commands, timeout=1, jobs=2, stream_dir=tmp_path)
+    assert results[0].timed_out is True
+    assert results[0].returncode == evidence_runner.TIMEOUT_RETURNCODE
+    assert results[0].stdout.strip() == "started"
+    assert results[1].ok and results[1].stdout.strip() == "1"
+
+
+def test_default_jobs_honours_env(monkeypatch) -> None:
+    monkeypatch.setenv("SDETKIT_EVIDENCE_JOBS", "7")
+    assert evidence_runner.default_jobs() == 7
+    monkeypatch.setenv("SDETKIT_EVIDENCE_JOBS", "zero")
+    assert 1 <= evidence_runner.default_jobs() <= 4
+
+
+def test_closeout_execute_writes_logs_in_command_order(tmp_path: Path) -> None:
+    spec = load_spec("day91_continuous_upgrade_closeout")
+    commands = [_py("import time; time.sleep(0.3); print('a')"), _py("print('b')")]
+    spec = {**spec, "constants": {**spec["constants"], "_EXECUTION_COMMANDS": commands}}
+    summary = execute_commands(spec, tmp_path, Path("ev"), jobs=2)
+    assert [c["stdout"] for c in summary["commands"]] == ["a\n", "b\n"]
+    logs = sorted((tmp_path / "ev").glob("command-*.log"))
+    assert [json.loads(p.read_text(encoding="utf-8"))["stdout"] for p in logs] == ["a\n", "b\n"]
+    assert not list((tmp_path / "ev").glob(".*.partial"))
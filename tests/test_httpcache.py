@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import threading
+
+import httpx
+import pytest
+
+import sdetkit.apiget as apiget
+from sdetkit import cli
+from sdetkit.httpcache import AsyncCachingTransport, CachingTransport, ResponseCache
+from sdetkit.netclient import ClientEvent, SdetAsyncHttpClient, SdetHttpClient
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _origin(seen: list[httpx.Request], *, cache_control: str = "max-age=60"):
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"', "Cache-Control": cache_control})
+        return httpx.Response(
+            200,
+            json={"n": len(seen)},
+            headers={"ETag": '"v1"', "Cache-Control": cache_control},
+        )
+
+    return handler
+
+
+def test_fresh_hit_then_conditional_revalidation(tmp_path) -> None:
+    seen: list[httpx.Request] = []
+    clock = _Clock()
+    cache = ResponseCache(tmp_path, clock=clock)
+    events: list[ClientEvent] = []
+    transport = CachingTransport(httpx.MockTransport(_origin(seen)), cache)
+    with httpx.Client(transport=transport) as raw:
+        c = SdetHttpClient(raw, hook=events.append)
+        assert c.get_json_dict("https://example.test/a") == {"n": 1}
+        assert c.get_json_dict("https://example.test/a") == {"n": 1}
+        assert len(seen) == 1
+
+        clock.now += 61
+        assert c.get_json_dict("https://example.test/a") == {"n": 1}
+        assert len(seen) == 2
+        assert seen[1].headers["If-None-Match"] == '"v1"'
+
+    statuses = [e.cache_status for e in events if e.type == "attempt_response"]
+    assert statuses == ["miss", "hit", "revalidated"]
+
+
+def test_vary_and_authorization_split_entries(tmp_path) -> None:
+    seen: list[httpx.Request] = []
+    cache = ResponseCache(tmp_path)
+    with httpx.Client(transport=CachingTransport(httpx.MockTransport(_origin(seen)), cache)) as c:
+        c.get("https://example.test/a", headers={"Authorization": "Bearer one"})
+        c.get("https://example.test/a", headers={"Authorization": "Bearer two"})
+        c.get("https://example.test/a", headers={"Authorization": "Bearer one"})
+    assert len(seen) == 2
+
+
+def test_vary_star_is_not_cached(tmp_path) -> None:
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(200, headers={"Cache-Control": "max-age=60", "Vary": "Accept, *"})
+
+    cache = ResponseCache(tmp_path)
+    with httpx.Client(transport=CachingTransport(httpx.MockTransport(handler), cache)) as c:
+        assert c.get("https://example.test/a").extensions["sdetkit_cache"] == "miss"
+        assert c.get("https://example.test/a").extensions["sdetkit_cache"] == "miss"
+        assert cache.total_bytes() == 0
+    assert len(calls) == 2
+
+
+def test_no_store_and_non_get_bypass(tmp_path) -> None:
+    seen: list[httpx.Request] = []
+    cache = ResponseCache(tmp_path)
+    origin = httpx.MockTransport(_origin(seen, cache_control="no-store"))
+    with httpx.Client(transport=CachingTransport(origin, cache)) as c:
+        assert c.get("https://example.test/a").extensions["sdetkit_cache"] == "miss"
+        assert c.get("https://example.test/a").extensions["sdetkit_cache"] == "miss"
+        assert c.post("https://example.test/a").extensions["sdetkit_cache"] == "bypass"
+    assert len(seen) == 3
+
+
+def test_lru_eviction_keeps_store_bounded(tmp_path) -> None:
+    clock = _Clock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"x" * 400, headers={"Cache-Control": "max-age=60"})
+
+    cache = ResponseCache(tmp_path, max_bytes=1000, clock=clock)
+    with httpx.Client(transport=CachingTransport(httpx.MockTransport(handler), cache)) as c:
+        for name in ("a", "b"):
+            clock.now += 1
+            c.get(f"https://example.test/{name}")
+        clock.now += 1
+        assert c.get("https://example.test/a").extensions["sdetkit_cache"] == "hit"
+        clock.now += 1
+        c.get("https://example.test/c")
+        assert cache.total_bytes() <= 1000
+        assert c.get("https://example.test/a").extensions["sdetkit_cache"] == "hit"
+        assert c.get("https://example.test/b").extensions["sdetkit_cache"] == "miss"
+
+
+@pytest.mark.asyncio
+async def test_async_transport_shares_cache_semantics(tmp_path) -> None:
+    seen: list[httpx.Request] = []
+    handler = _origin(seen)
+
+    async def ahandler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    transport = AsyncCachingTransport(httpx.MockTransport(ahandler), ResponseCache(tmp_path))
+    events: list[ClientEvent] = []
+    async with httpx.AsyncClient(transport=transport) as raw:
+        c = SdetAsyncHttpClient(raw, hook=events.append)
+        assert await c.get_json_dict("https://example.test/a") == {"n": 1}
+        assert await c.get_json_dict("https://example.test/a") == {"n": 1}
+    assert len(seen) == 1
+    assert [e.cache_status for e in events if e.type == "attempt_response"] == ["miss", "hit"]
+
+
+@pytest.mark.asyncio
+async def test_async_transport_keeps_sqlite_off_the_event_loop(tmp_path, monkeypatch) -> None:
+    seen: list[httpx.Request] = []
+    handler = _origin(seen)
+    clock = _Clock()
+    cache = ResponseCache(tmp_path, clock=clock)
+    loop_thread = threading.get_ident()
+    threads: list[tuple[str, bool]] = []
+    for name in ("lookup", "store", "refresh", "close"):
+        original = getattr(cache, name)
+
+        def spy(*args, _name=name, _original=original):
+            threads.append((_name, threading.get_ident() == loop_thread))
+            return _original(*args)
+
+        monkeypatch.setattr(cache, name, spy)
+
+    async def ahandler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    async with httpx.AsyncClient(
+        transport=AsyncCachingTransport(httpx.MockTransport(ahandler), cache)
+    ) as c:
+        await c.get("https://example.test/a")
+        clock.now += 61
+        assert (await c.get("https://example.test/a")).extensions["sdetkit_cache"] == "revalidated"
+    assert {name for name, _ in threads} == {"lookup", "store", "refresh", "close"}
+    assert not any(on_loop for _, on_loop in threads)
+
+
+def test_apiget_cache_flag_reuses_responses(monkeypatch, tmp_path, capsys) -> None:
+    seen: list[httpx.Request] = []
+    monkeypatch.setattr(
+        apiget.httpx, "HTTPTransport", lambda **kw: httpx.MockTransport(_origin(seen))
+    )
+    argv = ["apiget", "https://example.test/a", "--cache", str(tmp_path / "c"), "--verbose"]
+    assert cli.main(argv) == 0
+    first = capsys.readouterr()
+    assert cli.main(argv) == 0
+    second = capsys.readouterr()
+    assert json.loads(first.out) == json.loads(second.out) == {"n": 1}
+    assert len(seen) == 1
+    assert "http cache: miss https://example.test/a" in first.err
+    assert "http cache: hit https://example.test/a" in second.err
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sdetkit import apiget
+from sdetkit.httpdownload import DownloadError, download, partial_paths
+
+_SIZE = 24 * 1024 * 1024
+_BLOCK = 64 * 1024
+
+
+class _FileServer:
+    """Local HTTP server for a sparse file with Range/If-Range support and dropped transfers."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.etag = '"v1"'
+        self.drop_after: list[int] = []  # one entry per request to cut short
+        self.ranges: list[str | None] = []
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                size = outer.path.stat().st_size
+                rng = self.headers.get("Range")
+                outer.ranges.append(rng)
+                start = 0
+                if rng and self.headers.get("If-Range") in (None, outer.etag):
+                    start = int(rng.removeprefix("bytes=").rstrip("-"))
+                if start >= size and rng:
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(206 if start else 200)
+                if start:
+                    self.send_header("Content-Range", f"bytes {start}-{size - 1}/{size}")
+                self.send_header("Content-Length", str(size - start))
+                self.send_header("ETag", outer.etag)
+                self.end_headers()
+                budget = outer.drop_after.pop(0) if outer.drop_after else None
+                sent = 0
+                with outer.path.open("rb") as f:
+                    f.seek(start)
+                    while block := f.read(_BLOCK):
+                        if budget is not None and sent + len(block) > budget:
+                            return  # connection closes short of Content-Length
+                        self.wfile.write(block)
+                        sent += len(block)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/artifact.bin"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture()
+def served(tmp_path: Path):
+    src = tmp_path / "srv" / "artifact.bin"
+    src.parent.mkdir()
+    with src.open("wb") as f:
+        f.truncate(_SIZE)  # sparse; a few markers keep the checksum meaningful
+        for pos in (0, _SIZE // 3, _SIZE - 7):
+            f.seek(pos)
+            f.write(b"sdetkit")
+    server = _FileServer(src)
+    try:
+        yield server, hashlib.sha256(src.read_bytes()).hexdigest()
+    finally:
+        server.close()
+
+
+def test_download_streams_resumes_within_a_run_and_verifies(served, tmp_path: Path) -> None:
+    server, sha = served
+    server.drop_after = [5 * 1024 * 1024]
+    dest = tmp_path / "out" / "artifact.bin"
+    tracemalloc.start()
+    try:
+        with httpx.Client() as client:
+            res = download(client, server.url, dest, retries=3, expected_sha256=sha)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 8 * 1024 * 1024
+    assert server.ranges == [None, f"bytes={5 * 1024 * 1024}-"]
+    assert (res.total_bytes, res.sha256, res.status_code) == (_SIZE, sha, 206)
+    assert dest.stat().st_size == _SIZE
+    assert not any(p.exists() for p in partial_paths(dest))
+
+
+def test_interrupted_download_resumes_on_the_next_run(served, tmp_path: Path) -> None:
+    server, sha = served
+    server.drop_after = [3 * 1024 * 1024]
+    dest = tmp_path / "artifact.bin"
+    with httpx.Client() as client:
+        with pytest.raises(DownloadError, match="partial file kept"):
+            download(client, server.url, dest, retries=1)
+        part, meta = partial_paths(dest)
+        assert part.stat().st_size == 3 * 1024 * 1024 and meta.exists()
+        assert not dest.exists()
+
+        res = download(client, server.url, dest)
+    assert res.resumed_from == 3 * 1024 * 1024
+    assert res.bytes_transferred == _SIZE - res.resumed_from
+    assert res.sha256 == sha
+
+
+def test_changed_representation_restarts_from_zero(served, tmp_path: Path) -> None:
+    server, sha = served
+    server.drop_after = [1024 * 1024]
+    dest = tmp_path / "artifact.bin"
+    with httpx.Client() as client:
+        with pytest.raises(DownloadError):
+            download(client, server.url, dest, retries=1)
+        server.etag = '"v2"'
+        res = download(client, server.url, dest)
+    assert (res.resumed_from, res.status_code, res.sha256) == (0, 200, sha)
+
+
+def test_checksum_mismatch_discards_the_partial_file(served, tmp_path: Path) -> None:
+    server, _ = served
+    dest = tmp_path / "artifact.bin"
+    with httpx.Client() as client:
+        with pytest.raises(DownloadError, match="sha256 mismatch"):
+            download(client, server.url, dest, expected_sha256="0" * 64)
+    assert not dest.exists()
+    assert not any(p.exists() for p in partial_paths(dest))
+
+
+def test_apiget_raw_out_and_stdout(served, tmp_path: Path, monkeypatch, capsysbinary) -> None:
+    server, sha = served
+    monkeypatch.chdir(tmp_path)
+    server.drop_after = [2 * 1024 * 1024]
+    rc = apiget.main([server.url, "--raw", "--out", "dl/a.bin", "--retries", "2", "--sha256", sha])
+    assert rc == 0
+    assert hashlib.sha256((tmp_path / "dl" / "a.bin").read_bytes()).hexdigest() == sha
+
+    with pytest.raises(SystemExit) as exc:
+        apiget.main([server.url, "--raw", "--out", "dl/a.bin"])
+    assert exc.value.code == 2
+    assert b"refusing to overwrite" in capsysbinary.readouterr().err
+
+    assert apiget.main([server.url, "--raw", "--print-status"]) == 0
+    cap = capsysbinary.readouterr()
+    assert hashlib.sha256(cap.out).hexdigest() == sha
+    assert b"http status: 200" in cap.err
+
+
+def test_apiget_raw_rejects_incompatible_flags(capsys) -> None:
+    for extra in (
+        ["--paginate"],
+        ["--method", "POST"],
+        ["--sha256", "ab"],
+        ["--circuit-breaker"],
+        ["--deadline", "5"],
+    ):
+        with pytest.raises(SystemExit) as exc:
+            apiget.main(["https://example.test/x", "--raw", *extra])
+        assert exc.value.code == 2
+    assert "raw does not support --circuit-breaker or --deadline" in capsys.readouterr().err
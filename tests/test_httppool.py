@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from sdetkit.httppool import ClientRegistry, PoolStats
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def base_url():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_shared_client_is_reused_and_counts_connection_reuse(base_url: str) -> None:
+    reg = ClientRegistry()
+    client = reg.client(base_url)
+    assert reg.client(base_url + "/") is client
+    assert reg.client(base_url, timeout=1.0) is not client
+    for _ in range(5):
+        assert reg.client(base_url).get("/items").json() == {"ok": True}
+
+    stats = reg.stats()[f"sync {base_url}"]
+    assert stats == PoolStats(requests=5, connections_opened=1)
+    assert stats.reused == 4
+
+    reg.close()
+    assert client.is_closed
+    assert reg.client(base_url) is not client
+    assert reg.stats()[f"sync {base_url}"].requests == 5  # closed clients keep their counts
+    reg.close()
+
+
+def test_closed_client_is_replaced() -> None:
+    reg = ClientRegistry()
+    client = reg.client("https://example.test")
+    client.close()
+    assert reg.client("https://example.test") is not client
+    reg.close()
+
+
+def test_async_clients_are_scoped_to_their_event_loop(base_url: str) -> None:
+    reg = ClientRegistry()
+
+    async def run() -> httpx.AsyncClient:
+        client = reg.async_client(base_url)
+        assert reg.async_client(base_url) is client
+        await asyncio.gather(*(client.get("/x") for _ in range(3)))
+        for _ in range(3):
+            await reg.async_client(base_url).get("/x")
+        return client
+
+    first = asyncio.run(run())
+    second = asyncio.run(run())
+    assert first is not second
+    stats = reg.stats()[f"async {base_url}"]
+    assert stats.requests == 12
+    assert stats.connections_opened <= 6 and stats.reused >= 6
+
+    async def close() -> None:
+        reg.async_client(base_url)
+        await reg.aclose()
+
+    asyncio.run(close())
+    reg.close()
+
+
+def test_user_trace_extension_still_fires(base_url: str) -> None:
+    reg = ClientRegistry()
+    seen: list[str] = []
+    reg.client(base_url).get("/", extensions={"trace": lambda name, info: seen.append(name)})
+    assert "connection.connect_tcp.complete" in seen
+    reg.close()
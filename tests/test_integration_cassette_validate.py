@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import gc
+import gzip
+import json
+import tracemalloc
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sdetkit import cassette as cassette_mod
+from sdetkit import integration
+from sdetkit.cassette import Cassette, CassetteRecordTransport
+
+
+@pytest.fixture(autouse=True)
+def _gzip_store(monkeypatch) -> None:
+    monkeypatch.setattr(cassette_mod, "_zstd", lambda: None)
+
+
+def _record(path: Path, bodies: list[bytes], *, version: int = 2) -> Path:
+    cassette = Cassette()
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=bodies[int(req.url.params["i"])])
+
+    with httpx.Client(
+        transport=CassetteRecordTransport(cassette, httpx.MockTransport(handler))
+    ) as c:
+        for i in range(len(bodies)):
+            c.get(f"https://api.example.test/items?i={i}")
+        c.get("https://api.example.test/items?i=0")
+    cassette.save(path, allow_absolute=True, version=version)
+    return path
+
+
+def _run(argv: list[str], capsys) -> tuple[int, dict]:
+    rc = integration.main(["cassette-validate", *argv])
+    return rc, json.loads(capsys.readouterr().out)
+
+
+def test_validates_every_format_and_reports_timing(tmp_path: Path, capsys) -> None:
+    bodies = [b'{"n": %d}' % i for i in range(3)]
+    for name, version in (("v1.json", 1), ("v2.json", 2), ("rec.ndjson", 2)):
+        path = _record(tmp_path / name, bodies, version=version)
+        rc, out = _run(["--cassette", str(path)], capsys)
+        assert rc == 0, out
+        assert out["schema_version"] == "sdetkit.integration.cassette-validate.v1"
+        summary = out["summary"]
+        assert summary["interactions"] == 4 and summary["repeated_requests"] == 1
+        assert summary["hosts"] == ["api.example.test"] and summary["elapsed_ms"] >= 0
+
+
+def test_reports_undecodable_bodies_duplicate_keys_and_bad_headers(tmp_path: Path, capsys) -> None:
+    v2 = _record(tmp_path / "v2.json", [b"alpha", b"beta"])
+    blobs = sorted((tmp_path / "v2.bodies").iterdir())
+    blobs[0].write_bytes(gzip.compress(b"tampered"))
+    blobs[1].write_bytes(b"not gzip at all")
+    rc, out = _run(["--cassette", str(v2)], capsys)
+    assert rc == 1
+    details = sorted(item["detail"] for item in out["invalid"])
+    assert any("does not match its digest" in d for d in details)
+    assert any("is unreadable" in d for d in details)
+
+    v1 = _record(tmp_path / "v1.json", [b"alpha"], version=1)
+    raw = v1.read_text(encoding="utf-8")
+    doc = json.loads(raw)
+    doc["interactions"][0]["response"]["body_b64"] = "***"
+    doc["interactions"][1]["request"]["headers"] = [["only-one"]]
+    text = json.dumps(doc, indent=2).replace(
+        '"method": "GET"', '"method": "GET", "method": "POST"', 1
+    )
+    doc["interactions"].append(json.loads(json.dumps(doc["interactions"][1])))
+    v1.write_text(text, encoding="utf-8")
+    rc, out = _run(["--cassette", str(v1)], capsys)
+    assert rc == 1
+    assert [item["reason"] for item in out["invalid"]] == ["duplicate-key", "invalid-headers"]
+
+    doc = json.loads(raw)
+    doc["interactions"][0]["response"]["body_b64"] = "***"
+    v1.write_text(json.dumps(doc), encoding="utf-8")
+    rc, out = _run(["--cassette", str(v1)], capsys)
+    assert out["invalid"] == [
+        {"index": 0, "reason": "invalid-body", "detail": "cassette body is not valid base64"}
+    ]
+
+
+def test_body_checks_stream_instead_of_loading_bodies(tmp_path: Path) -> None:
+    bodies = [bytes([65 + i]) * (2 * 1024 * 1024) for i in range(12)]  # 24 MiB decoded
+    path = _record(tmp_path / "big.ndjson", bodies)
+    del bodies
+    gc.collect()
+    tracemalloc.start()
+    try:
+        out = integration._validate_cassette(path)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert out["summary"]["passed"] and out["summary"]["interactions"] == 13
+    assert peak < 2 * 1024 * 1024
+
+
+def test_batch_validation_across_processes(tmp_path: Path, capsys) -> None:
+    fixtures = tmp_path / "fixtures"
+    nested = fixtures / "nested"
+    nested.mkdir(parents=True)
+    for i in range(6):
+        _record((nested if i % 2 else fixtures) / f"c{i}.json", [b"ok %d" % i])
+    (fixtures / "broken.json").write_text('{"interactions": [', encoding="utf-8")
+    (nested / "package.json").write_text('{"name": "fixtures"}', encoding="utf-8")
+    (fixtures / "log.ndjson").write_text('{"level": "info"}\n', encoding="utf-8")
+
+    rc, out = _run(["--dir", str(fixtures), "--jobs", "2"], capsys)
+    assert rc == 1
+    assert out["schema_version"] == "sdetkit.integration.cassette-validate-batch.v1"
+    summary = out["summary"]
+    assert summary["files"] == 7 and summary["failed"] == 1 and summary["errors"] == 1
+    assert summary["jobs"] == 2 and summary["interactions"] == 12
+    assert summary["skipped"] == 2
+    assert sorted(Path(p).name for p in out["skipped"]) == ["log.ndjson", "package.json"]
+    assert len(summary["slowest"]) == 5
+    names = [Path(r["cassette"]).name for r in out["results"]]
+    assert names == sorted(names, key=lambda n: str(next(fixtures.rglob(n))))
+    assert all("elapsed_ms" in r["summary"] for r in out["results"])
+
+    good = [str(p) for p in sorted(fixtures.rglob("c*.json"))]
+    rc, out = _run([*sum((["--cassette", p] for p in good), []), "--jobs", "1"], capsys)
+    assert rc == 0 and out["summary"]["files"] == 6 and out["summary"]["passed"]
+
+    assert integration.main(["cassette-validate"]) == 2
+    assert "needs --cassette or --dir" in capsys.readouterr().err
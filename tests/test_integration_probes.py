@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from sdetkit import integration
+
+
+class _Health(BaseHTTPRequestHandler):
+    calls: dict[str, int] = {}
+
+    def do_GET(self) -> None:  # noqa: N802
+        n = self.calls[self.path] = self.calls.get(self.path, 0) + 1
+        if self.path == "/slow":
+            time.sleep(0.4)
+        if self.path == "/warming" and n < 3:
+            status, doc = 503, {"status": "starting"}
+        else:
+            status, doc = 200, {"status": "ok", "checks": [{"db": {"up": self.path != "/down"}}]}
+        body = json.dumps(doc).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def health() -> Iterator[str]:
+    _Health.calls = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Health)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _services(payload: dict) -> dict[str, dict]:
+    return {c["name"]: c for c in payload["checks"] if c["kind"] == "service"}
+
+
+def test_tcp_and_http_probes_run_concurrently(health: str) -> None:
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+        profile = {
+            "services": [
+                {"name": "db", "port": port, "expect": "open"},
+                {"name": "gone", "port": _free_port(), "expect": "closed"},
+                {"name": "bad", "port": 0},
+                *(
+                    {"name": f"slow{i}", "url": f"{health}/slow", "json": {"status": "ok"}}
+                    for i in range(4)
+                ),
+                {"name": "deep", "url": f"{health}/down", "json": {"checks.0.db.up": True}},
+                {"name": "typo", "url": f"{health}/ok", "json": {"checks.1.db": True}},
+                {"name": "code", "url": f"{health}/ok", "status": [201, 204]},
+            ]
+        }
+        started = time.perf_counter()
+        payload = integration._evaluate(profile)
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.2  # four 0.4 s health checks overlap
+    checks = _services(payload)
+    assert checks["db"]["passed"] and checks["db"]["observed"] == "open"
+    assert checks["gone"]["passed"] and checks["gone"]["observed"] == "closed"
+    assert checks["bad"] == {
+        "kind": "service",
+        "name": "bad",
+        "passed": False,
+        "reason": "invalid-port",
+    }
+    for i in range(4):
+        slow = checks[f"slow{i}"]
+        assert slow["passed"] and slow["observed"] == 200 and slow["latency_ms"] >= 400
+        assert slow["attempts"] == 1
+    assert checks["deep"]["reason"] == "field checks.0.db.up is false, expected true"
+    assert checks["typo"]["reason"] == "missing field checks.1.db"
+    assert checks["code"]["reason"] == "status 200"
+    assert payload["summary"]["failed"] == 4
+
+
+def test_wait_polls_until_ready_and_deadline_bounds_the_run(health: str) -> None:
+    profile = {
+        "services": [
+            {"name": "warming", "url": f"{health}/warming", "wait": 5},
+            {"name": "never", "port": _free_port(), "expect": "open", "wait": 30},
+        ]
+    }
+    started = time.perf_counter()
+    payload = integration._evaluate(profile, deadline_s=0.8)
+    assert time.perf_counter() - started < 2.0
+    checks = _services(payload)
+    warming = checks["warming"]
+    assert warming["passed"] and warming["attempts"] == 3 and "reason" not in warming
+    assert warming["elapsed_ms"] > warming["latency_ms"]
+    never = checks["never"]
+    assert not never["passed"] and never["reason"] == "deadline-exceeded"
+    assert never["attempts"] > 3 and never["observed"] == "closed"
+
+
+def test_cli_deadline_flag(tmp_path: Path, capsys) -> None:
+    profile = tmp_path / "profile.json"
+    port = _free_port()
+    profile.write_text(
+        json.dumps(
+            {
+                "deadline": 60,
+                "services": [{"name": "x", "port": port, "expect": "open", "wait": 60}],
+            }
+        ),
+        encoding="utf-8",
+    )
+    started = time.perf_counter()
+    assert integration.main(["check", "--profile", str(profile), "--deadline", "0.3"]) == 1
+    assert time.perf_counter() - started < 2.0
+    out = json.loads(capsys.readouterr().out)
+    assert out["checks"][0]["reason"] == "deadline-exceeded"
+
+    assert integration.main(["matrix", "--profile", str(profile), "--deadline", "0"]) == 2
+    assert "deadline must be > 0" in capsys.readouterr().err
+
+
+def test_malformed_service_numbers_are_reported_not_raised(health: str) -> None:
+    profile = {
+        "services": [
+            {"name": "null-port", "port": None},
+            {"name": "word-port", "port": "http"},
+            {"name": "big-port", "port": 70000},
+            {"name": "str-port", "port": str(_free_port()), "expect": "closed"},
+            {"name": "null-status", "url": f"{health}/ok", "status": None},
+            {"name": "bad-status", "url": f"{health}/ok", "status": [200, "ok"]},
+            {"name": "null-timeout", "url": f"{health}/ok", "timeout": None},
+            {"name": "bool-timeout", "port": 1, "timeout": True},
+            {"name": "bad-wait", "url": f"{health}/ok", "wait": "soon"},
+        ]
+    }
+    checks = _services(integration._evaluate(profile))
+    assert {name: c.get("reason") for name, c in checks.items()} == {
+        "null-port": "invalid-port",
+        "word-port": "invalid-port",
+        "big-port": "invalid-port",
+        "str-port": None,
+        "null-status": "invalid-status",
+        "bad-status": "invalid-status",
+        "null-timeout": "invalid-timeout",
+        "bool-timeout": "invalid-timeout",
+        "bad-wait": "invalid-wait",
+    }
+    with pytest.raises(ValueError, match="deadline"):
+        integration._evaluate({"deadline": None, **profile})
+
+
+def test_async_entry_point_runs_inside_a_running_loop(health: str) -> None:
+    profile = {"services": [{"name": "ok", "url": f"{health}/ok"}]}
+
+    async def caller() -> dict:
+        return await integration._evaluate_async(profile)
+
+    payload = asyncio.run(caller())
+    assert payload["summary"]["passed"] and _services(payload)["ok"]["observed"] == 200
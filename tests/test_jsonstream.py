@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+import random
+import tracemalloc
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+import sdetkit.apiget as apiget
+from sdetkit import cli
+from sdetkit.jsonstream import JsonArrayDecoder, aiter_json_array, iter_json_array
+from sdetkit.netclient import HttpStatusError, SdetHttpClient
+
+_REAL_HTTPX_CLIENT = httpx.Client
+
+_ITEMS = [
+    {"id": i, "name": "é" * (i % 7), "score": i * 1.5e-3, "neg": -i, "tags": [1, {"x": None}]}
+    for i in range(400)
+] + [12345, -0.5e10, 'a"]b', None, True, [], {}]
+
+
+def _split(raw: bytes, rnd: random.Random) -> list[bytes]:
+    cuts = sorted(rnd.sample(range(1, len(raw)), rnd.randrange(1, 200)))
+    return [raw[a:b] for a, b in zip([0, *cuts], [*cuts, len(raw)], strict=True)]
+
+
+def test_decodes_arrays_split_at_any_byte() -> None:
+    rnd = random.Random(5)
+    for indent in (None, 2):
+        raw = json.dumps(_ITEMS, indent=indent).encode("utf-8")
+        for _ in range(20):
+            assert list(iter_json_array(_split(raw, rnd))) == _ITEMS
+    small = b'\xef\xbb\xbf [1, 22 ,-1.5e3, "x" ] \n'
+    assert list(iter_json_array(small[i : i + 1] for i in range(len(small)))) == [
+        1,
+        22,
+        -1500.0,
+        "x",
+    ]
+    assert list(iter_json_array([b"[", b"]"])) == []
+
+
+def test_yields_elements_as_soon_as_they_complete() -> None:
+    decoder = JsonArrayDecoder()
+    assert decoder.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+    assert decoder.feed(b": 2}, 3") == [{"b": 2}]
+    assert decoder.feed(b"4") == []
+    assert decoder.feed(b"]") == [34]
+    assert decoder.done and decoder.close() == [] and decoder.count == 3
+
+
+@pytest.mark.parametrize(
+    ("raw", "message"),
+    [
+        (b'{"a": 1}', "expected a JSON array at char 0"),
+        (b"[1 2]", "expected ',' or ']' at char 3"),
+        (b"[1,]", "invalid JSON array element"),
+        (b"[1.]", "expected ',' or ']'"),
+        (b"[1]x", "extra data after JSON array"),
+        (b"[1,", "truncated JSON array"),
+        (b"", "truncated JSON array"),
+    ],
+)
+def test_rejects_anything_but_one_array(raw: bytes, message: str) -> None:
+    with pytest.raises(ValueError, match=message.replace("[", r"\[")):
+        list(iter_json_array([raw]))
+
+
+def test_async_variant() -> None:
+    async def chunks():
+        for part in (b'[{"a"', b": 1}, 2", b"]"):
+            yield part
+
+    async def go() -> list[object]:
+        return [item async for item in aiter_json_array(chunks())]
+
+    assert asyncio.run(go()) == [{"a": 1}, 2]
+
+
+def _streaming_handler(items: int, sent: list[int]):
+    def body() -> Iterator[bytes]:
+        yield b"["
+        for i in range(items):
+            sent.append(i)
+            yield (b"," if i else b"") + json.dumps({"id": i, "pad": "x" * 200}).encode()
+        yield b"]"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gone":
+            return httpx.Response(410, json={"error": "gone"})
+        return httpx.Response(200, content=body())
+
+    return handler
+
+
+def test_client_iter_json_array_streams_and_checks_status() -> None:
+    sent: list[int] = []
+    with httpx.Client(transport=httpx.MockTransport(_streaming_handler(50, sent))) as raw:
+        c = SdetHttpClient(raw)
+        it = c.iter_json_array("https://example.test/items")
+        assert next(it)["id"] == 0
+        assert len(sent) < 50
+        assert [item["id"] for item in it] == list(range(1, 50))
+        with pytest.raises(HttpStatusError) as exc:
+            list(c.iter_json_array("https://example.test/gone"))
+        assert exc.value.status_code == 410 and b"gone" in exc.value.body
+
+
+def _peak(fn) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_streaming_peak_memory_is_well_below_buffered_decode() -> None:
+    transport = httpx.MockTransport(_streaming_handler(5000, []))
+
+    def buffered() -> None:
+        with httpx.Client(transport=transport) as raw:
+            assert len(raw.get("https://example.test/items").json()) == 5000
+
+    def streamed() -> None:
+        with httpx.Client(transport=transport) as raw:
+            n = sum(1 for _ in SdetHttpClient(raw).iter_json_array("https://example.test/items"))
+            assert n == 5000
+
+    assert _peak(streamed) * 2 < _peak(buffered)
+
+
+def _client_factory(transport: httpx.BaseTransport):
+    def _make_client(*args, **kwargs):
+        return _REAL_HTTPX_CLIENT(transport=transport)
+
+    return _make_client
+
+
+def test_apiget_stream_writes_ndjson(monkeypatch, tmp_path, capsys) -> None:
+    transport = httpx.MockTransport(_streaming_handler(3, []))
+    monkeypatch.setattr(apiget.httpx, "Client", _client_factory(transport))
+    assert cli.main(["apiget", "https://example.test/items", "--stream", "--print-status"]) == 0
+    captured = capsys.readouterr()
+    assert [json.loads(line)["id"] for line in captured.out.splitlines()] == [0, 1, 2]
+    assert captured.err == "http status: 200\n"
+
+    monkeypatch.chdir(tmp_path)
+    assert cli.main(["apiget", "https://example.test/items", "--stream", "--out", "o.jsonl"]) == 0
+    assert len((tmp_path / "o.jsonl").read_text(encoding="utf-8").splitlines()) == 3
+
+    assert cli.main(["apiget", "https://example.test/gone", "--stream", "--fail"]) == 1
+    assert "http error: 410" in capsys.readouterr().err
+    for extra in (["--paginate"], ["--expect", "dict"]):
+        with pytest.raises(SystemExit):
+            cli.main(["apiget", "https://example.test/items", "--stream", *extra])
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sdetkit import loadgen
+from sdetkit.cassette import Cassette, CassetteRecordTransport
+from sdetkit.cassette_server import FaultProfile, create_server
+from sdetkit.loadgen import LatencyHistogram, LoadConfig, run_load
+from sdetkit.netclient import SdetAsyncHttpClient
+
+
+def test_histogram_percentiles_stay_within_bucket_precision() -> None:
+    rnd = random.Random(3)
+    samples = [rnd.lognormvariate(-5, 1.2) for _ in range(20000)]
+    hist = LatencyHistogram()
+    for s in samples:
+        hist.record(s)
+    ordered = sorted(samples)
+    for p in (50.0, 90.0, 99.0, 99.9):
+        exact = ordered[int(-(-p * len(ordered) // 100)) - 1]
+        assert hist.percentile(p) == pytest.approx(exact, rel=0.02, abs=2e-6)
+    assert hist.percentile(100) == pytest.approx(max(samples), abs=1e-6)
+    assert len(hist.counts) < 1500  # bounded by magnitude, not by sample count
+
+    a, b = LatencyHistogram(), LatencyHistogram()
+    for i, s in enumerate(samples):
+        (a if i % 2 else b).record(s)
+    a.merge(b)
+    assert a.counts == hist.counts and a.count == hist.count and a.max_us == hist.max_us
+    with pytest.raises(ValueError, match="precision"):
+        a.merge(LatencyHistogram(sub_bits=5))
+
+
+def test_closed_loop_reports_status_codes_and_error_breakdown() -> None:
+    seen = {"n": 0}
+
+    async def handler(req: httpx.Request) -> httpx.Response:
+        seen["n"] += 1
+        if seen["n"] % 5 == 0:
+            return httpx.Response(503, json={"busy": True})
+        if seen["n"] % 7 == 0:
+            return httpx.Response(200, content=b"not json")
+        return httpx.Response(200, json={"ok": True})
+
+    async def go() -> loadgen.LoadReport:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+            cfg = LoadConfig("https://svc.test/health", concurrency=4, max_requests=70)
+            return await run_load(SdetAsyncHttpClient(raw), cfg)
+
+    out = asyncio.run(go()).to_dict()
+    assert out["mode"] == "closed" and out["requests"] == 70 == seen["n"]
+    assert out["errors"] == {"http_503": 14, "invalid_json": 8}
+    assert out["ok"] == 48
+    assert out["status_codes"] == {"200": 56, "503": 14}
+    assert set(out["latency_ms"]) == {"min", "mean", "max", "p50", "p90", "p99", "p99.9"}
+
+
+def test_open_loop_cli_against_served_cassette(tmp_path: Path, capsys) -> None:
+    cassette = Cassette()
+
+    def upstream(req: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"status": "up"})
+
+    with httpx.Client(
+        transport=CassetteRecordTransport(cassette, httpx.MockTransport(upstream))
+    ) as c:
+        c.get("https://svc.test/health")
+    path = tmp_path / "health.json"
+    cassette.save(path, allow_absolute=True)
+
+    server = create_server(path, faults=FaultProfile(latency_ms=20))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        rc = loadgen.main(
+            [server.url + "/health", "--rate", "40", "--duration", "0.5", "--concurrency", "8"]
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert rc == 0
+    out = json.loads(capsys.readouterr().out)
+    assert out["mode"] == "open" and out["rate"] == 40.0
+    assert 15 <= out["requests"] <= 21 and out["errors"] == {}
+    assert out["latency_ms"]["p50"] >= 20.0
+
+
+def test_invalid_arguments_exit_2(capsys) -> None:
+    for argv in (
+        ["http://x.test/", "--concurrency", "0"],
+        ["http://x.test/", "--rate", "-1"],
+        ["http://x.test/", "--header", "nocolon"],
+        ["ftp://x.test/"],
+    ):
+        with pytest.raises(SystemExit) as exc:
+            loadgen.main(argv)
+        assert exc.value.code == 2
+    assert "concurrency must be >= 1" in capsys.readouterr().err
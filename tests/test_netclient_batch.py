@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from sdetkit.netclient import (
+    BatchRequest,
+    CircuitBreaker,
+    CircuitOpenError,
+    HttpStatusError,
+    RetryPolicy,
+    SdetAsyncHttpClient,
+    SdetHttpClient,
+    batch_stats,
+)
+
+
+class _Gauge:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.now: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.total_peak = 0
+
+    def enter(self, host: str) -> None:
+        with self._lock:
+            self.now[host] = self.now.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.now[host])
+            self.total_peak = max(self.total_peak, sum(self.now.values()))
+
+    def leave(self, host: str) -> None:
+        with self._lock:
+            self.now[host] -= 1
+
+
+def _async_api(gauge: _Gauge, *, flaky: set[str] | None = None):
+    seen: set[str] = set()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        gauge.enter(host)
+        try:
+            # Higher ids answer faster, so completion order differs from input order.
+            n = int(request.url.path.rsplit("/", 1)[-1])
+            await asyncio.sleep(0.01 * (10 - n % 10))
+        finally:
+            gauge.leave(host)
+        if request.url.path.endswith("/404"):
+            return httpx.Response(404, json={"error": "nope"})
+        if flaky and str(request.url) in flaky and str(request.url) not in seen:
+            seen.add(str(request.url))
+            raise httpx.ConnectError("flaky", request=request)
+        return httpx.Response(200, json={"id": n, "host": host})
+
+    return handler
+
+
+def _urls(count: int) -> list[str]:
+    return [f"https://{'ab'[i % 2]}.example.test/item/{i}" for i in range(count)]
+
+
+def test_async_fetch_many_caps_concurrency_and_keeps_input_order() -> None:
+    gauge = _Gauge()
+
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_async_api(gauge))) as raw:
+            c = SdetAsyncHttpClient(raw)
+            return await c.fetch_many(_urls(20), concurrency=5, per_host=2)
+
+    results = asyncio.run(go())
+    assert [r.value["id"] for r in results] == list(range(20))
+    assert all(r.ok and r.elapsed_seconds > 0 for r in results)
+    assert gauge.total_peak <= 4
+    assert max(gauge.peak.values()) == 2
+
+
+def test_async_iter_many_streams_in_completion_order() -> None:
+    gauge = _Gauge()
+
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_async_api(gauge))) as raw:
+            c = SdetAsyncHttpClient(raw)
+            return [r.index async for r in c.iter_many(_urls(6), concurrency=6)]
+
+    order = asyncio.run(go())
+    assert sorted(order) == list(range(6))
+    assert order[0] == 5
+
+
+def test_async_fetch_many_per_request_retry_and_return_exceptions() -> None:
+    urls = _urls(3)
+    gauge = _Gauge()
+    handler = _async_api(gauge, flaky={urls[0], urls[1]})
+    batch = [
+        BatchRequest(urls[0], expect="dict", retry=RetryPolicy(retries=2)),
+        BatchRequest(urls[1], expect="dict"),
+        BatchRequest("https://a.example.test/item/404", expect="dict"),
+        BatchRequest(urls[2], expect="list"),
+    ]
+
+    async def go(return_exceptions: bool):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+            c = SdetAsyncHttpClient(raw)
+            return await c.fetch_many(batch, return_exceptions=return_exceptions)
+
+    results = asyncio.run(go(True))
+    assert [r.ok for r in results] == [True, False, False, False]
+    assert results[0].value == {"id": 0, "host": "a.example.test"}
+    assert isinstance(results[3].error, ValueError)
+
+    stats = batch_stats(results, wall_seconds=1.0)
+    assert (stats.count, stats.succeeded, stats.failed) == (4, 1, 3)
+    assert stats.min_seconds <= stats.p50_seconds <= stats.p95_seconds <= stats.max_seconds
+
+    with pytest.raises(HttpStatusError):
+        asyncio.run(go(False))
+
+
+def test_async_fetch_many_cancels_outstanding_on_first_error() -> None:
+    started: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.append(request.url.path)
+        if request.url.path == "/boom":
+            return httpx.Response(500)
+        await asyncio.sleep(5)
+        return httpx.Response(200, json={})
+
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+            c = SdetAsyncHttpClient(raw)
+            urls = ["https://x.test/boom"] + [f"https://x.test/slow/{i}" for i in range(4)]
+            return await c.fetch_many(urls, concurrency=5)
+
+    start = time.perf_counter()
+    with pytest.raises(RuntimeError):
+        asyncio.run(go())
+    assert time.perf_counter() - start < 2
+    assert len(started) == 5
+
+
+def test_sync_fetch_many_facade() -> None:
+    gauge = _Gauge()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        gauge.enter(request.url.host)
+        try:
+            time.sleep(0.02)
+        finally:
+            gauge.leave(request.url.host)
+        return httpx.Response(200, json=[request.url.path])
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        c = SdetHttpClient(raw)
+        results = c.fetch_many(
+            [BatchRequest(u, expect="list") for u in _urls(10)], concurrency=4, per_host=1
+        )
+    assert [r.value for r in results] == [[f"/item/{i}"] for i in range(10)]
+    assert max(gauge.peak.values()) == 1
+
+
+def test_fetch_many_rejects_bad_limits() -> None:
+    with httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200))) as raw:
+        c = SdetHttpClient(raw)
+        with pytest.raises(ValueError, match="concurrency"):
+            c.fetch_many(["https://x.test/"], concurrency=0)
+        with pytest.raises(ValueError, match="per_host"):
+            c.iter_many(["https://x.test/"], per_host=0)
+
+
+def test_sync_iter_many_does_not_let_one_host_hold_every_worker() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "slow.example.test":
+            time.sleep(0.3)
+        return httpx.Response(200, json={"host": request.url.host})
+
+    urls = [f"https://slow.example.test/{i}" for i in range(3)] + ["https://fast.example.test/"]
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        c = SdetHttpClient(raw)
+        start = time.perf_counter()
+        finished: list[tuple[str, float]] = []
+        for res in c.iter_many(urls, concurrency=2, per_host=1):
+            finished.append((res.url, time.perf_counter() - start))
+    assert finished[0][0] == "https://fast.example.test/"
+    assert finished[0][1] < 0.2
+    assert [url for url, _ in finished[1:]] == urls[:3]
+
+
+def test_sync_iter_many_workers_share_one_half_open_probe() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        time.sleep(0.1)
+        return httpx.Response(200, json={})
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.05)
+    breaker.record_failure(time.monotonic())
+    time.sleep(0.06)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        c = SdetHttpClient(raw, breaker=breaker)
+        results = list(c.iter_many(_urls(8), concurrency=8))
+    assert len(calls) == 1
+    assert sum(r.ok for r in results) == 1
+    assert all(isinstance(r.error, CircuitOpenError) for r in results if not r.ok)
+    assert breaker.state == "closed"
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from sdetkit.netclient import (
+    ClientEvent,
+    RateLimiter,
+    RetryPolicy,
+    SdetAsyncHttpClient,
+    SdetHttpClient,
+)
+
+
+def _slow_fast_api(slow_first: int, slow: float = 1.0, fast: float = 0.01):
+    """The first ``slow_first`` requests stall for ``slow`` seconds; the rest answer quickly."""
+    calls = {"n": 0, "cancelled": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        n = calls["n"]
+        try:
+            await asyncio.sleep(slow if n <= slow_first else fast)
+        except asyncio.CancelledError:
+            calls["cancelled"] += 1
+            raise
+        return httpx.Response(200, json={"call": n})
+
+    return handler, calls
+
+
+async def _get(handler, policy: RetryPolicy, events: list[ClientEvent] | None = None):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+        hook = events.append if events is not None else None
+        c = SdetAsyncHttpClient(raw, retry=policy, hook=hook)
+        return await c.get_json_dict("https://api.example.test/x")
+
+
+def test_deadline_bounds_a_slow_async_attempt() -> None:
+    handler, _ = _slow_fast_api(slow_first=5)
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError, match="deadline exceeded"):
+        asyncio.run(_get(handler, RetryPolicy(retries=5, deadline=0.1)))
+    assert time.perf_counter() - start < 0.5
+
+
+def test_deadline_stops_retrying_when_backoff_would_overrun() -> None:
+    now = {"t": 0.0}
+    sleeps: list[float] = []
+
+    def sleep(d: float) -> None:
+        sleeps.append(d)
+        now["t"] += d
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        now["t"] += 0.4
+        raise httpx.ConnectError("down", request=request)
+
+    policy = RetryPolicy(retries=10, backoff_base=0.5, backoff_factor=1.0, deadline=2.0)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        c = SdetHttpClient(raw, retry=policy, clock=lambda: now["t"], sleep=sleep)
+        with pytest.raises(TimeoutError, match="deadline exceeded") as ei:
+            c.get_json_dict("https://api.example.test/x")
+    assert isinstance(ei.value.__cause__, httpx.ConnectError)
+    assert sleeps == [0.5, 0.5]
+
+
+def test_deadline_caps_per_attempt_timeouts() -> None:
+    seen: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        c = SdetHttpClient(raw, retry=RetryPolicy(deadline=0.5))
+        c.request("GET", "https://api.example.test/x", timeout=30.0)
+    assert all(0 < v <= 0.5 for v in seen[0].values())
+
+
+def test_hedged_get_returns_the_faster_attempt() -> None:
+    handler, calls = _slow_fast_api(slow_first=1, slow=2.0)
+    events: list[ClientEvent] = []
+    start = time.perf_counter()
+    data = asyncio.run(_get(handler, RetryPolicy(hedge_after=0.05), events))
+    assert time.perf_counter() - start < 1.0
+    assert data == {"call": 2}
+    assert calls["cancelled"] == 1
+    assert [e.type for e in events] == ["attempt_start", "hedge", "attempt_response", "complete"]
+
+
+def test_hedge_is_not_fired_when_the_first_attempt_is_quick() -> None:
+    handler, calls = _slow_fast_api(slow_first=0)
+    events: list[ClientEvent] = []
+    assert asyncio.run(_get(handler, RetryPolicy(hedge_after=0.5), events)) == {"call": 1}
+    assert calls["n"] == 1
+    assert "hedge" not in [e.type for e in events]
+
+
+def test_p95_hedge_waits_for_latency_samples() -> None:
+    slow = {"next": False}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        delay = 0.5 if slow["next"] else 0.001
+        slow["next"] = False
+        await asyncio.sleep(delay)
+        return httpx.Response(200, json={})
+
+    async def go() -> list[str]:
+        events: list[ClientEvent] = []
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+            c = SdetAsyncHttpClient(raw, retry=RetryPolicy(hedge_after="p95"), hook=events.append)
+            for _ in range(20):  # no hedging until the window holds enough samples
+                await c.get_json_dict("https://api.example.test/x")
+            assert "hedge" not in [e.type for e in events]
+            del events[:]
+            slow["next"] = True
+            await c.get_json_dict("https://api.example.test/x")
+        return [e.type for e in events]
+
+    assert asyncio.run(go()).count("hedge") == 1
+
+
+def test_hedge_that_would_start_after_the_deadline_is_skipped() -> None:
+    handler, calls = _slow_fast_api(slow_first=5)
+    events: list[ClientEvent] = []
+    with pytest.raises(TimeoutError, match="deadline exceeded"):
+        asyncio.run(_get(handler, RetryPolicy(hedge_after=0.5, deadline=0.1), events))
+    assert calls["n"] == 1
+    assert "hedge" not in [e.type for e in events]
+
+
+def test_limiter_wait_is_bounded_by_the_deadline() -> None:
+    now = {"t": 0.0}
+    sleeps: list[float] = []
+
+    def sleep(d: float) -> None:
+        sleeps.append(d)
+        now["t"] += d
+
+    limiter = RateLimiter(rate=0.1, burst=1, clock=lambda: now["t"])
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        return httpx.Response(200, json={})
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        c = SdetHttpClient(
+            raw,
+            retry=RetryPolicy(deadline=2.0),
+            limiter=limiter,
+            clock=lambda: now["t"],
+            sleep=sleep,
+        )
+        c.get_json_dict("https://api.example.test/a")
+        with pytest.raises(TimeoutError, match="deadline exceeded"):
+            c.get_json_dict("https://api.example.test/b")
+    # The 10 s limiter wait is never slept and its slot goes back to the bucket.
+    assert sleeps == [] and sent == ["/a"]
+    assert limiter.reserve("https://api.example.test/c") == pytest.approx(10.0)
+
+    async def go() -> None:
+        async def asleep(d: float) -> None:
+            sleeps.append(d)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+            c = SdetAsyncHttpClient(
+                raw,
+                retry=RetryPolicy(deadline=2.0),
+                limiter=limiter,
+                clock=lambda: now["t"],
+                sleep=asleep,
+            )
+            with pytest.raises(TimeoutError, match="deadline exceeded"):
+                await c.get_json_dict("https://api.example.test/d")
+
+    asyncio.run(go())
+    assert sleeps == [] and sent == ["/a"]
+
+
+def test_deadline_must_be_positive() -> None:
+    with httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200))) as raw:
+        c = SdetHttpClient(raw, retry=RetryPolicy(deadline=0))
+        with pytest.raises(ValueError, match="deadline"):
+            c.get_json_dict("https://api.example.test/x")
+
+
+def test_apiget_rejects_non_positive_deadline(capsys) -> None:
+    from sdetkit import apiget
+
+    with pytest.raises(SystemExit) as exc:
+        apiget.main(["https://api.example.test/x", "--deadline", "0"])
+    assert exc.value.code == 2
+    assert "deadline must be > 0" in capsys.readouterr().err
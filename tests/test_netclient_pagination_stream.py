@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+import sdetkit.apiget as apiget
+from sdetkit import cli
+from sdetkit.netclient import SdetAsyncHttpClient, SdetHttpClient
+
+_REAL_HTTPX_CLIENT = httpx.Client
+
+
+def _link_pages(pages: int, per_page: int, calls: list[int]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        calls.append(page)
+        items = [{"id": (page - 1) * per_page + i} for i in range(per_page)]
+        headers = {}
+        if page < pages:
+            headers["Link"] = f'<https://example.test/items?page={page + 1}>; rel="next"'
+        return httpx.Response(200, json=items, headers=headers)
+
+    return handler
+
+
+def test_iter_json_list_paginated_yields_before_next_page_is_fetched() -> None:
+    calls: list[int] = []
+    with httpx.Client(transport=httpx.MockTransport(_link_pages(3, 2, calls))) as raw:
+        it = SdetHttpClient(raw).iter_json_list_paginated("https://example.test/items")
+        assert next(it) == {"id": 0}
+        assert calls == [1]
+        assert [item["id"] for item in it] == [1, 2, 3, 4, 5]
+        assert calls == [1, 2, 3]
+
+
+def test_iter_json_list_paginated_validates_eagerly_and_keeps_limit() -> None:
+    calls: list[int] = []
+    with httpx.Client(transport=httpx.MockTransport(_link_pages(5, 1, calls))) as raw:
+        c = SdetHttpClient(raw)
+        with pytest.raises(ValueError, match="max_pages"):
+            c.iter_json_list_paginated("https://example.test/items", max_pages=0)
+        seen = []
+        with pytest.raises(RuntimeError, match="pagination limit exceeded"):
+            for item in c.iter_json_list_paginated("https://example.test/items", max_pages=2):
+                seen.append(item["id"])
+        assert seen == [0, 1]
+
+
+def test_iter_json_list_paginated_envelope_streams_items() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.query == b"page=2":
+            return httpx.Response(200, json={"items": [3], "next": None})
+        return httpx.Response(200, json={"items": [1, 2], "next": "?page=2"})
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as raw:
+        it = SdetHttpClient(raw).iter_json_list_paginated_envelope("https://example.test/e")
+        assert list(it) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_aiter_json_list_paginated_streams_pages() -> None:
+    calls: list[int] = []
+    handler = _link_pages(2, 2, calls)
+
+    async def ahandler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(ahandler)) as raw:
+        c = SdetAsyncHttpClient(raw)
+        got = []
+        async for item in c.aiter_json_list_paginated("https://example.test/items"):
+            got.append((item["id"], list(calls)))
+        assert got == [(0, [1]), (1, [1]), (2, [1, 2]), (3, [1, 2])]
+        assert await c.get_json_list_paginated("https://example.test/items") == [
+            {"id": i} for i in range(4)
+        ]
+
+
+def _client_factory(transport: httpx.BaseTransport):
+    def _make_client(*args, **kwargs):
+        return _REAL_HTTPX_CLIENT(transport=transport)
+
+    return _make_client
+
+
+def test_apiget_paginate_ndjson_streams_items(monkeypatch, capsys) -> None:
+    transport = httpx.MockTransport(_link_pages(2, 2, []))
+    monkeypatch.setattr(apiget.httpx, "Client", _client_factory(transport))
+    rc = cli.main(["apiget", "https://example.test/items", "--paginate", "--ndjson"])
+    assert rc == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == [{"id": i} for i in range(4)]
+
+
+def test_apiget_paginate_ndjson_out_file(monkeypatch, tmp_path, capsys) -> None:
+    transport = httpx.MockTransport(_link_pages(2, 1, []))
+    monkeypatch.setattr(apiget.httpx, "Client", _client_factory(transport))
+    monkeypatch.chdir(tmp_path)
+    argv = ["apiget", "https://example.test/items", "--paginate", "--ndjson", "--out", "o.jsonl"]
+    assert cli.main([*argv, "--print-status"]) == 0
+    assert (tmp_path / "o.jsonl").read_text(encoding="utf-8") == '{"id": 0}\n{"id": 1}\n'
+    assert capsys.readouterr().err == "http status: 200\nhttp status: 200\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["o.jsonl"]
+    with pytest.raises(SystemExit):
+        cli.main(argv)
+
+
+def test_apiget_ndjson_requires_paginate(capsys) -> None:
+    with pytest.raises(SystemExit):
+        cli.main(["apiget", "https://example.test/items", "--ndjson"])
+    assert "ndjson requires --paginate" in capsys.readouterr().err
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from sdetkit.netclient import CircuitBreaker, RetryPolicy, SdetAsyncHttpClient
+
+_TOTAL = 10
+_PER_PAGE = 2
+
+
+def _paged_api(*, delay: float, inflight: list[int], fail_once: set[int] | None = None):
+    state = {"now": 0}
+    failed: set[int] = set()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        state["now"] += 1
+        inflight.append(state["now"])
+        try:
+            # Later pages answer faster, so out-of-order completion is exercised.
+            await asyncio.sleep(delay * (1 + (_TOTAL // _PER_PAGE - page) / 4))
+        finally:
+            state["now"] -= 1
+        if fail_once and page in fail_once and page not in failed:
+            failed.add(page)
+            raise httpx.ConnectError("flaky", request=request)
+        start = (page - 1) * _PER_PAGE
+        return httpx.Response(
+            200,
+            json={
+                "items": list(range(start, min(start + _PER_PAGE, _TOTAL))),
+                "page": page,
+                "per_page": _PER_PAGE,
+                "total": _TOTAL,
+                "next": f"?page={page + 1}" if start + _PER_PAGE < _TOTAL else None,
+            },
+        )
+
+    return handler
+
+
+async def _collect(prefetch: int, **kwargs) -> tuple[list, float, int]:
+    inflight: list[int] = []
+    transport = httpx.MockTransport(_paged_api(delay=0.05, inflight=inflight, **kwargs))
+    async with httpx.AsyncClient(transport=transport) as raw:
+        c = SdetAsyncHttpClient(raw, retry=RetryPolicy(retries=2))
+        start = time.perf_counter()
+        items = [
+            item
+            async for item in c.aiter_json_list_paginated_envelope(
+                "https://example.test/items", prefetch=prefetch
+            )
+        ]
+        return items, time.perf_counter() - start, max(inflight)
+
+
+@pytest.mark.asyncio
+async def test_prefetch_keeps_page_order_and_overlaps_requests() -> None:
+    sequential, t_seq, peak_seq = await _collect(0)
+    prefetched, t_pre, peak_pre = await _collect(4)
+    assert sequential == prefetched == list(range(_TOTAL))
+    assert peak_seq == 1
+    assert peak_pre == 4
+    assert t_pre < t_seq
+
+
+@pytest.mark.asyncio
+async def test_prefetch_retries_each_page_request() -> None:
+    items, _t, _peak = await _collect(3, fail_once={3, 4})
+    assert items == list(range(_TOTAL))
+
+
+@pytest.mark.asyncio
+async def test_prefetch_respects_max_pages_and_falls_back_without_counts() -> None:
+    transport = httpx.MockTransport(_paged_api(delay=0, inflight=[]))
+    async with httpx.AsyncClient(transport=transport) as raw:
+        c = SdetAsyncHttpClient(raw)
+        got: list[int] = []
+        with pytest.raises(RuntimeError, match="pagination limit exceeded"):
+            async for item in c.aiter_json_list_paginated_envelope(
+                "https://example.test/items", prefetch=4, max_pages=2
+            ):
+                got.append(item)
+        assert got == [0, 1, 2, 3]
+        with pytest.raises(ValueError, match="prefetch"):
+            c.aiter_json_list_paginated_envelope("https://example.test/items", prefetch=-1)
+
+    async def no_counts(request: httpx.Request) -> httpx.Response:
+        if request.url.query == b"page=2":
+            return httpx.Response(200, json={"items": [2], "next": None})
+        return httpx.Response(200, json={"items": [1], "next": "?page=2"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(no_counts)) as raw:
+        c = SdetAsyncHttpClient(raw)
+        assert await c.get_json_list_paginated_envelope(
+            "https://example.test/items", prefetch=4
+        ) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_open_breaker_stops_pending_pages() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        if page > 1:
+            return httpx.Response(503)
+        return httpx.Response(
+            200, json={"items": [0], "page": 1, "per_page": 1, "total": 5, "next": "?page=2"}
+        )
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+        c = SdetAsyncHttpClient(raw, breaker=breaker)
+        with pytest.raises(Exception) as info:
+            await c.get_json_list_paginated_envelope("https://example.test/items", prefetch=2)
+        assert type(info.value).__name__ in {"HttpStatusError", "CircuitOpenError"}
+
+
+@pytest.mark.asyncio
+async def test_prefetch_list_wrapper_forwards_custom_keys_and_reaps_pending_pages() -> None:
+    requested: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        n = int(request.url.params.get("p", "1"))
+        requested.append(request.url.query.decode())
+        await asyncio.sleep(0.01 * n)
+        return httpx.Response(200, json={"items": [n], "count": 4, "size": 1})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+        c = SdetAsyncHttpClient(raw)
+        items = await c.get_json_list_paginated_envelope(
+            "https://example.test/items",
+            prefetch=2,
+            page_param="p",
+            total_key="count",
+            per_page_key="size",
+        )
+        assert items == [1, 2, 3, 4]
+        assert sorted(requested) == ["", "p=2", "p=3", "p=4"]
+
+        before = asyncio.all_tasks()
+        pages = c.aiter_json_list_paginated_envelope(
+            "https://example.test/items",
+            prefetch=3,
+            page_param="p",
+            total_key="count",
+            per_page_key="size",
+        )
+        assert await pages.__anext__() == 1
+        assert await pages.__anext__() == 2
+        await pages.aclose()
+        assert asyncio.all_tasks() == before
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from sdetkit.netclient import (
+    ClientEvent,
+    RateLimiter,
+    RetryPolicy,
+    SdetAsyncHttpClient,
+    SdetHttpClient,
+)
+
+
+class _FakeTime:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+def _limited_server(rate: float, burst: int):
+    """Stub API enforcing its own token bucket; answers 429 when exceeded."""
+    lock = threading.Lock()
+    state = {"tokens": float(burst), "at": time.monotonic(), "429": 0, "ok": 0}
+
+    def take() -> bool:
+        with lock:
+            now = time.monotonic()
+            state["tokens"] = min(burst, state["tokens"] + (now - state["at"]) * rate)
+            state["at"] = now
+            if state["tokens"] < 0.95:  # a little slack for scheduler jitter
+                state["429"] += 1
+                return False
+            state["tokens"] -= 1
+            state["ok"] += 1
+            return True
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if not take():
+            return httpx.Response(429, headers={"Retry-After": "1"})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    return handler, state
+
+
+def test_limiter_spaces_sync_attempts_and_emits_sleep_events() -> None:
+    t = _FakeTime()
+    limiter = RateLimiter(rate=4, burst=2, clock=t.clock)
+    events: list[ClientEvent] = []
+    transport = httpx.MockTransport(lambda r: httpx.Response(200, json={}))
+    with httpx.Client(transport=transport) as raw:
+        c = SdetHttpClient(raw, limiter=limiter, clock=t.clock, sleep=t.sleep, hook=events.append)
+        for _ in range(5):
+            c.get_json_dict("https://api.example.test/x")
+        c.get_json_dict("https://other.example.test/x")
+    assert t.sleeps == [0.25, 0.25, 0.25]
+    assert [e.sleep_seconds for e in events if e.type == "sleep"] == [0.25, 0.25, 0.25]
+
+
+def test_limiter_is_shared_across_clients() -> None:
+    t = _FakeTime()
+    limiter = RateLimiter(rate=1, burst=1, clock=t.clock)
+    transport = httpx.MockTransport(lambda r: httpx.Response(200, json={}))
+    with httpx.Client(transport=transport) as raw:
+        a = SdetHttpClient(raw, limiter=limiter, clock=t.clock, sleep=t.sleep)
+        b = SdetHttpClient(raw, limiter=limiter, clock=t.clock, sleep=t.sleep)
+        a.get_json_dict("https://api.example.test/a")
+        b.get_json_dict("https://api.example.test/b")
+    assert t.sleeps == [1.0]
+
+
+def test_limiter_honours_retry_after_and_remaining_headers() -> None:
+    t = _FakeTime()
+    limiter = RateLimiter(rate=10, burst=10, clock=t.clock)
+    limiter.observe("https://api.example.test/", 429, {"Retry-After": "3"})
+    assert limiter.reserve("https://api.example.test/next") == pytest.approx(3.0)
+
+    limiter.observe("https://b.example.test/", 200, {"X-RateLimit-Remaining": "1"})
+    assert limiter.reserve("https://b.example.test/") == 0.0
+    assert limiter.reserve("https://b.example.test/") == pytest.approx(0.1)
+
+    limiter.observe(
+        "https://c.example.test/", 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"}
+    )
+    assert limiter.reserve("https://c.example.test/") == pytest.approx(2.0)
+
+
+def test_retry_after_from_a_429_delays_the_next_attempt() -> None:
+    t = _FakeTime()
+    limiter = RateLimiter(rate=100, burst=5, clock=t.clock)
+    replies = iter(
+        [httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200, json={})]
+    )
+    with httpx.Client(transport=httpx.MockTransport(lambda r: next(replies))) as raw:
+        c = SdetHttpClient(
+            raw,
+            limiter=limiter,
+            clock=t.clock,
+            sleep=t.sleep,
+            retry=RetryPolicy(retries=2, retry_on_429=True),
+        )
+        assert c.get_json_dict("https://api.example.test/") == {}
+    # The retry loop sleeps Retry-After itself; the limiter then lets the retry through.
+    assert t.sleeps == [2.0]
+
+
+def test_async_throughput_tracks_configured_rate_without_429s() -> None:
+    rate, burst, total = 40.0, 4, 32
+    handler, state = _limited_server(rate, burst)
+
+    async def go() -> float:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as raw:
+            c = SdetAsyncHttpClient(raw, limiter=RateLimiter(rate=rate, burst=burst))
+            start = time.perf_counter()
+            results = await c.fetch_many(
+                [f"https://api.example.test/{i}" for i in range(total)], concurrency=16
+            )
+            assert all(r.ok for r in results)
+            return time.perf_counter() - start
+
+    elapsed = asyncio.run(go())
+    assert state["429"] == 0
+    assert state["ok"] == total
+    expected = (total - burst) / rate
+    assert expected * 0.9 <= elapsed <= expected * 2
+
+
+def test_limiter_rejects_bad_configuration() -> None:
+    with pytest.raises(ValueError, match="rate"):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError, match="burst"):
+        RateLimiter(rate=1, burst=0)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import types
 from pathlib import Path
 
@@ -94,3 +95,85 @@ def test_cmd_run_success_and_validate_json(monkeypatch, capsys) -> None:
     out = capsys.readouterr().out
     assert '"failed": [' in out
     assert '"canonical": "demo"' in out
+
+
+def test_registry_manifest_reused_until_pkg_dir_changes(monkeypatch, tmp_path: Path) -> None:
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "day77_community_touchpoint_closeout.py").write_text("x", encoding="utf-8")
+    monkeypatch.setenv("SDETKIT_CACHE_DIR", str(tmp_path / "cache"))
+
+    builds: list[Path] = []
+    real_build = pc._build_registry
+
+    def _counting_build(pkg_dir: Path):
+        builds.append(pkg_dir)
+        return real_build(pkg_dir)
+
+    monkeypatch.setattr(pc, "_build_registry", _counting_build)
+
+    first = pc._load_registry(pkg)
+    assert pc._load_registry(pkg) == first
+    assert len(builds) == 1
+    assert "community-touchpoint-closeout" in first[0]
+
+    (pkg / "day78_ecosystem_priorities_closeout.py").write_text("x", encoding="utf-8")
+    os.utime(pkg, ns=(0, pkg.stat().st_mtime_ns + 1_000_000))
+    refreshed = pc._load_registry(pkg)
+    assert len(builds) == 2
+    assert "ecosystem-priorities-closeout" in refreshed[0]
+
+
+def test_registry_manifest_ignores_corrupt_and_unwritable_cache(
+    monkeypatch, tmp_path: Path
+) -> None:
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("x", encoding="utf-8")
+    monkeypatch.setenv("SDETKIT_CACHE_DIR", str(blocker))
+    assert pc._load_registry(pkg) == pc._build_registry(pkg)
+
+    monkeypatch.setenv("SDETKIT_CACHE_DIR", str(tmp_path / "cache"))
+    key = pc._registry_manifest_key(pkg)
+    assert key is not None
+    path = pc._registry_manifest_path(key)
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+    assert pc._load_registry(pkg) == pc._build_registry(pkg)
+    assert pc._read_registry_manifest(path, key) is not None
+
+
+def test_registry_manifest_key_tracks_version_and_module_constants(
+    monkeypatch, tmp_path: Path
+) -> None:
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    monkeypatch.setenv("SDETKIT_CACHE_DIR", str(tmp_path / "cache"))
+    pc._load_registry(pkg)
+    key = pc._registry_manifest_key(pkg)
+    assert key is not None
+    path = pc._registry_manifest_path(key)
+    assert pc._read_registry_manifest(path, key) is not None
+
+    monkeypatch.setattr(pc, "__version__", "999.0")
+    bumped = pc._registry_manifest_key(pkg)
+    assert bumped is not None and pc._read_registry_manifest(path, bumped) is None
+
+    monkeypatch.undo()
+    fake_module = tmp_path / "playbooks_cli.py"
+    fake_module.write_text("x", encoding="utf-8")
+    monkeypatch.setattr(pc, "__file__", str(fake_module))
+    edited = pc._registry_manifest_key(pkg)
+    assert edited is not None and edited["module_mtime_ns"] != key["module_mtime_ns"]
+    assert pc._read_registry_manifest(path, edited) is None
+
+
+def test_package_version_matches_pyproject() -> None:
+    import tomllib
+
+    import sdetkit
+
+    pyproject = Path(__file__).resolve().parents[1] / "pyproject.toml"
+    project = tomllib.loads(pyproject.read_text(encoding="utf-8"))["project"]
+    assert sdetkit.__version__ == project["version"]
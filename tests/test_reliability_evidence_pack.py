@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from sdetkit import cli
+from sdetkit import cli, evidence_runner
 from sdetkit import reliability_evidence_pack as rep
 
 
@@ -180,7 +180,7 @@ def test_reliability_pack_execute_commands_timeout_records_error(monkeypatch) ->
     def boom(*args, **kwargs):
         raise subprocess.TimeoutExpired(cmd=["x"], timeout=1, output="out", stderr="err")
 
-    monkeypatch.setattr(rep.subprocess, "run", boom)
+    monkeypatch.setattr(evidence_runner.subprocess, "run", boom)
     rows = rep._execute_commands(["python -c 'print(1)'"], timeout_sec=1)
     assert rows[0]["returncode"] == 124
     assert rows[0]["ok"] is False
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import re
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from sdetkit.security import (
+    Redactor,
+    is_sensitive_key,
+    redact_json,
+    redact_keys,
+    redact_secrets_text,
+    redactor,
+)
+
+_KEYS = redact_keys(["x-trace-id"])
+
+
+def _reference_text(text: str, keys: set[str]) -> str:
+    out = text
+    for key in sorted(keys):
+        token = re.escape(key).replace("\\-", "[-_]")
+        out = re.sub(rf"(?i)(\b{token}\b\s*[:=]\s*)([^\s,;]+)", r"\1<redacted>", out)
+    return out
+
+
+def _reference_json(value: object, keys: set[str]) -> object:
+    if isinstance(value, dict):
+        return {
+            k: "<redacted>"
+            if isinstance(k, str) and is_sensitive_key(k, keys)
+            else _reference_json(value[k], keys)
+            for k in sorted(value.keys(), key=str)
+        }
+    if isinstance(value, list):
+        return [_reference_json(v, keys) for v in value]
+    return value
+
+
+_names = st.sampled_from(
+    ["token", "Password", "X-API-KEY", "set_cookie", "name", "id", "x_trace_id", "tokens"]
+)
+_json = st.recursive(
+    st.none() | st.booleans() | st.integers() | st.text(max_size=8),
+    lambda inner: st.lists(inner, max_size=4) | st.dictionaries(_names, inner, max_size=4),
+    max_leaves=30,
+)
+_text = st.lists(
+    st.sampled_from(
+        ["token", "password", "ACCESS-TOKEN", "x_api_key", "name", "=", ":", " ", ",", ";", "ab"]
+    ),
+    max_size=20,
+).map("".join)
+
+
+@settings(max_examples=200, deadline=None)
+@given(_json)
+def test_redact_json_matches_reference(value) -> None:
+    out = redact_json(value, enabled=True, keys=_KEYS)
+    assert out == _reference_json(value, _KEYS)
+    if isinstance(out, dict):
+        assert list(out) == sorted(out, key=str)
+
+
+@settings(max_examples=300, deadline=None)
+@given(_text)
+def test_redact_secrets_text_matches_reference(text: str) -> None:
+    assert redact_secrets_text(text, enabled=True, keys=_KEYS) == _reference_text(text, _KEYS)
+
+
+def test_redactor_is_built_once_per_key_set() -> None:
+    assert redactor(set(_KEYS)) is redactor(frozenset(_KEYS))
+    assert redactor({"token"}) is not redactor(_KEYS)
+
+
+def test_redact_json_handles_deep_nesting_and_copies() -> None:
+    deep: object = {"token": "x"}
+    for _ in range(5000):
+        deep = {"next": [deep]}
+    out = Redactor(_KEYS).json(deep)
+    for _ in range(5000):
+        assert isinstance(out, dict)
+        out = out["next"][0]
+    assert out == {"token": "<redacted>"}
+
+    src = {"items": [1, 2, 3]}
+    copy = redact_json(src, enabled=True, keys=_KEYS)
+    assert copy == src and copy["items"] is not src["items"]
+
+
+def test_disabled_and_empty_key_sets_pass_through() -> None:
+    payload = {"token": "x"}
+    assert redact_json(payload, enabled=False, keys=_KEYS) is payload
+    assert Redactor([]).text("token=1") == "token=1"
+    assert Redactor([]).json(payload) == payload